@@ -5,6 +5,9 @@ from fastapi import Depends
 from fastapi.params import Header
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.cache.local_cache import LocalCache, get_local_cache
+from app.cache.refresher import CacheRefresher, get_cache_refresher
+from app.cache.single_flight import SingleFlight, get_single_flight
 from app.core.config import Settings, get_settings
 from app.db.redis import get_redis_client
 from app.db.session import get_db
@@ -12,6 +15,9 @@ from app.mappers.company_mapper import CompanyMapper
 from app.mappers.company_tag_mapper import CompanyTagMapper
 from app.repositories.company_repository import CompanyRepository
 from app.repositories.company_tag_repository import CompanyTagRepository
+from app.search.autocomplete import AutocompleteIndex, get_autocomplete_index
+from app.search.refine import PartialNameRefineStats, get_partial_name_refine_stats
+from app.search.tag_index import TagIndex, get_tag_index
 from app.services.company_service import CompanyService
 
 WantedLanguage = Annotated[str, Header(..., alias="x-wanted-language")]
@@ -33,6 +39,13 @@ def get_company_repository(
     company_mapper: Annotated[CompanyMapper, Depends(get_company_mapper)],
     company_tag_mapper: Annotated[CompanyTagMapper, Depends(get_company_tag_mapper)],
     settings: Annotated[Settings, Depends(get_settings)],
+    local_cache: Annotated[LocalCache | None, Depends(get_local_cache)],
+    single_flight: Annotated[SingleFlight, Depends(get_single_flight)],
+    cache_refresher: Annotated[CacheRefresher, Depends(get_cache_refresher)],
+    tag_index: Annotated[TagIndex | None, Depends(get_tag_index)],
+    refine_stats: Annotated[
+        PartialNameRefineStats, Depends(get_partial_name_refine_stats)
+    ],
 ) -> CompanyRepository:
     return CompanyRepository(
         db=db,
@@ -40,6 +53,11 @@ def get_company_repository(
         company_mapper=company_mapper,
         company_tag_mapper=company_tag_mapper,
         settings=settings,
+        local_cache=local_cache,
+        single_flight=single_flight,
+        cache_refresher=cache_refresher,
+        tag_index=tag_index,
+        refine_stats=refine_stats,
     )
 
 
@@ -62,6 +80,10 @@ def get_company_service(
     ],
     company_mapper: Annotated[CompanyMapper, Depends(get_company_mapper)],
     company_tag_mapper: Annotated[CompanyTagMapper, Depends(get_company_tag_mapper)],
+    autocomplete_index: Annotated[
+        AutocompleteIndex | None, Depends(get_autocomplete_index)
+    ],
+    tag_index: Annotated[TagIndex | None, Depends(get_tag_index)],
 ) -> CompanyService:
     return CompanyService(
         db=db,
@@ -69,4 +91,6 @@ def get_company_service(
         company_tag_repo=company_tag_repo,
         company_mapper=company_mapper,
         company_tag_mapper=company_tag_mapper,
+        autocomplete_index=autocomplete_index,
+        tag_index=tag_index,
     )
@@ -1,46 +1,255 @@
+import asyncio
+from dataclasses import asdict
 from pathlib import Path
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
-from app.db.session import get_db
-from app.services.data_initializer import (
-    DataInitializationError,
-    DataInitializerService,
+from app.api.deps import get_company_repository, get_company_tag_mapper
+from app.cache.local_cache import LocalCache, get_local_cache
+from app.core.config import Settings, get_settings
+from app.db.session import get_db, get_session_factory
+from app.mappers.company_tag_mapper import CompanyTagMapper
+from app.repositories.company_repository import CompanyRepository
+from app.repositories.company_tag_repository import CompanyTagRepository
+from app.search.autocomplete import AutocompleteIndex, get_autocomplete_index
+from app.search.refine import PartialNameRefineStats, get_partial_name_refine_stats
+from app.search.tag_index import TagIndex, get_tag_index
+from app.services.csv_upload import (
+    CsvUploadError,
+    multipart_boundary,
+    multipart_file_chunks,
+    open_upload_stream,
+)
+from app.services.data_exporter import DataExporterService, gzip_chunks
+from app.services.data_importer import (
+    CsvSource,
+    DataImporterService,
+    ProgressCallback,
+    count_csv_rows,
+)
+from app.services.data_initializer import DataInitializerService
+from app.services.data_synchronizer import DataSynchronizerService
+from app.services.import_job import (
+    ImportJobConflictError,
+    ImportJobManager,
+    ImportRunFn,
+    get_import_job_manager,
 )
 
 router = APIRouter(prefix="/admin", tags=["admin"])
 
 
-@router.post("/initialize-data", status_code=status.HTTP_201_CREATED)
+def _import_runner(
+    csv_file: CsvSource,
+    bulk: bool,
+    sync: bool,
+    session_factory: async_sessionmaker,
+    settings: Settings,
+    tag_index: TagIndex | None,
+    autocomplete_index: AutocompleteIndex | None,
+    company_repo: CompanyRepository,
+    company_tag_mapper: CompanyTagMapper,
+) -> ImportRunFn:
+    # bulk 모드는 여러 writer 가 각자의 세션으로 저장
+    importer = DataImporterService(
+        session_factory,
+        parallelism=settings.DATA_IMPORT_PARALLELISM,
+        queue_size=settings.DATA_IMPORT_QUEUE_SIZE,
+    )
+
+    async def _run(on_progress: ProgressCallback) -> dict:
+        # 요청이 끝난 뒤에도 실행되므로 요청 세션 대신 작업 전용 세션 사용
+        async with session_factory() as job_session:
+            synchronizer = DataSynchronizerService(
+                job_session,
+                CompanyTagRepository(
+                    db=job_session, company_tag_mapper=company_tag_mapper
+                ),
+                company_repo=company_repo.with_session(job_session),
+            )
+            initializer = DataInitializerService(
+                job_session, importer=importer, synchronizer=synchronizer
+            )
+            result = await initializer.initialize_data_from_csv(
+                csv_file, bulk=bulk, sync=sync, on_progress=on_progress
+            )
+
+        # 리포지토리를 거치지 않고 저장하므로 태그/자동완성 인덱스는 DB 에서 다시 생성
+        changed = not sync or result["changed"]
+        if tag_index is not None and changed:
+            await tag_index.reload()
+        if autocomplete_index is not None and changed:
+            await autocomplete_index.reload()
+        return result
+
+    return _run
+
+
+@router.post("/initialize-data", status_code=status.HTTP_202_ACCEPTED)
 async def initialize_data(
     session: Annotated[AsyncSession, Depends(get_db)],
+    session_factory: Annotated[async_sessionmaker, Depends(get_session_factory)],
+    settings: Annotated[Settings, Depends(get_settings)],
+    tag_index: Annotated[TagIndex | None, Depends(get_tag_index)],
+    autocomplete_index: Annotated[
+        AutocompleteIndex | None, Depends(get_autocomplete_index)
+    ],
+    company_repo: Annotated[CompanyRepository, Depends(get_company_repository)],
+    company_tag_mapper: Annotated[CompanyTagMapper, Depends(get_company_tag_mapper)],
+    job_manager: Annotated[ImportJobManager, Depends(get_import_job_manager)],
+    bulk: Annotated[bool, Query()] = False,
+    sync: Annotated[bool, Query()] = False,
 ):
-    try:
-        # CSV 파일 경로 설정 (프로젝트 루트에 있는 파일)
-        csv_file_path = (
-            Path(__file__).parent.parent.parent.parent / "company_tag_sample.csv"
+    # CSV 파일 경로 설정 (프로젝트 루트에 있는 파일)
+    csv_file_path = (
+        Path(__file__).parent.parent.parent.parent / "company_tag_sample.csv"
+    )
+    if not csv_file_path.exists():
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"CSV 파일을 찾을 수 없습니다: {csv_file_path}",
+        )
+    # 작업을 만들기 전에 바로 확인할 수 있는 오류는 요청에서 응답
+    if not sync and await DataInitializerService(session).is_data_already_initialized():
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="데이터가 이미 초기화되어 있습니다. 기존 데이터를 삭제한 후 다시 시도하세요.",
         )
 
-        # 데이터 초기화 서비스
-        initializer = DataInitializerService(session)
+    run = _import_runner(
+        csv_file_path,
+        bulk=bulk,
+        sync=sync,
+        session_factory=session_factory,
+        settings=settings,
+        tag_index=tag_index,
+        autocomplete_index=autocomplete_index,
+        company_repo=company_repo,
+        company_tag_mapper=company_tag_mapper,
+    )
+    try:
+        job_id = await job_manager.start(
+            run, total_rows=await asyncio.to_thread(count_csv_rows, csv_file_path)
+        )
+    except ImportJobConflictError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
 
-        # 데이터 초기화 실행
-        result = await initializer.initialize_data_from_csv(csv_file_path)
+    return {"success": True, "data": await job_manager.get(job_id)}
 
-        return {"success": True, "data": result}
 
-    except DataInitializationError as e:
+@router.post("/initialize-data/upload")
+async def upload_initialize_data(
+    request: Request,
+    session_factory: Annotated[async_sessionmaker, Depends(get_session_factory)],
+    settings: Annotated[Settings, Depends(get_settings)],
+    tag_index: Annotated[TagIndex | None, Depends(get_tag_index)],
+    autocomplete_index: Annotated[
+        AutocompleteIndex | None, Depends(get_autocomplete_index)
+    ],
+    company_repo: Annotated[CompanyRepository, Depends(get_company_repository)],
+    company_tag_mapper: Annotated[CompanyTagMapper, Depends(get_company_tag_mapper)],
+    job_manager: Annotated[ImportJobManager, Depends(get_import_job_manager)],
+    content_type: Annotated[str | None, Header()] = None,
+    sync: Annotated[bool, Query()] = False,
+):
+    """
+    요청 본문(CSV 또는 multipart 의 첫 번째 파일, gzip 가능)을 받는 대로 해제/파싱하여 가져옵니다.
+    본문을 메모리나 디스크에 모두 올리지 않으며, 가져오기는 bulk(sync=true 이면 sync) 모드로 실행합니다.
+    본문을 읽는 동안 요청이 유지되므로 작업이 끝난 뒤 작업 상태를 응답합니다.
+    """
+    chunks = request.stream()
+    try:
+        boundary = multipart_boundary(content_type)
+    except CsvUploadError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
-    except FileNotFoundError as e:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    if boundary is not None:
+        chunks = multipart_file_chunks(chunks, boundary)
+
+    if not sync:
+        # 업로드 동안 요청이 유지되므로 커넥션을 잡고 있지 않도록 짧은 세션에서 확인
+        async with session_factory() as session:
+            if await DataInitializerService(session).is_data_already_initialized():
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="데이터가 이미 초기화되어 있습니다. 기존 데이터를 삭제한 후 다시 시도하세요.",
+                )
+
+    csv_file = open_upload_stream(chunks, asyncio.get_running_loop())
+    import_csv = _import_runner(
+        csv_file,
+        bulk=not sync,
+        sync=sync,
+        session_factory=session_factory,
+        settings=settings,
+        tag_index=tag_index,
+        autocomplete_index=autocomplete_index,
+        company_repo=company_repo,
+        company_tag_mapper=company_tag_mapper,
+    )
+
+    async def run(on_progress: ProgressCallback) -> dict:
+        try:
+            return await import_csv(on_progress)
+        finally:
+            # 요청이 먼저 끝나도 읽는 스레드가 있을 수 있으므로 작업이 끝난 뒤 스레드에서 닫음
+            await asyncio.to_thread(csv_file.close)
+
+    try:
+        job_id = await job_manager.start(run)
     except Exception as e:
+        # 작업을 시작하지 못했으면 읽는 스레드가 없으므로 바로 닫음
+        csv_file.close()
+        if isinstance(e, ImportJobConflictError):
+            raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+        raise
+    # 클라이언트 연결이 끊겨 요청이 취소되면 나머지 본문을 받을 수 없으므로 작업도 취소
+    job = await job_manager.wait(job_id, cancel_on_exit=True)
+    if job is None:
+        # 작업 상태가 만료/삭제된 경우
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"데이터 초기화 중 예상치 못한 오류가 발생했습니다: {str(e)}",
+            detail=f"작업 상태를 찾을 수 없습니다: {job_id}",
         )
 
+    return {"success": job["status"] == "succeeded", "data": job}
+
+
+@router.get("/jobs/{job_id}")
+async def get_import_job(
+    job_id: str,
+    job_manager: Annotated[ImportJobManager, Depends(get_import_job_manager)],
+):
+    # 처리한 행 수, 처리량(rows/s), 남은 시간(추정), 오류/결과
+    job = await job_manager.get(job_id)
+    if job is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"작업을 찾을 수 없습니다: {job_id}",
+        )
+    return {"success": True, "data": job}
+
+
+@router.post("/jobs/{job_id}/cancel", status_code=status.HTTP_202_ACCEPTED)
+async def cancel_import_job(
+    job_id: str,
+    job_manager: Annotated[ImportJobManager, Depends(get_import_job_manager)],
+):
+    # 다른 워커에서 실행 중인 작업은 해당 워커의 heartbeat 에서 취소
+    if not await job_manager.cancel(job_id):
+        if await job_manager.get(job_id) is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"작업을 찾을 수 없습니다: {job_id}",
+            )
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"실행 중인 작업이 아닙니다: {job_id}",
+        )
+    return {"success": True, "data": await job_manager.get(job_id)}
+
 
 @router.get("/data-status")
 async def check_data_status(
@@ -62,3 +271,68 @@ async def check_data_status(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"데이터 상태 확인 중 오류가 발생했습니다: {str(e)}",
         )
+
+
+@router.get("/cache-stats")
+async def get_cache_stats(
+    local_cache: Annotated[LocalCache | None, Depends(get_local_cache)],
+    refine_stats: Annotated[
+        PartialNameRefineStats, Depends(get_partial_name_refine_stats)
+    ],
+):
+    local_cache_stats = {"enabled": False}
+    if local_cache is not None:
+        local_cache_stats = {
+            "enabled": True,
+            "size": len(local_cache),
+            **asdict(local_cache.stats),
+        }
+
+    return {
+        "local_cache": local_cache_stats,
+        # 부분 검색을 캐시된 짧은 검색어 후보로 처리한 횟수(hits) / DB 로 조회한 횟수(misses)
+        "partial_name_refine": asdict(refine_stats),
+    }
+
+
+@router.get("/tag-index-stats")
+async def get_tag_index_stats(
+    tag_index: Annotated[TagIndex | None, Depends(get_tag_index)],
+):
+    if tag_index is None:
+        return {"tag_index": {"enabled": False}}
+
+    return {"tag_index": {"enabled": True, **tag_index.memory_usage()}}
+
+
+def _accepts_gzip(accept_encoding: str | None) -> bool:
+    # "gzip", "gzip;q=0.5" 등은 허용, "gzip;q=0" 은 거부
+    for encoding in (accept_encoding or "").split(","):
+        name, _, params = encoding.partition(";")
+        if name.strip().lower() != "gzip":
+            continue
+        quality = params.strip()
+        if not quality.startswith("q="):
+            return True
+        try:
+            return float(quality[2:]) > 0
+        except ValueError:
+            return False
+    return False
+
+
+@router.get("/export")
+async def export_companies(
+    session_factory: Annotated[async_sessionmaker, Depends(get_session_factory)],
+    language_code: Annotated[str | None, Query()] = None,
+    accept_encoding: Annotated[str | None, Header()] = None,
+):
+    # 전체 회사를 한 줄에 하나씩 JSON(NDJSON)으로 스트리밍, Accept-Encoding 에 gzip 이 있으면 압축
+    exporter = DataExporterService(session_factory)
+    body = exporter.export_ndjson(language_code)
+    headers = {"Vary": "Accept-Encoding"}
+    if _accepts_gzip(accept_encoding):
+        body = gzip_chunks(body)
+        headers["Content-Encoding"] = "gzip"
+
+    return StreamingResponse(body, media_type="application/x-ndjson", headers=headers)
@@ -1,11 +1,22 @@
-from typing import Annotated
+from typing import Annotated, Awaitable
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 
 from app.api.deps import WantedLanguage, get_company_service
+from app.cache.keys import (
+    company_name_cache_key,
+    company_partial_name_cache_key,
+    company_tags_cache_key,
+    page_cache_field,
+)
+from app.cache.response_cache import ResponseCache, get_response_cache
+from app.core.config import Settings, get_settings
+from app.core.constants import SearchMode, TagMatchMode
+from app.core.pagination import InvalidCursorError
 from app.dto.company_dto import (
     CompanyDto,
     CompanyNameDto,
+    CompanySearchResultPageDto,
     CompanyTagDto,
     CompanyTagNameDto,
 )
@@ -15,20 +26,136 @@ from app.schemas.company import (
     CompanyTagRequest,
     CreateCompanyRequest,
     SearchedCompanyResponse,
+    render_company_response,
+    render_searched_companies_response,
 )
 
 router = APIRouter(tags=["Company"])
 
+# 다음 페이지 커서는 헤더로 전달하여 응답 본문(목록) 형식을 유지
+NEXT_CURSOR_HEADER = "x-next-cursor"
+
+# 조회 API 는 response_model 검증 없이 DTO 를 바로 직렬화 (response_model 은 OpenAPI 용)
+
+
+def _json_response(body: bytes, next_cursor: str | None = None) -> Response:
+    headers = {NEXT_CURSOR_HEADER: next_cursor} if next_cursor else None
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+async def _get_cached_response(
+    response_cache: ResponseCache | None, cache_key: str, field: str
+) -> tuple[Response | None, bytes]:
+    # (캐시된 응답, 응답 버전), 캐시가 없으면 데이터를 읽기 전의 버전을 저장할 때 넘김
+    if response_cache is None:
+        return None, b""
+    cached, version = await response_cache.get(cache_key, field)
+    if cached:
+        return _json_response(cached.body, cached.next_cursor), version
+    return None, version
+
+
+async def _cache_response(
+    response_cache: ResponseCache | None,
+    cache_key: str,
+    field: str,
+    body: bytes,
+    version: bytes,
+    ttl: int | None = None,
+    next_cursor: str | None = None,
+) -> Response:
+    if response_cache is not None:
+        await response_cache.set(
+            cache_key, field, body, version, ttl=ttl, next_cursor=next_cursor
+        )
+    return _json_response(body, next_cursor)
+
+
+async def _get_page(
+    load: Awaitable[CompanySearchResultPageDto],
+) -> CompanySearchResultPageDto:
+    try:
+        return await load
+    except InvalidCursorError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor"
+        )
+
+
+async def _cache_page_response(
+    response_cache: ResponseCache | None,
+    cache_key: str,
+    field: str,
+    page: CompanySearchResultPageDto,
+    version: bytes,
+    ttl: int | None = None,
+) -> Response:
+    return await _cache_response(
+        response_cache,
+        cache_key,
+        field,
+        render_searched_companies_response(page.items),
+        version,
+        ttl=ttl,
+        next_cursor=page.next_cursor,
+    )
+
 
 @router.get("/search", response_model=list[SearchedCompanyResponse])
 async def search_companies(
     query: Annotated[str, Query()],
     language_code: WantedLanguage,
     company_service: Annotated[ICompanyService, Depends(get_company_service)],
+    response_cache: Annotated[ResponseCache | None, Depends(get_response_cache)],
+    settings: Annotated[Settings, Depends(get_settings)],
+    limit: Annotated[int | None, Query(ge=1)] = None,
+    cursor: Annotated[str | None, Query()] = None,
+    language_only: Annotated[bool, Query()] = False,
+    mode: Annotated[SearchMode, Query()] = SearchMode.NAME,
+    fuzzy: Annotated[bool, Query()] = False,
 ):
-    return await company_service.get_by_partial_name(
-        partial_name=query, language_code=language_code
+    cache_key = company_partial_name_cache_key(
+        query, language_code if language_only else None, mode, fuzzy
     )
+    field = f"{language_code}:{page_cache_field(limit, cursor)}"
+    cached, version = await _get_cached_response(response_cache, cache_key, field)
+    if cached:
+        return cached
+
+    page = await _get_page(
+        company_service.get_by_partial_name(
+            partial_name=query,
+            language_code=language_code,
+            limit=limit,
+            cursor=cursor,
+            language_only=language_only,
+            mode=mode,
+            fuzzy=fuzzy,
+        )
+    )
+    # 부분 검색은 무효화되지 않으므로 리포지토리 캐시와 같은 짧은 TTL 사용
+    return await _cache_page_response(
+        response_cache,
+        cache_key,
+        field,
+        page,
+        version,
+        ttl=settings.REPOSITORY_CACHE_PARTIAL_TTL,
+    )
+
+
+@router.get("/autocomplete", response_model=list[SearchedCompanyResponse])
+async def autocomplete_companies(
+    query: Annotated[str, Query()],
+    language_code: WantedLanguage,
+    company_service: Annotated[ICompanyService, Depends(get_company_service)],
+    limit: Annotated[int, Query(ge=1, le=50)] = 10,
+):
+    # 키 입력마다 호출되므로 DB/Redis 를 거치지 않는 메모리 인덱스에서 조회
+    companies = await company_service.autocomplete(
+        query=query, language_code=language_code, limit=limit
+    )
+    return _json_response(render_searched_companies_response(companies))
 
 
 @router.post("/companies", response_model=CompanyResponse)
@@ -62,7 +189,15 @@ async def get_company(
     company_name: str,
     language_code: WantedLanguage,
     company_service: Annotated[ICompanyService, Depends(get_company_service)],
+    response_cache: Annotated[ResponseCache | None, Depends(get_response_cache)],
 ):
+    cache_key = company_name_cache_key(company_name)
+    cached, version = await _get_cached_response(
+        response_cache, cache_key, language_code
+    )
+    if cached:
+        return cached
+
     company = await company_service.get_by_name(
         name=company_name, language_code=language_code
     )
@@ -70,7 +205,13 @@ async def get_company(
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
         )
-    return company
+    return await _cache_response(
+        response_cache,
+        cache_key,
+        language_code,
+        render_company_response(company),
+        version,
+    )
 
 
 @router.put("/companies/{company_name}/tags", response_model=CompanyResponse)
@@ -120,8 +261,28 @@ async def remove_tag_from_company(
 
 @router.get("/tags", response_model=list[SearchedCompanyResponse])
 async def get_companies_by_tag(
-    query: Annotated[str, Query()],
+    query: Annotated[list[str], Query()],
     language_code: WantedLanguage,
     company_service: Annotated[ICompanyService, Depends(get_company_service)],
+    response_cache: Annotated[ResponseCache | None, Depends(get_response_cache)],
+    mode: Annotated[TagMatchMode, Query()] = TagMatchMode.ANY,
+    limit: Annotated[int | None, Query(ge=1)] = None,
+    cursor: Annotated[str | None, Query()] = None,
 ):
-    return await company_service.get_by_tag(tag=query, language_code=language_code)
+    # query 를 여러 번 전달하면 mode(all/any)에 따라 태그 조합으로 검색
+    cache_key = company_tags_cache_key(query, mode)
+    field = f"{language_code}:{page_cache_field(limit, cursor)}"
+    cached, version = await _get_cached_response(response_cache, cache_key, field)
+    if cached:
+        return cached
+
+    page = await _get_page(
+        company_service.get_by_tags(
+            tags=query,
+            language_code=language_code,
+            mode=mode,
+            limit=limit,
+            cursor=cursor,
+        )
+    )
+    return await _cache_page_response(response_cache, cache_key, field, page, version)
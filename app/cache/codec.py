@@ -0,0 +1,74 @@
+import json
+from functools import cache
+from typing import Any, Protocol
+
+
+class CacheCodecError(Exception):
+    pass
+
+
+class CacheCodec(Protocol):
+    name: str
+
+    def dumps(self, data: Any) -> bytes: ...
+
+    def loads(self, payload: bytes) -> Any: ...
+
+
+class JsonCodec:
+    name = "json"
+
+    def dumps(self, data: Any) -> bytes:
+        return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode()
+
+    def loads(self, payload: bytes) -> Any:
+        return json.loads(payload)
+
+
+class OrjsonCodec:
+    name = "orjson"
+
+    def __init__(self):
+        import orjson
+
+        self._orjson = orjson
+
+    def dumps(self, data: Any) -> bytes:
+        return self._orjson.dumps(data)
+
+    def loads(self, payload: bytes) -> Any:
+        return self._orjson.loads(payload)
+
+
+class MsgpackCodec:
+    name = "msgpack"
+
+    def __init__(self):
+        import msgpack
+
+        self._msgpack = msgpack
+
+    def dumps(self, data: Any) -> bytes:
+        return self._msgpack.packb(data, use_bin_type=True)
+
+    def loads(self, payload: bytes) -> Any:
+        return self._msgpack.unpackb(payload, raw=False)
+
+
+_CODECS: dict[str, type[CacheCodec]] = {
+    JsonCodec.name: JsonCodec,
+    OrjsonCodec.name: OrjsonCodec,
+    MsgpackCodec.name: MsgpackCodec,
+}
+
+
+@cache
+def get_cache_codec(name: str) -> CacheCodec:
+    # orjson/msgpack 은 선택 의존성이므로 사용할 때만 import
+    codec_class = _CODECS.get(name)
+    if codec_class is None:
+        raise CacheCodecError(f"Unknown cache codec: {name}")
+    try:
+        return codec_class()
+    except ImportError as e:
+        raise CacheCodecError(f"Cache codec {name} is not installed: {e}") from e
@@ -0,0 +1,67 @@
+import time
+from dataclasses import dataclass
+
+# 캐시 항목 형식 버전, 형식이 바뀌면 올려서 이전/이후 버전 워커가 서로의 항목을 건너뛰도록 함
+CACHE_FORMAT_VERSION = 2
+_VERSION_PREFIX = f"v{CACHE_FORMAT_VERSION}".encode()
+
+
+@dataclass(frozen=True, slots=True)
+class CacheTTL:
+    # hard: Redis 만료 시간, soft: 지나면 기존 값을 응답하면서 백그라운드에서 갱신 (0 이면 사용 안 함)
+    hard: int
+    soft: int = 0
+
+    @property
+    def stale_while_revalidate(self) -> bool:
+        return 0 < self.soft < self.hard
+
+
+@dataclass(frozen=True, slots=True)
+class CacheEntry:
+    # codec 이 None 이면 버전 prefix 가 없던 이전 형식(dict JSON)
+    payload: bytes
+    codec: str | None = None
+    soft_expires_at: int | None = None
+
+
+def pack_cache_entry(
+    payload: bytes, codec: str, ttl: CacheTTL, now: float | None = None
+) -> bytes:
+    # v2|<codec>|<soft 만료 시각 또는 빈 값>|<payload>
+    soft_expires_at = b""
+    if ttl.stale_while_revalidate:
+        now = time.time() if now is None else now
+        soft_expires_at = str(int(now + ttl.soft)).encode()
+    return b"|".join((_VERSION_PREFIX, codec.encode(), soft_expires_at, payload))
+
+
+def unpack_cache_entry(raw: str | bytes) -> CacheEntry | None:
+    # 알 수 없는 형식은 None (캐시 미스로 처리하여 다시 적재)
+    if isinstance(raw, str):
+        raw = raw.encode("utf-8")
+
+    if raw[:1] == b"v":
+        parts = raw.split(b"|", 3)
+        if len(parts) != 4 or parts[0] != _VERSION_PREFIX:
+            return None
+        _, codec, soft_expires_at, payload = parts
+        return CacheEntry(
+            payload=payload,
+            codec=codec.decode(),
+            soft_expires_at=int(soft_expires_at) if soft_expires_at else None,
+        )
+
+    # 버전 prefix 도입 전 형식: JSON 또는 "<soft 만료 시각>|JSON"
+    if raw[:1].isdigit():
+        soft_expires_at, _, payload = raw.partition(b"|")
+        return CacheEntry(payload=payload, soft_expires_at=int(soft_expires_at))
+    if raw[:1] in (b"{", b"["):
+        return CacheEntry(payload=raw)
+    return None
+
+
+def is_stale(soft_expires_at: int | None, now: float | None = None) -> bool:
+    if soft_expires_at is None:
+        return False
+    return soft_expires_at <= (time.time() if now is None else now)
@@ -0,0 +1,37 @@
+import json
+
+from redis.asyncio import Redis
+
+from app.cache.local_cache import LocalCache
+from app.cache.pubsub import ChannelSubscriber
+
+INVALIDATION_CHANNEL = "cache:invalidate"
+
+
+async def publish_invalidation(redis_client: Redis, keys: list[str]) -> None:
+    if keys:
+        await redis_client.publish(INVALIDATION_CHANNEL, json.dumps(keys))
+
+
+class CacheInvalidationSubscriber(ChannelSubscriber):
+    """
+    다른 워커가 발행한 무효화 메시지를 받아 로컬 캐시에서 키를 제거합니다.
+    연결이 끊기면 그동안 놓친 메시지가 있을 수 있으므로 로컬 캐시를 비우고 재구독합니다.
+    """
+
+    channel = INVALIDATION_CHANNEL
+
+    def __init__(
+        self,
+        redis_client: Redis,
+        local_cache: LocalCache,
+        retry_interval: float = 1.0,
+    ):
+        super().__init__(redis_client, retry_interval)
+        self._local_cache = local_cache
+
+    def handle(self, data: list[str]) -> None:
+        self._local_cache.delete(*data)
+
+    async def on_reconnect(self) -> None:
+        self._local_cache.clear()
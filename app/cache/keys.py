@@ -0,0 +1,62 @@
+import json
+
+# 리포지토리 캐시 키, 응답 캐시도 같은 키를 기준으로 저장/무효화
+COMPANY_CACHE_NAMESPACE = "repository:company"
+RESPONSE_CACHE_NAMESPACE = "response"
+
+
+def company_name_cache_key(name: str) -> str:
+    return f"{COMPANY_CACHE_NAMESPACE}:name:{name}"
+
+
+# 태그/부분 검색 결과는 페이지별로 하나의 hash(field: page_cache_field)에 저장
+def company_tag_cache_key(tag: str) -> str:
+    return f"{COMPANY_CACHE_NAMESPACE}:tag_pages:{tag}"
+
+
+def company_partial_name_cache_key(
+    partial_name: str,
+    language_code: str | None = None,
+    mode: str = "name",
+    fuzzy: bool = False,
+) -> str:
+    # language_code 가 없으면 모든 언어 검색 ("*"), fuzzy 검색은 "<mode>+fuzzy"
+    scope = language_code or "*"
+    if fuzzy:
+        mode = f"{mode}+fuzzy"
+    return f"{COMPANY_CACHE_NAMESPACE}:partial_name_pages:{mode}:{scope}:{partial_name}"
+
+
+def company_partial_name_candidates_key(
+    partial_name: str, language_code: str | None = None, mode: str = "name"
+) -> str:
+    # 결과가 작은 부분 검색의 전체 후보, 더 긴 검색어는 이 후보를 메모리에서 필터링
+    scope = language_code or "*"
+    return f"{COMPANY_CACHE_NAMESPACE}:partial_name_candidates:{mode}:{scope}:{partial_name}"
+
+
+def company_tags_cache_key(tags: list[str], mode: str) -> str:
+    # 태그 순서/중복과 무관하게 같은 키가 되도록 정렬, 태그가 하나면 단일 태그 키와 같음
+    tags = sorted(set(tags))
+    if len(tags) == 1:
+        return company_tag_cache_key(tags[0])
+    canonical = json.dumps(tags, ensure_ascii=False, separators=(",", ":"))
+    return f"{COMPANY_CACHE_NAMESPACE}:tag_combination_pages:{mode}:{canonical}"
+
+
+def company_tag_combinations_index_key(tag: str) -> str:
+    # 태그가 포함된 다중 태그 캐시 키 목록 (태그 변경 시 함께 무효화)
+    return f"{COMPANY_CACHE_NAMESPACE}:tag_combinations:{tag}"
+
+
+def page_cache_field(limit: int | None, cursor: str | None) -> str:
+    return f"{limit or ''}:{cursor or ''}"
+
+
+def response_cache_key(cache_key: str) -> str:
+    return f"{RESPONSE_CACHE_NAMESPACE}:{cache_key}"
+
+
+def response_version_key(cache_key: str) -> str:
+    # 무효화마다 증가하는 응답 버전 (응답 hash 와 달리 무효화해도 삭제하지 않음)
+    return f"{RESPONSE_CACHE_NAMESPACE}:version:{cache_key}"
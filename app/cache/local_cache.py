@@ -0,0 +1,87 @@
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from fastapi import Request
+
+
+@dataclass(slots=True)
+class LocalCacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    invalidations: int = 0
+
+
+class LocalCache:
+    """
+    워커 프로세스 내부의 LRU + TTL 캐시 (Redis 앞단 L1)
+    값은 공유되므로 불변 객체(frozen dataclass 등)만 저장해야 합니다.
+    """
+
+    def __init__(
+        self,
+        max_size: int,
+        ttl: float,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if max_size <= 0:
+            raise ValueError("max_size must be positive")
+        self._max_size = max_size
+        self._ttl = ttl
+        self._clock = clock
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._generation = 0
+        self.stats = LocalCacheStats()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def generation(self) -> int:
+        # 무효화가 일어날 때마다 증가. 조회 시작 시점 값을 set 에 넘겨
+        # 조회 도중 무효화된 값이 다시 채워지는 것을 막는다
+        return self._generation
+
+    def get(self, key: str) -> Any | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.stats.misses += 1
+            return None
+
+        expires_at, value = entry
+        if expires_at <= self._clock():
+            del self._entries[key]
+            self.stats.expirations += 1
+            self.stats.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.stats.hits += 1
+        return value
+
+    def set(self, key: str, value: Any, generation: int | None = None) -> None:
+        if generation is not None and generation != self._generation:
+            return
+
+        self._entries[key] = (self._clock() + self._ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+            self.stats.evictions += 1
+
+    def delete(self, *keys: str) -> None:
+        self._generation += 1
+        for key in keys:
+            if self._entries.pop(key, None) is not None:
+                self.stats.invalidations += 1
+
+    def clear(self) -> None:
+        self._generation += 1
+        self._entries.clear()
+
+
+def get_local_cache(request: Request) -> LocalCache | None:
+    return request.app.state.local_cache
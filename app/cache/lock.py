@@ -0,0 +1,24 @@
+from redis.asyncio import Redis
+
+# 락 값(토큰)이 일치할 때만 삭제/연장, GET 과 DEL/PEXPIRE 사이에 락이 만료되어
+# 다른 워커가 잡은 락을 건드리지 않도록 한 번에 실행
+_RELEASE_LOCK_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+_EXTEND_LOCK_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('pexpire', KEYS[1], ARGV[2])
+end
+return 0
+"""
+
+
+async def release_lock(redis_client: Redis, key: str, token: str) -> bool:
+    return bool(await redis_client.eval(_RELEASE_LOCK_SCRIPT, 1, key, token))
+
+
+async def extend_lock(redis_client: Redis, key: str, token: str, ttl_ms: int) -> bool:
+    return bool(await redis_client.eval(_EXTEND_LOCK_SCRIPT, 1, key, token, ttl_ms))
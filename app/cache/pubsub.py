@@ -0,0 +1,83 @@
+import asyncio
+import json
+import logging
+from typing import Any
+
+from redis.asyncio import Redis
+
+logger = logging.getLogger(__name__)
+
+
+class ChannelSubscriber:
+    """
+    Redis 채널을 구독하여 JSON 메시지를 handle 로 전달합니다.
+    연결이 끊기면 그동안 놓친 메시지가 있을 수 있으므로 on_reconnect 를 호출한 뒤 재구독합니다.
+    """
+
+    channel: str
+
+    def __init__(self, redis_client: Redis, retry_interval: float = 1.0):
+        self._redis = redis_client
+        self._retry_interval = retry_interval
+        self._task: asyncio.Task | None = None
+
+    def handle(self, data: Any) -> None:
+        raise NotImplementedError
+
+    async def on_reconnect(self) -> None:
+        pass
+
+    async def start(self) -> None:
+        pubsub = await self._subscribe()
+        self._task = asyncio.create_task(self._run(pubsub))
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _subscribe(self):
+        pubsub = self._redis.pubsub(ignore_subscribe_messages=True)
+        await pubsub.subscribe(self.channel)
+        return pubsub
+
+    async def _run(self, pubsub) -> None:
+        try:
+            while True:
+                try:
+                    async for message in pubsub.listen():
+                        self._handle(message)
+                except Exception as e:
+                    logger.warning(f"Subscriber for {self.channel} disconnected: {e}")
+
+                await pubsub.aclose()
+                try:
+                    await self.on_reconnect()
+                except Exception as e:
+                    logger.warning(f"Reconnect handler for {self.channel} failed: {e}")
+                pubsub = await self._resubscribe()
+        finally:
+            await pubsub.aclose()
+
+    async def _resubscribe(self):
+        while True:
+            await asyncio.sleep(self._retry_interval)
+            try:
+                return await self._subscribe()
+            except Exception as e:
+                logger.warning(f"Resubscribe to {self.channel} failed: {e}")
+
+    def _handle(self, message: dict) -> None:
+        if message.get("type") != "message":
+            return
+        try:
+            data = json.loads(message["data"])
+        except (TypeError, ValueError):
+            logger.warning(f"Invalid message on {self.channel}: {message!r}")
+            return
+        self.handle(data)
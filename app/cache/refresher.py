@@ -0,0 +1,68 @@
+import asyncio
+import logging
+from typing import Awaitable, Callable
+
+from fastapi import Request
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+logger = logging.getLogger(__name__)
+
+RefreshFn = Callable[[AsyncSession], Awaitable[object]]
+
+
+class CacheRefresher:
+    """
+    stale 캐시 항목을 요청과 분리된 백그라운드 태스크에서 갱신합니다.
+    동시 갱신 수(max_concurrency)와 대기 중인 갱신 수(max_pending)를 제한하여
+    stale 키가 몰려도 DB 커넥션 풀을 모두 점유하지 않도록 합니다.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        max_concurrency: int,
+        max_pending: int,
+    ):
+        self._session_factory = session_factory
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._max_pending = max_pending
+        self._pending: dict[str, asyncio.Task] = {}
+        self.dropped = 0
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def schedule(self, key: str, refresh: RefreshFn) -> bool:
+        if key in self._pending:
+            return False
+        if len(self._pending) >= self._max_pending:
+            # 갱신하지 못한 항목은 hard TTL 까지 stale 값으로 응답
+            self.dropped += 1
+            return False
+
+        self._pending[key] = asyncio.create_task(self._run(key, refresh))
+        return True
+
+    async def _run(self, key: str, refresh: RefreshFn) -> None:
+        try:
+            async with self._semaphore:
+                async with self._session_factory() as session:
+                    await refresh(session)
+        except Exception as e:
+            logger.warning(f"Failed to refresh cache key {key}: {e}")
+        finally:
+            self._pending.pop(key, None)
+
+    async def join(self) -> None:
+        while self._pending:
+            await asyncio.gather(*self._pending.values(), return_exceptions=True)
+
+    async def close(self) -> None:
+        tasks = list(self._pending.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def get_cache_refresher(request: Request) -> CacheRefresher:
+    return request.app.state.cache_refresher
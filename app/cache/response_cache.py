@@ -0,0 +1,127 @@
+from dataclasses import dataclass
+from typing import Annotated
+
+from fastapi import Depends
+from redis.asyncio import Redis
+from redis.asyncio.client import Pipeline
+
+from app.cache.keys import response_cache_key, response_version_key
+from app.core.config import Settings, get_settings
+from app.db.redis import get_redis_client
+
+# 응답 field 는 "<언어>:<페이지>" 이므로 모든 언어에서 해당 페이지의 응답만 삭제
+_DELETE_PAGE_RESPONSES_SCRIPT = """
+local suffix = ':' .. ARGV[1]
+for _, field in ipairs(redis.call('hkeys', KEYS[1])) do
+    if string.sub(field, -string.len(suffix)) == suffix then
+        redis.call('hdel', KEYS[1], field)
+    end
+end
+return 0
+"""
+
+
+# 조회 전에 읽은 버전이 그대로일 때만 저장, 조회 도중 무효화되면 이전 데이터로 만든 응답을 버림
+# (첫 언어가 저장될 때의 만료 시간을 유지)
+_SET_RESPONSE_SCRIPT = """
+if (redis.call('get', KEYS[2]) or '') ~= ARGV[4] then
+    return 0
+end
+redis.call('hset', KEYS[1], ARGV[1], ARGV[2])
+if redis.call('ttl', KEYS[1]) < 0 then
+    redis.call('expire', KEYS[1], ARGV[3])
+end
+return 1
+"""
+
+# 버전 키 만료 시간, 요청 처리 시간보다 충분히 길면 됨
+RESPONSE_VERSION_TTL = 60 * 60
+
+
+@dataclass(frozen=True, slots=True)
+class CachedResponse:
+    body: bytes
+    next_cursor: str | None = None
+
+
+class ResponseCache:
+    """
+    언어별로 렌더링된 최종 응답 바이트를 저장합니다.
+    리포지토리 캐시 키마다 하나의 Redis hash(field: x-wanted-language[:페이지])를 사용하므로
+    리포지토리 키가 무효화되면 모든 언어/페이지의 응답이 함께 제거됩니다.
+    페이지 응답은 "<next_cursor>\n<body>" 로 저장합니다 (compact JSON 본문에는 개행이 없음).
+    캐시가 없으면 get 이 함께 반환한 버전을 set 에 넘겨, 그 사이 무효화되었으면 저장하지 않습니다.
+    """
+
+    def __init__(self, redis_client: Redis, ttl: int):
+        self._redis = redis_client
+        self._ttl = ttl
+
+    async def get(
+        self, cache_key: str, field: str
+    ) -> tuple[CachedResponse | None, bytes]:
+        # (캐시된 응답, 현재 버전)
+        async with self._redis.pipeline(transaction=False) as pipe:
+            pipe.hget(response_cache_key(cache_key), field)
+            pipe.get(response_version_key(cache_key))
+            value, version = await pipe.execute()
+        version = version or b""
+        if value is None:
+            return None, version
+        next_cursor, sep, body = value.partition(b"\n")
+        if not sep:
+            return CachedResponse(body=value), version
+        return (
+            CachedResponse(body=body, next_cursor=next_cursor.decode() or None),
+            version,
+        )
+
+    async def set(
+        self,
+        cache_key: str,
+        field: str,
+        body: bytes,
+        version: bytes,
+        ttl: int | None = None,
+        next_cursor: str | None = None,
+    ) -> bool:
+        # 저장하지 않았으면(get 이후 무효화됨) False
+        if next_cursor is not None:
+            body = next_cursor.encode() + b"\n" + body
+        return bool(
+            await self._redis.eval(
+                _SET_RESPONSE_SCRIPT,
+                2,
+                response_cache_key(cache_key),
+                response_version_key(cache_key),
+                field,
+                body,
+                min(self._ttl, ttl or self._ttl),
+                version,
+            )
+        )
+
+
+def delete_page_responses(pipe: Pipeline, cache_key: str, page_field: str) -> None:
+    # 페이지 하나가 다시 적재되면 같은 키의 다른 페이지 응답은 유지
+    pipe.eval(
+        _DELETE_PAGE_RESPONSES_SCRIPT, 1, response_cache_key(cache_key), page_field
+    )
+
+
+def invalidate_responses(pipe: Pipeline, cache_keys: list[str]) -> None:
+    # 응답을 삭제하고 버전을 올려, 무효화 전에 조회를 시작한 요청이 응답을 다시 저장하지 않도록 함
+    for cache_key in cache_keys:
+        version_key = response_version_key(cache_key)
+        pipe.delete(response_cache_key(cache_key))
+        pipe.incr(version_key)
+        pipe.expire(version_key, RESPONSE_VERSION_TTL)
+
+
+def get_response_cache(
+    redis_client: Annotated[Redis, Depends(get_redis_client)],
+    settings: Annotated[Settings, Depends(get_settings)],
+) -> ResponseCache | None:
+    if not settings.RESPONSE_CACHE_ENABLED:
+        return None
+    return ResponseCache(redis_client, ttl=settings.RESPONSE_CACHE_TTL)
@@ -0,0 +1,49 @@
+import asyncio
+from typing import Awaitable, Callable, TypeVar
+
+from fastapi import Request
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """
+    같은 키에 대한 동시 호출을 하나로 합칩니다.
+    먼저 들어온 호출(leader)만 fn 을 실행하고, 나머지는 그 결과(또는 예외)를 함께 받습니다.
+    """
+
+    def __init__(self):
+        self._calls: dict[str, asyncio.Future] = {}
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        while (future := self._calls.get(key)) is not None:
+            try:
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                # leader 가 취소된 경우에는 직접 다시 시도
+                if not future.cancelled() or asyncio.current_task().cancelling():
+                    raise
+
+        future = asyncio.get_running_loop().create_future()
+        self._calls[key] = future
+        try:
+            result = await fn()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # 대기자가 없어도 경고가 남지 않도록 소비
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            del self._calls[key]
+
+
+def get_single_flight(request: Request) -> SingleFlight:
+    return request.app.state.single_flight
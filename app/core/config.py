@@ -1,4 +1,5 @@
 from functools import lru_cache
+from typing import Literal
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -18,6 +19,7 @@ class Settings(BaseSettings):
     DATABASE_URL: str
     DATABASE_SCHEMA: str = "public"
     DATABASE_POOL_SIZE: int = 10
+    DATABASE_POOL_MIN_SIZE: int = 5  # 앱 시작 시 미리 열어둘 커넥션 수
     DATABASE_MAX_OVERFLOW: int = 20
     DATABASE_POOL_TIMEOUT: int = 30
     DATABASE_POOL_RECYCLE: int = 1800
@@ -29,10 +31,63 @@ class Settings(BaseSettings):
     REDIS_DB: int = 0
     REDIS_PASSWORD: str
     REDIS_MAX_CONNECTIONS: int = 100
+    REDIS_POOL_TIMEOUT: float = 5.0  # 풀의 커넥션이 모두 사용 중일 때 대기 시간
+    REDIS_SOCKET_TIMEOUT: float = 5.0
+    REDIS_SOCKET_CONNECT_TIMEOUT: float = 5.0
 
     # Cache settings
     REPOSITORY_CACHE_TTL: int = 60 * 60 * 12  # 12 hours
     REPOSITORY_CACHE_PARTIAL_TTL: int = 60  # 1 minute, 부분 검색용 캐시 TTL
+    # 부분 검색에서 일치한 회사명이 이 수 이하이면 후보 전체를 캐시하고,
+    # 이어서 입력된 더 긴 검색어는 DB 대신 캐시된 후보를 필터링 (0 이면 비활성화)
+    REPOSITORY_CACHE_PARTIAL_REFINE_MAX_SIZE: int = 200
+    # 캐시 직렬화 포맷, orjson/msgpack 은 해당 패키지 설치 필요
+    REPOSITORY_CACHE_CODEC: Literal["json", "orjson", "msgpack"] = "json"
+    # namespace(name/tag) 별 hard TTL, None 이면 REPOSITORY_CACHE_TTL 사용
+    REPOSITORY_CACHE_NAME_TTL: int | None = None
+    REPOSITORY_CACHE_TAG_TTL: int | None = None
+    # Stale-while-revalidate: soft TTL 이 지난 항목은 기존 값을 바로 응답하고 백그라운드에서 갱신
+    # 0 이면 비활성화 (hard TTL 까지 그대로 사용)
+    REPOSITORY_CACHE_NAME_SOFT_TTL: int = 0
+    REPOSITORY_CACHE_TAG_SOFT_TTL: int = 0
+    # 백그라운드 갱신이 DB 커넥션 풀을 점유하지 않도록 동시 실행/대기 수 제한
+    REPOSITORY_CACHE_REFRESH_CONCURRENCY: int = 2
+    REPOSITORY_CACHE_REFRESH_MAX_PENDING: int = 100
+    # 캐시 미스 시 워커 간 중복 DB 조회를 막는 Redis 락 (워커 내부는 항상 single-flight)
+    REPOSITORY_CACHE_LOCK_ENABLED: bool = False
+    REPOSITORY_CACHE_LOCK_TTL_MS: int = 3000
+    REPOSITORY_CACHE_LOCK_POLL_INTERVAL_MS: int = 50
+
+    # 언어별 최종 응답 바이트 캐시, 리포지토리 캐시와 같은 이벤트로 무효화
+    RESPONSE_CACHE_ENABLED: bool = False
+    RESPONSE_CACHE_TTL: int = 60 * 10  # 10 minutes
+
+    # /search, /tags keyset 페이지네이션, 요청한 limit 은 최대 페이지 크기로 제한
+    SEARCH_PAGE_SIZE: int = 20
+    SEARCH_MAX_PAGE_SIZE: int = 100
+    # /search?fuzzy=true: pg_trgm similarity/word_similarity 가 임계값 이상인 회사명도 포함
+    # 오타 허용으로 추가되는 회사명은 유사도 상위 최대 개수까지만 순위 계산 (지연 시간 상한)
+    SEARCH_FUZZY_THRESHOLD: float = 0.3
+    SEARCH_FUZZY_MAX_CANDIDATES: int = 200
+
+    # 자동완성 prefix 인덱스 (워커 메모리), 비활성화 시 부분 검색으로 대체
+    AUTOCOMPLETE_INDEX_ENABLED: bool = True
+
+    # 태그 -> 회사 비트맵 인덱스 (워커 메모리), 활성화 시 /tags 조회를 DB 대신 인덱스에서 처리
+    TAG_INDEX_ENABLED: bool = False
+
+    # POST /admin/initialize-data?bulk=true: CSV 파싱 스레드 / DB writer 수, writer 를 기다리는 청크 수(backpressure)
+    # writer 마다 커넥션을 하나씩 사용하므로 DATABASE_POOL_SIZE 보다 작게 설정
+    DATA_IMPORT_PARALLELISM: int = 4
+    DATA_IMPORT_QUEUE_SIZE: int = 8
+    # 가져오기는 백그라운드 작업으로 실행, 워커 간 하나만 실행하도록 Redis 락 사용 (heartbeat 마다 연장)
+    DATA_IMPORT_LOCK_TTL: int = 60  # seconds, 워커가 종료되면 이 시간 후 락 해제
+    DATA_IMPORT_JOB_TTL: int = 60 * 60 * 24  # 1 day, 작업 상태 보관 기간
+
+    # Local(L1) cache settings, 워커 프로세스 메모리 캐시
+    LOCAL_CACHE_ENABLED: bool = True
+    LOCAL_CACHE_MAX_SIZE: int = 1000
+    LOCAL_CACHE_TTL: int = 60  # 워커 간 무효화 메시지 유실 대비 짧은 TTL
 
 
 @lru_cache
@@ -1,4 +1,5 @@
 import os
+from enum import StrEnum
 from pathlib import Path
 
 ROOT_PATH = Path(__file__).resolve().parents[2]
@@ -11,6 +12,16 @@ class EnvConstants:
     PROD = "prod"
 
 
+class TagMatchMode(StrEnum):
+    ALL = "all"  # 모든 태그를 가진 회사
+    ANY = "any"  # 하나 이상의 태그를 가진 회사
+
+
+class SearchMode(StrEnum):
+    NAME = "name"  # 회사명 부분 일치
+    NORMALIZED = "normalized"  # 정규화 키(NFKC, casefold, 초성, 가나) 부분 일치
+
+
 def get_env_file(env: EnvConstants | None = None) -> str:
     if env is None:
         env = os.getenv("APP_ENV", EnvConstants.DEV)
@@ -0,0 +1,22 @@
+import base64
+import binascii
+import json
+
+
+class InvalidCursorError(ValueError):
+    pass
+
+
+# keyset 페이지네이션 커서: 마지막 항목의 정렬 키를 클라이언트가 해석하지 않도록 인코딩
+def encode_cursor(position: object) -> str:
+    raw = json.dumps([position], separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str) -> object:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        (position,) = json.loads(raw)
+    except (binascii.Error, UnicodeDecodeError, ValueError, TypeError) as e:
+        raise InvalidCursorError(f"Invalid cursor: {cursor}") from e
+    return position
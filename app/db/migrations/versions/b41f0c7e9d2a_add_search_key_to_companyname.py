@@ -0,0 +1,102 @@
+"""add search_key to CompanyName
+
+Revision ID: b41f0c7e9d2a
+Revises: 7a3e5d91c2b4
+Create Date: 2026-10-18 11:04:27.902315
+
+"""
+
+import unicodedata
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b41f0c7e9d2a"
+down_revision: Union[str, None] = "7a3e5d91c2b4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BACKFILL_BATCH_SIZE = 1000
+
+# 이 리비전 시점의 app.search.normalize.build_search_key 사본
+# (이후 정규화 규칙이 바뀌어도 이 마이그레이션의 결과는 바뀌지 않도록 고정)
+_CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+_HANGUL_FIRST, _HANGUL_LAST = 0xAC00, 0xD7A3
+_SYLLABLES_PER_CHOSEONG = 21 * 28
+_KATAKANA_FIRST, _KATAKANA_LAST = 0x30A1, 0x30F6
+_KANA_OFFSET = 0x60
+_SEARCH_KEY_SEPARATOR = "\n"
+
+
+def _normalize_search_text(value: str) -> str:
+    value = unicodedata.normalize("NFKC", value).casefold()
+    return "".join(
+        chr(ord(char) - _KANA_OFFSET)
+        if _KATAKANA_FIRST <= ord(char) <= _KATAKANA_LAST
+        else char
+        for char in value
+    )
+
+
+def _hangul_choseong(value: str) -> str:
+    return "".join(
+        _CHOSEONG[(ord(char) - _HANGUL_FIRST) // _SYLLABLES_PER_CHOSEONG]
+        if _HANGUL_FIRST <= ord(char) <= _HANGUL_LAST
+        else char
+        for char in value
+    )
+
+
+def _build_search_key(name: str) -> str:
+    normalized = _normalize_search_text(name)
+    forms = [normalized]
+    choseong = _normalize_search_text(_hangul_choseong(normalized))
+    if choseong != normalized:
+        forms.append(choseong)
+    return _SEARCH_KEY_SEPARATOR.join(forms)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column("company_names", sa.Column("search_key", sa.String(), nullable=True))
+
+    # 기존 회사명의 검색 키 채우기, 전체 행을 메모리에 올리지 않도록 id 범위로 나누어 처리
+    bind = op.get_bind()
+    select_batch = sa.text(
+        "SELECT id, name FROM company_names WHERE id > :last_id ORDER BY id LIMIT :limit"
+    )
+    update = sa.text("UPDATE company_names SET search_key = :search_key WHERE id = :id")
+    last_id = 0
+    while rows := bind.execute(
+        select_batch, {"last_id": last_id, "limit": BACKFILL_BATCH_SIZE}
+    ).all():
+        bind.execute(
+            update,
+            [
+                {"id": row_id, "search_key": _build_search_key(name)}
+                for row_id, name in rows
+            ],
+        )
+        last_id = rows[-1][0]
+
+    op.create_index(
+        "ix_company_names_search_key_trgm",
+        "company_names",
+        ["search_key"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"search_key": "gin_trgm_ops"},
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        "ix_company_names_search_key_trgm",
+        table_name="company_names",
+        postgresql_using="gin",
+        postgresql_ops={"search_key": "gin_trgm_ops"},
+    )
+    op.drop_column("company_names", "search_key")
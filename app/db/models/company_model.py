@@ -15,6 +15,7 @@ from sqlalchemy import (
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
+from app.search.normalize import build_search_key
 
 company_tag = Table(
     "company_tag",
@@ -43,6 +44,11 @@ class Company(Base):
     )
 
 
+def _search_key_default(context) -> str:
+    # 삽입 시 회사명으로부터 검색 키를 만든다 (ORM/Core insert 모두 적용)
+    return build_search_key(context.get_current_parameters()["name"])
+
+
 class CompanyName(Base):
     __tablename__ = "company_names"
 
@@ -50,17 +56,27 @@ class CompanyName(Base):
     company_id: Mapped[int] = mapped_column(ForeignKey("companies.id"), nullable=False)
     language_code: Mapped[str] = mapped_column(String(10), nullable=False, index=True)
     name: Mapped[str] = mapped_column(nullable=False)
+    search_key: Mapped[str | None] = mapped_column(default=_search_key_default)
 
     __table_args__ = (
         UniqueConstraint("company_id", "language_code"),
         UniqueConstraint("name", "language_code"),
         Index("ix_company_names_name_exact", "name"),  # btree (정확 일치)
+        Index(
+            "ix_company_names_language_code_name", "language_code", "name"
+        ),  # btree (언어 범위 검색)
         Index(
             "ix_company_names_name_trgm",
             "name",
             postgresql_using="gin",
             postgresql_ops={"name": "gin_trgm_ops"},
         ),  # trigram (ilike 대응용)
+        Index(
+            "ix_company_names_search_key_trgm",
+            "search_key",
+            postgresql_using="gin",
+            postgresql_ops={"search_key": "gin_trgm_ops"},
+        ),  # trigram (정규화 검색용)
     )
 
 
@@ -1,33 +1,42 @@
 from typing import Annotated
 
 import redis.asyncio as redis
-from fastapi import Depends
+from fastapi import Depends, Request
 
 from app.core.config import Settings, get_settings
 
 
-def create_redis_pool(settings: Annotated[Settings, Depends(get_settings)]):
-    return redis.ConnectionPool(
+def create_redis_pool(
+    settings: Annotated[Settings, Depends(get_settings)],
+) -> redis.ConnectionPool:
+    # BlockingConnectionPool: max_connections 를 넘으면 에러 대신 반납될 때까지 대기
+    return redis.BlockingConnectionPool(
         host=settings.REDIS_URL,
         port=settings.REDIS_PORT,
         db=settings.REDIS_DB,
         password=settings.REDIS_PASSWORD,
-        decode_responses=True,
+        # 캐시 값은 바이너리 코덱(msgpack 등)일 수 있으므로 bytes 그대로 받음
+        decode_responses=False,
         max_connections=settings.REDIS_MAX_CONNECTIONS,
+        timeout=settings.REDIS_POOL_TIMEOUT,
+        socket_timeout=settings.REDIS_SOCKET_TIMEOUT,
+        socket_connect_timeout=settings.REDIS_SOCKET_CONNECT_TIMEOUT,
     )
 
 
-async def get_redis_client(
-    redis_pool: Annotated[redis.ConnectionPool, Depends(create_redis_pool)],
-):
-    redis_client = redis.Redis(connection_pool=redis_pool)
+async def open_redis_client(pool: redis.ConnectionPool) -> redis.Redis:
+    redis_client = redis.Redis(connection_pool=pool)
     try:
-        yield redis_client
-    finally:
-        await redis_client.aclose()
+        await redis_client.ping()
+    except Exception:
+        await redis_client.aclose(close_connection_pool=True)
+        raise
+    return redis_client
 
 
-async def close_redis_client(
-    redis_client: Annotated[redis.Redis, Depends(get_redis_client)],
-):
-    await redis_client.close()
+async def close_redis_client(redis_client: redis.Redis) -> None:
+    await redis_client.aclose(close_connection_pool=True)
+
+
+def get_redis_client(request: Request) -> redis.Redis:
+    return request.app.state.redis_client
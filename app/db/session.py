@@ -1,33 +1,59 @@
-from typing import AsyncGenerator, Annotated
+import asyncio
+from typing import Annotated, AsyncGenerator
 
-from fastapi import Depends
+from fastapi import Depends, Request
+from sqlalchemy import QueuePool, StaticPool, event, make_url, text
 from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
-    AsyncEngine,
 )
 
-from app.core.config import Settings, get_settings
+from app.core.config import Settings
+from app.search.trigram import similarity, word_similarity
+
 
+def install_sqlite_functions(engine: AsyncEngine) -> None:
+    # 검색 쿼리가 사용하는 postgres(pg_trgm) 함수를 sqlite 커넥션에 등록
+    @event.listens_for(engine.sync_engine, "connect")
+    def _register(dbapi_connection, _connection_record):
+        dbapi_connection.create_function(
+            "similarity", 2, similarity, deterministic=True
+        )
+        dbapi_connection.create_function(
+            "word_similarity", 2, word_similarity, deterministic=True
+        )
+
+
+def create_database_engine(settings: Settings) -> AsyncEngine:
+    url = make_url(settings.DATABASE_URL)
+    if url.get_backend_name() == "sqlite":
+        # sqlite(테스트/벤치마크용)는 postgres 전용 풀/커넥션 설정을 사용하지 않음
+        # in-memory DB 는 커넥션마다 별도 DB 가 되므로 하나의 커넥션을 공유
+        in_memory = url.database in (None, "", ":memory:")
+        engine = create_async_engine(
+            url=url,
+            echo=settings.SQLALCHEMY_ECHO,
+            connect_args={"check_same_thread": False},
+            **({"poolclass": StaticPool} if in_memory else {}),
+        )
+        install_sqlite_functions(engine)
+        return engine
 
-def create_database_engine(
-    settings: Annotated[Settings, Depends(get_settings)],
-):
     return create_async_engine(
-        url=settings.DATABASE_URL,
+        url=url,
         pool_size=settings.DATABASE_POOL_SIZE,
         max_overflow=settings.DATABASE_MAX_OVERFLOW,
         pool_timeout=settings.DATABASE_POOL_TIMEOUT,
         pool_recycle=settings.DATABASE_POOL_RECYCLE,
+        pool_pre_ping=True,
         echo=settings.SQLALCHEMY_ECHO,
         connect_args={"server_settings": {"search_path": settings.DATABASE_SCHEMA}},
     )
 
 
-def create_session_factory(
-    engine: Annotated[AsyncEngine, Depends(create_database_engine)],
-):
+def create_session_factory(engine: AsyncEngine) -> async_sessionmaker[AsyncSession]:
     return async_sessionmaker(
         bind=engine,
         class_=AsyncSession,
@@ -35,8 +61,32 @@ def create_session_factory(
     )
 
 
+async def warm_up_database_engine(engine: AsyncEngine, min_connections: int) -> None:
+    # 커넥션을 동시에 열어두었다가 반납하여 풀에 min_connections 개를 채워둔다
+    pool = engine.sync_engine.pool
+    if isinstance(pool, QueuePool):
+        # pool_size 를 넘는 커넥션은 반납 시 닫히므로 의미가 없음
+        min_connections = min(min_connections, pool.size())
+    else:
+        min_connections = min(min_connections, 1)
+    if min_connections <= 0:
+        return
+
+    async def _connect_and_hold(ready: asyncio.Barrier) -> None:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+            await ready.wait()
+
+    ready = asyncio.Barrier(min_connections)
+    await asyncio.gather(*(_connect_and_hold(ready) for _ in range(min_connections)))
+
+
+def get_session_factory(request: Request) -> async_sessionmaker[AsyncSession]:
+    return request.app.state.session_factory
+
+
 async def get_db(
-    session_factory: Annotated[async_sessionmaker, Depends(create_session_factory)],
+    session_factory: Annotated[async_sessionmaker, Depends(get_session_factory)],
 ) -> AsyncGenerator[AsyncSession, None]:
     async with session_factory() as session:
         try:
@@ -28,3 +28,15 @@ class CompanyTagDto:
 class CompanyDto:
     names: tuple[CompanyNameDto, ...]
     tags: tuple[CompanyTagDto, ...] = field(default_factory=tuple)
+
+
+@dataclass(frozen=True, slots=True)
+class CompanyPageDto:
+    items: tuple[CompanyDto, ...]
+    next_cursor: str | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class CompanySearchResultPageDto:
+    items: tuple[CompanySearchResultDto, ...]
+    next_cursor: str | None = None
@@ -1,20 +1,43 @@
-from typing import Protocol
+from typing import Iterable, Protocol
 
+from app.core.constants import SearchMode, TagMatchMode
 from app.domain.company_entity import CompanyEntity, CompanyTagEntity
-from app.dto.company_dto import CompanyDto
+from app.dto.company_dto import CompanyPageDto
 
 
 class ICompanyRepository(Protocol):
     async def get_by_name(self, name: str) -> CompanyEntity | None: ...
 
-    async def get_by_partial_name(self, partial_name: str) -> list[CompanyDto]: ...
-
-    async def get_by_tag(self, tag: str) -> list[CompanyDto]: ...
-
-    async def save(self, company: CompanyEntity) -> None: ...
+    async def get_by_partial_name(
+        self,
+        partial_name: str,
+        limit: int | None = None,
+        cursor: str | None = None,
+        language_code: str | None = None,
+        mode: SearchMode = SearchMode.NAME,
+        fuzzy: bool = False,
+    ) -> CompanyPageDto: ...
+
+    async def get_by_tag(
+        self, tag: str, limit: int | None = None, cursor: str | None = None
+    ) -> CompanyPageDto: ...
+
+    async def get_by_tags(
+        self,
+        tags: list[str],
+        mode: TagMatchMode = TagMatchMode.ANY,
+        limit: int | None = None,
+        cursor: str | None = None,
+    ) -> CompanyPageDto: ...
+
+    async def save(self, company: CompanyEntity) -> CompanyEntity: ...
 
     async def add_tag(
         self, name: str, tags: list[CompanyTagEntity]
     ) -> CompanyEntity | None: ...
 
     async def remove_tag(self, name: str, tag: str) -> CompanyEntity | None: ...
+
+    async def invalidate(
+        self, company_names: Iterable[str], tag_names: Iterable[str]
+    ) -> None: ...
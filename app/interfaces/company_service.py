@@ -1,6 +1,12 @@
 from typing import Protocol
 
-from app.dto.company_dto import CompanySearchResultDto, CompanyDto, CompanyTagDto
+from app.core.constants import SearchMode, TagMatchMode
+from app.dto.company_dto import (
+    CompanyDto,
+    CompanySearchResultDto,
+    CompanySearchResultPageDto,
+    CompanyTagDto,
+)
 
 
 class ICompanyService(Protocol):
@@ -9,12 +15,36 @@ class ICompanyService(Protocol):
     ) -> CompanySearchResultDto | None: ...
 
     async def get_by_partial_name(
-        self, partial_name: str, language_code: str
+        self,
+        partial_name: str,
+        language_code: str,
+        limit: int | None = None,
+        cursor: str | None = None,
+        language_only: bool = False,
+        mode: SearchMode = SearchMode.NAME,
+        fuzzy: bool = False,
+    ) -> CompanySearchResultPageDto: ...
+
+    async def autocomplete(
+        self, query: str, language_code: str, limit: int
     ) -> list[CompanySearchResultDto]: ...
 
     async def get_by_tag(
-        self, tag: str, language_code: str
-    ) -> list[CompanySearchResultDto]: ...
+        self,
+        tag: str,
+        language_code: str,
+        limit: int | None = None,
+        cursor: str | None = None,
+    ) -> CompanySearchResultPageDto: ...
+
+    async def get_by_tags(
+        self,
+        tags: list[str],
+        language_code: str,
+        mode: TagMatchMode = TagMatchMode.ANY,
+        limit: int | None = None,
+        cursor: str | None = None,
+    ) -> CompanySearchResultPageDto: ...
 
     async def create(
         self, company: CompanyDto, language_code: str
@@ -1,7 +1,7 @@
 from typing import Protocol
 
 from app.domain.company_entity import CompanyTagEntity
-from app.dto.company_dto import CompanyTagNameDto
+from app.dto.company_dto import CompanyTagDto, CompanyTagNameDto
 
 
 class ICompanyTagRepository(Protocol):
@@ -16,3 +16,7 @@ class ICompanyTagRepository(Protocol):
     async def add_missing_names(
         self, tag: CompanyTagEntity, names: list[CompanyTagNameDto]
     ) -> CompanyTagEntity: ...
+
+    async def get_or_create_all(
+        self, tags: list[CompanyTagDto]
+    ) -> list[CompanyTagEntity]: ...
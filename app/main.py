@@ -1,12 +1,153 @@
+import logging
+from contextlib import AsyncExitStack, asynccontextmanager
+
 from fastapi import FastAPI
+from redis.asyncio import Redis
 
 from app.api.v1.route import router as v1_router
+from app.cache.codec import get_cache_codec
+from app.cache.invalidation import CacheInvalidationSubscriber
+from app.cache.local_cache import LocalCache
+from app.cache.refresher import CacheRefresher
+from app.cache.single_flight import SingleFlight
+from app.core.config import get_settings
+from app.db.redis import close_redis_client, create_redis_pool, open_redis_client
+from app.db.session import (
+    create_database_engine,
+    create_session_factory,
+    warm_up_database_engine,
+)
+from app.search.autocomplete import (
+    AutocompleteIndex,
+    AutocompleteSubscriber,
+    load_prefix_index,
+)
+from app.search.prefix_index import PrefixIndex
+from app.search.refine import PartialNameRefineStats
+from app.search.tag_bitmap_index import TagBitmapIndex
+from app.search.tag_index import TagIndex, TagIndexSubscriber, load_tag_bitmap_index
+from app.services.import_job import ImportJobManager
+
+logger = logging.getLogger(__name__)
+
+
+async def _start_autocomplete_index(
+    app: FastAPI, redis_client: Redis, stack: AsyncExitStack
+) -> AutocompleteIndex | None:
+    session_factory = app.state.session_factory
+    load = app.dependency_overrides.get(load_prefix_index, load_prefix_index)
+
+    async def _load() -> PrefixIndex:
+        async with session_factory() as session:
+            return await load(session)
+
+    try:
+        autocomplete_index = AutocompleteIndex(redis_client, await _load(), load=_load)
+    except Exception as e:
+        # 인덱스를 만들 수 없으면(마이그레이션 전 등) 부분 검색으로 대체하여 기동
+        logger.warning(f"Failed to build autocomplete index: {e}")
+        return None
+
+    subscriber = AutocompleteSubscriber(redis_client, autocomplete_index)
+    await subscriber.start()
+    stack.push_async_callback(subscriber.stop)
+    return autocomplete_index
+
+
+async def _start_tag_index(
+    app: FastAPI, redis_client: Redis, stack: AsyncExitStack
+) -> TagIndex | None:
+    session_factory = app.state.session_factory
+    load = app.dependency_overrides.get(load_tag_bitmap_index, load_tag_bitmap_index)
+
+    async def _load() -> TagBitmapIndex:
+        async with session_factory() as session:
+            return await load(session)
+
+    try:
+        tag_index = TagIndex(redis_client, await _load(), load=_load)
+    except Exception as e:
+        # 인덱스를 만들 수 없으면 기존 DB/캐시 조회로 기동
+        logger.warning(f"Failed to build tag index: {e}")
+        return None
+
+    subscriber = TagIndexSubscriber(redis_client, tag_index)
+    await subscriber.start()
+    stack.push_async_callback(subscriber.stop)
+    return tag_index
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # 테스트에서 dependency_overrides 로 교체한 설정/리소스를 lifespan 에서도 사용
+    overrides = app.dependency_overrides
+    settings = overrides.get(get_settings, get_settings)()
+
+    # 설정한 캐시 코덱의 선택 의존성이 없으면 요청 처리 전에 실패
+    get_cache_codec(settings.REPOSITORY_CACHE_CODEC)
+
+    async with AsyncExitStack() as stack:
+        engine = create_database_engine(settings)
+        stack.push_async_callback(engine.dispose)
+        await warm_up_database_engine(engine, settings.DATABASE_POOL_MIN_SIZE)
+        app.state.db_engine = engine
+        app.state.session_factory = create_session_factory(engine)
+
+        redis_pool = overrides.get(create_redis_pool, create_redis_pool)(settings)
+        redis_client = await open_redis_client(redis_pool)
+        stack.push_async_callback(close_redis_client, redis_client)
+        app.state.redis_client = redis_client
+
+        local_cache = None
+        if settings.LOCAL_CACHE_ENABLED:
+            local_cache = LocalCache(
+                max_size=settings.LOCAL_CACHE_MAX_SIZE, ttl=settings.LOCAL_CACHE_TTL
+            )
+            subscriber = CacheInvalidationSubscriber(redis_client, local_cache)
+            await subscriber.start()
+            stack.push_async_callback(subscriber.stop)
+        app.state.local_cache = local_cache
+        app.state.single_flight = SingleFlight()
+        app.state.partial_name_refine_stats = PartialNameRefineStats()
+
+        autocomplete_index = None
+        if settings.AUTOCOMPLETE_INDEX_ENABLED:
+            autocomplete_index = await _start_autocomplete_index(
+                app, redis_client, stack
+            )
+        app.state.autocomplete_index = autocomplete_index
+
+        tag_index = None
+        if settings.TAG_INDEX_ENABLED:
+            tag_index = await _start_tag_index(app, redis_client, stack)
+        app.state.tag_index = tag_index
+
+        # 백그라운드 갱신 태스크는 엔진/Redis 정리 전에 취소
+        cache_refresher = CacheRefresher(
+            app.state.session_factory,
+            max_concurrency=settings.REPOSITORY_CACHE_REFRESH_CONCURRENCY,
+            max_pending=settings.REPOSITORY_CACHE_REFRESH_MAX_PENDING,
+        )
+        stack.push_async_callback(cache_refresher.close)
+        app.state.cache_refresher = cache_refresher
+
+        # 실행 중인 가져오기 작업은 종료 시 취소 (커밋한 청크까지 유지)
+        import_job_manager = ImportJobManager(
+            redis_client,
+            lock_ttl=settings.DATA_IMPORT_LOCK_TTL,
+            job_ttl=settings.DATA_IMPORT_JOB_TTL,
+        )
+        stack.push_async_callback(import_job_manager.close)
+        app.state.import_job_manager = import_job_manager
+
+        yield
 
 
 def create_app() -> FastAPI:
     app = FastAPI(
         title="Company Info API",
         version="1.0.0",
+        lifespan=lifespan,
     )
 
     app.include_router(v1_router)
@@ -8,7 +8,12 @@ from app.domain.company_entity import (
     CompanyTagEntity,
     CompanyTagNameEntity,
 )
-from app.dto.company_dto import CompanyDto, CompanyNameDto, CompanySearchResultDto
+from app.dto.company_dto import (
+    CompanyDto,
+    CompanyNameDto,
+    CompanyPageDto,
+    CompanySearchResultDto,
+)
 
 
 class CompanyMapper:
@@ -182,6 +187,63 @@ class CompanyMapper:
             for item in data
         ]
 
+    # 캐시용 위치 기반(positional) 표현: 반복되는 키 없이 [language_code, name] 배열로 저장
+    def entity_to_cache_data(self, entity: CompanyEntity) -> list:
+        return [
+            entity.id,
+            [[name.language_code, name.name] for name in entity.names],
+            [
+                [
+                    tag.id,
+                    [[tag_name.language_code, tag_name.name] for tag_name in tag.names],
+                ]
+                for tag in entity.tags
+            ],
+        ]
+
+    def cache_data_to_entity(self, data: list) -> CompanyEntity:
+        company_id, names, tags = data
+        return CompanyEntity(
+            id=company_id,
+            names=tuple(
+                CompanyNameEntity(language_code=language_code, name=name)
+                for language_code, name in names
+            ),
+            tags=tuple(
+                CompanyTagEntity(
+                    id=tag_id,
+                    names=tuple(
+                        CompanyTagNameEntity(language_code=language_code, name=name)
+                        for language_code, name in tag_names
+                    ),
+                )
+                for tag_id, tag_names in tags
+            ),
+        )
+
+    def dtos_to_cache_data(self, dtos: list[CompanyDto]) -> list:
+        return [[[name.language_code, name.name] for name in dto.names] for dto in dtos]
+
+    def cache_data_to_dtos(self, data: list) -> list[CompanyDto]:
+        return [
+            CompanyDto(
+                names=tuple(
+                    CompanyNameDto(language_code=language_code, name=name)
+                    for language_code, name in names
+                )
+            )
+            for names in data
+        ]
+
+    def page_to_cache_data(self, page: CompanyPageDto) -> list:
+        return [page.next_cursor, self.dtos_to_cache_data(list(page.items))]
+
+    def cache_data_to_page(self, data: list) -> CompanyPageDto:
+        next_cursor, items = data
+        return CompanyPageDto(
+            items=tuple(self.cache_data_to_dtos(items)), next_cursor=next_cursor
+        )
+
     def dto_to_entity(
         self, dto: CompanyDto, tags: list[CompanyTagEntity] | None = None
     ) -> CompanyEntity:
@@ -1,19 +1,63 @@
+import asyncio
+import uuid
+from dataclasses import replace
+from typing import Awaitable, Callable, Iterable, TypeVar
+
 from redis.asyncio import Redis
-from sqlalchemy import select
+from sqlalchemy import and_, case, distinct, func, literal, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from app.cache.codec import CacheCodecError, get_cache_codec
+from app.cache.entry import (
+    CacheEntry,
+    CacheTTL,
+    is_stale,
+    pack_cache_entry,
+    unpack_cache_entry,
+)
+from app.cache.invalidation import publish_invalidation
+from app.cache.keys import (
+    company_name_cache_key,
+    company_partial_name_cache_key,
+    company_partial_name_candidates_key,
+    company_tag_cache_key,
+    company_tag_combinations_index_key,
+    company_tags_cache_key,
+    page_cache_field,
+    response_cache_key,
+)
+from app.cache.local_cache import LocalCache
+from app.cache.lock import release_lock
+from app.cache.refresher import CacheRefresher
+from app.cache.response_cache import delete_page_responses, invalidate_responses
+from app.cache.single_flight import SingleFlight
 from app.core.config import Settings
-from app.db.models import Company, CompanyName, CompanyTag, CompanyTagName
+from app.core.constants import SearchMode, TagMatchMode
+from app.core.pagination import InvalidCursorError, decode_cursor, encode_cursor
+from app.db.models import (
+    Company,
+    CompanyName,
+    CompanyTag,
+    CompanyTagName,
+    company_tag,
+)
 from app.domain.company_entity import CompanyEntity, CompanyTagEntity
-from app.dto.company_dto import CompanyDto
+from app.dto.company_dto import CompanyDto, CompanyNameDto, CompanyPageDto
 from app.mappers.company_mapper import CompanyMapper
 from app.mappers.company_tag_mapper import CompanyTagMapper
+from app.search.normalize import SEARCH_KEY_SEPARATOR, normalize_search_text
+from app.search.refine import (
+    PartialNameRefineStats,
+    refine_candidates,
+    search_term,
+)
+from app.search.tag_index import TagIndex
 
+T = TypeVar("T")
 
-class CompanyRepository:
-    _cache_namespace = "repository:company"
 
+class CompanyRepository:
     def __init__(
         self,
         db: AsyncSession,
@@ -21,12 +65,264 @@ class CompanyRepository:
         company_mapper: CompanyMapper,
         company_tag_mapper: CompanyTagMapper,
         settings: Settings,
+        local_cache: LocalCache | None = None,
+        single_flight: SingleFlight | None = None,
+        cache_refresher: CacheRefresher | None = None,
+        tag_index: TagIndex | None = None,
+        refine_stats: PartialNameRefineStats | None = None,
     ):
         self._db = db
         self._redis = redis_client
         self._company_mapper = company_mapper
         self._company_tag_mapper = company_tag_mapper
         self._settings = settings
+        self._local_cache = local_cache
+        self._single_flight = single_flight or SingleFlight()
+        # cache_refresher 가 없으면 soft TTL 이 지나도 갱신하지 않고 hard TTL 까지 사용
+        self._cache_refresher = cache_refresher
+        # tag_index 가 있으면 태그 조회를 인덱스에서 처리 (태그 변경은 커밋 후 서비스에서 반영)
+        self._tag_index = tag_index
+        self._refine_stats = refine_stats or PartialNameRefineStats()
+        self._cache_codec = get_cache_codec(settings.REPOSITORY_CACHE_CODEC)
+        self._name_cache_ttl = CacheTTL(
+            hard=settings.REPOSITORY_CACHE_NAME_TTL or settings.REPOSITORY_CACHE_TTL,
+            soft=settings.REPOSITORY_CACHE_NAME_SOFT_TTL,
+        )
+        self._tag_cache_ttl = CacheTTL(
+            hard=settings.REPOSITORY_CACHE_TAG_TTL or settings.REPOSITORY_CACHE_TTL,
+            soft=settings.REPOSITORY_CACHE_TAG_SOFT_TTL,
+        )
+        # 부분 검색 특성상 무효화 불가로 짧은 TTL 설정
+        self._partial_name_cache_ttl = CacheTTL(
+            hard=settings.REPOSITORY_CACHE_PARTIAL_TTL
+        )
+
+    def with_session(self, db: AsyncSession) -> "CompanyRepository":
+        # 요청이 끝난 뒤에도 실행되는 작업(백그라운드 갱신, 가져오기 작업)은 요청 세션 대신 별도 세션 사용
+        return CompanyRepository(
+            db=db,
+            redis_client=self._redis,
+            company_mapper=self._company_mapper,
+            company_tag_mapper=self._company_tag_mapper,
+            settings=self._settings,
+            local_cache=self._local_cache,
+            single_flight=self._single_flight,
+            tag_index=self._tag_index,
+            refine_stats=self._refine_stats,
+        )
+
+    def _name_cache_key(self, name: str) -> str:
+        return company_name_cache_key(name)
+
+    def _tag_cache_key(self, tag: str) -> str:
+        return company_tag_cache_key(tag)
+
+    def _decode_cached(
+        self,
+        entry: CacheEntry,
+        from_cache_data: Callable[[list], T],
+        from_json: Callable[[bytes], T],
+    ) -> T | None:
+        if entry.codec is None:
+            return from_json(entry.payload)
+        try:
+            codec = get_cache_codec(entry.codec)
+        except CacheCodecError:
+            # 롤아웃 중 이 워커에서 사용할 수 없는 코덱으로 저장된 항목은 미스로 처리
+            return None
+        return from_cache_data(codec.loads(entry.payload))
+
+    def _decode_entity(self, entry: CacheEntry) -> CompanyEntity | None:
+        return self._decode_cached(
+            entry,
+            self._company_mapper.cache_data_to_entity,
+            self._company_mapper.json_to_entity,
+        )
+
+    def _decode_page(self, entry: CacheEntry) -> CompanyPageDto | None:
+        # 페이지 캐시는 v2 항목으로만 저장되므로 레거시 JSON 항목은 미스로 처리
+        return self._decode_cached(
+            entry, self._company_mapper.cache_data_to_page, lambda _: None
+        )
+
+    def _page_limit(self, limit: int | None) -> int:
+        return min(
+            limit or self._settings.SEARCH_PAGE_SIZE,
+            self._settings.SEARCH_MAX_PAGE_SIZE,
+        )
+
+    def _to_page(self, rows: list, limit: int) -> CompanyPageDto:
+        # limit + 1 개를 조회하여 다음 페이지 존재 여부를 판단, rows: (Company, 정렬 키)
+        next_cursor = encode_cursor(rows[limit - 1][1]) if len(rows) > limit else None
+        return CompanyPageDto(
+            items=tuple(
+                self._company_mapper.row_to_search_result_dto(company)
+                for company, _ in rows[:limit]
+            ),
+            next_cursor=next_cursor,
+        )
+
+    def _to_names_page(self, rows: list, limit: int) -> CompanyPageDto:
+        # DB 를 거치지 않은 결과를 _to_page 와 같은 형태로 변환, rows: (정렬 키, [(언어, 회사명)])
+        next_cursor = encode_cursor(rows[limit - 1][0]) if len(rows) > limit else None
+        return CompanyPageDto(
+            items=tuple(
+                CompanyDto(
+                    names=tuple(
+                        CompanyNameDto(language_code=language_code, name=name)
+                        for language_code, name in names
+                    )
+                )
+                for _, names in rows[:limit]
+            ),
+            next_cursor=next_cursor,
+        )
+
+    async def _read_cached(self, cache_key: str, field: str | None) -> bytes | None:
+        if field is None:
+            return await self._redis.get(cache_key)
+        return await self._redis.hget(cache_key, field)
+
+    async def _get_cached(
+        self,
+        cache_key: str,
+        decode: Callable[[CacheEntry], T | None],
+        refresh: Callable[["CompanyRepository"], Awaitable[object]] | None = None,
+        field: str | None = None,
+    ) -> T | None:
+        cached = await self._read_cached(cache_key, field)
+        if not cached or (entry := unpack_cache_entry(cached)) is None:
+            return None
+
+        value = decode(entry)
+        if value is not None and refresh is not None:
+            if is_stale(entry.soft_expires_at):
+                self._schedule_refresh(_flight_key(cache_key, field), refresh)
+        return value
+
+    async def _set_cached(
+        self, cache_key: str, data: list, ttl: CacheTTL, field: str | None = None
+    ) -> None:
+        payload = self._cache_codec.dumps(data)
+        entry = pack_cache_entry(payload, self._cache_codec.name, ttl)
+        async with self._redis.pipeline(transaction=True) as pipe:
+            # 값이 다시 적재/갱신되면 이전 값으로 렌더링된 응답은 버림
+            if field is None:
+                pipe.set(cache_key, entry, ex=ttl.hard)
+                pipe.delete(response_cache_key(cache_key))
+            else:
+                # 페이지는 같은 hash 에 저장하여 키 하나로 모든 페이지를 무효화
+                pipe.hset(cache_key, field, entry)
+                pipe.expire(cache_key, ttl.hard, nx=True)
+                delete_page_responses(pipe, cache_key, field)
+            await pipe.execute()
+
+    def _schedule_refresh(
+        self,
+        flight_key: str,
+        refresh: Callable[["CompanyRepository"], Awaitable[object]],
+    ) -> None:
+        if self._cache_refresher is None:
+            return
+
+        # 요청 세션은 응답 후 닫히므로 갱신은 별도 세션으로 수행
+        self._cache_refresher.schedule(
+            flight_key,
+            lambda db: self._single_flight.do(
+                flight_key, lambda: refresh(self.with_session(db))
+            ),
+        )
+
+    async def _load_once(
+        self,
+        cache_key: str,
+        load: Callable[[], Awaitable[T]],
+        decode: Callable[[CacheEntry], T | None],
+        field: str | None = None,
+    ) -> T:
+        # 같은 키의 동시 캐시 미스는 한 번의 DB 조회/캐시 적재로 합친다
+        return await self._single_flight.do(
+            _flight_key(cache_key, field),
+            lambda: self._load_with_lock(cache_key, load, decode, field),
+        )
+
+    async def _load_with_lock(
+        self,
+        cache_key: str,
+        load: Callable[[], Awaitable[T]],
+        decode: Callable[[CacheEntry], T | None],
+        field: str | None = None,
+    ) -> T:
+        # 워커 간 조정: 짧은 Redis 락을 잡은 워커만 DB 에서 읽고, 나머지는 캐시가 채워지길 대기
+        if not self._settings.REPOSITORY_CACHE_LOCK_ENABLED:
+            return await load()
+
+        lock_key = f"lock:{_flight_key(cache_key, field)}"
+        lock_token = uuid.uuid4().hex
+        lock_ttl_ms = self._settings.REPOSITORY_CACHE_LOCK_TTL_MS
+        if await self._redis.set(lock_key, lock_token, nx=True, px=lock_ttl_ms):
+            try:
+                return await load()
+            finally:
+                # 락이 만료되어 다른 워커가 잡은 경우에는 지우지 않음
+                await release_lock(self._redis, lock_key, lock_token)
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + lock_ttl_ms / 1000
+        poll_interval = self._settings.REPOSITORY_CACHE_LOCK_POLL_INTERVAL_MS / 1000
+        while loop.time() < deadline:
+            await asyncio.sleep(poll_interval)
+            cached = await self._read_cached(cache_key, field)
+            if cached and (entry := unpack_cache_entry(cached)) is not None:
+                if (value := decode(entry)) is not None:
+                    return value
+            if not await self._redis.exists(lock_key):
+                break
+
+        return await load()
+
+    async def _tag_keys(self, tag_names: Iterable[str]) -> list[str]:
+        # 태그 키와 함께 그 태그가 포함된 다중 태그 캐시 키도 무효화 대상
+        tag_names = list(tag_names)
+        if not tag_names:
+            return []
+
+        index_keys = [company_tag_combinations_index_key(tag) for tag in tag_names]
+        async with self._redis.pipeline(transaction=False) as pipe:
+            for index_key in index_keys:
+                pipe.smembers(index_key)
+            members = await pipe.execute()
+        combination_keys = {
+            key.decode() if isinstance(key, bytes) else key
+            for keys in members
+            for key in keys
+        }
+        return (
+            [self._tag_cache_key(tag) for tag in tag_names]
+            + index_keys
+            + sorted(combination_keys)
+        )
+
+    async def _invalidate(self, keys: list[str]) -> None:
+        if not keys:
+            return
+
+        async with self._redis.pipeline(transaction=True) as pipe:
+            pipe.delete(*keys)
+            invalidate_responses(pipe, keys)
+            await pipe.execute()
+        if self._local_cache is not None:
+            self._local_cache.delete(*keys)
+            await publish_invalidation(self._redis, keys)
+
+    async def invalidate(
+        self, company_names: Iterable[str], tag_names: Iterable[str]
+    ) -> None:
+        # 리포지토리를 거치지 않고 변경한 회사명/태그명의 캐시 무효화 (CSV 동기화 등)
+        await self._invalidate(
+            [self._name_cache_key(name) for name in sorted(set(company_names))]
+            + await self._tag_keys(sorted(set(tag_names)))
+        )
 
     async def _get_by_name(self, name: str) -> Company | None:
         stmt = (
@@ -42,78 +338,459 @@ class CompanyRepository:
         return result.scalars().first()
 
     async def get_by_name(self, name: str) -> CompanyEntity | None:
-        cache_key = f"{self._cache_namespace}:name:{name}"
-        if cached := await self._redis.get(cache_key):
-            return self._company_mapper.json_to_entity(cached)
+        cache_key = self._name_cache_key(name)
+
+        local_generation = None
+        if self._local_cache is not None:
+            if company_entity := self._local_cache.get(cache_key):
+                return company_entity
+            local_generation = self._local_cache.generation
+
+        company_entity = await self._get_cached(
+            cache_key,
+            decode=self._decode_entity,
+            refresh=lambda repo: repo._load_by_name(name, cache_key),
+        )
+        if company_entity is None:
+            company_entity = await self._load_once(
+                cache_key,
+                load=lambda: self._load_by_name(name, cache_key),
+                decode=self._decode_entity,
+            )
+            if company_entity is None:
+                return None
+
+        if self._local_cache is not None:
+            self._local_cache.set(cache_key, company_entity, local_generation)
+        return company_entity
 
+    async def _load_by_name(self, name: str, cache_key: str) -> CompanyEntity | None:
         company = await self._get_by_name(name)
         if company is None:
             return None
 
         company_entity = self._company_mapper.row_to_entity(company)
-        await self._redis.set(
+        await self._set_cached(
             cache_key,
-            self._company_mapper.entity_to_json(company_entity),
-            ex=self._settings.REPOSITORY_CACHE_TTL,
+            self._company_mapper.entity_to_cache_data(company_entity),
+            self._name_cache_ttl,
         )
-
         return company_entity
 
-    async def get_by_partial_name(self, partial_name: str) -> list[CompanyDto]:
-        cache_key = f"{self._cache_namespace}:partial_name:{partial_name}"
-        if cached := await self._redis.get(cache_key):
-            return self._company_mapper.json_to_dtos(cached)
+    async def get_by_partial_name(
+        self,
+        partial_name: str,
+        limit: int | None = None,
+        cursor: str | None = None,
+        language_code: str | None = None,
+        mode: SearchMode = SearchMode.NAME,
+        fuzzy: bool = False,
+    ) -> CompanyPageDto:
+        # language_code 가 없으면 모든 언어의 회사명에서 검색
+        limit = self._page_limit(limit)
+        after = _ranked_position(cursor)
+        cache_key = company_partial_name_cache_key(
+            partial_name, language_code, mode, fuzzy
+        )
+        field = page_cache_field(limit, cursor)
+        cached = await self._get_cached(cache_key, self._decode_page, field=field)
+        if cached is not None:
+            return cached
+
+        # 입력 중인 검색어(첫 페이지)는 캐시된 더 짧은 검색어의 후보로 계산
+        # (fuzzy 검색 결과는 긴 검색어의 결과를 포함하지 않으므로 제외)
+        refine = (
+            cursor is None
+            and not fuzzy
+            and self._settings.REPOSITORY_CACHE_PARTIAL_REFINE_MAX_SIZE > 0
+        )
+        name_ids = None
+        if refine:
+            ranked = await self._refine_partial_name(partial_name, language_code, mode)
+            if ranked is not None and len(ranked) <= limit:
+                # 한 페이지에 모두 들어가면 커서가 없으므로 메모리에서 정렬한 결과를 그대로 사용
+                page = self._to_names_page(
+                    [
+                        (position, [tuple(name) for name in candidate[2]])
+                        for position, candidate in ranked
+                    ],
+                    limit,
+                )
+                await self._set_cached(
+                    cache_key,
+                    self._company_mapper.page_to_cache_data(page),
+                    self._partial_name_cache_ttl,
+                    field=field,
+                )
+                return page
+            if ranked is not None:
+                # 다음 페이지가 있으면 커서가 이후 페이지의 DB 정렬 키와 같아야 하므로
+                # 후보 회사명으로 범위만 좁혀 일치 종류/유사도는 DB 에서 계산
+                name_ids = [
+                    name_id for _, candidate in ranked for name_id, *_ in candidate[1]
+                ]
+
+        # 정렬 키: (일치 종류, trigram 유사도 내림차순, 회사명 행 ID)
+        # 일치 종류 0: 정확히 일치, 1: 앞부분 일치, 2: 부분 일치, 3: 오타 허용(fuzzy) 일치
+        if mode == SearchMode.NORMALIZED:
+            match_rank, is_match, score = _normalized_match(partial_name)
+        else:
+            match_rank, is_match, score = _name_match(partial_name)
+        if fuzzy:
+            match_rank, is_match, score = await self._fuzzy_match(
+                partial_name, language_code, mode, match_rank, is_match
+            )
+        matched = select(
+            CompanyName.company_id,
+            match_rank.label("match_rank"),
+            score.label("score"),
+            CompanyName.id.label("name_id"),
+            # 여러 언어의 회사명이 일치해도 가장 잘 맞는 이름 하나로 회사를 한 번만 반환
+            func.row_number()
+            .over(
+                partition_by=CompanyName.company_id,
+                order_by=(match_rank, score.desc(), CompanyName.id),
+            )
+            .label("row_number"),
+        ).where(is_match)
+        if language_code is not None:
+            matched = matched.where(CompanyName.language_code == language_code)
+        if name_ids is not None:
+            matched = matched.where(CompanyName.id.in_(name_ids))
+        matched = matched.subquery()
 
         stmt = (
-            select(Company)
-            .join(Company.names)
-            .where(
-                CompanyName.name.ilike(f"%{partial_name}%"),
-            )
+            select(Company, matched.c.match_rank, matched.c.score, matched.c.name_id)
+            .join(matched, matched.c.company_id == Company.id)
+            .where(matched.c.row_number == 1)
             .options(selectinload(Company.names))
+            # 상위 limit + 1 개만 정렬하여 가져옴 (top-N)
+            .order_by(matched.c.match_rank, matched.c.score.desc(), matched.c.name_id)
+            .limit(limit + 1)
         )
+        if after is not None:
+            after_rank, after_score, after_id = after
+            stmt = stmt.where(
+                or_(
+                    matched.c.match_rank > after_rank,
+                    and_(
+                        matched.c.match_rank == after_rank,
+                        matched.c.score < after_score,
+                    ),
+                    and_(
+                        matched.c.match_rank == after_rank,
+                        matched.c.score == after_score,
+                        matched.c.name_id > after_id,
+                    ),
+                )
+            )
         result = await self._db.execute(stmt)
-        companies = result.scalars().all()
 
-        company_dtos = [
-            self._company_mapper.row_to_search_result_dto(company)
-            for company in companies
-        ]
-        await self._redis.set(
+        page = self._to_page(
+            [(company, list(position)) for company, *position in result.all()],
+            limit,
+        )
+        await self._set_cached(
             cache_key,
-            self._company_mapper.dtos_to_json(company_dtos),
-            ex=self._settings.REPOSITORY_CACHE_PARTIAL_TTL,  # 부분 검색 특성상 무효화 불가로 짧은 TTL 설정
+            self._company_mapper.page_to_cache_data(page),
+            self._partial_name_cache_ttl,
+            field=field,
         )
-        return company_dtos
+        if refine and name_ids is None:
+            await self._cache_partial_name_candidates(
+                partial_name, language_code, mode, is_match
+            )
+        return page
 
-    async def get_by_tag(self, tag: str) -> list[CompanyDto]:
-        cache_key = f"{self._cache_namespace}:tag:{tag}"
-        if cached := await self._redis.get(cache_key):
-            return self._company_mapper.json_to_dtos(cached)
+    async def _fuzzy_match(
+        self,
+        partial_name: str,
+        language_code: str | None,
+        mode: SearchMode,
+        match_rank,
+        is_match,
+    ) -> tuple:
+        if mode == SearchMode.NORMALIZED:
+            target, term = CompanyName.search_key, normalize_search_text(partial_name)
+        else:
+            target, term = CompanyName.name, partial_name
+        threshold = self._settings.SEARCH_FUZZY_THRESHOLD
+        # 검색어가 회사명의 일부(단어)와 비슷한 정도, 부분 일치한 이름도 같은 기준으로 정렬
+        score = func.word_similarity(term, target)
+
+        if self._db.get_bind().dialect.name == "postgresql":
+            # % / <% 연산자는 trigram GIN 인덱스를 사용, 임계값은 현재 트랜잭션에만 적용
+            await self._db.execute(
+                select(
+                    func.set_config(
+                        "pg_trgm.similarity_threshold", str(threshold), True
+                    ),
+                    func.set_config(
+                        "pg_trgm.word_similarity_threshold", str(threshold), True
+                    ),
+                )
+            )
+            fuzzy_match = or_(target.op("%")(term), literal(term).op("<%")(target))
+        else:
+            fuzzy_match = or_(
+                func.similarity(target, term) >= threshold, score >= threshold
+            )
+
+        # 오타 허용으로 추가되는 이름은 유사도 상위 SEARCH_FUZZY_MAX_CANDIDATES 개만 사용
+        candidates = (
+            select(CompanyName.id)
+            .where(fuzzy_match, ~is_match)
+            .order_by(score.desc(), CompanyName.id)
+            .limit(self._settings.SEARCH_FUZZY_MAX_CANDIDATES)
+        )
+        if language_code is not None:
+            candidates = candidates.where(CompanyName.language_code == language_code)
+
+        return (
+            case((is_match, match_rank), else_=3),
+            or_(is_match, CompanyName.id.in_(candidates)),
+            score,
+        )
+
+    async def _refine_partial_name(
+        self, partial_name: str, language_code: str | None, mode: SearchMode
+    ) -> list[tuple[list, list]] | None:
+        # 검색어 자신을 포함하여 가장 긴 앞부분부터 캐시된 후보를 찾음
+        prefixes = [partial_name[:i] for i in range(len(partial_name), 0, -1)]
+        if not prefixes:
+            return None
+        raw_entries = await self._redis.mget(
+            [
+                company_partial_name_candidates_key(prefix, language_code, mode)
+                for prefix in prefixes
+            ]
+        )
 
+        term = search_term(partial_name, mode)
+        candidates = None
+        for prefix, raw in zip(prefixes, raw_entries):
+            if not raw or (entry := unpack_cache_entry(raw)) is None:
+                continue
+            # 정규화 후에도 앞부분 관계가 유지되어야 결과가 포함 관계
+            if not term.startswith(search_term(prefix, mode)):
+                continue
+            candidates = self._decode_cached(entry, lambda data: data, lambda _: None)
+            if candidates is not None:
+                break
+        if candidates is None:
+            self._refine_stats.misses += 1
+            return None
+
+        ranked = refine_candidates(candidates, partial_name, mode)
+        await self._set_cached(
+            company_partial_name_candidates_key(partial_name, language_code, mode),
+            [candidate for _, candidate in ranked],
+            self._partial_name_cache_ttl,
+        )
+        self._refine_stats.hits += 1
+        return ranked
+
+    async def _cache_partial_name_candidates(
+        self,
+        partial_name: str,
+        language_code: str | None,
+        mode: SearchMode,
+        is_match,
+    ) -> None:
+        max_size = self._settings.REPOSITORY_CACHE_PARTIAL_REFINE_MAX_SIZE
+        if language_code is not None:
+            is_match = and_(is_match, CompanyName.language_code == language_code)
+        # 일치한 회사명이 max_size 를 넘으면 후보로 쓰지 않으므로 max_size + 1 개까지만 확인
+        matched_company_ids = select(CompanyName.company_id).where(is_match)
         stmt = (
-            select(Company)
+            select(
+                CompanyName.company_id,
+                CompanyName.id,
+                CompanyName.language_code,
+                CompanyName.name,
+                CompanyName.search_key,
+                is_match.label("is_match"),
+            )
+            .where(CompanyName.company_id.in_(matched_company_ids.limit(max_size + 1)))
+            .order_by(CompanyName.id)
+        )
+        result = await self._db.execute(stmt)
+
+        candidates: dict[str, list] = {}
+        matched_count = 0
+        for company_id, name_id, name_language, name, key, matched in result.all():
+            candidate = candidates.setdefault(
+                str(company_id), [str(company_id), [], []]
+            )
+            candidate[2].append([name_language, name])
+            if matched:
+                candidate[1].append([name_id, name, key])
+                matched_count += 1
+        if matched_count > max_size:
+            return
+
+        await self._set_cached(
+            company_partial_name_candidates_key(partial_name, language_code, mode),
+            list(candidates.values()),
+            self._partial_name_cache_ttl,
+        )
+
+    async def get_by_tag(
+        self, tag: str, limit: int | None = None, cursor: str | None = None
+    ) -> CompanyPageDto:
+        limit = self._page_limit(limit)
+        # 정렬 키: 회사 ID (UUID)
+        after = _uuid_position(cursor)
+        if self._tag_index is not None:
+            return self._search_tag_index([tag], TagMatchMode.ANY, limit, after)
+
+        cache_key = self._tag_cache_key(tag)
+        field = page_cache_field(limit, cursor)
+        cached = await self._get_cached(
+            cache_key,
+            decode=self._decode_page,
+            refresh=lambda repo: repo._load_by_tag(tag, limit, after, cache_key, field),
+            field=field,
+        )
+        if cached is not None:
+            return cached
+
+        return await self._load_once(
+            cache_key,
+            load=lambda: self._load_by_tag(tag, limit, after, cache_key, field),
+            decode=self._decode_page,
+            field=field,
+        )
+
+    def _search_tag_index(
+        self,
+        tags: list[str],
+        mode: TagMatchMode,
+        limit: int,
+        after: uuid.UUID | None,
+    ) -> CompanyPageDto:
+        matches = self._tag_index.search(
+            tags, mode, limit + 1, str(after) if after is not None else None
+        )
+        return self._to_names_page(matches, limit)
+
+    async def _load_by_tag(
+        self,
+        tag: str,
+        limit: int,
+        after: uuid.UUID | None,
+        cache_key: str,
+        field: str,
+    ) -> CompanyPageDto:
+        stmt = (
+            select(Company, Company.id)
             .join(Company.tags)
             .join(CompanyTag.names)
             .where(CompanyTagName.name == tag)
             .options(selectinload(Company.names))
+            .order_by(Company.id)
+            .limit(limit + 1)
         )
+        if after is not None:
+            stmt = stmt.where(Company.id > after)
         result = await self._db.execute(stmt)
-        companies = result.scalars().all()
 
-        company_dtos = [
-            self._company_mapper.row_to_search_result_dto(company)
-            for company in companies
-        ]
-        await self._redis.set(
+        page = self._to_page(
+            [(company, str(company_id)) for company, company_id in result.all()],
+            limit,
+        )
+        await self._set_cached(
+            cache_key,
+            self._company_mapper.page_to_cache_data(page),
+            self._tag_cache_ttl,
+            field=field,
+        )
+        return page
+
+    async def get_by_tags(
+        self,
+        tags: list[str],
+        mode: TagMatchMode = TagMatchMode.ANY,
+        limit: int | None = None,
+        cursor: str | None = None,
+    ) -> CompanyPageDto:
+        tags = sorted(set(tags))
+        if not tags:
+            return CompanyPageDto(items=())
+        if len(tags) == 1:
+            return await self.get_by_tag(tags[0], limit=limit, cursor=cursor)
+
+        limit = self._page_limit(limit)
+        after = _uuid_position(cursor)
+        if self._tag_index is not None:
+            return self._search_tag_index(tags, mode, limit, after)
+
+        cache_key = company_tags_cache_key(tags, mode)
+        field = page_cache_field(limit, cursor)
+        cached = await self._get_cached(cache_key, self._decode_page, field=field)
+        if cached is not None:
+            return cached
+
+        return await self._load_once(
+            cache_key,
+            load=lambda: self._load_by_tags(tags, mode, limit, after, cache_key, field),
+            decode=self._decode_page,
+            field=field,
+        )
+
+    async def _load_by_tags(
+        self,
+        tags: list[str],
+        mode: TagMatchMode,
+        limit: int,
+        after: uuid.UUID | None,
+        cache_key: str,
+        field: str,
+    ) -> CompanyPageDto:
+        # company_tag 를 회사별로 묶어 한 번의 쿼리로 처리 (all: 모든 태그명이 일치한 회사만)
+        stmt = (
+            select(Company, Company.id)
+            .join(company_tag, company_tag.c.company_id == Company.id)
+            .join(
+                CompanyTagName,
+                CompanyTagName.company_tag_id == company_tag.c.company_tag_id,
+            )
+            .where(CompanyTagName.name.in_(tags))
+            .group_by(Company.id)
+            .options(selectinload(Company.names))
+            .order_by(Company.id)
+            .limit(limit + 1)
+        )
+        if mode == TagMatchMode.ALL:
+            stmt = stmt.having(func.count(distinct(CompanyTagName.name)) == len(tags))
+        if after is not None:
+            stmt = stmt.where(Company.id > after)
+        result = await self._db.execute(stmt)
+
+        page = self._to_page(
+            [(company, str(company_id)) for company, company_id in result.all()],
+            limit,
+        )
+        # 값을 저장하기 전에 태그별 색인에 등록하여 무효화 누락을 막음
+        async with self._redis.pipeline(transaction=True) as pipe:
+            for tag in tags:
+                index_key = company_tag_combinations_index_key(tag)
+                pipe.sadd(index_key, cache_key)
+                pipe.expire(index_key, self._tag_cache_ttl.hard)
+            await pipe.execute()
+        await self._set_cached(
             cache_key,
-            self._company_mapper.dtos_to_json(company_dtos),
-            ex=self._settings.REPOSITORY_CACHE_TTL,
+            self._company_mapper.page_to_cache_data(page),
+            self._tag_cache_ttl,
+            field=field,
         )
-        return company_dtos
+        return page
 
-    async def save(self, company: CompanyEntity) -> None:
+    async def save(self, company: CompanyEntity) -> CompanyEntity:
         company_row = self._company_mapper.entity_to_row(company)
+        if company_row.id is None:
+            # flush 전에도 ID 를 알 수 있도록 미리 생성
+            company_row.id = uuid.uuid4()
 
         existing_tag_ids = [tag.id for tag in company.tags if tag.id is not None]
 
@@ -139,9 +816,13 @@ class CompanyRepository:
         self._db.add(company_row)
 
         # Cache 무효화
-        for tag in company.tags:
-            for tag_name in tag.names:
-                await self._redis.delete(f"{self._cache_namespace}:tag:{tag_name.name}")
+        await self._invalidate(
+            await self._tag_keys(
+                tag_name.name for tag in company.tags for tag_name in tag.names
+            )
+        )
+
+        return replace(company, id=str(company_row.id))
 
     async def add_tag(
         self, name: str, tags: list[CompanyTagEntity]
@@ -152,6 +833,22 @@ class CompanyRepository:
 
         existing_tag_ids = {tag.id for tag in company.tags}
 
+        # 추가할 기존 태그는 한 번에 조회
+        added_tag_ids = [
+            tag.id
+            for tag in tags
+            if tag.id is not None and tag.id not in existing_tag_ids
+        ]
+        tag_rows = {}
+        if added_tag_ids:
+            stmt = (
+                select(CompanyTag)
+                .where(CompanyTag.id.in_(added_tag_ids))
+                .options(selectinload(CompanyTag.names))
+            )
+            result = await self._db.execute(stmt)
+            tag_rows = {tag_row.id: tag_row for tag_row in result.scalars().all()}
+
         for tag in tags:
             if tag.id is None:
                 tag_new_row = self._company_tag_mapper.entity_to_row(tag)
@@ -160,24 +857,21 @@ class CompanyRepository:
             if tag.id in existing_tag_ids:
                 continue
 
-            stmt = (
-                select(CompanyTag)
-                .where(CompanyTag.id == tag.id)
-                .options(selectinload(CompanyTag.names))
-            )
-            result = await self._db.execute(stmt)
-            tag_row = result.scalar_one_or_none()
+            tag_row = tag_rows.get(tag.id)
             if tag_row:
+                existing_tag_ids.add(tag.id)
                 company.tags.append(tag_row)
 
         await self._db.flush()
         company = await self._get_by_name(name=name)
 
-        # Cache 무효화
-        await self._redis.delete(f"{self._cache_namespace}:name:{name}")
-        for tag in company.tags:
-            for tag_name in tag.names:
-                await self._redis.delete(f"{self._cache_namespace}:tag:{tag_name.name}")
+        # Cache 무효화 (다른 언어의 회사명으로 캐시된 키 포함)
+        await self._invalidate(
+            [self._name_cache_key(company_name.name) for company_name in company.names]
+            + await self._tag_keys(
+                tag_name.name for tag in company.tags for tag_name in tag.names
+            )
+        )
 
         return self._company_mapper.row_to_entity(company)
 
@@ -197,10 +891,89 @@ class CompanyRepository:
         if tag_row:
             company.tags.remove(tag_row)
 
-        # Cache 무효화
-        await self._redis.delete(f"{self._cache_namespace}:name:{name}")
-        if tag_row:
-            for tag_name in tag_row.names:
-                await self._redis.delete(f"{self._cache_namespace}:tag:{tag_name.name}")
+        # Cache 무효화 (다른 언어의 회사명으로 캐시된 키 포함)
+        await self._invalidate(
+            [self._name_cache_key(company_name.name) for company_name in company.names]
+            + await self._tag_keys(
+                tag_name.name for tag_name in (tag_row.names if tag_row else [])
+            )
+        )
 
         return self._company_mapper.row_to_entity(company)
+
+
+def _flight_key(cache_key: str, field: str | None) -> str:
+    return cache_key if field is None else f"{cache_key}#{field}"
+
+
+def _name_match(partial_name: str) -> tuple:
+    pattern = _escape_like(partial_name)
+    match_rank = case(
+        (func.lower(CompanyName.name) == func.lower(partial_name), 0),
+        (CompanyName.name.ilike(f"{pattern}%", escape="\\"), 1),
+        else_=2,
+    )
+    is_match = CompanyName.name.ilike(f"%{pattern}%", escape="\\")
+    return match_rank, is_match, func.similarity(CompanyName.name, partial_name)
+
+
+def _normalized_match(partial_name: str) -> tuple:
+    # search_key: "정규화된 이름[\n초성]", 각 형태의 시작을 앞부분 일치로 취급
+    term = normalize_search_text(partial_name)
+    pattern = _escape_like(term)
+    separator = SEARCH_KEY_SEPARATOR
+    search_key = CompanyName.search_key
+    match_rank = case(
+        (
+            or_(
+                search_key == term,
+                search_key.like(f"{pattern}{separator}%", escape="\\"),
+                search_key.like(f"%{separator}{pattern}", escape="\\"),
+            ),
+            0,
+        ),
+        (
+            or_(
+                search_key.like(f"{pattern}%", escape="\\"),
+                search_key.like(f"%{separator}{pattern}%", escape="\\"),
+            ),
+            1,
+        ),
+        else_=2,
+    )
+    is_match = search_key.like(f"%{pattern}%", escape="\\")
+    return match_rank, is_match, func.similarity(search_key, term)
+
+
+def _escape_like(value: str) -> str:
+    # 사용자 입력의 %, _ 를 LIKE 패턴 문자가 아닌 문자 그대로 일치하도록 escape
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def _ranked_position(cursor: str | None) -> tuple[int, float, int] | None:
+    if cursor is None:
+        return None
+    position = decode_cursor(cursor)
+    try:
+        match_rank, score, name_id = position
+        if not all(
+            isinstance(value, kind) and not isinstance(value, bool)
+            for value, kind in (
+                (match_rank, int),
+                (score, (int, float)),
+                (name_id, int),
+            )
+        ):
+            raise TypeError
+    except (TypeError, ValueError) as e:
+        raise InvalidCursorError(f"Invalid cursor: {cursor}") from e
+    return match_rank, score, name_id
+
+
+def _uuid_position(cursor: str | None) -> uuid.UUID | None:
+    if cursor is None:
+        return None
+    try:
+        return uuid.UUID(str(decode_cursor(cursor)))
+    except ValueError as e:
+        raise InvalidCursorError(f"Invalid cursor: {cursor}") from e
@@ -1,10 +1,13 @@
-from sqlalchemy import func, select, tuple_
+from collections import Counter
+from dataclasses import replace
+
+from sqlalchemy import func, insert, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from app.db.models import CompanyTag, CompanyTagName
-from app.domain.company_entity import CompanyTagEntity
-from app.dto.company_dto import CompanyTagNameDto
+from app.domain.company_entity import CompanyTagEntity, CompanyTagNameEntity
+from app.dto.company_dto import CompanyTagDto, CompanyTagNameDto
 from app.mappers.company_tag_mapper import CompanyTagMapper
 
 
@@ -86,3 +89,140 @@ class CompanyTagRepository:
         await self._db.refresh(tag_row)
 
         return self._company_tag_mapper.row_to_entity(tag_row)
+
+    async def get_or_create_all(
+        self, tags: list[CompanyTagDto]
+    ) -> list[CompanyTagEntity]:
+        """
+        태그마다 get_by_names 후 save 또는 add_missing_names 를 호출한 것과 같은 결과를 반환합니다.
+        기존 태그는 한 번의 조회로 찾고, 새 태그와 누락된 태그명은 각각 한 번의 multi-row INSERT 로 저장합니다.
+        """
+        # 태그 키 -> 태그명, 기존 태그는 태그 ID, 새 태그는 음수 임시 키
+        tag_names: dict[int, list[CompanyTagNameEntity]] = {}
+        pairs = sorted(
+            {(name.name, name.language_code) for tag in tags for name in tag.names}
+        )
+        if pairs:
+            matched_tag_ids = select(CompanyTagName.company_tag_id).where(
+                tuple_(CompanyTagName.name, CompanyTagName.language_code).in_(pairs)
+            )
+            stmt = (
+                select(
+                    CompanyTagName.company_tag_id,
+                    CompanyTagName.id,
+                    CompanyTagName.language_code,
+                    CompanyTagName.name,
+                )
+                .where(CompanyTagName.company_tag_id.in_(matched_tag_ids))
+                .order_by(CompanyTagName.company_tag_id, CompanyTagName.id)
+            )
+            for tag_id, name_id, language_code, name in await self._db.execute(stmt):
+                tag_names.setdefault(tag_id, []).append(
+                    CompanyTagNameEntity(
+                        language_code=language_code,
+                        name=name,
+                        id=name_id,
+                        company_tag_id=tag_id,
+                    )
+                )
+
+        # (태그명, 언어) -> 태그 키, 이번 요청에서 만든 태그도 이후 태그의 조회 대상
+        owners = {
+            (name.name, name.language_code): tag_key
+            for tag_key, names in tag_names.items()
+            for name in names
+        }
+        resolved: list[int] = []
+        new_tag_keys: list[int] = []
+        new_names: list[tuple[int, CompanyTagNameEntity]] = []
+
+        for tag in tags:
+            tag_pairs = {(name.name, name.language_code) for name in tag.names}
+            match_counts = Counter(owners[pair] for pair in tag_pairs if pair in owners)
+            if not match_counts:
+                tag_key = -(len(new_tag_keys) + 1)
+                new_tag_keys.append(tag_key)
+                tag_names[tag_key] = []
+                added = self._company_tag_mapper.dto_to_entity(tag).names
+            else:
+                # 가장 많은 태그명이 일치하는 태그에 없는 언어의 태그명만 추가
+                tag_key = max(match_counts, key=match_counts.get)
+                existing_language_codes = {
+                    name.language_code for name in tag_names[tag_key]
+                }
+                added = []
+                for name in tag.names:
+                    if not name.language_code or not name.name:
+                        continue
+                    if name.language_code in existing_language_codes:
+                        continue
+                    existing_language_codes.add(name.language_code)
+                    added.append(
+                        CompanyTagNameEntity(
+                            language_code=name.language_code, name=name.name
+                        )
+                    )
+
+            for name in added:
+                tag_names[tag_key].append(name)
+                new_names.append((tag_key, name))
+                owners.setdefault((name.name, name.language_code), tag_key)
+            resolved.append(tag_key)
+
+        tag_ids = {tag_key: tag_key for tag_key in tag_names if tag_key > 0}
+        if new_tag_keys:
+            # 새 태그는 컬럼 값이 없으므로 반환된 ID 를 순서와 무관하게 배정
+            result = await self._db.execute(
+                insert(CompanyTag).returning(CompanyTag.id),
+                [{} for _ in new_tag_keys],
+            )
+            tag_ids.update(zip(new_tag_keys, result.scalars().all(), strict=True))
+
+        name_ids = {}
+        if new_names:
+            result = await self._db.execute(
+                insert(CompanyTagName).returning(
+                    CompanyTagName.id,
+                    CompanyTagName.company_tag_id,
+                    CompanyTagName.language_code,
+                ),
+                [
+                    {
+                        "company_tag_id": tag_ids[tag_key],
+                        "language_code": name.language_code,
+                        "name": name.name,
+                    }
+                    for tag_key, name in new_names
+                ],
+            )
+            name_ids = {
+                (tag_id, language_code): name_id
+                for name_id, tag_id, language_code in result
+            }
+            self._expire_names({tag_key for tag_key, _ in new_names if tag_key > 0})
+
+        return [
+            CompanyTagEntity(
+                id=tag_ids[tag_key],
+                names=tuple(
+                    name
+                    if name.id is not None
+                    else replace(
+                        name,
+                        id=name_ids[(tag_ids[tag_key], name.language_code)],
+                        company_tag_id=tag_ids[tag_key],
+                    )
+                    for name in tag_names[tag_key]
+                ),
+            )
+            for tag_key in resolved
+        ]
+
+    def _expire_names(self, tag_ids: set[int]) -> None:
+        # 세션에 이미 로드된 태그는 다음 조회 때 추가된 태그명까지 다시 로드
+        for tag_id in tag_ids:
+            tag_row = self._db.identity_map.get(
+                self._db.identity_key(CompanyTag, tag_id)
+            )
+            if tag_row is not None:
+                self._db.expire(tag_row, ["names"])
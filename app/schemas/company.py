@@ -1,6 +1,10 @@
+import json
+from collections.abc import Sequence
+
 from pydantic import field_validator
 
 from app.core.schema import NamesDict, SchemaBase
+from app.dto.company_dto import CompanySearchResultDto
 
 
 class SearchedCompanyResponse(SchemaBase):
@@ -12,6 +16,29 @@ class CompanyResponse(SchemaBase):
     tags: list[str] = []
 
 
+def _dumps(content: object) -> bytes:
+    # fastapi.responses.JSONResponse.render 와 같은 옵션 (응답 바이트 동일)
+    return json.dumps(
+        content,
+        ensure_ascii=False,
+        allow_nan=False,
+        indent=None,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
+def render_company_response(company: CompanySearchResultDto) -> bytes:
+    # CompanyResponse 와 같은 필드/순서로 직렬화 (pydantic 검증 생략)
+    return _dumps({"company_name": company.company_name, "tags": list(company.tags)})
+
+
+def render_searched_companies_response(
+    companies: Sequence[CompanySearchResultDto],
+) -> bytes:
+    # list[SearchedCompanyResponse] 와 같은 필드/순서로 직렬화 (pydantic 검증 생략)
+    return _dumps([{"company_name": company.company_name} for company in companies])
+
+
 class CompanyTagRequest(SchemaBase):
     tag_name: NamesDict
 
@@ -0,0 +1,126 @@
+import asyncio
+import json
+import uuid
+from typing import Awaitable, Callable
+
+from fastapi import Request
+from redis.asyncio import Redis
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.cache.pubsub import ChannelSubscriber
+from app.db.models import CompanyName
+from app.search.prefix_index import PrefixIndex
+
+AUTOCOMPLETE_CHANNEL = "autocomplete:add"
+
+
+async def load_prefix_index(session: AsyncSession) -> PrefixIndex:
+    # 시작 시 company_names 전체로 인덱스 생성 (첫 번째 이름이 기본 표시 이름이 되도록 id 순)
+    stmt = select(
+        CompanyName.company_id, CompanyName.language_code, CompanyName.name
+    ).order_by(CompanyName.id)
+    result = await session.stream(stmt)
+    return PrefixIndex.build(
+        [
+            (str(company_id), language_code, name)
+            async for company_id, language_code, name in result
+        ]
+    )
+
+
+class AutocompleteIndex:
+    """
+    워커별 PrefixIndex 를 보관하고, 새 회사명을 다른 워커에도 전달합니다.
+    """
+
+    def __init__(
+        self,
+        redis_client: Redis,
+        index: PrefixIndex,
+        load: Callable[[], Awaitable[PrefixIndex]],
+    ):
+        self._redis = redis_client
+        self._index = index
+        self._load = load
+        # 자신이 보낸 다시 생성 메시지를 구분하기 위한 ID
+        self.origin = uuid.uuid4().hex
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def search(self, prefix: str, language_code: str, limit: int) -> list[str]:
+        return self._index.search(prefix, language_code, limit)
+
+    def add(self, company_id: str, names: list[tuple[str, str]]) -> None:
+        self._index.add(company_id, names)
+
+    def replace(self, index: PrefixIndex) -> None:
+        self._index = index
+
+    async def refresh(self) -> None:
+        self.replace(await self._load())
+
+    async def add_company(self, company_id: str, names: list[tuple[str, str]]) -> None:
+        # 현재 워커는 바로 반영하고, 다른 워커는 pub/sub 으로 반영 (중복 추가는 무시됨)
+        self.add(company_id, names)
+        await self._redis.publish(
+            AUTOCOMPLETE_CHANNEL,
+            json.dumps({"company_id": company_id, "names": names}),
+        )
+
+    async def reload(self) -> None:
+        # 데이터 초기화 등 대량 변경 후 모든 워커에서 DB 로 다시 생성 (현재 워커는 한 번만)
+        await self.refresh()
+        await self._redis.publish(
+            AUTOCOMPLETE_CHANNEL, json.dumps({"reload": True, "origin": self.origin})
+        )
+
+
+class AutocompleteSubscriber(ChannelSubscriber):
+    """
+    다른 워커에서 추가된 회사명을 인덱스에 반영합니다.
+    연결이 끊기면 놓친 메시지가 있을 수 있으므로 DB 에서 인덱스를 다시 만듭니다.
+    """
+
+    channel = AUTOCOMPLETE_CHANNEL
+
+    def __init__(
+        self,
+        redis_client: Redis,
+        autocomplete_index: AutocompleteIndex,
+        retry_interval: float = 1.0,
+    ):
+        super().__init__(redis_client, retry_interval)
+        self._autocomplete_index = autocomplete_index
+        self._reload_task: asyncio.Task | None = None
+
+    def handle(self, data: dict) -> None:
+        if data.get("reload"):
+            if data.get("origin") == self._autocomplete_index.origin:
+                return
+            if self._reload_task is None or self._reload_task.done():
+                self._reload_task = asyncio.create_task(
+                    self._autocomplete_index.refresh()
+                )
+            return
+        self._autocomplete_index.add(
+            data["company_id"], [tuple(name) for name in data["names"]]
+        )
+
+    async def on_reconnect(self) -> None:
+        await self._autocomplete_index.refresh()
+
+    async def stop(self) -> None:
+        await super().stop()
+        if self._reload_task is not None:
+            self._reload_task.cancel()
+            try:
+                await self._reload_task
+            except (asyncio.CancelledError, Exception):
+                pass
+            self._reload_task = None
+
+
+def get_autocomplete_index(request: Request) -> AutocompleteIndex | None:
+    return request.app.state.autocomplete_index
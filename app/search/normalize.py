@@ -0,0 +1,43 @@
+import unicodedata
+
+# 한글 음절(가-힣)의 초성 19개 (호환 자모)
+_CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+_HANGUL_FIRST, _HANGUL_LAST = 0xAC00, 0xD7A3
+_SYLLABLES_PER_CHOSEONG = 21 * 28
+# 가타카나(ァ-ヶ)는 같은 위치의 히라가나(ぁ-ゖ)로 접음
+_KATAKANA_FIRST, _KATAKANA_LAST = 0x30A1, 0x30F6
+_KANA_OFFSET = 0x60
+
+# 검색 키 안의 여러 형태(정규화된 이름, 초성)를 구분, LIKE 검색이 경계를 넘지 않도록 개행 사용
+SEARCH_KEY_SEPARATOR = "\n"
+
+
+def normalize_search_text(value: str) -> str:
+    # NFKC(전각/반각 통일) -> casefold -> 가타카나를 히라가나로
+    value = unicodedata.normalize("NFKC", value).casefold()
+    return "".join(
+        chr(ord(char) - _KANA_OFFSET)
+        if _KATAKANA_FIRST <= ord(char) <= _KATAKANA_LAST
+        else char
+        for char in value
+    )
+
+
+def hangul_choseong(value: str) -> str:
+    # 한글 음절은 초성으로, 나머지 문자는 그대로 둔다 ("원티드랩" -> "ㅇㅌㄷㄹ")
+    return "".join(
+        _CHOSEONG[(ord(char) - _HANGUL_FIRST) // _SYLLABLES_PER_CHOSEONG]
+        if _HANGUL_FIRST <= ord(char) <= _HANGUL_LAST
+        else char
+        for char in value
+    )
+
+
+def build_search_key(name: str) -> str:
+    # 정규화된 이름, 한글이 있으면 초성 문자열을 이어 붙임 (초성도 같은 방식으로 정규화)
+    normalized = normalize_search_text(name)
+    forms = [normalized]
+    choseong = normalize_search_text(hangul_choseong(normalized))
+    if choseong != normalized:
+        forms.append(choseong)
+    return SEARCH_KEY_SEPARATOR.join(forms)
@@ -0,0 +1,113 @@
+import heapq
+from bisect import bisect_left, insort
+from itertools import chain, islice
+from typing import Iterable, Iterator
+
+
+def normalize_prefix(value: str) -> str:
+    return value.strip().casefold()
+
+
+class PrefixIndex:
+    """
+    언어별 회사명 prefix 인덱스 (정렬된 배열 + bisect)
+    언어/이름 길이마다 (정규화된 이름, 회사 ID, 이름) 튜플을 정렬하여 보관하고,
+    짧은 이름의 버킷부터 prefix 범위를 이분 탐색으로 찾아 limit 개를 채우면 중단합니다.
+    """
+
+    def __init__(self):
+        # 언어 -> 정규화된 이름 길이 -> 정렬된 항목
+        self._entries: dict[str, dict[int, list[tuple[str, str, str]]]] = {}
+        # 모든 언어의 이름 길이 (오름차순)
+        self._lengths: list[int] = []
+        # 회사 ID -> {언어: 이름}, 응답 언어 선택용 (첫 번째 이름이 기본값)
+        self._company_names: dict[str, dict[str, str]] = {}
+
+    def __len__(self) -> int:
+        return sum(
+            len(entries)
+            for buckets in self._entries.values()
+            for entries in buckets.values()
+        )
+
+    @classmethod
+    def build(cls, rows: Iterable[tuple[str, str, str]]) -> "PrefixIndex":
+        # rows: (회사 ID, 언어, 이름), 시작 시 한 번에 정렬하여 생성
+        index = cls()
+        for company_id, language_code, name in rows:
+            names = index._company_names.setdefault(company_id, {})
+            names.setdefault(language_code, name)
+            normalized = normalize_prefix(name)
+            index._entries.setdefault(language_code, {}).setdefault(
+                len(normalized), []
+            ).append((normalized, company_id, name))
+        lengths = set()
+        for buckets in index._entries.values():
+            for entries in buckets.values():
+                entries.sort()
+            lengths.update(buckets)
+        index._lengths = sorted(lengths)
+        return index
+
+    def add(self, company_id: str, names: Iterable[tuple[str, str]]) -> None:
+        company_names = self._company_names.setdefault(company_id, {})
+        for language_code, name in names:
+            if company_names.get(language_code) == name:
+                continue
+            company_names.setdefault(language_code, name)
+            normalized = normalize_prefix(name)
+            buckets = self._entries.setdefault(language_code, {})
+            insort(
+                buckets.setdefault(len(normalized), []),
+                (normalized, company_id, name),
+            )
+            position = bisect_left(self._lengths, len(normalized))
+            if self._lengths[position : position + 1] != [len(normalized)]:
+                self._lengths.insert(position, len(normalized))
+
+    def search(self, prefix: str, language_code: str, limit: int) -> list[str]:
+        key = normalize_prefix(prefix)
+        if not key or limit <= 0:
+            return []
+
+        # 정확히 일치 > 짧은 이름 > 요청 언어 > 사전순
+        # 짧은 길이부터 보므로 앞 길이에서 limit 개를 채우면 긴 이름은 보지 않음
+        result = []
+        seen = set()
+        for length in islice(self._lengths, bisect_left(self._lengths, len(key)), None):
+            other_languages = heapq.merge(
+                *(
+                    _prefix_range(buckets.get(length), key)
+                    for entry_language, buckets in self._entries.items()
+                    if entry_language != language_code
+                )
+            )
+            wanted_language = _prefix_range(
+                self._entries.get(language_code, {}).get(length), key
+            )
+            for _, company_id, _ in chain(wanted_language, other_languages):
+                if company_id in seen:
+                    continue
+                seen.add(company_id)
+                result.append(self._display_name(company_id, language_code))
+                if len(result) == limit:
+                    return result
+        return result
+
+    def _display_name(self, company_id: str, language_code: str) -> str:
+        names = self._company_names[company_id]
+        return names.get(language_code) or next(iter(names.values()))
+
+
+def _prefix_range(
+    entries: list[tuple[str, str, str]] | None, key: str
+) -> Iterator[tuple[str, str, str]]:
+    # 범위를 복사하지 않고 인덱스로 순회 (필요한 만큼만 읽음)
+    if not entries:
+        return
+    start = bisect_left(entries, (key,))
+    for position in range(start, len(entries)):
+        entry = entries[position]
+        if not entry[0].startswith(key):
+            return
+        yield entry
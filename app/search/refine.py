@@ -0,0 +1,86 @@
+from dataclasses import dataclass
+
+from fastapi import Request
+
+from app.core.constants import SearchMode
+from app.search.normalize import SEARCH_KEY_SEPARATOR, normalize_search_text
+from app.search.trigram import similarity
+
+# 부분 검색 후보: [회사 ID, [[회사명 행 ID, 회사명, 검색 키], ...(검색 범위에서 일치한 이름)], [[언어, 회사명], ...]]
+Candidate = list
+
+
+@dataclass(slots=True)
+class PartialNameRefineStats:
+    # hits: 캐시된 짧은 검색어의 후보에서 결과를 계산한 횟수, misses: 사용할 후보가 없어 DB 를 조회한 횟수
+    hits: int = 0
+    misses: int = 0
+
+
+def search_term(partial_name: str, mode: SearchMode) -> str:
+    # 비교에 사용하는 검색어, 짧은 검색어의 term 이 긴 검색어 term 의 앞부분이면 결과가 포함 관계
+    if mode == SearchMode.NORMALIZED:
+        return normalize_search_text(partial_name)
+    return partial_name.lower()
+
+
+def _match(name: str, search_key: str | None, term: str, mode: SearchMode):
+    # 리포지토리의 _name_match / _normalized_match 와 같은 (일치 종류, 유사도), 불일치는 None
+    if mode == SearchMode.NORMALIZED:
+        if search_key is None or term not in search_key:
+            return None
+        forms = search_key.split(SEARCH_KEY_SEPARATOR)
+        if term in forms:
+            match_rank = 0
+        elif any(form.startswith(term) for form in forms):
+            match_rank = 1
+        else:
+            match_rank = 2
+        return match_rank, similarity(search_key, term)
+
+    lowered = name.lower()
+    if term not in lowered:
+        return None
+    if lowered == term:
+        match_rank = 0
+    elif lowered.startswith(term):
+        match_rank = 1
+    else:
+        match_rank = 2
+    return match_rank, similarity(name, term)
+
+
+def refine_candidates(
+    candidates: list[Candidate],
+    partial_name: str,
+    mode: SearchMode,
+) -> list[tuple[list, Candidate]]:
+    """
+    짧은 검색어의 후보에서 partial_name 에 일치하는 회사만 남기고 DB 와 같은 기준으로 정렬합니다.
+    유사도는 pg_trgm 과 완전히 같지 않으므로 커서(다음 페이지)가 필요한 경우에는 사용하지 않습니다.
+    반환: (정렬 키 [일치 종류, 유사도, 회사명 행 ID], 일치한 이름만 남긴 후보) 목록
+    """
+    term = search_term(partial_name, mode)
+    ranked = []
+    for company_id, matched_names, names in candidates:
+        best = None
+        matched = []
+        for name_id, name, search_key in matched_names:
+            result = _match(name, search_key, term, mode)
+            if result is None:
+                continue
+            match_rank, score = result
+            matched.append([name_id, name, search_key])
+            position = (match_rank, -score, name_id)
+            if best is None or position < best:
+                best = position
+        if best is None:
+            continue
+        match_rank, score, name_id = best
+        ranked.append(([match_rank, -score, name_id], [company_id, matched, names]))
+    ranked.sort(key=lambda item: (item[0][0], -item[0][1], item[0][2]))
+    return ranked
+
+
+def get_partial_name_refine_stats(request: Request) -> PartialNameRefineStats:
+    return request.app.state.partial_name_refine_stats
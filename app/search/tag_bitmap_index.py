@@ -0,0 +1,319 @@
+import heapq
+import sys
+from array import array
+from bisect import bisect_left, bisect_right
+from itertools import islice, takewhile
+from typing import Iterable, Iterator
+
+from app.core.constants import TagMatchMode
+
+CompanyNames = tuple[tuple[str, str], ...]
+
+
+class Bitmap:
+    """
+    정수 집합을 보관하는 압축 비트맵 (roaring 방식)
+    값의 상위 16비트로 컨테이너를 나누고, 컨테이너마다 하위 16비트를 정렬된 array('H') 로 보관합니다.
+    """
+
+    __slots__ = ("_containers",)
+
+    def __init__(self, values: Iterable[int] = ()):
+        self._containers: dict[int, array] = {}
+        for value in sorted(set(values)):
+            self._containers.setdefault(value >> 16, array("H")).append(value & 0xFFFF)
+
+    def __len__(self) -> int:
+        return sum(len(container) for container in self._containers.values())
+
+    def __bool__(self) -> bool:
+        return bool(self._containers)
+
+    def __iter__(self):
+        return self.iter_from(0)
+
+    def iter_from(self, start: int) -> Iterator[int]:
+        # start 이상의 값을 오름차순으로, 앞의 컨테이너는 건너뛰고 시작 위치는 이분 탐색
+        start_high = start >> 16
+        for high in sorted(self._containers):
+            if high < start_high:
+                continue
+            container = self._containers[high]
+            base = high << 16
+            i = bisect_left(container, start & 0xFFFF) if high == start_high else 0
+            for j in range(i, len(container)):
+                yield base | container[j]
+
+    def __contains__(self, value: int) -> bool:
+        container = self._containers.get(value >> 16)
+        if container is None:
+            return False
+        low = value & 0xFFFF
+        i = bisect_left(container, low)
+        return i < len(container) and container[i] == low
+
+    def add(self, value: int) -> None:
+        container = self._containers.setdefault(value >> 16, array("H"))
+        low = value & 0xFFFF
+        i = bisect_left(container, low)
+        if i == len(container) or container[i] != low:
+            container.insert(i, low)
+
+    def discard(self, value: int) -> None:
+        high = value >> 16
+        container = self._containers.get(high)
+        if container is None:
+            return
+        low = value & 0xFFFF
+        i = bisect_left(container, low)
+        if i < len(container) and container[i] == low:
+            del container[i]
+            if not container:
+                del self._containers[high]
+
+    def __and__(self, other: "Bitmap") -> "Bitmap":
+        result = Bitmap()
+        for high in self._containers.keys() & other._containers.keys():
+            container = _intersect(self._containers[high], other._containers[high])
+            if container:
+                result._containers[high] = container
+        return result
+
+    def __or__(self, other: "Bitmap") -> "Bitmap":
+        result = Bitmap()
+        for high in self._containers.keys() | other._containers.keys():
+            left = self._containers.get(high, ())
+            right = other._containers.get(high, ())
+            result._containers[high] = array("H", sorted(set(left).union(right)))
+        return result
+
+    @classmethod
+    def intersection(cls, bitmaps: list["Bitmap"]) -> "Bitmap":
+        # 작은 비트맵부터 교집합하여 중간 결과를 줄임
+        if not bitmaps:
+            return cls()
+        ordered = sorted(bitmaps, key=len)
+        result = ordered[0]
+        for bitmap in ordered[1:]:
+            if not result:
+                break
+            result = result & bitmap
+        return result
+
+    @classmethod
+    def union(cls, bitmaps: list["Bitmap"]) -> "Bitmap":
+        result = cls()
+        for bitmap in bitmaps:
+            result = result | bitmap
+        return result
+
+    def nbytes(self) -> int:
+        return sys.getsizeof(self._containers) + sum(
+            sys.getsizeof(container) for container in self._containers.values()
+        )
+
+
+def _intersect(small: array, large: array) -> array:
+    # 정렬된 두 배열의 교집합, 작은 쪽의 값을 큰 쪽에서 이분 탐색 (앞으로만 이동)
+    if len(small) > len(large):
+        small, large = large, small
+    result = array("H")
+    lo = 0
+    for value in small:
+        lo = bisect_left(large, value, lo)
+        if lo == len(large):
+            break
+        if large[lo] == value:
+            result.append(value)
+    return result
+
+
+class TagBitmapIndex:
+    """
+    태그명 -> 회사 비트맵 역색인
+    회사마다 조밀한 순번(ordinal)을 부여하고, (태그명, 언어) 별로 해당 태그가 달린 회사 순번을
+    Bitmap 으로 보관합니다. 순번 -> 회사 ID/회사명 테이블로 응답을 DB 조회 없이 만듭니다.
+    build 에서는 회사 ID 순으로 순번을 부여하므로 페이지 조회는 커서 위치부터 limit 개만 읽습니다.
+    이후 추가된 회사는 뒤쪽 순번(정렬되지 않은 꼬리)에 붙으며 다음 build 까지 따로 확인합니다.
+    """
+
+    def __init__(self):
+        # 회사 ID -> 순번, 순번 -> 회사 ID/회사명/(태그 언어, 태그명)
+        self._ordinals: dict[str, int] = {}
+        self._company_ids: list[str] = []
+        self._company_names: list[CompanyNames] = []
+        self._company_tags: list[frozenset[tuple[str, str]]] = []
+        # 태그명 -> {언어: Bitmap}
+        self._postings: dict[str, dict[str, Bitmap]] = {}
+        # 이 순번 미만은 순번 순서와 회사 ID 순서가 같음
+        self._sorted_count = 0
+
+    def __len__(self) -> int:
+        return len(self._company_ids)
+
+    @classmethod
+    def build(
+        cls,
+        name_rows: Iterable[tuple[str, str, str]],
+        tag_rows: Iterable[tuple[str, str, str]],
+    ) -> "TagBitmapIndex":
+        # name_rows: (회사 ID, 언어, 회사명), tag_rows: (회사 ID, 태그 언어, 태그명)
+        index = cls()
+        names: dict[str, list[tuple[str, str]]] = {}
+        for company_id, language_code, name in name_rows:
+            names.setdefault(company_id, []).append((language_code, name))
+        for company_id in sorted(names):
+            index._append_company(company_id, tuple(names[company_id]))
+        index._sorted_count = len(index._company_ids)
+
+        tags: dict[int, set[tuple[str, str]]] = {}
+        ordinals: dict[tuple[str, str], list[int]] = {}
+        for company_id, language_code, tag_name in tag_rows:
+            ordinal = index._ordinals.get(company_id)
+            if ordinal is None:
+                continue
+            tags.setdefault(ordinal, set()).add((language_code, tag_name))
+            ordinals.setdefault((tag_name, language_code), []).append(ordinal)
+        for ordinal, company_tags in tags.items():
+            index._company_tags[ordinal] = frozenset(company_tags)
+        for (tag_name, language_code), values in ordinals.items():
+            index._postings.setdefault(tag_name, {})[language_code] = Bitmap(values)
+        return index
+
+    def _append_company(self, company_id: str, names: CompanyNames) -> int:
+        ordinal = len(self._company_ids)
+        self._ordinals[company_id] = ordinal
+        self._company_ids.append(company_id)
+        self._company_names.append(names)
+        self._company_tags.append(frozenset())
+        return ordinal
+
+    def update_company(
+        self,
+        company_id: str,
+        names: Iterable[tuple[str, str]],
+        tags: Iterable[tuple[str, str]],
+    ) -> None:
+        # 회사의 이름/태그 전체를 받아 이전 상태와의 차이만 반영 (같은 내용을 다시 받아도 무방)
+        names = tuple(names)
+        ordinal = self._ordinals.get(company_id)
+        if ordinal is None:
+            ordinal = self._append_company(company_id, names)
+        elif names:
+            self._company_names[ordinal] = names
+
+        tags = frozenset(tags)
+        previous = self._company_tags[ordinal]
+        for language_code, tag_name in previous - tags:
+            languages = self._postings.get(tag_name, {})
+            bitmap = languages.get(language_code)
+            if bitmap is None:
+                continue
+            bitmap.discard(ordinal)
+            if not bitmap:
+                del languages[language_code]
+                if not languages:
+                    del self._postings[tag_name]
+        for language_code, tag_name in tags - previous:
+            languages = self._postings.setdefault(tag_name, {})
+            languages.setdefault(language_code, Bitmap()).add(ordinal)
+        self._company_tags[ordinal] = tags
+
+    def lookup(self, tag: str) -> Bitmap:
+        # 태그명은 언어와 관계없이 일치시키므로 언어별 비트맵의 합집합 (결과는 수정하지 않음)
+        bitmaps = list(self._postings.get(tag, {}).values())
+        if len(bitmaps) == 1:
+            return bitmaps[0]
+        return Bitmap.union(bitmaps)
+
+    def search(
+        self,
+        tags: list[str],
+        mode: TagMatchMode,
+        limit: int,
+        after: str | None = None,
+    ) -> list[tuple[str, CompanyNames]]:
+        # 회사 ID 순으로 after 다음부터 최대 limit 개 (DB 조회와 같은 keyset 순서)
+        # 태그별 언어 비트맵 목록 (태그명은 언어와 관계없이 일치)
+        groups = [list(self._postings.get(tag, {}).values()) for tag in tags]
+        start = 0
+        if after is not None:
+            start = bisect_right(self._company_ids, after, 0, self._sorted_count)
+
+        # 정렬된 구간은 커서 위치부터 limit 개까지만 확인
+        sorted_matches = takewhile(
+            lambda ordinal: ordinal < self._sorted_count,
+            _iter_matches(groups, mode, start),
+        )
+        company_ids = [
+            self._company_ids[ordinal] for ordinal in islice(sorted_matches, limit)
+        ]
+        # build 이후 추가된 회사는 순서가 없으므로 전부 확인
+        if self._sorted_count < len(self._company_ids):
+            tail_ids = (
+                self._company_ids[ordinal]
+                for ordinal in _iter_matches(groups, mode, self._sorted_count)
+            )
+            company_ids.extend(
+                company_id
+                for company_id in tail_ids
+                if after is None or company_id > after
+            )
+        return [
+            (company_id, self._company_names[self._ordinals[company_id]])
+            for company_id in heapq.nsmallest(limit, company_ids)
+        ]
+
+    def memory_usage(self) -> dict[str, int]:
+        bitmap_bytes = sys.getsizeof(self._postings) + sum(
+            sys.getsizeof(languages)
+            + sum(bitmap.nbytes() for bitmap in languages.values())
+            for languages in self._postings.values()
+        )
+        table_bytes = (
+            sys.getsizeof(self._ordinals)
+            + sys.getsizeof(self._company_ids)
+            + sys.getsizeof(self._company_names)
+            + sys.getsizeof(self._company_tags)
+            + sum(sys.getsizeof(company_id) for company_id in self._company_ids)
+            + sum(
+                sys.getsizeof(names)
+                + sum(sys.getsizeof(name) + sys.getsizeof(name[1]) for name in names)
+                for names in self._company_names
+            )
+            + sum(sys.getsizeof(tags) for tags in self._company_tags)
+        )
+        return {
+            "companies": len(self._company_ids),
+            "tags": sum(len(languages) for languages in self._postings.values()),
+            "bitmap_bytes": bitmap_bytes,
+            "table_bytes": table_bytes,
+        }
+
+
+def _iter_matches(
+    groups: list[list[Bitmap]], mode: TagMatchMode, start: int
+) -> Iterator[int]:
+    # start 이상의 일치하는 순번을 오름차순으로 필요한 만큼만 생성
+    # groups: 태그별 언어 비트맵 목록 (한 태그 안에서는 어느 언어든 일치)
+    if mode == TagMatchMode.ALL:
+        if not groups or not all(groups):
+            return
+        # 가장 작은 태그를 따라가며 나머지 태그에 포함되는지 확인
+        smallest, *others = sorted(
+            groups, key=lambda bitmaps: sum(len(bitmap) for bitmap in bitmaps)
+        )
+        for ordinal in _merge(smallest, start):
+            if all(any(ordinal in bitmap for bitmap in group) for group in others):
+                yield ordinal
+    else:
+        yield from _merge([bitmap for group in groups for bitmap in group], start)
+
+
+def _merge(bitmaps: list[Bitmap], start: int) -> Iterator[int]:
+    # 여러 비트맵의 합집합을 만들지 않고 순서대로 병합 (중복 제거)
+    previous = None
+    for ordinal in heapq.merge(*(bitmap.iter_from(start) for bitmap in bitmaps)):
+        if ordinal != previous:
+            yield ordinal
+            previous = ordinal
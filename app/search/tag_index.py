@@ -0,0 +1,141 @@
+import asyncio
+import json
+from typing import Awaitable, Callable, Iterable
+
+from fastapi import Request
+from redis.asyncio import Redis
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.cache.pubsub import ChannelSubscriber
+from app.core.constants import TagMatchMode
+from app.db.models import CompanyName, CompanyTagName, company_tag
+from app.search.tag_bitmap_index import CompanyNames, TagBitmapIndex
+
+TAG_INDEX_CHANNEL = "tag_index:update"
+
+
+async def load_tag_bitmap_index(session: AsyncSession) -> TagBitmapIndex:
+    # 회사 ID 순으로 순번을 부여 (회사명은 저장 순서 유지)
+    name_stmt = select(
+        CompanyName.company_id, CompanyName.language_code, CompanyName.name
+    ).order_by(CompanyName.company_id, CompanyName.id)
+    tag_stmt = select(
+        company_tag.c.company_id, CompanyTagName.language_code, CompanyTagName.name
+    ).join(
+        CompanyTagName, CompanyTagName.company_tag_id == company_tag.c.company_tag_id
+    )
+    name_result = await session.stream(name_stmt)
+    name_rows = [
+        (str(company_id), language_code, name)
+        async for company_id, language_code, name in name_result
+    ]
+    tag_result = await session.stream(tag_stmt)
+    tag_rows = [
+        (str(company_id), language_code, name)
+        async for company_id, language_code, name in tag_result
+    ]
+    return TagBitmapIndex.build(name_rows, tag_rows)
+
+
+class TagIndex:
+    """
+    워커별 TagBitmapIndex 를 보관하고, 회사 태그 변경을 다른 워커에도 전달합니다.
+    """
+
+    def __init__(
+        self,
+        redis_client: Redis,
+        index: TagBitmapIndex,
+        load: Callable[[], Awaitable[TagBitmapIndex]],
+    ):
+        self._redis = redis_client
+        self._index = index
+        self._load = load
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def search(
+        self, tags: list[str], mode: TagMatchMode, limit: int, after: str | None
+    ) -> list[tuple[str, CompanyNames]]:
+        return self._index.search(tags, mode, limit, after)
+
+    def memory_usage(self) -> dict[str, int]:
+        return self._index.memory_usage()
+
+    def apply(
+        self,
+        company_id: str,
+        names: Iterable[tuple[str, str]],
+        tags: Iterable[tuple[str, str]],
+    ) -> None:
+        self._index.update_company(company_id, names, tags)
+
+    def replace(self, index: TagBitmapIndex) -> None:
+        self._index = index
+
+    async def refresh(self) -> None:
+        self.replace(await self._load())
+
+    async def update_company(
+        self,
+        company_id: str,
+        names: list[tuple[str, str]],
+        tags: list[tuple[str, str]],
+    ) -> None:
+        # 현재 워커는 바로 반영하고, 다른 워커는 pub/sub 으로 반영 (회사 전체 상태라 재적용해도 무방)
+        self.apply(company_id, names, tags)
+        await self._redis.publish(
+            TAG_INDEX_CHANNEL,
+            json.dumps({"company_id": company_id, "names": names, "tags": tags}),
+        )
+
+    async def reload(self) -> None:
+        # 리포지토리를 거치지 않은 대량 변경(데이터 초기화 등) 후 모든 워커에서 DB 로 다시 생성
+        await self.refresh()
+        await self._redis.publish(TAG_INDEX_CHANNEL, json.dumps({"reload": True}))
+
+
+class TagIndexSubscriber(ChannelSubscriber):
+    """
+    다른 워커에서 변경된 회사 태그를 인덱스에 반영합니다.
+    연결이 끊기면 놓친 메시지가 있을 수 있으므로 DB 에서 인덱스를 다시 만듭니다.
+    """
+
+    channel = TAG_INDEX_CHANNEL
+
+    def __init__(
+        self, redis_client: Redis, tag_index: TagIndex, retry_interval: float = 1.0
+    ):
+        super().__init__(redis_client, retry_interval)
+        self._tag_index = tag_index
+        self._reload_task: asyncio.Task | None = None
+
+    def handle(self, data: dict) -> None:
+        if data.get("reload"):
+            if self._reload_task is None or self._reload_task.done():
+                self._reload_task = asyncio.create_task(self._tag_index.refresh())
+            return
+        self._tag_index.apply(
+            data["company_id"],
+            [tuple(name) for name in data["names"]],
+            [tuple(tag) for tag in data["tags"]],
+        )
+
+    async def on_reconnect(self) -> None:
+        await self._tag_index.refresh()
+
+    async def stop(self) -> None:
+        await super().stop()
+        if self._reload_task is not None:
+            self._reload_task.cancel()
+            try:
+                await self._reload_task
+            except (asyncio.CancelledError, Exception):
+                pass
+            self._reload_task = None
+
+
+def get_tag_index(request: Request) -> TagIndex | None:
+    return request.app.state.tag_index
@@ -0,0 +1,51 @@
+# pg_trgm similarity() 의 Python 구현, postgres 가 아닌 DB(sqlite 테스트/벤치마크)에서 사용
+
+
+def _ordered_trigrams(value: str) -> list[str]:
+    # pg_trgm 과 같이 단어(영숫자 연속) 단위로 앞 공백 2칸, 뒤 공백 1칸을 붙여 3글자씩 분리
+    result = []
+    word = []
+    for char in value.lower() + " ":
+        if char.isalnum():
+            word.append(char)
+            continue
+        if word:
+            padded = "  " + "".join(word) + " "
+            result.extend(padded[i : i + 3] for i in range(len(padded) - 2))
+            word.clear()
+    return result
+
+
+def trigrams(value: str) -> set[str]:
+    return set(_ordered_trigrams(value))
+
+
+def similarity(left: str | None, right: str | None) -> float | None:
+    if left is None or right is None:
+        return None
+    left_trigrams, right_trigrams = trigrams(left), trigrams(right)
+    if not left_trigrams or not right_trigrams:
+        return 0.0
+    shared = len(left_trigrams & right_trigrams)
+    return shared / (len(left_trigrams) + len(right_trigrams) - shared)
+
+
+def word_similarity(left: str | None, right: str | None) -> float | None:
+    # left 의 trigram 과 right 의 연속된 trigram 구간 중 가장 비슷한 구간의 유사도
+    if left is None or right is None:
+        return None
+    left_trigrams = trigrams(left)
+    right_trigrams = _ordered_trigrams(right)
+    if not left_trigrams or not right_trigrams:
+        return 0.0
+    best = 0.0
+    for start, trigram in enumerate(right_trigrams):
+        # 공유하지 않는 trigram 으로 시작하는 구간은 한 칸 뒤에서 시작하는 구간보다 유사도가 낮음
+        if trigram not in left_trigrams:
+            continue
+        extent = set()
+        for value in right_trigrams[start:]:
+            extent.add(value)
+            shared = len(left_trigrams & extent)
+            best = max(best, shared / (len(left_trigrams) + len(extent) - shared))
+    return best
@@ -2,11 +2,21 @@ import logging
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.dto.company_dto import CompanyDto, CompanySearchResultDto, CompanyTagDto
+from app.core.constants import SearchMode, TagMatchMode
+from app.domain.company_entity import CompanyEntity
+from app.dto.company_dto import (
+    CompanyDto,
+    CompanyPageDto,
+    CompanySearchResultDto,
+    CompanySearchResultPageDto,
+    CompanyTagDto,
+)
 from app.interfaces.company_repository import ICompanyRepository
 from app.interfaces.company_tag_repository import ICompanyTagRepository
 from app.mappers.company_mapper import CompanyMapper
 from app.mappers.company_tag_mapper import CompanyTagMapper
+from app.search.autocomplete import AutocompleteIndex
+from app.search.tag_index import TagIndex
 
 logger = logging.getLogger(__name__)
 
@@ -19,12 +29,30 @@ class CompanyService:
         company_tag_repo: ICompanyTagRepository,
         company_mapper: CompanyMapper,
         company_tag_mapper: CompanyTagMapper,
+        autocomplete_index: AutocompleteIndex | None = None,
+        tag_index: TagIndex | None = None,
     ):
         self._db = db
         self._company_repo = company_repo
         self._company_tag_repo = company_tag_repo
         self._company_mapper = company_mapper
         self._company_tag_mapper = company_tag_mapper
+        self._autocomplete_index = autocomplete_index
+        self._tag_index = tag_index
+
+    async def _update_tag_index(self, company: CompanyEntity) -> None:
+        # 커밋된 변경만 모든 워커의 인덱스에 반영되도록 트랜잭션이 끝난 뒤 호출
+        if self._tag_index is None:
+            return
+        await self._tag_index.update_company(
+            company.id,
+            [(name.language_code, name.name) for name in company.names],
+            [
+                (tag_name.language_code, tag_name.name)
+                for tag in company.tags
+                for tag_name in tag.names
+            ],
+        )
 
     async def get_by_name(
         self, name: str, language_code: str
@@ -41,68 +69,106 @@ class CompanyService:
             )
             return None
 
-    async def get_by_partial_name(
-        self, partial_name: str, language_code: str
-    ) -> list[CompanySearchResultDto]:
-        companies = await self._company_repo.get_by_partial_name(
-            partial_name=partial_name
-        )
-
+    def _to_search_result_page(
+        self, page: CompanyPageDto, language_code: str, searched_with: str
+    ) -> CompanySearchResultPageDto:
         result = []
-        for company in companies:
+        for company in page.items:
             try:
                 result.append(
                     self._company_mapper.dto_to_search_result(company, language_code)
                 )
             except ValueError as e:
                 logger.warning(
-                    f"Company with invalid names found: {e}, searched with partial name: {partial_name}"
+                    f"Company with invalid names found: {e}, searched with {searched_with}"
                 )
                 continue
-        return result
+        # 건너뛴 항목이 있어도 다음 페이지 위치는 리포지토리 기준으로 유지
+        return CompanySearchResultPageDto(
+            items=tuple(result), next_cursor=page.next_cursor
+        )
 
-    async def get_by_tag(
-        self, tag: str, language_code: str
+    async def get_by_partial_name(
+        self,
+        partial_name: str,
+        language_code: str,
+        limit: int | None = None,
+        cursor: str | None = None,
+        language_only: bool = False,
+        mode: SearchMode = SearchMode.NAME,
+        fuzzy: bool = False,
+    ) -> CompanySearchResultPageDto:
+        # language_only 이면 x-wanted-language 언어의 회사명에서만 검색
+        page = await self._company_repo.get_by_partial_name(
+            partial_name=partial_name,
+            limit=limit,
+            cursor=cursor,
+            language_code=language_code if language_only else None,
+            mode=mode,
+            fuzzy=fuzzy,
+        )
+        return self._to_search_result_page(
+            page, language_code, f"partial name: {partial_name}"
+        )
+
+    async def autocomplete(
+        self, query: str, language_code: str, limit: int
     ) -> list[CompanySearchResultDto]:
-        companies = await self._company_repo.get_by_tag(tag=tag)
+        if self._autocomplete_index is None:
+            # 인덱스를 사용하지 않는 경우 부분 검색 결과로 대체
+            page = await self.get_by_partial_name(
+                partial_name=query, language_code=language_code, limit=limit
+            )
+            return list(page.items)
 
-        result = []
-        for company in companies:
-            try:
-                result.append(
-                    self._company_mapper.dto_to_search_result(company, language_code)
-                )
-            except ValueError as e:
-                logger.warning(
-                    f"Company with invalid names found: {e}, searched with tag: {tag}"
-                )
-                continue
-        return result
+        return [
+            CompanySearchResultDto(company_name=name)
+            for name in self._autocomplete_index.search(query, language_code, limit)
+        ]
+
+    async def get_by_tag(
+        self,
+        tag: str,
+        language_code: str,
+        limit: int | None = None,
+        cursor: str | None = None,
+    ) -> CompanySearchResultPageDto:
+        page = await self._company_repo.get_by_tag(tag=tag, limit=limit, cursor=cursor)
+        return self._to_search_result_page(page, language_code, f"tag: {tag}")
+
+    async def get_by_tags(
+        self,
+        tags: list[str],
+        language_code: str,
+        mode: TagMatchMode = TagMatchMode.ANY,
+        limit: int | None = None,
+        cursor: str | None = None,
+    ) -> CompanySearchResultPageDto:
+        page = await self._company_repo.get_by_tags(
+            tags=tags, mode=mode, limit=limit, cursor=cursor
+        )
+        return self._to_search_result_page(page, language_code, f"tags: {tags}")
 
     async def create(
         self, company: CompanyDto, language_code: str
     ) -> CompanySearchResultDto:
         async with self._db.begin():
-            tag_entities = []
-            for tag in company.tags:
-                tag_entity = await self._company_tag_repo.get_by_names(
-                    names=list(tag.names)
-                )
-                if tag_entity is None:
-                    new_tag_entity = self._company_tag_mapper.dto_to_entity(tag)
-                    tag_entity = await self._company_tag_repo.save(new_tag_entity)
-                else:
-                    tag_entity = await self._company_tag_repo.add_missing_names(
-                        tag=tag_entity, names=list(tag.names)
-                    )
-
-                tag_entities.append(tag_entity)
+            tag_entities = await self._company_tag_repo.get_or_create_all(
+                tags=list(company.tags)
+            )
 
             company_entity = self._company_mapper.dto_to_entity(
                 company, tags=tag_entities
             )
 
-            await self._company_repo.save(company=company_entity)
+            company_entity = await self._company_repo.save(company=company_entity)
+
+        await self._update_tag_index(company_entity)
+        if self._autocomplete_index is not None:
+            await self._autocomplete_index.add_company(
+                company_entity.id,
+                [(name.language_code, name.name) for name in company_entity.names],
+            )
 
         return self._company_mapper.entity_to_search_result(
             entity=company_entity, language_code=language_code
@@ -112,20 +178,7 @@ class CompanyService:
         self, name: str, tags: list[CompanyTagDto], language_code: str
     ) -> CompanySearchResultDto | None:
         async with self._db.begin():
-            tag_entities = []
-            for tag in tags:
-                tag_entity = await self._company_tag_repo.get_by_names(
-                    names=list(tag.names)
-                )
-                if tag_entity is None:
-                    new_tag_entity = self._company_tag_mapper.dto_to_entity(tag)
-                    tag_entity = await self._company_tag_repo.save(new_tag_entity)
-                else:
-                    tag_entity = await self._company_tag_repo.add_missing_names(
-                        tag=tag_entity, names=list(tag.names)
-                    )
-
-                tag_entities.append(tag_entity)
+            tag_entities = await self._company_tag_repo.get_or_create_all(tags=tags)
 
             company_entity = await self._company_repo.add_tag(
                 name=name, tags=tag_entities
@@ -133,6 +186,7 @@ class CompanyService:
 
         if company_entity is None:
             return None
+        await self._update_tag_index(company_entity)
 
         return self._company_mapper.entity_to_search_result(
             entity=company_entity, language_code=language_code
@@ -146,6 +200,7 @@ class CompanyService:
 
         if company_entity is None:
             return None
+        await self._update_tag_index(company_entity)
 
         return self._company_mapper.entity_to_search_result(
             entity=company_entity, language_code=language_code
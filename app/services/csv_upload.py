@@ -0,0 +1,190 @@
+import asyncio
+import concurrent.futures
+import io
+import zlib
+from typing import IO, AsyncIterable, AsyncIterator
+
+# 업로드 본문을 읽는 단위 (gzip 해제 결과도 이 크기 이하로 나눔)
+UPLOAD_READ_SIZE = 64 * 1024
+
+# 업로드 본문의 다음 청크를 기다리는 최대 시간 (초), 연결이 끊겨도 읽는 스레드가 영원히 막히지 않도록
+UPLOAD_READ_TIMEOUT = 60.0
+
+# multipart 파트 헤더 최대 크기
+_MAX_PART_HEADER_SIZE = 16 * 1024
+
+_GZIP_MAGIC = b"\x1f\x8b"
+
+
+class CsvUploadError(Exception):
+    pass
+
+
+def multipart_boundary(content_type: str | None) -> bytes | None:
+    # multipart/form-data; boundary=... 가 아니면 None
+    media_type, *params = (content_type or "").split(";")
+    if media_type.strip().lower() != "multipart/form-data":
+        return None
+    for param in params:
+        name, _, value = param.strip().partition("=")
+        if name.lower() == "boundary" and value:
+            return value.strip('"').encode("latin-1")
+    raise CsvUploadError("multipart boundary 가 없습니다.")
+
+
+async def multipart_file_chunks(
+    chunks: AsyncIterable[bytes], boundary: bytes
+) -> AsyncIterator[bytes]:
+    """
+    multipart/form-data 본문에서 첫 번째 파일 파트(filename 이 있는 파트)의 내용만 그대로 전달합니다.
+    버퍼에는 받은 청크 하나와 구분자 길이만큼의 꼬리만 유지합니다.
+    """
+    delimiter = b"\r\n--" + boundary
+    # 본문 시작은 앞의 CRLF 없이 "--boundary" 로 시작할 수 있으므로 CRLF 를 붙여 동일하게 처리
+    buffer = b"\r\n"
+    in_headers = False
+    in_file = False
+    found = False
+    async for chunk in chunks:
+        buffer += chunk
+        while True:
+            if in_headers:
+                end = buffer.find(b"\r\n\r\n")
+                if end < 0:
+                    if len(buffer) > _MAX_PART_HEADER_SIZE:
+                        raise CsvUploadError("multipart 파트 헤더가 너무 큽니다.")
+                    break
+                headers = buffer[:end].decode("latin-1").lower()
+                in_file = not found and "filename=" in headers
+                found = found or in_file
+                buffer = buffer[end + 4 :]
+                in_headers = False
+                continue
+
+            index = buffer.find(delimiter)
+            if index < 0:
+                # 구분자가 청크 경계에 걸칠 수 있으므로 꼬리는 남김
+                keep = len(delimiter) + 1
+                if in_file and len(buffer) > keep:
+                    yield buffer[:-keep]
+                buffer = buffer[-keep:]
+                break
+
+            if in_file:
+                if index:
+                    yield buffer[:index]
+                # 파일 파트가 끝나면 나머지 본문은 읽지 않음
+                return
+            rest = buffer[index + len(delimiter) :]
+            if len(rest) < 2:
+                break
+            if rest.startswith(b"--"):
+                raise CsvUploadError("multipart 본문에 파일이 없습니다.")
+            buffer = rest[2:]
+            in_headers = True
+
+    raise CsvUploadError("multipart 본문이 완전하지 않습니다.")
+
+
+async def gunzip_chunks(
+    chunks: AsyncIterable[bytes], max_size: int = UPLOAD_READ_SIZE
+) -> AsyncIterator[bytes]:
+    # 압축률이 높아도 max_size 단위로 나누어 해제 (이어 붙인 gzip 멤버도 처리)
+    decompressor = zlib.decompressobj(wbits=zlib.MAX_WBITS | 16)
+    async for chunk in chunks:
+        data = chunk
+        while data:
+            if decompressor.eof:
+                data = decompressor.unused_data + data
+                decompressor = zlib.decompressobj(wbits=zlib.MAX_WBITS | 16)
+            try:
+                output = decompressor.decompress(data, max_size)
+            except zlib.error as e:
+                raise CsvUploadError(f"gzip 압축을 해제할 수 없습니다: {e}") from e
+            if output:
+                yield output
+            data = decompressor.unconsumed_tail
+    if not decompressor.eof:
+        raise CsvUploadError("gzip 본문이 완전하지 않습니다.")
+
+
+async def maybe_gunzip_chunks(chunks: AsyncIterable[bytes]) -> AsyncIterator[bytes]:
+    # Content-Encoding 이나 파일명과 관계없이 gzip 헤더로 압축 여부 판단
+    chunks = aiter(chunks)
+    head = b""
+    async for chunk in chunks:
+        head += chunk
+        if len(head) >= len(_GZIP_MAGIC):
+            break
+
+    async def _rest() -> AsyncIterator[bytes]:
+        if head:
+            yield head
+        async for chunk in chunks:
+            yield chunk
+
+    if head.startswith(_GZIP_MAGIC):
+        async for chunk in gunzip_chunks(_rest()):
+            yield chunk
+    else:
+        async for chunk in _rest():
+            yield chunk
+
+
+class _AsyncChunkReader(io.RawIOBase):
+    # 스레드에서 읽을 때마다 이벤트 루프의 비동기 이터레이터에서 다음 청크를 가져옴
+    def __init__(
+        self,
+        chunks: AsyncIterable[bytes],
+        loop: asyncio.AbstractEventLoop,
+        timeout: float,
+    ):
+        self._chunks = aiter(chunks)
+        self._loop = loop
+        self._timeout = timeout
+        self._chunk = memoryview(b"")
+        self._eof = False
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        while not self._chunk and not self._eof:
+            future = asyncio.run_coroutine_threadsafe(self._next(), self._loop)
+            try:
+                self._chunk = memoryview(future.result(self._timeout))
+            except concurrent.futures.TimeoutError:
+                future.cancel()
+                raise CsvUploadError(
+                    f"업로드 본문을 {self._timeout:g}초 동안 받지 못했습니다."
+                ) from None
+        size = min(len(buffer), len(self._chunk))
+        buffer[:size] = self._chunk[:size]
+        self._chunk = self._chunk[size:]
+        return size
+
+    async def _next(self) -> bytes:
+        try:
+            return await anext(self._chunks)
+        except StopAsyncIteration:
+            self._eof = True
+            return b""
+
+
+def open_upload_stream(
+    chunks: AsyncIterable[bytes],
+    loop: asyncio.AbstractEventLoop,
+    timeout: float = UPLOAD_READ_TIMEOUT,
+) -> IO[str]:
+    """
+    업로드 본문 청크를 CSV 텍스트 스트림으로 변환합니다. 파일로 저장하지 않고 받은 만큼만 디코딩합니다.
+    읽기는 이벤트 루프가 아닌 스레드에서만 호출해야 합니다 (이벤트 루프에서 다음 청크를 기다리므로).
+    다음 청크가 timeout 초 안에 오지 않으면 CsvUploadError 가 발생합니다.
+    닫기도 스레드에서 호출해야 합니다 (읽는 중인 스레드가 버퍼 락을 잡고 있을 수 있으므로).
+    """
+    return io.TextIOWrapper(
+        io.BufferedReader(
+            _AsyncChunkReader(maybe_gunzip_chunks(chunks), loop, timeout)
+        ),
+        encoding="utf-8",
+    )
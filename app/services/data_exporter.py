@@ -0,0 +1,117 @@
+import json
+import zlib
+from typing import AsyncIterable, AsyncIterator
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.db.models import CompanyName, CompanyTagName, company_tag
+
+# 한 번에 DB 에서 가져올 행 수 / 응답으로 내보낼 청크 크기
+EXPORT_YIELD_PER = 1000
+EXPORT_CHUNK_SIZE = 64 * 1024
+
+
+async def _group_by_company(rows: AsyncIterable) -> AsyncIterator[tuple]:
+    # 회사 ID 로 정렬된 행을 회사별로 묶음, rows: (회사 ID, ...)
+    company_id, group = None, []
+    async for row in rows:
+        if row[0] != company_id:
+            if group:
+                yield company_id, group
+            company_id, group = row[0], []
+        group.append(tuple(row[1:]))
+    if group:
+        yield company_id, group
+
+
+class DataExporterService:
+    """
+    전체 회사를 회사명/태그와 함께 NDJSON 으로 내보냅니다.
+    회사명과 태그를 각각 회사 ID 순으로 스트리밍하여 병합하므로 메모리 사용량은 회사 수와 무관합니다.
+    """
+
+    def __init__(self, session_factory: async_sessionmaker[AsyncSession]):
+        # 응답을 스트리밍하는 동안 요청 세션은 이미 닫히므로 별도 세션을 사용
+        self._session_factory = session_factory
+
+    async def export_ndjson(
+        self, language_code: str | None = None
+    ) -> AsyncIterator[bytes]:
+        buffer = bytearray()
+        async for company in self.export_companies(language_code):
+            line = json.dumps(company, ensure_ascii=False, separators=(",", ":"))
+            buffer += line.encode() + b"\n"
+            if len(buffer) >= EXPORT_CHUNK_SIZE:
+                yield bytes(buffer)
+                buffer.clear()
+        if buffer:
+            yield bytes(buffer)
+
+    async def export_companies(
+        self, language_code: str | None = None
+    ) -> AsyncIterator[dict]:
+        # POST /companies 요청과 같은 형태, language_code 가 있으면 해당 언어의 이름만 포함
+        # (해당 언어의 회사명이 없는 회사는 내보내지 않음)
+        name_stmt = (
+            select(CompanyName.company_id, CompanyName.language_code, CompanyName.name)
+            .order_by(CompanyName.company_id, CompanyName.id)
+            .execution_options(yield_per=EXPORT_YIELD_PER)
+        )
+        tag_stmt = (
+            select(
+                company_tag.c.company_id,
+                CompanyTagName.company_tag_id,
+                CompanyTagName.language_code,
+                CompanyTagName.name,
+            )
+            .join(
+                CompanyTagName,
+                CompanyTagName.company_tag_id == company_tag.c.company_tag_id,
+            )
+            .order_by(
+                company_tag.c.company_id,
+                CompanyTagName.company_tag_id,
+                CompanyTagName.id,
+            )
+            .execution_options(yield_per=EXPORT_YIELD_PER)
+        )
+        if language_code is not None:
+            name_stmt = name_stmt.where(CompanyName.language_code == language_code)
+            tag_stmt = tag_stmt.where(CompanyTagName.language_code == language_code)
+
+        async with self._session_factory() as session:
+            name_result = await session.stream(name_stmt)
+            tag_result = await session.stream(tag_stmt)
+            tag_groups = _group_by_company(tag_result)
+            next_tags = await anext(tag_groups, None)
+
+            async for company_id, names in _group_by_company(name_result):
+                # 두 결과 모두 회사 ID 순이므로 태그 쪽을 따라오며 병합
+                while next_tags is not None and next_tags[0] < company_id:
+                    next_tags = await anext(tag_groups, None)
+                tags = []
+                if next_tags is not None and next_tags[0] == company_id:
+                    tags = next_tags[1]
+                    next_tags = await anext(tag_groups, None)
+
+                yield _to_export_row(company_id, names, tags)
+
+
+def _to_export_row(company_id, names: list[tuple], tags: list[tuple]) -> dict:
+    tag_names: dict[int, dict[str, str]] = {}
+    for company_tag_id, tag_language, tag_name in tags:
+        tag_names.setdefault(company_tag_id, {})[tag_language] = tag_name
+    return {
+        "id": str(company_id),
+        "company_name": dict(names),
+        "tags": [{"tag_name": tag_name} for tag_name in tag_names.values()],
+    }
+
+
+async def gzip_chunks(chunks: AsyncIterable[bytes]) -> AsyncIterator[bytes]:
+    # 청크마다 sync flush 하여 압축된 데이터도 바로 전송
+    compressor = zlib.compressobj(wbits=zlib.MAX_WBITS | 16)
+    async for chunk in chunks:
+        yield compressor.compress(chunk) + compressor.flush(zlib.Z_SYNC_FLUSH)
+    yield compressor.flush()
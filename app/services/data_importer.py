@@ -0,0 +1,351 @@
+import asyncio
+import csv
+import uuid
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from dataclasses import dataclass
+from pathlib import Path
+from typing import IO, AsyncContextManager, Callable, ContextManager, Iterator
+
+from sqlalchemy import Table, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models import (
+    Company,
+    CompanyName,
+    CompanyTag,
+    CompanyTagName,
+    company_tag,
+)
+from app.search.normalize import build_search_key
+
+# 한 번에 저장(커밋)할 CSV 행 수
+IMPORT_CHUNK_SIZE = 5000
+
+# CSV 컬럼 접미사 -> 저장할 언어 코드
+_LANGUAGE_CODES = (("ko", "ko"), ("en", "en"), ("ja", "jp"))
+
+# (ko, en, jp) 태그명, 없는 언어는 ""
+TagKey = tuple[str, str, str]
+
+# CSV 파일 경로 또는 이미 열린 텍스트 스트림 (업로드 등)
+CsvSource = str | Path | IO[str]
+
+# 커밋한 CSV 행 수(헤더 제외, 회사명이 없어 건너뛴 행 포함)를 전달받는 콜백
+ProgressCallback = Callable[[int], None]
+
+
+class DataInitializationError(Exception):
+    pass
+
+
+@dataclass(frozen=True, slots=True)
+class CsvCompanyRow:
+    # row_idx: CSV 줄 번호(헤더 제외, 1부터), names: (언어, 회사명)
+    row_idx: int
+    names: tuple[tuple[str, str], ...]
+    tags: tuple[TagKey, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class ImportChunk:
+    # DB 에 바로 넣을 수 있는 형태로 변환한 CSV 청크, 태그 ID 는 writer 가 채움
+    first_row_idx: int
+    last_row_idx: int
+    companies: list[dict]
+    names: list[dict]
+    relations: list[tuple[uuid.UUID, TagKey]]
+    tag_keys: list[TagKey]
+
+
+def parse_csv_row(row_idx: int, row: dict[str, str]) -> CsvCompanyRow | None:
+    # 회사명이 모두 빈 값이면 None
+    names = tuple(
+        (language_code, row[f"company_{column}"].strip())
+        for column, language_code in _LANGUAGE_CODES
+        if row[f"company_{column}"] and row[f"company_{column}"].strip()
+    )
+    if not names:
+        return None
+
+    # 태그 길이 맞추기 (가장 긴 것을 기준으로)
+    tag_lists = [
+        row[f"tag_{column}"].split("|") if row[f"tag_{column}"] else []
+        for column, _ in _LANGUAGE_CODES
+    ]
+    max_len = max(*(len(tag_list) for tag_list in tag_lists), 1)
+    tags = []
+    for i in range(max_len):
+        tag_key = tuple(
+            tag_list[i].strip() if i < len(tag_list) else "" for tag_list in tag_lists
+        )
+        # 모든 태그명이 비어있으면 스킵
+        if any(tag_key):
+            tags.append(tag_key)
+    return CsvCompanyRow(row_idx=row_idx, names=names, tags=tuple(tags))
+
+
+def tag_names(tag_key: TagKey) -> list[tuple[str, str]]:
+    # (언어, 태그명), 빈 문자열이 아닌 경우만
+    return [
+        (language_code, name)
+        for (_, language_code), name in zip(_LANGUAGE_CODES, tag_key)
+        if name
+    ]
+
+
+def open_csv(csv_file: CsvSource) -> ContextManager[IO[str]]:
+    # 경로는 열고 닫으며, 스트림은 그대로 사용 (닫는 것은 호출한 쪽에서)
+    if isinstance(csv_file, (str, Path)):
+        return open(csv_file, "r", encoding="utf-8")
+    return nullcontext(csv_file)
+
+
+def count_csv_rows(csv_file_path: str | Path) -> int:
+    # 진행률 계산용 추정치: 줄바꿈 수 - 헤더 (따옴표 안의 줄바꿈도 포함됨)
+    lines = 0
+    with open(csv_file_path, "rb") as file:
+        while block := file.read(1 << 20):
+            lines += block.count(b"\n")
+    return max(lines - 1, 0)
+
+
+def read_raw_chunks(
+    file: IO[str], chunk_size: int
+) -> Iterator[list[tuple[int, dict[str, str]]]]:
+    # (줄 번호, 행) 청크, 파싱은 prepare_chunk 에서
+    chunk = []
+    row_idx = 0
+    try:
+        for row_idx, row in enumerate(csv.DictReader(file), 1):
+            chunk.append((row_idx, row))
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+    except csv.Error as e:
+        # 다음 줄을 읽는 중 발생한 CSV 형식 오류
+        raise DataInitializationError(
+            f"CSV 파일 {row_idx + 1}번째 줄 처리 중 오류 발생: {str(e)}"
+        ) from e
+    if chunk:
+        yield chunk
+
+
+def prepare_chunk(raw_rows: list[tuple[int, dict[str, str]]]) -> ImportChunk:
+    # 스레드 풀에서 실행: 파싱, 검색 키 생성, 회사 ID(UUID) 생성
+    companies, names, relations = [], [], []
+    tag_keys: dict[TagKey, None] = {}
+    for row_idx, row in raw_rows:
+        try:
+            parsed = parse_csv_row(row_idx, row)
+        except KeyError as e:
+            # 컬럼 누락
+            raise DataInitializationError(
+                f"CSV 파일 {row_idx}번째 줄 처리 중 오류 발생: {str(e)}"
+            ) from e
+        if parsed is None:
+            continue
+
+        company_id = uuid.uuid4()
+        companies.append({"id": company_id})
+        names.extend(
+            {
+                "company_id": company_id,
+                "language_code": language_code,
+                "name": name,
+                "search_key": build_search_key(name),
+            }
+            for language_code, name in parsed.names
+        )
+        for tag_key in parsed.tags:
+            relations.append((company_id, tag_key))
+            tag_keys[tag_key] = None
+
+    return ImportChunk(
+        first_row_idx=raw_rows[0][0],
+        last_row_idx=raw_rows[-1][0],
+        companies=companies,
+        names=names,
+        relations=relations,
+        tag_keys=list(tag_keys),
+    )
+
+
+async def insert_many(session: AsyncSession, table: Table, rows: list[dict]) -> None:
+    if not rows:
+        return
+    if session.get_bind().dialect.name == "postgresql":
+        # asyncpg COPY, 현재 트랜잭션의 커넥션을 그대로 사용
+        connection = await session.connection()
+        raw_connection = await connection.get_raw_connection()
+        columns = list(rows[0])
+        await raw_connection.driver_connection.copy_records_to_table(
+            table.name,
+            records=[tuple(row[column] for column in columns) for row in rows],
+            columns=columns,
+        )
+        return
+    # multi-row INSERT (insertmanyvalues)
+    await session.execute(insert(table), rows)
+
+
+class _TagIdRegistry:
+    # 여러 writer 가 같은 태그를 중복 생성하지 않도록 새 태그의 ID 발급을 직렬화
+    def __init__(self):
+        self._ids: dict[TagKey, int] = {}
+        self._lock = asyncio.Lock()
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    async def resolve(
+        self, session: AsyncSession, tag_keys: list[TagKey]
+    ) -> dict[TagKey, int]:
+        if any(tag_key not in self._ids for tag_key in tag_keys):
+            async with self._lock:
+                missing = [tag_key for tag_key in tag_keys if tag_key not in self._ids]
+                if missing:
+                    await self._create(session, missing)
+        return {tag_key: self._ids[tag_key] for tag_key in tag_keys}
+
+    async def _create(self, session: AsyncSession, tag_keys: list[TagKey]) -> None:
+        # 태그 행에는 ID 외의 컬럼이 없으므로 반환된 ID 를 순서와 무관하게 배정
+        result = await session.execute(
+            insert(CompanyTag.__table__).returning(CompanyTag.id),
+            [{} for _ in tag_keys],
+        )
+        created = dict(zip(tag_keys, result.scalars().all(), strict=True))
+        await insert_many(
+            session,
+            CompanyTagName.__table__,
+            [
+                {"company_tag_id": tag_id, "language_code": language_code, "name": name}
+                for tag_key, tag_id in created.items()
+                for language_code, name in tag_names(tag_key)
+            ],
+        )
+        # 다른 writer 가 바로 참조할 수 있도록 커밋한 뒤 공유
+        await session.commit()
+        self._ids.update(created)
+
+
+class DataImporterService:
+    """
+    CSV 를 스레드 풀에서 읽고 변환한 뒤, bounded queue 를 거쳐 여러 writer 가 각자의 커넥션으로 저장합니다.
+    writer 가 밀리면 큐가 차서 파싱도 멈추므로(backpressure) 메모리 사용량은 청크 (parallelism * 2 + queue_size) 개 이하입니다.
+    이벤트 루프에서는 DB 호출만 실행되므로 같은 워커의 다른 요청은 계속 처리됩니다.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncContextManager[AsyncSession]],
+        parallelism: int = 1,
+        queue_size: int | None = None,
+    ):
+        self._session_factory = session_factory
+        self._parallelism = max(parallelism, 1)
+        self._queue_size = queue_size or self._parallelism
+
+    async def import_csv(
+        self,
+        csv_file: CsvSource,
+        chunk_size: int = IMPORT_CHUNK_SIZE,
+        on_progress: ProgressCallback | None = None,
+    ) -> tuple[int, int]:
+        # 반환: (생성한 회사 수, 생성한 태그 수)
+        queue: asyncio.Queue[ImportChunk | None] = asyncio.Queue(self._queue_size)
+        tag_ids = _TagIdRegistry()
+        write_lock = asyncio.Lock()
+        executor = ThreadPoolExecutor(
+            max_workers=self._parallelism, thread_name_prefix="csv-import"
+        )
+        try:
+            async with asyncio.TaskGroup() as group:
+                writers = [
+                    group.create_task(
+                        self._write(queue, tag_ids, write_lock, on_progress)
+                    )
+                    for _ in range(self._parallelism)
+                ]
+                group.create_task(self._produce(csv_file, chunk_size, queue, executor))
+        except ExceptionGroup as errors:
+            # 처음 실패한 작업의 예외만 전달 (나머지 작업은 취소됨)
+            raise errors.exceptions[0] from None
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        return sum(writer.result() for writer in writers), len(tag_ids)
+
+    async def _produce(
+        self,
+        csv_file: CsvSource,
+        chunk_size: int,
+        queue: asyncio.Queue,
+        executor: ThreadPoolExecutor,
+    ) -> None:
+        loop = asyncio.get_running_loop()
+        # 업로드 스트림은 읽기(next)가 데이터를 기다리며 스레드를 막으므로 항상 스레드 풀에서 읽음
+        file_context = await loop.run_in_executor(executor, open_csv, csv_file)
+        with file_context as file:
+            raw_chunks = read_raw_chunks(file, chunk_size)
+            # 변환은 최대 parallelism 개 청크를 동시에, 큐에는 CSV 순서대로 전달
+            pending = deque()
+            while True:
+                raw_rows = await loop.run_in_executor(executor, next, raw_chunks, None)
+                if raw_rows is None:
+                    break
+                pending.append(loop.run_in_executor(executor, prepare_chunk, raw_rows))
+                if len(pending) >= self._parallelism:
+                    await queue.put(await pending.popleft())
+            while pending:
+                await queue.put(await pending.popleft())
+
+        # writer 종료 신호
+        for _ in range(self._parallelism):
+            await queue.put(None)
+
+    async def _write(
+        self,
+        queue: asyncio.Queue,
+        tag_ids: _TagIdRegistry,
+        write_lock: asyncio.Lock,
+        on_progress: ProgressCallback | None,
+    ) -> int:
+        companies_count = 0
+        async with self._session_factory() as session:
+            # sqlite 는 동시에 하나의 쓰기 트랜잭션만 가능하므로 writer 간 순서대로 저장
+            if session.get_bind().dialect.name != "sqlite":
+                write_lock = nullcontext()
+            while (chunk := await queue.get()) is not None:
+                async with write_lock:
+                    try:
+                        await self._write_chunk(session, chunk, tag_ids)
+                    except Exception as e:
+                        # 커밋이 실패하면 트랜잭션이 이미 끝났을 수 있음
+                        if session.in_transaction():
+                            await session.rollback()
+                        raise DataInitializationError(
+                            f"CSV 파일 {chunk.first_row_idx}~{chunk.last_row_idx}번째 줄 처리 중 오류 발생: {str(e)}"
+                        ) from e
+                companies_count += len(chunk.companies)
+                if on_progress is not None:
+                    on_progress(chunk.last_row_idx - chunk.first_row_idx + 1)
+        return companies_count
+
+    async def _write_chunk(
+        self, session: AsyncSession, chunk: ImportChunk, tag_ids: _TagIdRegistry
+    ) -> None:
+        chunk_tag_ids = await tag_ids.resolve(session, chunk.tag_keys)
+        await insert_many(session, Company.__table__, chunk.companies)
+        await insert_many(session, CompanyName.__table__, chunk.names)
+        await insert_many(
+            session,
+            company_tag,
+            [
+                {"company_id": company_id, "company_tag_id": chunk_tag_ids[tag_key]}
+                for company_id, tag_key in chunk.relations
+            ],
+        )
+        # 청크마다 커밋
+        await session.commit()
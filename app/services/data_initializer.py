@@ -1,6 +1,7 @@
 import csv
+from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Iterable
 
 from sqlalchemy import insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -12,15 +13,42 @@ from app.db.models import (
     CompanyTagName,
     company_tag,
 )
+from app.mappers.company_tag_mapper import CompanyTagMapper
+from app.repositories.company_tag_repository import CompanyTagRepository
+from app.services.data_importer import (
+    IMPORT_CHUNK_SIZE,
+    CsvSource,
+    DataImporterService,
+    DataInitializationError,
+    ProgressCallback,
+    open_csv,
+    parse_csv_row,
+    tag_names,
+)
+from app.services.data_synchronizer import DataSynchronizerService
 
-
-class DataInitializationError(Exception):
-    pass
+__all__ = ["DataInitializationError", "DataInitializerService"]
 
 
 class DataInitializerService:
-    def __init__(self, session: AsyncSession):
+    def __init__(
+        self,
+        session: AsyncSession,
+        importer: DataImporterService | None = None,
+        synchronizer: DataSynchronizerService | None = None,
+    ):
         self.session = session
+        # bulk 모드에서 사용, 없으면 현재 세션 하나로 순차 저장
+        self._importer = importer or DataImporterService(self._current_session)
+        # sync 모드에서 사용, 없으면 캐시 무효화 없이 현재 세션으로 저장
+        self._synchronizer = synchronizer or DataSynchronizerService(
+            session,
+            CompanyTagRepository(db=session, company_tag_mapper=CompanyTagMapper()),
+        )
+
+    @asynccontextmanager
+    async def _current_session(self):
+        yield self.session
 
     async def is_data_already_initialized(self) -> bool:
         # 회사 데이터가 하나라도 있으면 이미 초기화된 것으로 간주
@@ -28,9 +56,22 @@ class DataInitializerService:
         return result.first() is not None
 
     async def initialize_data_from_csv(
-        self, csv_file_path: str | Path
+        self,
+        csv_file: CsvSource,
+        bulk: bool = False,
+        chunk_size: int = IMPORT_CHUNK_SIZE,
+        sync: bool = False,
+        on_progress: ProgressCallback | None = None,
     ) -> Dict[str, Any]:
-        csv_file_path = Path(csv_file_path)
+        """
+        bulk=True 이면 importer 로 chunk_size 행 단위 multi-row INSERT(Postgres 는 COPY) 후 커밋합니다.
+        sync=True 이면 기존 데이터가 있어도 chunk_size 행 단위로 바뀐 회사만 upsert 합니다.
+        기본 모드는 행마다 커밋하므로 오류가 나도 이전 행까지는 저장됩니다.
+        on_progress 는 커밋할 때마다 처리한 CSV 행 수로 호출됩니다.
+        csv_file 이 업로드 스트림이면 스레드에서 읽는 bulk 또는 sync 모드만 사용할 수 있습니다.
+        """
+        if sync:
+            return await self._sync_from_csv(csv_file, chunk_size, on_progress)
 
         # 데이터가 이미 초기화되어 있는지 확인
         if await self.is_data_already_initialized():
@@ -39,132 +80,129 @@ class DataInitializerService:
             )
 
         # CSV 파일 존재 확인
-        if not csv_file_path.exists():
-            raise FileNotFoundError(f"CSV 파일을 찾을 수 없습니다: {csv_file_path}")
+        _check_exists(csv_file)
+
+        if bulk:
+            # 확인에 사용한 트랜잭션을 끝내 다른 커넥션의 writer 가 잠금을 기다리지 않도록 함
+            await self.session.commit()
+            companies_count, tags_count = await self._importer.import_csv(
+                csv_file, chunk_size, on_progress
+            )
+        else:
+            if not isinstance(csv_file, (str, Path)):
+                raise DataInitializationError(
+                    "업로드한 CSV 는 bulk 또는 sync 모드로만 가져올 수 있습니다."
+                )
+            with open_csv(csv_file) as file:
+                companies_count, tags_count = await self._import_rows(
+                    csv.DictReader(file), on_progress
+                )
+
+        # 데이터 반환
+        return {
+            "companies_count": companies_count,
+            "tags_count": tags_count,
+            "message": f"성공적으로 {companies_count}개의 회사와 {tags_count}개의 태그를 생성했습니다.",
+        }
+
+    async def _sync_from_csv(
+        self,
+        csv_file: CsvSource,
+        chunk_size: int,
+        on_progress: ProgressCallback | None,
+    ) -> Dict[str, Any]:
+        _check_exists(csv_file)
+
+        result = await self._synchronizer.sync_csv(csv_file, chunk_size, on_progress)
+        return {
+            "inserted": result.inserted,
+            "updated": result.updated,
+            "unchanged": result.unchanged,
+            "linked": result.linked,
+            "unlinked": result.unlinked,
+            "changed": result.changed,
+            "message": f"{result.inserted}개의 회사를 추가하고 {result.updated}개의 회사를 변경했습니다.",
+        }
 
+    async def _import_rows(
+        self,
+        rows: Iterable[dict[str, str]],
+        on_progress: ProgressCallback | None = None,
+    ) -> tuple[int, int]:
         # 태그 캐시 (중복 방지용)
         tag_cache = {}  # (ko, en, jp) -> CompanyTag 객체
-        created_companies = []
-        created_tags = []
+        companies_count = 0
 
         # CSV 파일을 라인별로 순차 처리
-        with open(csv_file_path, "r", encoding="utf-8") as file:
-            reader = csv.DictReader(file)
-
-            for row_idx, row in enumerate(reader, 1):
-                try:
-                    # 회사명 정보 추출
-                    company_ko = (
-                        row["company_ko"].strip() if row["company_ko"] else None
+        for row_idx, row in enumerate(rows, 1):
+            try:
+                parsed = parse_csv_row(row_idx, row)
+                if parsed is None:
+                    if on_progress is not None:
+                        on_progress(1)
+                    continue
+
+                # 1. 회사 생성
+                company = Company()
+                self.session.add(company)
+                await self.session.flush()  # ID를 받기 위해
+                companies_count += 1
+
+                # 회사명들 추가
+                for lang, name in parsed.names:
+                    company_name = CompanyName(
+                        company_id=company.id, language_code=lang, name=name
                     )
-                    company_en = (
-                        row["company_en"].strip() if row["company_en"] else None
+                    self.session.add(company_name)
+
+                # 2. 각 태그 처리 및 회사-태그 관계 설정
+                company_tag_relations = []
+
+                for tag_key in parsed.tags:
+                    # 태그가 이미 생성되었는지 확인
+                    if tag_key in tag_cache:
+                        tag = tag_cache[tag_key]
+                    else:
+                        # 새 태그 생성
+                        tag = CompanyTag()
+                        self.session.add(tag)
+                        await self.session.flush()  # ID를 받기 위해
+                        tag_cache[tag_key] = tag
+
+                        # 태그명들 추가
+                        for lang, name in tag_names(tag_key):
+                            tag_name = CompanyTagName(
+                                company_tag_id=tag.id,
+                                language_code=lang,
+                                name=name,
+                            )
+                            self.session.add(tag_name)
+
+                    # 회사-태그 관계 추가
+                    company_tag_relations.append(
+                        {"company_id": company.id, "company_tag_id": tag.id}
                     )
-                    company_ja = (
-                        row["company_ja"].strip() if row["company_ja"] else None
+
+                # 3. 해당 회사의 태그 관계들 DB에 저장
+                if company_tag_relations:
+                    await self.session.execute(
+                        insert(company_tag), company_tag_relations
                     )
 
-                    # 회사명이 모두 빈 값이면 스킵
-                    if not any([company_ko, company_en, company_ja]):
-                        continue
-
-                    # 1. 회사 생성
-                    company = Company()
-                    self.session.add(company)
-                    await self.session.flush()  # ID를 받기 위해
-                    created_companies.append(company)
-
-                    # 회사명들 추가
-                    company_names_data = [
-                        ("ko", company_ko),
-                        ("en", company_en),
-                        ("jp", company_ja),
-                    ]
-
-                    for lang, name in company_names_data:
-                        if name:  # 빈 문자열이 아닌 경우만 추가
-                            company_name = CompanyName(
-                                company_id=company.id, language_code=lang, name=name
-                            )
-                            self.session.add(company_name)
+                # 각 라인 처리 후 커밋
+                await self.session.commit()
+                if on_progress is not None:
+                    on_progress(1)
 
-                    # 2. 태그 정보 파싱 및 생성
-                    tag_ko_list = row["tag_ko"].split("|") if row["tag_ko"] else []
-                    tag_en_list = row["tag_en"].split("|") if row["tag_en"] else []
-                    tag_ja_list = row["tag_ja"].split("|") if row["tag_ja"] else []
+            except Exception as e:
+                await self.session.rollback()
+                raise DataInitializationError(
+                    f"CSV 파일 {row_idx}번째 줄 처리 중 오류 발생: {str(e)}"
+                ) from e
 
-                    # 태그 길이 맞추기 (가장 긴 것을 기준으로)
-                    max_len = max(
-                        len(tag_ko_list), len(tag_en_list), len(tag_ja_list), 1
-                    )
-                    tag_ko_list.extend([""] * (max_len - len(tag_ko_list)))
-                    tag_en_list.extend([""] * (max_len - len(tag_en_list)))
-                    tag_ja_list.extend([""] * (max_len - len(tag_ja_list)))
-
-                    # 3. 각 태그 처리 및 회사-태그 관계 설정
-                    company_tag_relations = []
-
-                    for i in range(max_len):
-                        tag_ko = tag_ko_list[i].strip() if tag_ko_list[i] else ""
-                        tag_en = tag_en_list[i].strip() if tag_en_list[i] else ""
-                        tag_ja = tag_ja_list[i].strip() if tag_ja_list[i] else ""
-
-                        # 모든 태그명이 비어있으면 스킵
-                        if not any([tag_ko, tag_en, tag_ja]):
-                            continue
-
-                        tag_key = (tag_ko, tag_en, tag_ja)
-
-                        # 태그가 이미 생성되었는지 확인
-                        if tag_key in tag_cache:
-                            tag = tag_cache[tag_key]
-                        else:
-                            # 새 태그 생성
-                            tag = CompanyTag()
-                            self.session.add(tag)
-                            await self.session.flush()  # ID를 받기 위해
-                            created_tags.append(tag)
-                            tag_cache[tag_key] = tag
-
-                            # 태그명들 추가
-                            tag_names_data = [
-                                ("ko", tag_ko),
-                                ("en", tag_en),
-                                ("jp", tag_ja),
-                            ]
-
-                            for lang, name in tag_names_data:
-                                if name:  # 빈 문자열이 아닌 경우만 추가
-                                    tag_name = CompanyTagName(
-                                        company_tag_id=tag.id,
-                                        language_code=lang,
-                                        name=name,
-                                    )
-                                    self.session.add(tag_name)
-
-                        # 회사-태그 관계 추가
-                        company_tag_relations.append(
-                            {"company_id": company.id, "company_tag_id": tag.id}
-                        )
-
-                    # 4. 해당 회사의 태그 관계들 DB에 저장
-                    if company_tag_relations:
-                        await self.session.execute(
-                            insert(company_tag), company_tag_relations
-                        )
-
-                    # 각 라인 처리 후 커밋
-                    await self.session.commit()
-
-                except Exception as e:
-                    await self.session.rollback()
-                    raise DataInitializationError(
-                        f"CSV 파일 {row_idx}번째 줄 처리 중 오류 발생: {str(e)}"
-                    ) from e
+        return companies_count, len(tag_cache)
 
-        # 데이터 반환
-        return {
-            "companies_count": len(created_companies),
-            "tags_count": len(created_tags),
-            "message": f"성공적으로 {len(created_companies)}개의 회사와 {len(created_tags)}개의 태그를 생성했습니다.",
-        }
+
+def _check_exists(csv_file: CsvSource) -> None:
+    if isinstance(csv_file, (str, Path)) and not Path(csv_file).exists():
+        raise FileNotFoundError(f"CSV 파일을 찾을 수 없습니다: {csv_file}")
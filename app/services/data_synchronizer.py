@@ -0,0 +1,346 @@
+import asyncio
+import uuid
+from dataclasses import dataclass, field
+
+from sqlalchemy import Table, delete, select, tuple_
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models import Company, CompanyName, CompanyTagName, company_tag
+from app.dto.company_dto import CompanyTagDto, CompanyTagNameDto
+from app.interfaces.company_repository import ICompanyRepository
+from app.interfaces.company_tag_repository import ICompanyTagRepository
+from app.search.normalize import build_search_key
+from app.services.data_importer import (
+    IMPORT_CHUNK_SIZE,
+    CsvCompanyRow,
+    CsvSource,
+    DataInitializationError,
+    ProgressCallback,
+    TagKey,
+    insert_many,
+    open_csv,
+    parse_csv_row,
+    read_raw_chunks,
+    tag_names,
+)
+
+
+@dataclass(slots=True)
+class SyncResult:
+    # 회사 단위: inserted / updated / unchanged, 회사-태그 연결 단위: linked / unlinked
+    inserted: int = 0
+    updated: int = 0
+    unchanged: int = 0
+    linked: int = 0
+    unlinked: int = 0
+    # 무효화 대상 (청크마다 비움)
+    changed_company_names: set[str] = field(default_factory=set)
+    changed_tag_names: set[str] = field(default_factory=set)
+
+    @property
+    def changed(self) -> bool:
+        return bool(self.inserted or self.updated)
+
+
+@dataclass(slots=True)
+class _CompanyState:
+    # 청크 안에서 같은 회사가 여러 번 나오면 회사명은 합치고 태그는 마지막 행 기준
+    names: dict[str, str]
+    tags: tuple[TagKey, ...]
+
+
+def _parse_chunk(raw_rows: list[tuple[int, dict[str, str]]]) -> list[CsvCompanyRow]:
+    rows = []
+    for row_idx, row in raw_rows:
+        try:
+            parsed = parse_csv_row(row_idx, row)
+        except KeyError as e:
+            # 컬럼 누락
+            raise DataInitializationError(
+                f"CSV 파일 {row_idx}번째 줄 처리 중 오류 발생: {str(e)}"
+            ) from e
+        if parsed is not None:
+            rows.append(parsed)
+    return rows
+
+
+def _dialect_insert(session: AsyncSession, table: Table):
+    # INSERT ... ON CONFLICT 는 방언별 insert 에서만 지원
+    if session.get_bind().dialect.name == "postgresql":
+        return postgresql.insert(table)
+    return sqlite.insert(table)
+
+
+class DataSynchronizerService:
+    """
+    CSV 를 기존 데이터와 비교해 바뀐 행만 저장합니다. 같은 CSV 를 다시 적용하면 아무것도 바뀌지 않습니다.
+    회사는 (회사명, 언어) 중 하나라도 일치하면 같은 회사로 보고, 회사명은 (회사, 언어) 기준 upsert 합니다.
+    태그 연결은 CSV 를 기준으로 추가/삭제하며, CSV 에 없는 언어의 회사명은 삭제하지 않습니다.
+    """
+
+    def __init__(
+        self,
+        session: AsyncSession,
+        company_tag_repo: ICompanyTagRepository,
+        company_repo: ICompanyRepository | None = None,
+    ):
+        self.session = session
+        self._company_tag_repo = company_tag_repo
+        # company_repo 가 있으면 청크마다 바뀐 회사/태그의 캐시를 무효화
+        self._company_repo = company_repo
+
+    async def sync_csv(
+        self,
+        csv_file: CsvSource,
+        chunk_size: int = IMPORT_CHUNK_SIZE,
+        on_progress: ProgressCallback | None = None,
+    ) -> SyncResult:
+        result = SyncResult()
+        # 청크 단위로 읽고 파싱은 스레드에서 (이벤트 루프를 막지 않도록)
+        file_context = await asyncio.to_thread(open_csv, csv_file)
+        with file_context as file:
+            raw_chunks = read_raw_chunks(file, chunk_size)
+            while raw_rows := await asyncio.to_thread(next, raw_chunks, None):
+                rows = await asyncio.to_thread(_parse_chunk, raw_rows)
+                try:
+                    await self._sync_chunk(rows, result)
+                    # 청크마다 커밋
+                    await self.session.commit()
+                except Exception as e:
+                    # 커밋이 실패하면 트랜잭션이 이미 끝났을 수 있음
+                    if self.session.in_transaction():
+                        await self.session.rollback()
+                    raise DataInitializationError(
+                        f"CSV 파일 {raw_rows[0][0]}~{raw_rows[-1][0]}번째 줄 처리 중 오류 발생: {str(e)}"
+                    ) from e
+                await self._invalidate(result)
+                if on_progress is not None:
+                    on_progress(len(raw_rows))
+        return result
+
+    async def _invalidate(self, result: SyncResult) -> None:
+        if self._company_repo is not None:
+            await self._company_repo.invalidate(
+                company_names=sorted(result.changed_company_names),
+                tag_names=sorted(result.changed_tag_names),
+            )
+        result.changed_company_names.clear()
+        result.changed_tag_names.clear()
+
+    async def _sync_chunk(self, rows: list[CsvCompanyRow], result: SyncResult) -> None:
+        # 1. 회사 식별: (언어, 회사명) -> 회사 ID
+        owners = await self._load_owners(
+            sorted({pair for row in rows for pair in row.names})
+        )
+        states: dict[uuid.UUID, _CompanyState] = {}
+        new_company_ids: set[uuid.UUID] = set()
+        for row in rows:
+            company_ids = {
+                owners[(language_code, name)]
+                for language_code, name in row.names
+                if (language_code, name) in owners
+            }
+            if len(company_ids) > 1:
+                raise DataInitializationError(
+                    f"{row.row_idx}번째 줄의 회사명이 서로 다른 회사에 속해 있습니다."
+                )
+            if company_ids:
+                company_id = company_ids.pop()
+            else:
+                company_id = uuid.uuid4()
+                new_company_ids.add(company_id)
+            for language_code, name in row.names:
+                owners[(language_code, name)] = company_id
+            state = states.setdefault(company_id, _CompanyState(names={}, tags=()))
+            state.names.update(row.names)
+            state.tags = row.tags
+
+        existing_ids = [
+            company_id for company_id in states if company_id not in new_company_ids
+        ]
+        current_names = await self._load_names(existing_ids)
+        current_links = await self._load_links(existing_ids)
+
+        # 2. 태그 (없는 태그/태그명은 생성)
+        tag_keys = list(
+            dict.fromkeys(tag for state in states.values() for tag in state.tags)
+        )
+        tag_ids, tag_name_map = await self._resolve_tags(tag_keys, result)
+
+        # 3. 회사별 변경분 계산
+        name_rows, link_rows, unlink_rows = [], [], []
+        changed_tag_ids: set[int] = set()
+        for company_id, state in states.items():
+            old_names = current_names.get(company_id, {})
+            old_tag_ids = current_links.get(company_id, set())
+            new_tag_ids = {tag_ids[tag_key] for tag_key in state.tags}
+            changed_names = {
+                language_code: name
+                for language_code, name in state.names.items()
+                if old_names.get(language_code) != name
+            }
+            linked = new_tag_ids - old_tag_ids
+            unlinked = old_tag_ids - new_tag_ids
+
+            if company_id in new_company_ids:
+                result.inserted += 1
+            elif changed_names or linked or unlinked:
+                result.updated += 1
+            else:
+                result.unchanged += 1
+                continue
+
+            name_rows.extend(
+                {
+                    "company_id": company_id,
+                    "language_code": language_code,
+                    "name": name,
+                    "search_key": build_search_key(name),
+                }
+                for language_code, name in changed_names.items()
+            )
+            link_rows.extend(
+                {"company_id": company_id, "company_tag_id": tag_id}
+                for tag_id in linked
+            )
+            unlink_rows.extend((company_id, tag_id) for tag_id in unlinked)
+
+            # 이전/새 회사명 캐시, 태그 캐시 (회사명이 바뀌면 회사가 포함된 모든 태그)
+            result.changed_company_names.update(old_names.values())
+            result.changed_company_names.update(state.names.values())
+            changed_tag_ids.update(
+                old_tag_ids | new_tag_ids if changed_names else linked | unlinked
+            )
+
+        # 4. 저장
+        await insert_many(
+            self.session,
+            Company.__table__,
+            [{"id": company_id} for company_id in new_company_ids],
+        )
+        if name_rows:
+            stmt = _dialect_insert(self.session, CompanyName.__table__)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["company_id", "language_code"],
+                set_={
+                    "name": stmt.excluded.name,
+                    "search_key": stmt.excluded.search_key,
+                },
+            )
+            await self.session.execute(stmt, name_rows)
+        if link_rows:
+            stmt = _dialect_insert(self.session, company_tag).on_conflict_do_nothing()
+            await self.session.execute(stmt, link_rows)
+            result.linked += len(link_rows)
+        if unlink_rows:
+            await self.session.execute(
+                delete(company_tag).where(
+                    tuple_(company_tag.c.company_id, company_tag.c.company_tag_id).in_(
+                        unlink_rows
+                    )
+                )
+            )
+            result.unlinked += len(unlink_rows)
+
+        result.changed_tag_names.update(
+            await self._tag_names(changed_tag_ids, tag_name_map)
+        )
+
+    async def _load_owners(
+        self, pairs: list[tuple[str, str]]
+    ) -> dict[tuple[str, str], uuid.UUID]:
+        if not pairs:
+            return {}
+        stmt = select(
+            CompanyName.language_code, CompanyName.name, CompanyName.company_id
+        ).where(tuple_(CompanyName.language_code, CompanyName.name).in_(pairs))
+        return {
+            (language_code, name): company_id
+            for language_code, name, company_id in await self.session.execute(stmt)
+        }
+
+    async def _load_names(
+        self, company_ids: list[uuid.UUID]
+    ) -> dict[uuid.UUID, dict[str, str]]:
+        names: dict[uuid.UUID, dict[str, str]] = {}
+        if not company_ids:
+            return names
+        stmt = select(
+            CompanyName.company_id, CompanyName.language_code, CompanyName.name
+        ).where(CompanyName.company_id.in_(company_ids))
+        for company_id, language_code, name in await self.session.execute(stmt):
+            names.setdefault(company_id, {})[language_code] = name
+        return names
+
+    async def _load_links(
+        self, company_ids: list[uuid.UUID]
+    ) -> dict[uuid.UUID, set[int]]:
+        links: dict[uuid.UUID, set[int]] = {}
+        if not company_ids:
+            return links
+        stmt = select(company_tag.c.company_id, company_tag.c.company_tag_id).where(
+            company_tag.c.company_id.in_(company_ids)
+        )
+        for company_id, tag_id in await self.session.execute(stmt):
+            links.setdefault(company_id, set()).add(tag_id)
+        return links
+
+    async def _resolve_tags(
+        self, tag_keys: list[TagKey], result: SyncResult
+    ) -> tuple[dict[TagKey, int], dict[int, list[str]]]:
+        # 반환: (태그 키 -> 태그 ID, 태그 ID -> 태그명)
+        if not tag_keys:
+            return {}, {}
+        pairs = sorted(
+            {
+                (name, language_code)
+                for tag_key in tag_keys
+                for language_code, name in tag_names(tag_key)
+            }
+        )
+        stmt = select(CompanyTagName.name, CompanyTagName.language_code).where(
+            tuple_(CompanyTagName.name, CompanyTagName.language_code).in_(pairs)
+        )
+        existing_pairs = set((await self.session.execute(stmt)).tuples())
+
+        tags = await self._company_tag_repo.get_or_create_all(
+            tags=[
+                CompanyTagDto(
+                    names=tuple(
+                        CompanyTagNameDto(language_code=language_code, name=name)
+                        for language_code, name in tag_names(tag_key)
+                    )
+                )
+                for tag_key in tag_keys
+            ]
+        )
+        # 새로 생긴 태그명으로 캐시된 빈 결과도 무효화
+        result.changed_tag_names.update(
+            name.name
+            for tag in tags
+            for name in tag.names
+            if (name.name, name.language_code) not in existing_pairs
+        )
+        return (
+            {tag_key: tag.id for tag_key, tag in zip(tag_keys, tags, strict=True)},
+            {tag.id: [name.name for name in tag.names] for tag in tags},
+        )
+
+    async def _tag_names(
+        self, tag_ids: set[int], tag_name_map: dict[int, list[str]]
+    ) -> list[str]:
+        # 이번 청크에서 조회하지 않은 태그(연결이 끊긴 태그 등)의 태그명은 DB 에서 조회
+        missing = sorted(tag_id for tag_id in tag_ids if tag_id not in tag_name_map)
+        names = [
+            name
+            for tag_id in tag_ids
+            if tag_id in tag_name_map
+            for name in tag_name_map[tag_id]
+        ]
+        if missing:
+            stmt = select(CompanyTagName.name).where(
+                CompanyTagName.company_tag_id.in_(missing)
+            )
+            names.extend((await self.session.execute(stmt)).scalars())
+        return names
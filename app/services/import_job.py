@@ -0,0 +1,240 @@
+import asyncio
+import json
+import logging
+import time
+import uuid
+from typing import Any, Awaitable, Callable
+
+from fastapi import Request
+from redis.asyncio import Redis
+
+from app.cache.lock import extend_lock, release_lock
+from app.services.data_importer import ProgressCallback
+
+logger = logging.getLogger(__name__)
+
+# 워커 간 동시에 하나의 가져오기만 실행하도록 하는 Redis 락 (값: 실행 중인 작업 ID)
+IMPORT_LOCK_KEY = "admin:import:lock"
+
+LOCK_LOST_ERROR = "가져오기 락을 잃어 작업을 중단했습니다 (락 만료 또는 워커 종료)."
+
+ImportRunFn = Callable[[ProgressCallback], Awaitable[dict[str, Any]]]
+
+
+def import_job_key(job_id: str) -> str:
+    return f"admin:import:job:{job_id}"
+
+
+class ImportJobConflictError(Exception):
+    pass
+
+
+class _ImportJob:
+    def __init__(self, job_id: str):
+        self.id = job_id
+        self.rows_processed = 0
+        self.lock_lost = False
+
+    def add_rows(self, rows: int) -> None:
+        self.rows_processed += rows
+
+
+class ImportJobManager:
+    """
+    CSV 가져오기를 요청과 분리된 백그라운드 태스크로 실행하고 진행 상황을 Redis hash 에 저장합니다.
+    어느 워커에서든 작업 조회/취소가 가능하며, Redis 락으로 전체 워커에서 하나의 작업만 실행합니다.
+    락은 heartbeat 마다 연장하므로 워커가 종료되면 lock_ttl 이후 다른 작업을 시작할 수 있습니다.
+    """
+
+    def __init__(
+        self,
+        redis_client: Redis,
+        lock_ttl: int = 60,
+        job_ttl: int = 60 * 60 * 24,
+        heartbeat_interval: float = 1.0,
+    ):
+        self._redis = redis_client
+        self._lock_ttl_ms = lock_ttl * 1000
+        self._job_ttl = job_ttl
+        self._heartbeat_interval = heartbeat_interval
+        self._tasks: dict[str, asyncio.Task] = {}
+
+    def __len__(self) -> int:
+        return len(self._tasks)
+
+    async def start(self, run: ImportRunFn, total_rows: int | None = None) -> str:
+        job_id = uuid.uuid4().hex
+        if not await self._redis.set(
+            IMPORT_LOCK_KEY, job_id, nx=True, px=self._lock_ttl_ms
+        ):
+            running_job_id = await self._lock_owner()
+            raise ImportJobConflictError(
+                f"이미 실행 중인 데이터 가져오기 작업이 있습니다: {running_job_id}"
+            )
+
+        now = time.time()
+        state = {
+            "id": job_id,
+            "status": "running",
+            "rows_processed": 0,
+            "started_at": now,
+            "updated_at": now,
+        }
+        if total_rows is not None:
+            state["total_rows"] = total_rows
+        try:
+            await self._redis.hset(import_job_key(job_id), mapping=state)
+            await self._redis.expire(import_job_key(job_id), self._job_ttl)
+        except Exception:
+            # 작업을 시작하지 못했으므로 락을 만료까지 잡아두지 않음
+            await release_lock(self._redis, IMPORT_LOCK_KEY, job_id)
+            raise
+
+        job = _ImportJob(job_id)
+        self._tasks[job_id] = asyncio.create_task(self._run(job, run))
+        return job_id
+
+    async def get(self, job_id: str) -> dict[str, Any] | None:
+        state = await self._redis.hgetall(import_job_key(job_id))
+        if not state:
+            return None
+        state = {
+            (key.decode() if isinstance(key, bytes) else key): (
+                value.decode() if isinstance(value, bytes) else value
+            )
+            for key, value in state.items()
+        }
+
+        if state["status"] == "running" and await self._lock_owner() != job_id:
+            # 락이 만료되었거나 다른 작업이 가져감 (실행하던 워커가 종료됨)
+            state["status"] = "failed"
+            state.setdefault("error", LOCK_LOST_ERROR)
+
+        rows_processed = int(state["rows_processed"])
+        total_rows = int(state["total_rows"]) if "total_rows" in state else None
+        started_at = float(state["started_at"])
+        finished_at = float(state["finished_at"]) if "finished_at" in state else None
+        elapsed = (finished_at or time.time()) - started_at
+        throughput = rows_processed / elapsed if elapsed > 0 else 0.0
+
+        # 남은 행 수 / 지금까지의 평균 처리량 (전체 행 수를 모르면 None)
+        eta_seconds = None
+        if state["status"] == "running" and total_rows is not None and throughput > 0:
+            eta_seconds = max(total_rows - rows_processed, 0) / throughput
+
+        return {
+            "id": state["id"],
+            "status": state["status"],
+            "rows_processed": rows_processed,
+            "total_rows": total_rows,
+            "rows_per_second": round(throughput, 1),
+            "eta_seconds": None if eta_seconds is None else round(eta_seconds, 1),
+            "started_at": started_at,
+            "finished_at": finished_at,
+            "cancel_requested": state.get("cancel_requested") == "1",
+            "error": state.get("error"),
+            "result": json.loads(state["result"]) if "result" in state else None,
+        }
+
+    async def cancel(self, job_id: str) -> bool:
+        # 실행 중인 작업이 아니면 False, 다른 워커의 작업은 heartbeat 에서 취소 요청을 확인
+        state = await self.get(job_id)
+        if state is None or state["status"] != "running":
+            return False
+
+        await self._redis.hset(import_job_key(job_id), "cancel_requested", "1")
+        task = self._tasks.get(job_id)
+        if task is not None:
+            task.cancel()
+        return True
+
+    async def wait(
+        self, job_id: str, cancel_on_exit: bool = False
+    ) -> dict[str, Any] | None:
+        # 이 워커에서 실행 중인 작업이 끝날 때까지 기다린 뒤 상태 반환
+        # cancel_on_exit 이면 기다리던 쪽(요청 등)이 취소될 때 작업도 취소 (상태는 작업이 기록)
+        task = self._tasks.get(job_id)
+        if task is not None:
+            try:
+                # 취소된 작업도 상태를 반환하도록 예외 없이 종료만 기다림
+                await asyncio.wait([task])
+            except asyncio.CancelledError:
+                if cancel_on_exit:
+                    task.cancel()
+                raise
+        return await self.get(job_id)
+
+    async def join(self) -> None:
+        while self._tasks:
+            await asyncio.gather(*self._tasks.values(), return_exceptions=True)
+
+    async def close(self) -> None:
+        tasks = list(self._tasks.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _run(self, job: _ImportJob, run: ImportRunFn) -> None:
+        heartbeat = asyncio.create_task(self._heartbeat(job))
+        try:
+            result = await run(job.add_rows)
+        except asyncio.CancelledError:
+            # 이미 커밋한 청크는 유지, 종료 시 취소를 기다리는 쪽이 취소로 인식하도록 다시 발생
+            if job.lock_lost:
+                await self._finish(job, "failed", error=LOCK_LOST_ERROR)
+            else:
+                await self._finish(job, "cancelled")
+            raise
+        except Exception as e:
+            logger.warning(f"Import job {job.id} failed: {e}")
+            await self._finish(job, "failed", error=str(e))
+        else:
+            await self._finish(job, "succeeded", result=json.dumps(result))
+        finally:
+            heartbeat.cancel()
+            await self._release_lock(job.id)
+            self._tasks.pop(job.id, None)
+
+    async def _heartbeat(self, job: _ImportJob) -> None:
+        while True:
+            await asyncio.sleep(self._heartbeat_interval)
+            try:
+                await self._save_progress(job)
+                if not await extend_lock(
+                    self._redis, IMPORT_LOCK_KEY, job.id, self._lock_ttl_ms
+                ):
+                    # 락이 만료되어 다른 작업이 시작될 수 있으므로 동시에 쓰지 않도록 중단
+                    logger.warning(f"Import job {job.id} lost the import lock")
+                    job.lock_lost = True
+                    self._tasks[job.id].cancel()
+                    return
+                if await self._redis.hget(import_job_key(job.id), "cancel_requested"):
+                    self._tasks[job.id].cancel()
+            except Exception as e:
+                # Redis 오류로 가져오기를 중단하지 않음 (락 만료 전까지 재시도)
+                logger.warning(f"Failed to update import job {job.id}: {e}")
+
+    async def _save_progress(self, job: _ImportJob, **fields: Any) -> None:
+        await self._redis.hset(
+            import_job_key(job.id),
+            mapping={
+                "rows_processed": job.rows_processed,
+                "updated_at": time.time(),
+                **fields,
+            },
+        )
+
+    async def _finish(self, job: _ImportJob, status: str, **fields: Any) -> None:
+        await self._save_progress(job, status=status, finished_at=time.time(), **fields)
+
+    async def _lock_owner(self) -> str | None:
+        owner = await self._redis.get(IMPORT_LOCK_KEY)
+        return owner.decode() if isinstance(owner, bytes) else owner
+
+    async def _release_lock(self, job_id: str) -> None:
+        # 락이 만료되어 다른 작업이 가져간 경우에는 삭제하지 않음
+        await release_lock(self._redis, IMPORT_LOCK_KEY, job_id)
+
+
+def get_import_job_manager(request: Request) -> ImportJobManager:
+    return request.app.state.import_job_manager
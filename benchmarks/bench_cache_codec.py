@@ -0,0 +1,81 @@
+"""
+캐시 코덱별 인코딩/디코딩 시간과 payload 크기 비교 (/tags 결과 목록 기준)
+
+    uv run python -m benchmarks.bench_cache_codec --companies 2000 --repeat 50
+
+legacy 는 코덱 도입 전 형식(키를 반복하는 dict JSON)입니다.
+orjson/msgpack 이 설치되어 있지 않으면 해당 코덱은 건너뜁니다.
+"""
+
+import argparse
+import time
+
+from app.cache.codec import CacheCodecError, get_cache_codec
+from app.dto.company_dto import CompanyDto, CompanyNameDto
+from app.mappers.company_mapper import CompanyMapper
+
+
+def _make_dtos(count: int) -> list[CompanyDto]:
+    return [
+        CompanyDto(
+            names=(
+                CompanyNameDto(language_code="ko", name=f"원티드랩{i}"),
+                CompanyNameDto(language_code="en", name=f"Wantedlab {i}"),
+                CompanyNameDto(language_code="ja", name=f"ウォンテッドラボ{i}"),
+            )
+        )
+        for i in range(count)
+    ]
+
+
+def _measure(encode, decode, repeat: int) -> tuple[float, float, int]:
+    payload = encode()
+    started = time.perf_counter()
+    for _ in range(repeat):
+        encode()
+    encode_ms = (time.perf_counter() - started) / repeat * 1000
+
+    started = time.perf_counter()
+    for _ in range(repeat):
+        decode(payload)
+    decode_ms = (time.perf_counter() - started) / repeat * 1000
+    return encode_ms, decode_ms, len(payload)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--companies", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    mapper = CompanyMapper()
+    dtos = _make_dtos(args.companies)
+
+    results = {
+        "legacy": _measure(
+            lambda: mapper.dtos_to_json(dtos).encode(),
+            mapper.json_to_dtos,
+            args.repeat,
+        )
+    }
+    for name in ("json", "orjson", "msgpack"):
+        try:
+            codec = get_cache_codec(name)
+        except CacheCodecError as e:
+            print(f"skip {name}: {e}")
+            continue
+        results[name] = _measure(
+            lambda codec=codec: codec.dumps(mapper.dtos_to_cache_data(dtos)),
+            lambda payload, codec=codec: mapper.cache_data_to_dtos(
+                codec.loads(payload)
+            ),
+            args.repeat,
+        )
+
+    print(f"{'codec':>8} {'encode ms':>10} {'decode ms':>10} {'bytes':>10}")
+    for name, (encode_ms, decode_ms, size) in results.items():
+        print(f"{name:>8} {encode_ms:10.2f} {decode_ms:10.2f} {size:10d}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""
+/companies/{name} 처리량 비교: 요청마다 엔진 생성(before) vs 앱 lifetime 엔진(after)
+
+    uv run python -m benchmarks.bench_db_engine --requests 2000 --concurrency 50
+
+BENCH_DATABASE_URL 환경변수로 Postgres 를 지정할 수 있습니다 (기본값: 임시 sqlite 파일).
+캐시 히트 시에는 DB 를 타지 않으므로 Redis 조회는 항상 miss 로 처리합니다.
+"""
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+
+os.environ.setdefault("DATABASE_URL", "sqlite+aiosqlite:///:memory:")
+os.environ.setdefault("REDIS_URL", "localhost")
+os.environ.setdefault("REDIS_PASSWORD", "")
+
+import fakeredis.aioredis  # noqa: E402
+import httpx  # noqa: E402
+
+from app.core.config import Settings, get_settings  # noqa: E402
+from app.db.base import Base  # noqa: E402
+from app.db.models import Company, CompanyName  # noqa: E402
+from app.db.redis import create_redis_pool, get_redis_client  # noqa: E402
+from app.db.session import (  # noqa: E402
+    create_database_engine,
+    create_session_factory,
+    get_session_factory,
+)
+from app.main import create_app  # noqa: E402
+
+COMPANY_NAME = "벤치마크회사"
+
+
+class _AlwaysMissRedis(fakeredis.aioredis.FakeRedis):
+    async def get(self, name):
+        return None
+
+
+async def _seed(settings: Settings) -> None:
+    engine = create_database_engine(settings)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async with create_session_factory(engine)() as session:
+        exists = await session.execute(
+            CompanyName.__table__.select().where(CompanyName.name == COMPANY_NAME)
+        )
+        if exists.first() is None:
+            company = Company()
+            company.names.append(CompanyName(language_code="ko", name=COMPANY_NAME))
+            session.add(company)
+            await session.commit()
+    await engine.dispose()
+
+
+async def _run(mode: str, settings: Settings, requests: int, concurrency: int):
+    app = create_app()
+    redis_client = _AlwaysMissRedis()
+    app.dependency_overrides[get_settings] = lambda: settings
+    app.dependency_overrides[get_redis_client] = lambda: redis_client
+    app.dependency_overrides[create_redis_pool] = lambda _settings: (
+        redis_client.connection_pool
+    )
+    if mode == "before":
+
+        async def _per_request_session_factory():
+            # 변경 전 동작: 요청마다 새 엔진(커넥션 풀)을 만든다
+            # (변경 전 코드는 dispose 조차 하지 않았지만, 벤치마크 프로세스 보호를 위해 정리)
+            engine = create_database_engine(settings)
+            try:
+                yield create_session_factory(engine)
+            finally:
+                await engine.dispose()
+
+        app.dependency_overrides[get_session_factory] = _per_request_session_factory
+
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://bench"
+        ) as client:
+            headers = {"x-wanted-language": "ko"}
+            url = f"/companies/{COMPANY_NAME}"
+            semaphore = asyncio.Semaphore(concurrency)
+
+            async def _request():
+                async with semaphore:
+                    response = await client.get(url, headers=headers)
+                    assert response.status_code == 200, response.text
+
+            await _request()  # warm-up
+            started = time.perf_counter()
+            await asyncio.gather(*(_request() for _ in range(requests)))
+            elapsed = time.perf_counter() - started
+
+    await redis_client.aclose()
+    return requests / elapsed
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        database_url = os.getenv(
+            "BENCH_DATABASE_URL",
+            f"sqlite+aiosqlite:///{os.path.join(tmp_dir, 'bench.db')}",
+        )
+        settings = Settings(
+            _env_file=None,
+            DATABASE_URL=database_url,
+            REDIS_URL="localhost",
+            REDIS_PASSWORD="",
+        )
+        await _seed(settings)
+
+        results = {}
+        for mode in ("before", "after"):
+            results[mode] = await _run(mode, settings, args.requests, args.concurrency)
+            print(f"{mode:>6}: {results[mode]:10.1f} req/s")
+        print(f"speedup: {results['after'] / results['before']:.2f}x")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
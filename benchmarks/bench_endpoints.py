@@ -0,0 +1,230 @@
+"""
+엔드포인트별 지연 시간(p50/p95/p99)과 처리량 측정 (in-process 앱, 오프라인 실행)
+
+    uv run python -m benchmarks.bench_endpoints --companies 2000 --output result.json
+
+- 조회 API 는 cold(요청마다 캐시 비움, 순차 실행)와 warm(캐시 적재 후 동시 실행)으로 나누어 측정
+- 쓰기 API(POST /companies, 태그 PUT/DELETE)는 매 요청 다른 대상으로 측정
+- BENCH_DATABASE_URL 로 로컬 Postgres 를 지정할 수 있습니다 (기본값: 임시 sqlite 파일)
+- 결과는 JSON 으로 저장되므로 실행 간 비교가 가능합니다
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import subprocess
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Awaitable, Callable
+from urllib.parse import quote
+
+from benchmarks.common import (
+    clear_caches,
+    company_names,
+    make_settings,
+    running_app,
+    seed_database,
+    write_sample_csv,
+)
+
+HEADERS = {"x-wanted-language": "ko"}
+
+RequestSpec = tuple[str, str, object | None]  # (method, url, json body)
+
+
+def _percentile(sorted_values: list[float], percent: float) -> float:
+    # nearest-rank
+    index = max(0, int(round(percent / 100 * len(sorted_values) + 0.5)) - 1)
+    return sorted_values[min(index, len(sorted_values) - 1)]
+
+
+def _summarize(
+    name: str, phase: str, latencies: list[float], elapsed: float, concurrency: int
+) -> dict:
+    latencies = sorted(latencies)
+    return {
+        "endpoint": name,
+        "phase": phase,
+        "requests": len(latencies),
+        "concurrency": concurrency,
+        "p50_ms": round(_percentile(latencies, 50) * 1000, 3),
+        "p95_ms": round(_percentile(latencies, 95) * 1000, 3),
+        "p99_ms": round(_percentile(latencies, 99) * 1000, 3),
+        "mean_ms": round(sum(latencies) / len(latencies) * 1000, 3),
+        "throughput_rps": round(len(latencies) / elapsed, 1),
+    }
+
+
+async def _measure(
+    client,
+    specs: list[RequestSpec],
+    concurrency: int,
+    before_each: Callable[[], Awaitable[None]] | None = None,
+) -> tuple[list[float], float]:
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+
+    async def _request(spec: RequestSpec) -> None:
+        method, url, body = spec
+        async with semaphore:
+            if before_each is not None:
+                await before_each()
+            started = time.perf_counter()
+            response = await client.request(method, url, json=body, headers=HEADERS)
+            latencies.append(time.perf_counter() - started)
+            assert response.status_code < 400, f"{method} {url}: {response.text}"
+
+    started = time.perf_counter()
+    await asyncio.gather(*(_request(spec) for spec in specs))
+    elapsed = time.perf_counter() - started
+    if before_each is not None:
+        # cold 측정에서는 캐시를 비우는 시간이 처리량에 포함되지 않도록 지연 시간 합으로 계산
+        elapsed = sum(latencies)
+    return latencies, elapsed
+
+
+def _read_scenarios(companies: int, tags: int, requests: int) -> dict:
+    def _cycle(make: Callable[[int], str]) -> list[RequestSpec]:
+        return [("GET", make(i), None) for i in range(requests)]
+
+    return {
+        # 숫자 일부로 검색하여 결과 수가 다양한 부분 검색
+        "GET /search": _cycle(lambda i: f"/search?query={i % companies}"),
+        "GET /companies/{name}": _cycle(
+            lambda i: f"/companies/{quote(company_names(i % companies)[i % 2])}"
+        ),
+        "GET /tags": _cycle(lambda i: f"/tags?query={quote(f'태그_{i % tags + 1}')}"),
+    }
+
+
+def _write_scenarios(requests: int, run_id: str) -> list[tuple[str, list[RequestSpec]]]:
+    # POST 로 만든 회사를 PUT/DELETE 대상으로 사용
+    companies = [f"벤치신규{run_id}_{i}" for i in range(requests)]
+    tag = {"ko": f"벤치태그{run_id}", "en": f"bench_tag{run_id}"}
+    return [
+        (
+            "POST /companies",
+            [
+                (
+                    "POST",
+                    "/companies",
+                    {
+                        "company_name": {"ko": name, "en": f"{name}_en"},
+                        "tags": [{"tag_name": {"ko": "태그_1", "en": "tag_1"}}],
+                    },
+                )
+                for name in companies
+            ],
+        ),
+        (
+            "PUT /companies/{name}/tags",
+            [
+                ("PUT", f"/companies/{quote(name)}/tags", [{"tag_name": tag}])
+                for name in companies
+            ],
+        ),
+        (
+            "DELETE /companies/{name}/tags/{tag}",
+            [
+                ("DELETE", f"/companies/{quote(name)}/tags/{quote(tag['ko'])}", None)
+                for name in companies
+            ],
+        ),
+    ]
+
+
+def _git_revision() -> str | None:
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"],
+            text=True,
+            stderr=subprocess.DEVNULL,
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--companies", type=int, default=2000)
+    parser.add_argument("--tags", type=int, default=100)
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--cold-requests", type=int, default=100)
+    parser.add_argument("--write-requests", type=int, default=100)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--codec", default="json")
+    parser.add_argument("--response-cache", action="store_true")
+    parser.add_argument("--output", type=Path)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        database_url = os.getenv(
+            "BENCH_DATABASE_URL",
+            f"sqlite+aiosqlite:///{os.path.join(tmp_dir, 'bench.db')}",
+        )
+        settings = make_settings(
+            database_url,
+            REPOSITORY_CACHE_CODEC=args.codec,
+            RESPONSE_CACHE_ENABLED=args.response_cache,
+        )
+        csv_path = Path(tmp_dir) / "company_tag_sample.csv"
+        write_sample_csv(csv_path, companies=args.companies, tags=args.tags)
+        await seed_database(settings, csv_path)
+
+        results = []
+        async with running_app(settings) as (app, client, redis_client):
+            cold_before_each = clear_caches(app, redis_client)
+            for name, specs in _read_scenarios(
+                args.companies, args.tags, args.requests
+            ).items():
+                latencies, elapsed = await _measure(
+                    client, specs[: args.cold_requests], 1, cold_before_each
+                )
+                results.append(_summarize(name, "cold", latencies, elapsed, 1))
+
+                # warm: 측정할 키를 한 번씩 적재한 뒤 동시 요청
+                await _measure(client, list(dict.fromkeys(specs)), args.concurrency)
+                latencies, elapsed = await _measure(client, specs, args.concurrency)
+                results.append(
+                    _summarize(name, "warm", latencies, elapsed, args.concurrency)
+                )
+
+            # sqlite 는 쓰기 동시성이 없으므로 쓰기 API 는 순차 실행
+            run_id = str(int(time.time()))
+            for name, specs in _write_scenarios(args.write_requests, run_id):
+                latencies, elapsed = await _measure(client, specs, 1)
+                results.append(_summarize(name, "write", latencies, elapsed, 1))
+
+    report = {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "git_revision": _git_revision(),
+            "python": platform.python_version(),
+            "database": database_url.split(":", 1)[0],
+            "companies": args.companies,
+            "tags": args.tags,
+            "codec": args.codec,
+            "response_cache": args.response_cache,
+        },
+        "results": results,
+    }
+
+    print(
+        f"{'endpoint':<36} {'phase':<6} {'p50':>8} {'p95':>8} {'p99':>8} {'req/s':>9}"
+    )
+    for row in results:
+        print(
+            f"{row['endpoint']:<36} {row['phase']:<6} {row['p50_ms']:8.2f} "
+            f"{row['p95_ms']:8.2f} {row['p99_ms']:8.2f} {row['throughput_rps']:9.1f}"
+        )
+    if args.output:
+        args.output.write_text(json.dumps(report, ensure_ascii=False, indent=2))
+        print(f"saved: {args.output}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,162 @@
+"""
+회사명 부분 검색의 일반 검색과 오타 허용(fuzzy) 검색 지연 시간 비교 (p50/p95/p99)
+
+    BENCH_DATABASE_URL=postgresql+asyncpg://... \
+        uv run python -m benchmarks.bench_fuzzy_search --names 1000000 --repeat 200
+
+Postgres 에서는 pg_trgm GIN 인덱스(%, <% 연산자)를 사용합니다.
+BENCH_DATABASE_URL 이 없으면 임시 sqlite 파일을 사용하며, 이때 fuzzy 검색은 인덱스 없이
+Python 함수로 전체 회사명을 비교하므로 --names 를 작게 지정하세요.
+캐시 히트 시에는 DB 를 타지 않으므로 Redis 조회는 항상 miss 로 처리합니다.
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import tempfile
+import time
+import uuid
+
+os.environ.setdefault("DATABASE_URL", "sqlite+aiosqlite:///:memory:")
+os.environ.setdefault("REDIS_URL", "localhost")
+os.environ.setdefault("REDIS_PASSWORD", "")
+
+import fakeredis.aioredis  # noqa: E402
+from sqlalchemy import insert, text  # noqa: E402
+
+from app.core.config import Settings  # noqa: E402
+from app.db.base import Base  # noqa: E402
+from app.db.models import Company, CompanyName  # noqa: E402
+from app.db.session import create_database_engine, create_session_factory  # noqa: E402
+from app.mappers.company_mapper import CompanyMapper  # noqa: E402
+from app.mappers.company_tag_mapper import CompanyTagMapper  # noqa: E402
+from app.repositories.company_repository import CompanyRepository  # noqa: E402
+from benchmarks.common import company_names, make_settings  # noqa: E402
+
+INSERT_BATCH_SIZE = 10_000
+
+
+class _AlwaysMissRedis(fakeredis.aioredis.FakeRedis):
+    async def get(self, name):
+        return None
+
+    async def hget(self, name, key):
+        return None
+
+    async def mget(self, keys, *args):
+        return [None] * len(keys)
+
+
+def _typo(name: str, rng: random.Random) -> str:
+    # 한 글자를 바꿔 오타를 만든다 (숫자 접미사는 유지)
+    position = rng.randrange(len(name) - 1)
+    return name[:position] + "x" + name[position + 1 :]
+
+
+async def _seed(settings: Settings, names: int) -> None:
+    # 회사마다 ko/en 두 개의 이름
+    engine = create_database_engine(settings)
+    try:
+        async with engine.begin() as conn:
+            if engine.dialect.name == "postgresql":
+                await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+            await conn.run_sync(Base.metadata.drop_all)
+            await conn.run_sync(Base.metadata.create_all)
+
+        for start in range(0, names // 2, INSERT_BATCH_SIZE):
+            company_ids = [
+                uuid.uuid4()
+                for _ in range(start, min(start + INSERT_BATCH_SIZE, names // 2))
+            ]
+            name_rows = []
+            for offset, company_id in enumerate(company_ids):
+                company_ko, company_en, _ = company_names(start + offset)
+                name_rows.append(
+                    {
+                        "company_id": company_id,
+                        "language_code": "ko",
+                        "name": company_ko,
+                    }
+                )
+                name_rows.append(
+                    {
+                        "company_id": company_id,
+                        "language_code": "en",
+                        "name": company_en,
+                    }
+                )
+            async with engine.begin() as conn:
+                await conn.execute(
+                    insert(Company), [{"id": company_id} for company_id in company_ids]
+                )
+                await conn.execute(insert(CompanyName), name_rows)
+
+        if engine.dialect.name == "postgresql":
+            async with engine.connect() as conn:
+                await conn.execute(text("ANALYZE company_names"))
+    finally:
+        await engine.dispose()
+
+
+def _percentiles(latencies: list[float]) -> tuple[float, float, float]:
+    quantiles = statistics.quantiles(latencies, n=100, method="inclusive")
+    return quantiles[49], quantiles[94], quantiles[98]
+
+
+async def _measure(settings: Settings, queries: list[str], fuzzy: bool) -> list[float]:
+    engine = create_database_engine(settings)
+    session_factory = create_session_factory(engine)
+    redis_client = _AlwaysMissRedis()
+    latencies = []
+    try:
+        for query in queries:
+            async with session_factory() as session:
+                repository = CompanyRepository(
+                    db=session,
+                    redis_client=redis_client,
+                    company_mapper=CompanyMapper(),
+                    company_tag_mapper=CompanyTagMapper(),
+                    settings=settings,
+                )
+                started = time.perf_counter()
+                await repository.get_by_partial_name(query, fuzzy=fuzzy)
+                latencies.append((time.perf_counter() - started) * 1000)
+    finally:
+        await redis_client.aclose()
+        await engine.dispose()
+    return latencies
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--names", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    queries = []
+    for _ in range(args.repeat):
+        company_ko, company_en, _ = company_names(rng.randrange(args.names // 2))
+        queries.append(_typo(rng.choice([company_ko, company_en]), rng))
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        database_url = os.getenv(
+            "BENCH_DATABASE_URL",
+            f"sqlite+aiosqlite:///{os.path.join(tmp_dir, 'bench.db')}",
+        )
+        settings = make_settings(database_url)
+        await _seed(settings, args.names)
+
+        for label, fuzzy in (("exact", False), ("fuzzy", True)):
+            latencies = await _measure(settings, queries, fuzzy)
+            p50, p95, p99 = _percentiles(latencies)
+            print(
+                f"{label:>6}: p50 {p50:8.2f} ms  p95 {p95:8.2f} ms  p99 {p99:8.2f} ms"
+            )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
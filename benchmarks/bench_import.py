@@ -0,0 +1,116 @@
+"""
+CSV 데이터 초기화 처리량(rows/s)과 이벤트 루프 지연 비교
+- legacy: 행마다 커밋
+- bulk: 요청 세션 하나로 청크 단위 multi-row INSERT
+- parallel: 스레드 풀에서 파싱, --parallelism 개 writer 가 각자의 커넥션으로 저장
+
+    uv run python -m benchmarks.bench_import --rows 10000,100000,1000000
+
+BENCH_DATABASE_URL 로 로컬 Postgres 를 지정할 수 있습니다 (기본값: 임시 sqlite 파일, Postgres 는 COPY 사용).
+legacy 모드는 느리므로 --legacy-max-rows 이하의 크기에서만 측정합니다.
+"""
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+from pathlib import Path
+
+os.environ.setdefault("DATABASE_URL", "sqlite+aiosqlite:///:memory:")
+os.environ.setdefault("REDIS_URL", "localhost")
+os.environ.setdefault("REDIS_PASSWORD", "")
+
+from app.core.config import Settings  # noqa: E402
+from app.db.base import Base  # noqa: E402
+from app.db.session import create_database_engine, create_session_factory  # noqa: E402
+from app.services.data_importer import (  # noqa: E402
+    IMPORT_CHUNK_SIZE,
+    DataImporterService,
+)
+from app.services.data_initializer import DataInitializerService  # noqa: E402
+from benchmarks.common import make_settings, write_sample_csv  # noqa: E402
+
+
+async def _measure_loop_lag(lags: list[float], interval: float = 0.01) -> None:
+    # 같은 이벤트 루프의 다른 요청이 기다리는 시간 (sleep 이 예정보다 늦게 깨어난 정도)
+    loop = asyncio.get_running_loop()
+    while True:
+        expected = loop.time() + interval
+        await asyncio.sleep(interval)
+        lags.append(max(loop.time() - expected, 0.0))
+
+
+async def _import(
+    settings: Settings, csv_path: Path, mode: str, args: argparse.Namespace
+) -> tuple[float, list[float]]:
+    engine = create_database_engine(settings)
+    lags: list[float] = []
+    try:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.drop_all)
+            await conn.run_sync(Base.metadata.create_all)
+        session_factory = create_session_factory(engine)
+        async with session_factory() as session:
+            importer = None
+            if mode == "parallel":
+                importer = DataImporterService(
+                    session_factory,
+                    parallelism=args.parallelism,
+                    queue_size=args.queue_size,
+                )
+            initializer = DataInitializerService(session, importer=importer)
+            ticker = asyncio.create_task(_measure_loop_lag(lags))
+            started = time.perf_counter()
+            await initializer.initialize_data_from_csv(
+                csv_path, bulk=mode != "legacy", chunk_size=args.chunk_size
+            )
+            elapsed = time.perf_counter() - started
+            ticker.cancel()
+            return elapsed, lags
+    finally:
+        await engine.dispose()
+
+
+def _percentile(values: list[float], percent: float) -> float:
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(int(len(values) * percent / 100), len(values) - 1)]
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", default="10000,100000,1000000")
+    parser.add_argument("--chunk-size", type=int, default=IMPORT_CHUNK_SIZE)
+    parser.add_argument("--legacy-max-rows", type=int, default=10000)
+    parser.add_argument("--parallelism", type=int, default=4)
+    parser.add_argument("--queue-size", type=int, default=8)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        database_url = os.getenv(
+            "BENCH_DATABASE_URL",
+            f"sqlite+aiosqlite:///{os.path.join(tmp_dir, 'bench.db')}",
+        )
+        settings = make_settings(database_url)
+
+        for rows in (int(value) for value in args.rows.split(",")):
+            csv_path = Path(tmp_dir) / f"companies_{rows}.csv"
+            write_sample_csv(csv_path, companies=rows, tags=max(rows // 100, 10))
+
+            modes = ["bulk", "parallel"]
+            if rows <= args.legacy_max_rows:
+                modes.insert(0, "legacy")
+            for mode in modes:
+                elapsed, lags = await _import(settings, csv_path, mode, args)
+                print(
+                    f"{rows:>9} rows {mode:>8}: {rows / elapsed:10.1f} rows/s"
+                    f" ({elapsed:.2f} s), event loop lag"
+                    f" p99 {_percentile(lags, 99) * 1000:7.1f} ms"
+                    f" max {max(lags, default=0.0) * 1000:7.1f} ms"
+                )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,115 @@
+"""
+CSV 업로드(multipart + gzip) 초기화의 처리량과 최대 메모리(RSS) 측정
+CSV 는 요청 본문으로 보내는 동안 생성하므로 파일 크기와 관계없이 벤치마크 자체는 메모리를 쓰지 않습니다.
+
+    uv run python -m benchmarks.bench_upload --megabytes 100,500,2000
+
+BENCH_DATABASE_URL 로 로컬 Postgres 를 지정할 수 있습니다 (기본값: 임시 sqlite 파일).
+최대 RSS 는 프로세스 전체 기준이므로 크기를 늘려가며 측정해 증가량을 비교합니다.
+"""
+
+import argparse
+import asyncio
+import os
+import resource
+import tempfile
+import time
+from typing import AsyncIterator
+
+os.environ.setdefault("DATABASE_URL", "sqlite+aiosqlite:///:memory:")
+os.environ.setdefault("REDIS_URL", "localhost")
+os.environ.setdefault("REDIS_PASSWORD", "")
+
+from app.core.config import Settings  # noqa: E402
+from app.db.base import Base  # noqa: E402
+from app.db.session import create_database_engine  # noqa: E402
+from app.services.data_exporter import gzip_chunks  # noqa: E402
+from benchmarks.common import company_names, make_settings, running_app  # noqa: E402
+
+BOUNDARY = "bench-upload-boundary"
+ROWS_PER_CHUNK = 1000
+
+
+async def _csv_chunks(megabytes: int, tags: int) -> AsyncIterator[bytes]:
+    # 지정한 크기(압축 전)에 도달할 때까지 CSV 를 청크 단위로 생성
+    limit = megabytes * 1024 * 1024
+    sent = 0
+    yield b"company_ko,company_en,company_ja,tag_ko,tag_en,tag_ja\n"
+    start = 0
+    while sent < limit:
+        lines = []
+        for i in range(start, start + ROWS_PER_CHUNK):
+            company_ko, company_en, company_ja = company_names(i)
+            tag = i % tags
+            lines.append(
+                f"{company_ko},{company_en},{company_ja if i % 3 == 0 else ''},"
+                f"태그_{tag},tag_{tag},タグ_{tag}\n"
+            )
+        start += ROWS_PER_CHUNK
+        chunk = "".join(lines).encode()
+        sent += len(chunk)
+        yield chunk
+
+
+async def _multipart_body(chunks: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    yield (
+        f"--{BOUNDARY}\r\n"
+        'Content-Disposition: form-data; name="file"; filename="companies.csv.gz"\r\n'
+        "Content-Type: application/gzip\r\n\r\n"
+    ).encode()
+    async for chunk in chunks:
+        yield chunk
+    yield f"\r\n--{BOUNDARY}--\r\n".encode()
+
+
+def _max_rss_mb() -> float:
+    # Linux 는 KB 단위
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+async def _upload(settings: Settings, megabytes: int, tags: int) -> tuple[dict, float]:
+    engine = create_database_engine(settings)
+    try:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.drop_all)
+            await conn.run_sync(Base.metadata.create_all)
+    finally:
+        await engine.dispose()
+
+    async with running_app(settings) as (_, client, _):
+        started = time.perf_counter()
+        response = await client.post(
+            "/admin/initialize-data/upload",
+            content=_multipart_body(gzip_chunks(_csv_chunks(megabytes, tags))),
+            headers={"Content-Type": f"multipart/form-data; boundary={BOUNDARY}"},
+            timeout=None,
+        )
+        elapsed = time.perf_counter() - started
+    return response.json()["data"], elapsed
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--megabytes", default="100,500,2000")
+    parser.add_argument("--tags", type=int, default=1000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        database_url = os.getenv(
+            "BENCH_DATABASE_URL",
+            f"sqlite+aiosqlite:///{os.path.join(tmp_dir, 'bench.db')}",
+        )
+        settings = make_settings(database_url, AUTOCOMPLETE_INDEX_ENABLED=False)
+
+        baseline = _max_rss_mb()
+        for megabytes in (int(value) for value in args.megabytes.split(",")):
+            job, elapsed = await _upload(settings, megabytes, args.tags)
+            print(
+                f"{megabytes:>6} MB {job['status']:>9}: {job['rows_processed']:>10} rows"
+                f" {job['rows_processed'] / elapsed:10.1f} rows/s ({elapsed:.1f} s),"
+                f" max RSS +{_max_rss_mb() - baseline:7.1f} MB"
+            )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,118 @@
+"""
+벤치마크 공통: tests/conftest.py 와 같은 방식으로 앱을 구성하고 데이터를 적재합니다.
+"""
+
+import csv
+import os
+import random
+from contextlib import asynccontextmanager
+from pathlib import Path
+
+os.environ.setdefault("DATABASE_URL", "sqlite+aiosqlite:///:memory:")
+os.environ.setdefault("REDIS_URL", "localhost")
+os.environ.setdefault("REDIS_PASSWORD", "")
+
+import fakeredis.aioredis  # noqa: E402
+import httpx  # noqa: E402
+from fastapi import FastAPI  # noqa: E402
+
+from app.core.config import Settings, get_settings  # noqa: E402
+from app.db.base import Base  # noqa: E402
+from app.db.redis import create_redis_pool, get_redis_client  # noqa: E402
+from app.db.session import create_database_engine, create_session_factory  # noqa: E402
+from app.main import create_app  # noqa: E402
+from app.services.data_initializer import DataInitializerService  # noqa: E402
+
+CSV_FIELDS = ["company_ko", "company_en", "company_ja", "tag_ko", "tag_en", "tag_ja"]
+
+# 부분 검색 결과 수가 다양하도록 공통 단어를 섞어 회사명을 만든다
+_KO_WORDS = ["원티드", "링크", "테크", "랩스", "코리아", "소프트", "데이터", "클라우드"]
+_EN_WORDS = ["Wanted", "Link", "Tech", "Labs", "Korea", "Soft", "Data", "Cloud"]
+_JA_WORDS = [
+    "ウォンテッド",
+    "リンク",
+    "テック",
+    "ラボ",
+    "コリア",
+    "ソフト",
+    "データ",
+    "クラウド",
+]
+
+
+def make_settings(database_url: str, **overrides) -> Settings:
+    return Settings(
+        _env_file=None,
+        DATABASE_URL=database_url,
+        REDIS_URL="localhost",
+        REDIS_PASSWORD="",
+        **overrides,
+    )
+
+
+def company_names(i: int) -> tuple[str, str, str]:
+    # (ko, en, ja) i 번째 회사의 이름
+    word = i % len(_KO_WORDS)
+    return f"{_KO_WORDS[word]}{i}", f"{_EN_WORDS[word]} {i}", f"{_JA_WORDS[word]}{i}"
+
+
+def write_sample_csv(path: Path, companies: int, tags: int, seed: int = 0) -> None:
+    # company_tag_sample.csv 와 같은 스키마로 규모를 키운 데이터 생성
+    rng = random.Random(seed)
+    with open(path, "w", encoding="utf-8", newline="") as file:
+        writer = csv.DictWriter(file, fieldnames=CSV_FIELDS)
+        writer.writeheader()
+        for i in range(companies):
+            company_ko, company_en, company_ja = company_names(i)
+            tag_ids = rng.sample(range(1, tags + 1), k=min(tags, rng.randint(1, 3)))
+            writer.writerow(
+                {
+                    "company_ko": company_ko,
+                    "company_en": company_en,
+                    # 일본어 회사명은 원본 데이터처럼 일부만 존재
+                    "company_ja": company_ja if i % 3 == 0 else "",
+                    "tag_ko": "|".join(f"태그_{t}" for t in tag_ids),
+                    "tag_en": "|".join(f"tag_{t}" for t in tag_ids),
+                    "tag_ja": "|".join(f"タグ_{t}" for t in tag_ids),
+                }
+            )
+
+
+async def seed_database(settings: Settings, csv_path: Path) -> None:
+    engine = create_database_engine(settings)
+    try:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.drop_all)
+            await conn.run_sync(Base.metadata.create_all)
+        async with create_session_factory(engine)() as session:
+            await DataInitializerService(session).initialize_data_from_csv(csv_path)
+    finally:
+        await engine.dispose()
+
+
+def clear_caches(app: FastAPI, redis_client: fakeredis.aioredis.FakeRedis):
+    async def _clear() -> None:
+        await redis_client.flushall()
+        if app.state.local_cache is not None:
+            app.state.local_cache.clear()
+
+    return _clear
+
+
+@asynccontextmanager
+async def running_app(settings: Settings, redis_client=None):
+    """lifespan 이 실행된 앱과 httpx 클라이언트를 반환합니다."""
+    redis_client = redis_client or fakeredis.aioredis.FakeRedis()
+    app = create_app()
+    app.dependency_overrides[get_settings] = lambda: settings
+    app.dependency_overrides[get_redis_client] = lambda: redis_client
+    app.dependency_overrides[create_redis_pool] = lambda _settings: (
+        redis_client.connection_pool
+    )
+
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://bench"
+        ) as client:
+            yield app, client, redis_client
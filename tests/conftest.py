@@ -1,4 +1,5 @@
 import asyncio
+from contextlib import asynccontextmanager
 
 import fakeredis.aioredis
 import pytest
@@ -25,6 +26,7 @@ async def settings():
 async def _test_engine(settings):
     from app.db import models  # noqa: F401
     from app.db.base import Base
+    from app.db.session import install_sqlite_functions
 
     engine = create_async_engine(
         url=settings.DATABASE_URL,
@@ -32,6 +34,7 @@ async def _test_engine(settings):
         poolclass=StaticPool,
         connect_args={"check_same_thread": False},
     )
+    install_sqlite_functions(engine)
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
     yield engine
@@ -47,7 +50,19 @@ async def async_session(_test_engine):
         trans = await conn.begin()
         async with async_session_factory(bind=conn) as session:
             yield session
-        await trans.rollback()
+        # 테스트한 코드가 오류로 롤백하면 세션이 참여한 테스트 트랜잭션도 이미 끝남
+        if trans.is_active:
+            await trans.rollback()
+
+
+@pytest.fixture()
+def session_factory(async_session):
+    # 직접 세션을 여는 코드(스트리밍 응답 등)도 테스트 트랜잭션의 같은 세션을 사용
+    @asynccontextmanager
+    async def _session_factory():
+        yield async_session
+
+    return _session_factory
 
 
 @pytest.fixture()
@@ -59,13 +74,14 @@ async def redis_client():
 
 
 @pytest.fixture()
-def fastapi_client(async_session, redis_client, settings):
+def fastapi_client(async_session, redis_client, settings, session_factory):
     from fastapi.testclient import TestClient
 
     from app.core.config import get_settings
-    from app.db.redis import get_redis_client
-    from app.db.session import get_db
+    from app.db.redis import create_redis_pool, get_redis_client
+    from app.db.session import get_db, get_session_factory
     from app.main import create_app
+    from app.search.autocomplete import load_prefix_index
 
     # 테스트용 앱 생성
     app = create_app()
@@ -80,9 +96,21 @@ def fastapi_client(async_session, redis_client, settings):
     def override_get_settings():
         return settings
 
+    def override_create_redis_pool(_settings):
+        return redis_client.connection_pool
+
+    async def override_load_prefix_index(_session):
+        prefix_index = await load_prefix_index(async_session)
+        # 요청들과 같은 세션을 공유하므로 조회로 시작된 트랜잭션을 정리
+        await async_session.commit()
+        return prefix_index
+
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_session_factory] = lambda: session_factory
     app.dependency_overrides[get_redis_client] = override_get_redis_client
     app.dependency_overrides[get_settings] = override_get_settings
+    app.dependency_overrides[create_redis_pool] = override_create_redis_pool
+    app.dependency_overrides[load_prefix_index] = override_load_prefix_index
 
     with TestClient(app) as client:
         yield client
@@ -130,3 +130,16 @@ async def setup_company_test_data(async_session):
         "companies": created_companies,
         "tags": created_tags,
     }
+
+
+@pytest.fixture()
+def response_cache_client(fastapi_client, settings):
+    from app.core.config import get_settings
+
+    response_cache_settings = settings.model_copy(
+        update={"RESPONSE_CACHE_ENABLED": True}
+    )
+    fastapi_client.app.dependency_overrides[get_settings] = lambda: (
+        response_cache_settings
+    )
+    return fastapi_client
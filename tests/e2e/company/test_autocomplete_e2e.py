@@ -0,0 +1,48 @@
+class TestCompanyAutocomplete:
+    """
+    회사명 자동완성 (prefix)
+    입력한 prefix 로 시작하는 회사명이 정확히 일치/짧은 이름 순으로 limit 개까지 노출되어야 합니다.
+    header의 x-wanted-language 언어값에 따라 해당 언어로 출력되어야 합니다.
+    새로 추가한 회사도 바로 검색되어야 합니다.
+    """
+
+    # 인덱스는 앱 시작 시 생성되므로 데이터를 먼저 적재
+    def test_autocomplete(self, setup_company_test_data, fastapi_client):
+        response = fastapi_client.get(
+            "/autocomplete?query=want", headers={"x-wanted-language": "ko"}
+        )
+
+        assert response.status_code == 200
+        assert response.json() == [{"company_name": "원티드랩"}]
+
+    def test_autocomplete_limit(self, setup_company_test_data, fastapi_client):
+        response = fastapi_client.get(
+            "/autocomplete?query=주식회사&limit=1",
+            headers={"x-wanted-language": "en"},
+        )
+
+        assert response.status_code == 200
+        assert len(response.json()) == 1
+
+    def test_autocomplete_invalid_limit(self, setup_company_test_data, fastapi_client):
+        response = fastapi_client.get(
+            "/autocomplete?query=원&limit=0", headers={"x-wanted-language": "ko"}
+        )
+
+        assert response.status_code == 422
+
+    def test_autocomplete_new_company(self, setup_company_test_data, fastapi_client):
+        fastapi_client.post(
+            "/companies",
+            json={"company_name": {"ko": "원티드새회사", "en": "Wanted New"}},
+            headers={"x-wanted-language": "ko"},
+        )
+
+        response = fastapi_client.get(
+            "/autocomplete?query=원티드", headers={"x-wanted-language": "en"}
+        )
+
+        assert response.json() == [
+            {"company_name": "Wantedlab"},
+            {"company_name": "Wanted New"},
+        ]
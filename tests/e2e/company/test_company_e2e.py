@@ -115,20 +115,35 @@ class TestSearchTagName:
     동일한 회사는 한번만 노출이 되어야합니다.
     """
 
-    def test_search_tag_name(self, fastapi_client, setup_company_test_data):
+    def test_search_tag_name(
+        self, fastapi_client, setup_company_test_data, async_session
+    ):
+        from sqlalchemy import select
+
+        from app.db.models import CompanyName
+
         response = fastapi_client.get(
             "/tags?query=タグ_22", headers={"x-wanted-language": "ko"}
         )
 
         searched_companies = response.json()
 
-        assert [company["company_name"] for company in searched_companies] == [
+        # 페이지 정렬 키(회사 ID) 순서로 반환
+        names = [
             "딤딤섬 대구점",
             "마이셀럽스",
             "Rejoice Pregnancy",
             "삼일제약",
             "투게더앱스",
         ]
+        result = fastapi_client.portal.call(
+            async_session.execute,
+            select(CompanyName.company_id, CompanyName.name).where(
+                CompanyName.name.in_(names)
+            ),
+        )
+        expected = [name for _, name in sorted(result.all(), key=lambda row: row[0])]
+        assert [company["company_name"] for company in searched_companies] == expected
 
 
 class TestNewTag:
@@ -0,0 +1,40 @@
+import json
+
+
+class TestExport:
+    """
+    관리자 데이터 내보내기
+    전체 회사를 회사명/태그와 함께 NDJSON 으로 스트리밍합니다.
+    Accept-Encoding 에 gzip 이 있으면 압축하고, language_code 로 해당 언어의 이름만 내보냅니다.
+    """
+
+    def test_export_all_companies(self, fastapi_client, setup_company_test_data):
+        response = fastapi_client.get(
+            "/admin/export", headers={"Accept-Encoding": "gzip"}
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/x-ndjson"
+        assert response.headers["content-encoding"] == "gzip"
+        rows = [json.loads(line) for line in response.text.splitlines()]
+        assert len(rows) == len(setup_company_test_data["companies"])
+        wanted = next(
+            row for row in rows if row["company_name"].get("ko") == "원티드랩"
+        )
+        assert {"ko": "태그_4", "en": "tag_4", "jp": "タグ_4"} in [
+            tag["tag_name"] for tag in wanted["tags"]
+        ]
+
+    def test_export_language_projection(self, fastapi_client, setup_company_test_data):
+        response = fastapi_client.get(
+            "/admin/export",
+            params={"language_code": "en"},
+            headers={"Accept-Encoding": "identity"},
+        )
+
+        assert response.status_code == 200
+        assert "content-encoding" not in response.headers
+        for line in response.text.splitlines():
+            row = json.loads(line)
+            assert set(row["company_name"]) == {"en"}
+            assert all(set(tag["tag_name"]) == {"en"} for tag in row["tags"])
@@ -0,0 +1,22 @@
+class TestFuzzySearch:
+    """
+    오타 허용 회사명 검색
+    fuzzy=true 이면 철자가 조금 틀린 검색어로도 비슷한 회사명을 찾아야 합니다.
+    """
+
+    def test_fuzzy_search_finds_misspelled_company(
+        self, fastapi_client, setup_company_test_data
+    ):
+        headers = {"x-wanted-language": "ko"}
+
+        exact = fastapi_client.get(
+            "/search", params={"query": "Wantedlob"}, headers=headers
+        )
+        fuzzy = fastapi_client.get(
+            "/search", params={"query": "Wantedlob", "fuzzy": "true"}, headers=headers
+        )
+
+        assert exact.status_code == 200
+        assert exact.json() == []
+        assert fuzzy.status_code == 200
+        assert fuzzy.json()[0] == {"company_name": "원티드랩"}
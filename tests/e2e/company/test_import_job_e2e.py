@@ -0,0 +1,131 @@
+import gzip
+import time
+
+
+def _wait_for_job(fastapi_client, job_id, timeout=10):
+    deadline = time.monotonic() + timeout
+    while True:
+        job = fastapi_client.get(f"/admin/jobs/{job_id}").json()["data"]
+        if job["status"] != "running" or time.monotonic() > deadline:
+            return job
+        time.sleep(0.05)
+
+
+class TestImportJob:
+    """
+    관리자 데이터 초기화 작업
+    초기화 요청은 작업 ID 를 바로 반환하고, 가져오기는 백그라운드에서 실행됩니다.
+    GET /admin/jobs/{id} 로 처리한 행 수/처리량/남은 시간과 결과를 조회합니다.
+    """
+
+    def test_initialize_data_runs_as_background_job(self, fastapi_client):
+        response = fastapi_client.post("/admin/initialize-data", params={"sync": True})
+
+        assert response.status_code == 202
+        job = _wait_for_job(fastapi_client, response.json()["data"]["id"])
+        assert job["status"] == "succeeded"
+        assert job["rows_processed"] == job["total_rows"]
+        assert job["result"]["inserted"] > 0
+
+        # 같은 CSV 를 다시 적용하면 변경 없음
+        response = fastapi_client.post("/admin/initialize-data", params={"sync": True})
+        job = _wait_for_job(fastapi_client, response.json()["data"]["id"])
+        assert job["result"]["inserted"] == job["result"]["updated"] == 0
+        assert job["result"]["changed"] is False
+
+    def test_initialize_data_rejects_when_already_initialized(
+        self, fastapi_client, setup_company_test_data
+    ):
+        response = fastapi_client.post("/admin/initialize-data")
+
+        assert response.status_code == 400
+
+    def test_unknown_job(self, fastapi_client):
+        assert fastapi_client.get("/admin/jobs/unknown").status_code == 404
+        assert fastapi_client.post("/admin/jobs/unknown/cancel").status_code == 404
+
+
+class TestUploadImport:
+    """
+    관리자 CSV 업로드 초기화
+    multipart 또는 요청 본문으로 받은 CSV(gzip 가능)를 받는 대로 파싱하여 가져옵니다.
+    가져온 회사는 작업이 끝나면 자동완성으로도 검색되어야 합니다.
+    """
+
+    CSV_TEXT = (
+        "company_ko,company_en,company_ja,tag_ko,tag_en,tag_ja\n"
+        "업로드회사,Upload Co,,태그_업로드,tag_upload,\n"
+        "업로드회사2,,,태그_업로드,tag_upload,\n"
+    )
+
+    def test_upload_gzip_multipart(self, fastapi_client):
+        body = gzip.compress(self.CSV_TEXT.encode())
+
+        response = fastapi_client.post(
+            "/admin/initialize-data/upload",
+            params={"sync": True},
+            files={"file": ("companies.csv.gz", body, "application/gzip")},
+        )
+
+        assert response.status_code == 200
+        job = response.json()["data"]
+        assert job["status"] == "succeeded"
+        assert job["rows_processed"] == 2
+        assert job["result"]["inserted"] == 2
+
+        response = fastapi_client.get(
+            "/companies/업로드회사", headers={"x-wanted-language": "en"}
+        )
+        assert response.status_code == 200
+        assert response.json()["tags"] == ["tag_upload"]
+
+    def test_upload_raw_body(self, fastapi_client):
+        response = fastapi_client.post(
+            "/admin/initialize-data/upload",
+            params={"sync": True},
+            content=self.CSV_TEXT.encode(),
+            headers={"Content-Type": "text/csv"},
+        )
+
+        assert response.json()["data"]["result"]["inserted"] == 2
+
+    def test_upload_rejects_when_already_initialized(
+        self, fastapi_client, setup_company_test_data
+    ):
+        response = fastapi_client.post(
+            "/admin/initialize-data/upload",
+            content=self.CSV_TEXT.encode(),
+            headers={"Content-Type": "text/csv"},
+        )
+
+        assert response.status_code == 400
+
+    def test_upload_reports_invalid_gzip(self, fastapi_client):
+        response = fastapi_client.post(
+            "/admin/initialize-data/upload",
+            params={"sync": True},
+            content=gzip.compress(self.CSV_TEXT.encode())[:-10],
+        )
+
+        job = response.json()["data"]
+        assert response.json()["success"] is False
+        assert job["status"] == "failed"
+        assert "gzip" in job["error"]
+
+    def test_uploaded_companies_are_autocompleted(self, fastapi_client):
+        fastapi_client.post(
+            "/admin/initialize-data/upload",
+            params={"sync": True},
+            content=self.CSV_TEXT.encode(),
+            headers={"Content-Type": "text/csv"},
+        )
+
+        response = fastapi_client.get(
+            "/autocomplete?query=업로드", headers={"x-wanted-language": "ko"}
+        )
+
+        assert response.status_code == 200
+        assert response.json() == [
+            {"company_name": "업로드회사"},
+            {"company_name": "업로드회사2"},
+        ]
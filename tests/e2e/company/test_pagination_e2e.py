@@ -0,0 +1,55 @@
+class TestPagination:
+    """
+    검색/태그 검색 페이지네이션
+    limit 만큼만 반환하고, 다음 페이지가 있으면 x-next-cursor 헤더로 커서를 전달합니다.
+    커서를 따라가면 전체 결과를 중복 없이 한 번씩 조회할 수 있어야 합니다.
+    """
+
+    def _collect(self, client, url, query, limit):
+        headers = {"x-wanted-language": "ko"}
+        names, cursor = [], None
+        while True:
+            params = {"query": query, "limit": limit}
+            if cursor is not None:
+                params["cursor"] = cursor
+            response = client.get(url, params=params, headers=headers)
+            assert response.status_code == 200
+            assert len(response.json()) <= limit
+            names += [company["company_name"] for company in response.json()]
+            cursor = response.headers.get("x-next-cursor")
+            if cursor is None:
+                return names
+
+    def test_tag_pages_cover_all_results(self, fastapi_client, setup_company_test_data):
+        everything = fastapi_client.get(
+            "/tags?query=タグ_22", headers={"x-wanted-language": "ko"}
+        )
+
+        names = self._collect(fastapi_client, "/tags", "タグ_22", limit=2)
+
+        assert "x-next-cursor" not in everything.headers
+        assert names == [company["company_name"] for company in everything.json()]
+        assert len(names) == 5
+
+    def test_search_pages_cover_all_results(
+        self, fastapi_client, setup_company_test_data
+    ):
+        names = self._collect(fastapi_client, "/search", "링크", limit=1)
+
+        assert names == ["주식회사 링크드코리아", "스피링크"]
+
+    def test_cached_pages_keep_next_cursor(
+        self, response_cache_client, setup_company_test_data
+    ):
+        uncached = self._collect(response_cache_client, "/tags", "タグ_22", limit=2)
+        cached = self._collect(response_cache_client, "/tags", "タグ_22", limit=2)
+
+        assert cached == uncached
+
+    def test_invalid_cursor(self, fastapi_client, setup_company_test_data):
+        response = fastapi_client.get(
+            "/tags?query=タグ_22&cursor=not-a-cursor",
+            headers={"x-wanted-language": "ko"},
+        )
+
+        assert response.status_code == 400
@@ -0,0 +1,98 @@
+import pytest
+
+
+class TestResponseCache:
+    """
+    응답 캐시
+    캐시된 응답은 캐시 없이 렌더링한 응답과 바이트 단위로 같아야 합니다.
+    언어별로 따로 캐시되고, 회사/태그 변경 시 함께 무효화되어야 합니다.
+    """
+
+    @pytest.mark.parametrize(
+        "url",
+        ["/companies/Wantedlab", "/tags?query=タグ_22", "/search?query=링크"],
+    )
+    def test_cached_response_is_identical(
+        self, fastapi_client, setup_company_test_data, settings, url
+    ):
+        from app.core.config import get_settings
+
+        headers = {"x-wanted-language": "ko"}
+        uncached = fastapi_client.get(url, headers=headers)
+
+        fastapi_client.app.dependency_overrides[get_settings] = lambda: (
+            settings.model_copy(update={"RESPONSE_CACHE_ENABLED": True})
+        )
+        first = fastapi_client.get(url, headers=headers)
+        cached = fastapi_client.get(url, headers=headers)
+
+        assert uncached.status_code == first.status_code == cached.status_code == 200
+        assert first.content == uncached.content
+        assert cached.content == uncached.content
+        assert cached.headers["content-type"] == uncached.headers["content-type"]
+
+    def test_cached_per_language(
+        self, response_cache_client, setup_company_test_data, redis_client
+    ):
+        ko = response_cache_client.get(
+            "/companies/Wantedlab", headers={"x-wanted-language": "ko"}
+        )
+        en = response_cache_client.get(
+            "/companies/Wantedlab", headers={"x-wanted-language": "en"}
+        )
+
+        cached = response_cache_client.portal.call(
+            redis_client.hgetall, "response:repository:company:name:Wantedlab"
+        )
+        assert cached == {b"ko": ko.content, b"en": en.content}
+        assert ko.json()["company_name"] == "원티드랩"
+        assert en.json()["company_name"] == "Wantedlab"
+
+    def test_invalidated_on_tag_change(
+        self, response_cache_client, setup_company_test_data, async_session
+    ):
+        headers = {"x-wanted-language": "ko"}
+        response_cache_client.get("/companies/원티드랩", headers=headers)
+        response_cache_client.get("/tags?query=태그_50", headers=headers)
+        # 테스트는 요청 간 세션을 공유하므로 조회로 시작된 트랜잭션을 정리
+        response_cache_client.portal.call(async_session.commit)
+
+        response_cache_client.put(
+            "/companies/원티드랩/tags",
+            json=[{"tag_name": {"ko": "태그_50", "en": "tag_50"}}],
+            headers=headers,
+        )
+        company = response_cache_client.get("/companies/원티드랩", headers=headers)
+        tagged = response_cache_client.get("/tags?query=태그_50", headers=headers)
+
+        assert "태그_50" in company.json()["tags"]
+        assert {"company_name": "원티드랩"} in tagged.json()
+
+        response_cache_client.portal.call(async_session.commit)
+
+        response_cache_client.delete(
+            "/companies/원티드랩/tags/태그_50", headers=headers
+        )
+        company = response_cache_client.get("/companies/원티드랩", headers=headers)
+
+        assert "태그_50" not in company.json()["tags"]
+
+    def test_page_fill_keeps_other_page_responses(
+        self, response_cache_client, setup_company_test_data, redis_client
+    ):
+        headers = {"x-wanted-language": "ko"}
+        params = {"query": "태그_22", "limit": 1}
+        first = response_cache_client.get("/tags", params=params, headers=headers)
+        second = response_cache_client.get(
+            "/tags",
+            params={**params, "cursor": first.headers["x-next-cursor"]},
+            headers=headers,
+        )
+
+        # 두 번째 페이지를 적재해도 첫 페이지 응답은 유지
+        cached = response_cache_client.portal.call(
+            redis_client.hgetall, "response:repository:company:tag_pages:태그_22"
+        )
+        cursor = first.headers["x-next-cursor"]
+        assert cached[b"ko:1:"].endswith(first.content)
+        assert cached[f"ko:1:{cursor}".encode()].endswith(second.content)
@@ -0,0 +1,34 @@
+class TestTagCombination:
+    """
+    여러 태그로 회사 검색
+    query 를 여러 번 전달하면 mode=all 은 모든 태그를, mode=any 는 하나 이상의 태그를 가진 회사를 검색합니다.
+    각 회사는 한 번만 노출되어야 합니다.
+    """
+
+    def _names(self, client, params):
+        response = client.get(
+            "/tags", params=params, headers={"x-wanted-language": "ko"}
+        )
+        assert response.status_code == 200
+        return [company["company_name"] for company in response.json()]
+
+    def test_all_mode_is_intersection(self, fastapi_client, setup_company_test_data):
+        tag_4 = self._names(fastapi_client, {"query": "태그_4"})
+        tag_20 = self._names(fastapi_client, {"query": "태그_20"})
+
+        names = self._names(
+            fastapi_client, {"query": ["태그_4", "태그_20"], "mode": "all"}
+        )
+
+        assert "원티드랩" in names
+        assert sorted(names) == sorted(set(tag_4) & set(tag_20))
+
+    def test_any_mode_is_union(self, fastapi_client, setup_company_test_data):
+        tag_4 = self._names(fastapi_client, {"query": "태그_4"})
+        tag_20 = self._names(fastapi_client, {"query": "태그_20"})
+
+        names = self._names(
+            fastapi_client, {"query": ["태그_20", "tag_4"], "mode": "any"}
+        )
+
+        assert sorted(names) == sorted(set(tag_4) | set(tag_20))
@@ -0,0 +1,100 @@
+import pytest
+
+NAMES = [
+    "원티드랩",
+    "Wantedlab",
+    "ウォンテッドラボ",
+    'quote " and \\ backslash',
+    "line\nbreak\ttab\x00\x1f\x7f",
+    "emoji 🚀 / slash  ",
+    "",
+]
+
+
+def _render_with_response_model(response_model, content) -> bytes:
+    # 변경 전 동작: DTO 를 반환하고 FastAPI 가 response_model 로 검증/직렬화
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+
+    app = FastAPI()
+
+    @app.get("/", response_model=response_model)
+    async def _route():
+        return content
+
+    with TestClient(app) as client:
+        return client.get("/").content
+
+
+class TestCompanyResponseContract:
+    @pytest.mark.parametrize("name", NAMES)
+    def test_company_response_is_identical(self, name):
+        # Given
+        from app.dto.company_dto import CompanySearchResultDto
+        from app.schemas.company import CompanyResponse, render_company_response
+
+        company = CompanySearchResultDto(company_name=name, tags=tuple(NAMES))
+
+        # When
+        body = render_company_response(company)
+
+        # Then
+        assert body == _render_with_response_model(CompanyResponse, company)
+
+    def test_company_response_without_tags_is_identical(self):
+        # Given
+        from app.dto.company_dto import CompanySearchResultDto
+        from app.schemas.company import CompanyResponse, render_company_response
+
+        company = CompanySearchResultDto(company_name="원티드랩")
+
+        # When
+        body = render_company_response(company)
+
+        # Then
+        assert body == _render_with_response_model(CompanyResponse, company)
+
+    @pytest.mark.parametrize("count", [0, 1, 1000])
+    def test_searched_companies_response_is_identical(self, count):
+        # Given
+        from app.dto.company_dto import CompanySearchResultDto
+        from app.schemas.company import (
+            SearchedCompanyResponse,
+            render_searched_companies_response,
+        )
+
+        companies = [
+            CompanySearchResultDto(
+                company_name=f"{NAMES[i % len(NAMES)]}{i}", tags=("태그",)
+            )
+            for i in range(count)
+        ]
+
+        # When
+        body = render_searched_companies_response(companies)
+
+        # Then
+        assert body == _render_with_response_model(
+            list[SearchedCompanyResponse], companies
+        )
+
+    def test_openapi_schema_keeps_response_models(self):
+        # Given
+        from app.main import create_app
+
+        app = create_app()
+
+        # When
+        paths = app.openapi()["paths"]
+
+        # Then
+        company = paths["/companies/{company_name}"]["get"]["responses"]["200"]
+        tags = paths["/tags"]["get"]["responses"]["200"]
+        search = paths["/search"]["get"]["responses"]["200"]
+        assert company["content"]["application/json"]["schema"] == {
+            "$ref": "#/components/schemas/CompanyResponse"
+        }
+        for response in (tags, search):
+            assert response["content"]["application/json"]["schema"]["items"] == {
+                "$ref": "#/components/schemas/SearchedCompanyResponse"
+            }
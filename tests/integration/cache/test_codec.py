@@ -0,0 +1,25 @@
+import pytest
+
+
+class TestCacheCodec:
+    @pytest.mark.parametrize("name", ["json", "orjson", "msgpack"])
+    def test_round_trip(self, name):
+        # Given
+        from app.cache.codec import get_cache_codec
+
+        codec = get_cache_codec(name)
+        data = ["id", [["ko", "회사"], ["en", "company"]], [[1, [["ko", "태그"]]]]]
+
+        # When
+        result = codec.loads(codec.dumps(data))
+
+        # Then
+        assert result == data
+
+    def test_unknown_codec(self):
+        # Given
+        from app.cache.codec import CacheCodecError, get_cache_codec
+
+        # When / Then
+        with pytest.raises(CacheCodecError):
+            get_cache_codec("pickle")
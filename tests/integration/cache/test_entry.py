@@ -0,0 +1,60 @@
+class TestCacheEntry:
+    def test_pack_with_soft_ttl(self):
+        # Given
+        from app.cache.entry import CacheTTL, pack_cache_entry, unpack_cache_entry
+
+        ttl = CacheTTL(hard=100, soft=10)
+
+        # When
+        packed = pack_cache_entry(b"[1,2]", "json", ttl, now=1000)
+
+        # Then
+        entry = unpack_cache_entry(packed)
+        assert packed == b"v2|json|1010|[1,2]"
+        assert entry.payload == b"[1,2]"
+        assert entry.codec == "json"
+        assert entry.soft_expires_at == 1010
+
+    def test_pack_without_soft_ttl(self):
+        # Given
+        from app.cache.entry import (
+            CacheTTL,
+            is_stale,
+            pack_cache_entry,
+            unpack_cache_entry,
+        )
+
+        ttl = CacheTTL(hard=100)
+
+        # When
+        entry = unpack_cache_entry(pack_cache_entry(b"a|b", "msgpack", ttl))
+
+        # Then
+        assert entry.payload == b"a|b"
+        assert entry.soft_expires_at is None
+        assert is_stale(entry.soft_expires_at) is False
+
+    def test_unpack_legacy_entries(self):
+        # Given
+        from app.cache.entry import unpack_cache_entry
+
+        # When
+        plain = unpack_cache_entry('{"names": []}')
+        with_soft_ttl = unpack_cache_entry(b"1010|[]")
+
+        # Then
+        assert plain.codec is None
+        assert plain.payload == b'{"names": []}'
+        assert with_soft_ttl.codec is None
+        assert with_soft_ttl.payload == b"[]"
+        assert with_soft_ttl.soft_expires_at == 1010
+
+    def test_unpack_unknown_version_is_skipped(self):
+        # Given
+        from app.cache.entry import unpack_cache_entry
+
+        # When
+        result = unpack_cache_entry(b"v3|json||[]")
+
+        # Then
+        assert result is None
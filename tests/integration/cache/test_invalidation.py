@@ -0,0 +1,62 @@
+import asyncio
+
+
+async def _wait_until(predicate, timeout=1.0):
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while not predicate():
+        if loop.time() > deadline:
+            raise AssertionError("condition not met in time")
+        await asyncio.sleep(0.01)
+
+
+class TestCacheInvalidation:
+    async def test_subscriber_evicts_published_keys(self, redis_client):
+        # Given
+        from app.cache.invalidation import (
+            CacheInvalidationSubscriber,
+            publish_invalidation,
+        )
+        from app.cache.local_cache import LocalCache
+
+        local_cache = LocalCache(max_size=10, ttl=60)
+        local_cache.set("repository:company:name:회사", "entity")
+        local_cache.set("repository:company:name:다른회사", "entity")
+        subscriber = CacheInvalidationSubscriber(redis_client, local_cache)
+        await subscriber.start()
+
+        # When - 다른 워커가 무효화 메시지 발행
+        await publish_invalidation(redis_client, ["repository:company:name:회사"])
+
+        # Then
+        try:
+            await _wait_until(lambda: len(local_cache) == 1)
+            assert local_cache.get("repository:company:name:다른회사") == "entity"
+        finally:
+            await subscriber.stop()
+
+    async def test_subscriber_ignores_invalid_message(self, redis_client):
+        # Given
+        from app.cache.invalidation import (
+            INVALIDATION_CHANNEL,
+            CacheInvalidationSubscriber,
+            publish_invalidation,
+        )
+        from app.cache.local_cache import LocalCache
+
+        local_cache = LocalCache(max_size=10, ttl=60)
+        local_cache.set("a", 1)
+        local_cache.set("b", 2)
+        subscriber = CacheInvalidationSubscriber(redis_client, local_cache)
+        await subscriber.start()
+
+        # When
+        await redis_client.publish(INVALIDATION_CHANNEL, "not-json")
+        await publish_invalidation(redis_client, ["a"])
+
+        # Then - 잘못된 메시지 이후에도 구독이 유지됨
+        try:
+            await _wait_until(lambda: len(local_cache) == 1)
+            assert local_cache.get("b") == 2
+        finally:
+            await subscriber.stop()
@@ -0,0 +1,102 @@
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestLocalCache:
+    def test_get_returns_cached_value_and_counts_hit(self):
+        # Given
+        from app.cache.local_cache import LocalCache
+
+        cache = LocalCache(max_size=10, ttl=60)
+        cache.set("key", "value")
+
+        # When
+        result = cache.get("key")
+
+        # Then
+        assert result == "value"
+        assert cache.stats.hits == 1
+        assert cache.stats.misses == 0
+
+    def test_get_missing_key_counts_miss(self):
+        # Given
+        from app.cache.local_cache import LocalCache
+
+        cache = LocalCache(max_size=10, ttl=60)
+
+        # When
+        result = cache.get("key")
+
+        # Then
+        assert result is None
+        assert cache.stats.misses == 1
+
+    def test_expired_entry_is_removed(self):
+        # Given
+        from app.cache.local_cache import LocalCache
+
+        clock = FakeClock()
+        cache = LocalCache(max_size=10, ttl=60, clock=clock)
+        cache.set("key", "value")
+
+        # When
+        clock.now = 61
+        result = cache.get("key")
+
+        # Then
+        assert result is None
+        assert len(cache) == 0
+        assert cache.stats.expirations == 1
+        assert cache.stats.misses == 1
+
+    def test_least_recently_used_entry_is_evicted(self):
+        # Given
+        from app.cache.local_cache import LocalCache
+
+        cache = LocalCache(max_size=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")  # a 를 최근 사용으로 갱신
+
+        # When
+        cache.set("c", 3)
+
+        # Then
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+        assert cache.stats.evictions == 1
+
+    def test_delete_removes_keys(self):
+        # Given
+        from app.cache.local_cache import LocalCache
+
+        cache = LocalCache(max_size=10, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+
+        # When
+        cache.delete("a", "없는키")
+
+        # Then
+        assert cache.get("a") is None
+        assert cache.get("b") == 2
+        assert cache.stats.invalidations == 1
+
+    def test_set_is_skipped_when_invalidated_after_read_started(self):
+        # Given
+        from app.cache.local_cache import LocalCache
+
+        cache = LocalCache(max_size=10, ttl=60)
+        generation = cache.generation
+
+        # When - 값을 읽어오는 도중 무효화 발생
+        cache.delete("key")
+        cache.set("key", "stale", generation)
+
+        # Then
+        assert cache.get("key") is None
@@ -0,0 +1,25 @@
+class TestLock:
+    async def test_release_lock_deletes_only_own_token(self, redis_client):
+        # Given
+        from app.cache.lock import release_lock
+
+        # 락이 만료되어 다른 워커가 다시 잡은 상태
+        await redis_client.set("lock:key", "other-worker", px=3000)
+
+        # When / Then
+        assert not await release_lock(redis_client, "lock:key", "my-token")
+        assert await redis_client.get("lock:key") == b"other-worker"
+        assert await release_lock(redis_client, "lock:key", "other-worker")
+        assert not await redis_client.exists("lock:key")
+
+    async def test_extend_lock_extends_only_own_token(self, redis_client):
+        # Given
+        from app.cache.lock import extend_lock
+
+        await redis_client.set("lock:key", "other-worker", px=1000)
+
+        # When / Then
+        assert not await extend_lock(redis_client, "lock:key", "my-token", 60000)
+        assert await redis_client.pttl("lock:key") <= 1000
+        assert await extend_lock(redis_client, "lock:key", "other-worker", 60000)
+        assert await redis_client.pttl("lock:key") > 1000
@@ -0,0 +1,106 @@
+import asyncio
+from contextlib import asynccontextmanager
+
+
+@asynccontextmanager
+async def _session_factory():
+    yield "session"
+
+
+class TestCacheRefresher:
+    async def test_refresh_runs_with_own_session(self):
+        # Given
+        from app.cache.refresher import CacheRefresher
+
+        refresher = CacheRefresher(_session_factory, max_concurrency=1, max_pending=10)
+        sessions = []
+
+        async def _refresh(session):
+            sessions.append(session)
+
+        # When
+        scheduled = refresher.schedule("key", _refresh)
+        await refresher.join()
+
+        # Then
+        assert scheduled is True
+        assert sessions == ["session"]
+        assert len(refresher) == 0
+
+    async def test_same_key_is_scheduled_once(self):
+        # Given
+        from app.cache.refresher import CacheRefresher
+
+        refresher = CacheRefresher(_session_factory, max_concurrency=1, max_pending=10)
+        calls = 0
+
+        async def _refresh(session):
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+
+        # When
+        results = [refresher.schedule("key", _refresh) for _ in range(5)]
+        await refresher.join()
+
+        # Then
+        assert results == [True, False, False, False, False]
+        assert calls == 1
+
+    async def test_concurrency_is_bounded(self):
+        # Given
+        from app.cache.refresher import CacheRefresher
+
+        refresher = CacheRefresher(_session_factory, max_concurrency=2, max_pending=10)
+        running = 0
+        max_running = 0
+
+        async def _refresh(session):
+            nonlocal running, max_running
+            running += 1
+            max_running = max(max_running, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+        # When
+        for i in range(10):
+            refresher.schedule(f"key:{i}", _refresh)
+        await refresher.join()
+
+        # Then
+        assert max_running == 2
+
+    async def test_drops_refresh_when_pending_is_full(self):
+        # Given
+        from app.cache.refresher import CacheRefresher
+
+        refresher = CacheRefresher(_session_factory, max_concurrency=1, max_pending=2)
+
+        async def _refresh(session):
+            await asyncio.sleep(0.01)
+
+        # When
+        results = [refresher.schedule(f"key:{i}", _refresh) for i in range(3)]
+        await refresher.join()
+
+        # Then
+        assert results == [True, True, False]
+        assert refresher.dropped == 1
+
+    async def test_failed_refresh_is_released(self):
+        # Given
+        from app.cache.refresher import CacheRefresher
+
+        refresher = CacheRefresher(_session_factory, max_concurrency=1, max_pending=10)
+
+        async def _refresh(session):
+            raise RuntimeError("db down")
+
+        # When
+        refresher.schedule("key", _refresh)
+        await refresher.join()
+
+        # Then
+        assert len(refresher) == 0
+        assert refresher.schedule("key", _refresh) is True
+        await refresher.close()
@@ -0,0 +1,43 @@
+class TestResponseCache:
+    async def test_set_skips_response_invalidated_after_get(self, redis_client):
+        # Given - 캐시가 없어 버전을 읽고 데이터를 조회하기 시작
+        from app.cache.response_cache import ResponseCache, invalidate_responses
+
+        response_cache = ResponseCache(redis_client, ttl=60)
+        cached, version = await response_cache.get("company:name:회사", "ko")
+        assert cached is None
+
+        # When - 조회 도중 태그 변경으로 무효화된 뒤 이전 데이터로 만든 응답을 저장
+        async with redis_client.pipeline(transaction=True) as pipe:
+            invalidate_responses(pipe, ["company:name:회사"])
+            await pipe.execute()
+        stored = await response_cache.set(
+            "company:name:회사", "ko", b'{"stale":true}', version
+        )
+
+        # Then
+        assert stored is False
+        cached, _ = await response_cache.get("company:name:회사", "ko")
+        assert cached is None
+
+    async def test_set_stores_response_with_current_version(self, redis_client):
+        # Given - 이전 무효화 이후 버전을 읽음
+        from app.cache.response_cache import ResponseCache, invalidate_responses
+
+        response_cache = ResponseCache(redis_client, ttl=60)
+        async with redis_client.pipeline(transaction=True) as pipe:
+            invalidate_responses(pipe, ["company:name:회사"])
+            await pipe.execute()
+        _, version = await response_cache.get("company:name:회사", "ko")
+
+        # When
+        stored = await response_cache.set(
+            "company:name:회사", "ko", b'{"fresh":true}', version, next_cursor="10"
+        )
+
+        # Then
+        assert stored is True
+        cached, _ = await response_cache.get("company:name:회사", "ko")
+        assert cached.body == b'{"fresh":true}'
+        assert cached.next_cursor == "10"
+        assert 0 < await redis_client.ttl("response:company:name:회사") <= 60
@@ -0,0 +1,99 @@
+import asyncio
+
+import pytest
+
+
+class TestSingleFlight:
+    async def test_concurrent_calls_share_one_execution(self):
+        # Given
+        from app.cache.single_flight import SingleFlight
+
+        single_flight = SingleFlight()
+        calls = 0
+
+        async def _load():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return "value"
+
+        # When
+        results = await asyncio.gather(
+            *(single_flight.do("key", _load) for _ in range(10))
+        )
+
+        # Then
+        assert results == ["value"] * 10
+        assert calls == 1
+        assert len(single_flight) == 0
+
+    async def test_different_keys_run_separately(self):
+        # Given
+        from app.cache.single_flight import SingleFlight
+
+        single_flight = SingleFlight()
+        calls = []
+
+        async def _load(key):
+            calls.append(key)
+            await asyncio.sleep(0.01)
+            return key
+
+        # When
+        results = await asyncio.gather(
+            single_flight.do("a", lambda: _load("a")),
+            single_flight.do("b", lambda: _load("b")),
+        )
+
+        # Then
+        assert results == ["a", "b"]
+        assert sorted(calls) == ["a", "b"]
+
+    async def test_exception_is_shared_with_waiters(self):
+        # Given
+        from app.cache.single_flight import SingleFlight
+
+        single_flight = SingleFlight()
+
+        async def _load():
+            await asyncio.sleep(0.01)
+            raise ValueError("load failed")
+
+        # When
+        results = await asyncio.gather(
+            *(single_flight.do("key", _load) for _ in range(3)),
+            return_exceptions=True,
+        )
+
+        # Then
+        assert all(isinstance(result, ValueError) for result in results)
+        assert len(single_flight) == 0
+
+    async def test_waiter_retries_when_leader_is_cancelled(self):
+        # Given
+        from app.cache.single_flight import SingleFlight
+
+        single_flight = SingleFlight()
+        started = asyncio.Event()
+        calls = 0
+
+        async def _load():
+            nonlocal calls
+            calls += 1
+            started.set()
+            await asyncio.sleep(0.05)
+            return "value"
+
+        leader = asyncio.create_task(single_flight.do("key", _load))
+        await started.wait()
+        waiter = asyncio.create_task(single_flight.do("key", _load))
+        await asyncio.sleep(0)
+
+        # When
+        leader.cancel()
+
+        # Then
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        assert await waiter == "value"
+        assert calls == 2
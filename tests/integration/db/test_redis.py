@@ -0,0 +1,81 @@
+import pytest
+
+
+class TestRedis:
+    def test_create_redis_pool_applies_settings(self, settings):
+        # Given
+        import redis.asyncio as redis
+
+        from app.db.redis import create_redis_pool
+
+        test_settings = settings.model_copy(
+            update={
+                "REDIS_MAX_CONNECTIONS": 7,
+                "REDIS_SOCKET_TIMEOUT": 1.5,
+                "REDIS_SOCKET_CONNECT_TIMEOUT": 0.5,
+            }
+        )
+
+        # When
+        pool = create_redis_pool(test_settings)
+
+        # Then
+        assert isinstance(pool, redis.BlockingConnectionPool)
+        assert pool.max_connections == 7
+        assert pool.connection_kwargs["socket_timeout"] == 1.5
+        assert pool.connection_kwargs["socket_connect_timeout"] == 0.5
+
+    def test_lifespan_shares_redis_client_across_requests(self, settings, redis_client):
+        # Given
+        from fastapi import Depends
+        from fastapi.testclient import TestClient
+
+        from app.core.config import get_settings
+        from app.db.redis import create_redis_pool, get_redis_client
+        from app.main import create_app
+
+        app = create_app()
+        app.dependency_overrides[get_settings] = lambda: settings
+        app.dependency_overrides[create_redis_pool] = lambda _settings: (
+            redis_client.connection_pool
+        )
+        seen_clients = []
+
+        @app.get("/_redis_client")
+        async def _redis_client(client=Depends(get_redis_client)):
+            seen_clients.append(client)
+            return await client.ping()
+
+        # When
+        with TestClient(app) as client:
+            first = client.get("/_redis_client")
+            second = client.get("/_redis_client")
+
+        # Then
+        assert first.json() is True
+        assert second.json() is True
+        assert seen_clients[0] is seen_clients[1]
+        assert seen_clients[0].connection_pool is redis_client.connection_pool
+
+    def test_lifespan_fails_when_redis_is_unreachable(self, settings):
+        # Given
+        from fastapi.testclient import TestClient
+        from redis.exceptions import ConnectionError
+
+        from app.core.config import get_settings
+        from app.main import create_app
+
+        unreachable_settings = settings.model_copy(
+            update={
+                "REDIS_URL": "127.0.0.1",
+                "REDIS_PORT": 1,
+                "REDIS_SOCKET_CONNECT_TIMEOUT": 0.1,
+            }
+        )
+        app = create_app()
+        app.dependency_overrides[get_settings] = lambda: unreachable_settings
+
+        # When / Then
+        with pytest.raises(ConnectionError):
+            with TestClient(app):
+                pass
@@ -0,0 +1,76 @@
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+
+class TestDatabaseSession:
+    async def test_warm_up_opens_min_connections(self, tmp_path):
+        # Given
+        from sqlalchemy.ext.asyncio import create_async_engine
+
+        from app.db.session import warm_up_database_engine
+
+        engine = create_async_engine(
+            f"sqlite+aiosqlite:///{tmp_path / 'warm_up.db'}",
+            poolclass=AsyncAdaptedQueuePool,
+            pool_size=5,
+        )
+
+        # When
+        await warm_up_database_engine(engine, 3)
+
+        # Then
+        assert engine.sync_engine.pool.checkedin() == 3
+        await engine.dispose()
+
+    async def test_warm_up_is_capped_by_pool_size(self, tmp_path):
+        # Given
+        from sqlalchemy.ext.asyncio import create_async_engine
+
+        from app.db.session import warm_up_database_engine
+
+        engine = create_async_engine(
+            f"sqlite+aiosqlite:///{tmp_path / 'warm_up.db'}",
+            poolclass=AsyncAdaptedQueuePool,
+            pool_size=2,
+            max_overflow=0,
+        )
+
+        # When
+        await warm_up_database_engine(engine, 10)
+
+        # Then
+        assert engine.sync_engine.pool.checkedin() == 2
+        await engine.dispose()
+
+    def test_lifespan_shares_session_factory_across_requests(
+        self, settings, redis_client
+    ):
+        # Given
+        from fastapi import Depends
+        from fastapi.testclient import TestClient
+
+        from app.core.config import get_settings
+        from app.db.redis import create_redis_pool
+        from app.db.session import get_session_factory
+        from app.main import create_app
+
+        app = create_app()
+        app.dependency_overrides[get_settings] = lambda: settings
+        app.dependency_overrides[create_redis_pool] = lambda _settings: (
+            redis_client.connection_pool
+        )
+        seen_factories = []
+
+        @app.get("/_session_factory")
+        def _session_factory(factory=Depends(get_session_factory)):
+            seen_factories.append(factory)
+
+        # When
+        with TestClient(app) as client:
+            client.get("/_session_factory")
+            client.get("/_session_factory")
+            engine = app.state.db_engine
+
+        # Then
+        assert seen_factories[0] is seen_factories[1]
+        assert seen_factories[0] is app.state.session_factory
+        assert seen_factories[0].kw["bind"] is engine
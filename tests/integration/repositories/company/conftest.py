@@ -1,4 +1,5 @@
 import pytest
+from sqlalchemy import event
 
 
 @pytest.fixture()
@@ -30,6 +31,74 @@ def company_repository(
     )
 
 
+@pytest.fixture()
+def local_cache():
+    from app.cache.local_cache import LocalCache
+
+    return LocalCache(max_size=100, ttl=60)
+
+
+@pytest.fixture()
+def cached_company_repository(
+    async_session,
+    company_mapper,
+    company_tag_mapper,
+    redis_client,
+    settings,
+    local_cache,
+):
+    from app.repositories.company_repository import CompanyRepository
+
+    return CompanyRepository(
+        db=async_session,
+        company_mapper=company_mapper,
+        company_tag_mapper=company_tag_mapper,
+        redis_client=redis_client,
+        settings=settings,
+        local_cache=local_cache,
+    )
+
+
+@pytest.fixture()
+def tag_index(async_session, redis_client):
+    from app.search.tag_bitmap_index import TagBitmapIndex
+    from app.search.tag_index import TagIndex, load_tag_bitmap_index
+
+    async def _load():
+        return await load_tag_bitmap_index(async_session)
+
+    # 테스트 데이터 생성 후 refresh 로 DB 에서 다시 생성
+    return TagIndex(redis_client, TagBitmapIndex(), load=_load)
+
+
+@pytest.fixture()
+def indexed_company_repository(
+    async_session, company_mapper, company_tag_mapper, redis_client, settings, tag_index
+):
+    from app.repositories.company_repository import CompanyRepository
+
+    return CompanyRepository(
+        db=async_session,
+        company_mapper=company_mapper,
+        company_tag_mapper=company_tag_mapper,
+        redis_client=redis_client,
+        settings=settings,
+        tag_index=tag_index,
+    )
+
+
+@pytest.fixture()
+def sql_statements(_test_engine):
+    statements = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(_test_engine.sync_engine, "before_cursor_execute", _record)
+    yield statements
+    event.remove(_test_engine.sync_engine, "before_cursor_execute", _record)
+
+
 @pytest.fixture()
 def company_tag_repository(async_session, company_tag_mapper):
     from app.repositories.company_tag_repository import CompanyTagRepository
@@ -101,6 +170,24 @@ async def companies_with_tags(async_session, companies, company_tags):
     return companies
 
 
+@pytest.fixture
+async def companies_with_two_tags(async_session, companies_with_tags, company_tags):
+    from app.db.models.company_model import company_tag
+
+    # companies[0] 은 태그1, 태그2 를 모두 가짐
+    await async_session.execute(
+        company_tag.insert(),
+        [
+            {
+                "company_id": companies_with_tags[0].id,
+                "company_tag_id": company_tags[1].id,
+            }
+        ],
+    )
+
+    return companies_with_tags
+
+
 @pytest.fixture
 async def multi_language_company_tag(async_session):
     from app.db.models.company_model import CompanyTag, CompanyTagName
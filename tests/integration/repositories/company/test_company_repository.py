@@ -1,3 +1,6 @@
+import pytest
+
+
 class TestCompanyRepository:
     async def test_get_by_name_not_found(self, company_repository):
         # Given
@@ -34,7 +37,7 @@ class TestCompanyRepository:
         result = await company_repository.get_by_partial_name("없는회사")
 
         # Then
-        assert result == []
+        assert result.items == ()
 
     async def test_get_by_partial_name_found_with_exact_match(
         self, company_repository, companies
@@ -47,8 +50,8 @@ class TestCompanyRepository:
         )
 
         # Then
-        assert len(result) == 1
-        assert result[0].names[0].name == companies[0].names[0].name
+        assert len(result.items) == 1
+        assert result.items[0].names[0].name == companies[0].names[0].name
 
     async def test_get_by_partial_name_found_with_partial_match_from_start(
         self, company_repository, companies
@@ -61,9 +64,9 @@ class TestCompanyRepository:
         )
 
         # Then
-        assert len(result) == 2
-        assert result[0].names[0].name == companies[0].names[0].name
-        assert result[1].names[0].name == companies[1].names[0].name
+        assert len(result.items) == 2
+        assert result.items[0].names[0].name == companies[0].names[0].name
+        assert result.items[1].names[0].name == companies[1].names[0].name
 
     async def test_get_by_partial_name_found_with_partial_match_from_end(
         self, company_repository, companies
@@ -76,8 +79,8 @@ class TestCompanyRepository:
         )
 
         # Then
-        assert len(result) == 1
-        assert result[0].names[0].name == companies[0].names[0].name
+        assert len(result.items) == 1
+        assert result.items[0].names[0].name == companies[0].names[0].name
 
     async def test_get_by_partial_name_found_with_partial_match_from_middle(
         self, company_repository, companies
@@ -90,9 +93,9 @@ class TestCompanyRepository:
         )
 
         # Then
-        assert len(result) == 2
-        assert result[0].names[0].name == companies[0].names[0].name
-        assert result[1].names[0].name == companies[1].names[0].name
+        assert len(result.items) == 2
+        assert result.items[0].names[0].name == companies[0].names[0].name
+        assert result.items[1].names[0].name == companies[1].names[0].name
 
     async def test_get_by_tag_empty_result(
         self, company_repository, companies_with_tags
@@ -103,7 +106,7 @@ class TestCompanyRepository:
         result = await company_repository.get_by_tag("없는태그")
 
         # Then
-        assert result == []
+        assert result.items == ()
 
     async def test_get_by_tag_empty_result_with_empty_tag(
         self, company_repository, companies_with_tags, company_tags
@@ -114,7 +117,7 @@ class TestCompanyRepository:
         result = await company_repository.get_by_tag(company_tags[2].names[0].name)
 
         # Then
-        assert result == []
+        assert result.items == ()
 
     async def test_get_by_tag_found_with_exact_match(
         self, company_repository, companies_with_tags, company_tags
@@ -125,8 +128,8 @@ class TestCompanyRepository:
         result = await company_repository.get_by_tag(company_tags[0].names[0].name)
 
         # Then
-        assert len(result) == 2
-        company_names = [company.names[0].name for company in result]
+        assert len(result.items) == 2
+        company_names = [company.names[0].name for company in result.items]
         assert companies_with_tags[0].names[0].name in company_names
         assert companies_with_tags[1].names[0].name in company_names
 
@@ -139,7 +142,7 @@ class TestCompanyRepository:
         result = await company_repository.get_by_tag(company_tags[0].names[0].name[:-1])
 
         # Then
-        assert result == []
+        assert result.items == ()
 
     async def test_get_by_tag_found_with_case_insensitive_match(
         self, company_repository, companies_with_tags, company_tags
@@ -150,8 +153,8 @@ class TestCompanyRepository:
         result = await company_repository.get_by_tag(company_tags[1].names[0].name)
 
         # Then
-        assert len(result) == 1
-        company_names = [company.names[0].name for company in result]
+        assert len(result.items) == 1
+        company_names = [company.names[0].name for company in result.items]
         assert companies_with_tags[2].names[0].name in company_names
 
     async def test_save_with_names_only(self, company_repository, async_session):
@@ -586,3 +589,1028 @@ class TestCompanyRepository:
 
         # Then
         assert await redis_client.exists(cache_key) == 0  # 캐시가 무효화됨
+
+    async def test_invalidate_deletes_only_given_keys(
+        self, company_repository, redis_client
+    ):
+        # Given
+        await redis_client.set("repository:company:name:변경회사", "cached")
+        await redis_client.set("repository:company:name:그대로회사", "cached")
+        await redis_client.set("repository:company:tag_pages:변경태그", "cached")
+
+        # When
+        await company_repository.invalidate(
+            company_names=["변경회사"], tag_names=["변경태그"]
+        )
+
+        # Then
+        assert await redis_client.exists("repository:company:name:변경회사") == 0
+        assert await redis_client.exists("repository:company:tag_pages:변경태그") == 0
+        assert await redis_client.exists("repository:company:name:그대로회사") == 1
+
+    async def test_with_session_uses_given_session(
+        self, company_repository, session_factory, company
+    ):
+        # Given - 요청이 끝난 뒤 실행되는 작업의 세션
+        company_name = company.names[0].name
+
+        async with session_factory() as job_session:
+            # When
+            repository = company_repository.with_session(job_session)
+            result = await repository.get_by_name(company_name)
+
+        # Then
+        assert repository._db is job_session
+        assert result.names[0].name == company_name
+
+    # 로컬(L1) 캐시 테스트
+    async def test_get_by_name_is_served_from_local_cache(
+        self, cached_company_repository, redis_client, local_cache, company
+    ):
+        # Given
+        company_name = company.names[0].name
+        await cached_company_repository.get_by_name(company_name)
+        await redis_client.delete(f"repository:company:name:{company_name}")
+
+        # When
+        result = await cached_company_repository.get_by_name(company_name)
+
+        # Then
+        assert result is not None
+        assert result.names[0].name == company_name
+        assert local_cache.stats.hits == 1
+
+    async def test_get_by_name_fills_local_cache_from_redis(
+        self, cached_company_repository, company_repository, local_cache, company
+    ):
+        # Given - 다른 워커가 Redis 캐시를 채운 상태
+        company_name = company.names[0].name
+        await company_repository.get_by_name(company_name)
+
+        # When
+        await cached_company_repository.get_by_name(company_name)
+
+        # Then
+        cached = local_cache.get(f"repository:company:name:{company_name}")
+        assert cached is not None
+        assert cached.names[0].name == company_name
+
+    async def test_add_tag_invalidates_local_cache_and_notifies_workers(
+        self, cached_company_repository, redis_client, local_cache, async_session
+    ):
+        # Given
+        import json
+
+        from app.cache.invalidation import INVALIDATION_CHANNEL
+        from app.db.models.company_model import Company, CompanyName
+        from app.domain.company_entity import CompanyTagEntity, CompanyTagNameEntity
+
+        company = Company()
+        company.names.append(CompanyName(name="L1캐시회사", language_code="ko"))
+        company.names.append(CompanyName(name="L1 Cache Company", language_code="en"))
+        async_session.add(company)
+        await async_session.flush()
+
+        await cached_company_repository.get_by_name("L1캐시회사")
+        await cached_company_repository.get_by_name("L1 Cache Company")
+        pubsub = redis_client.pubsub(ignore_subscribe_messages=True)
+        await pubsub.subscribe(INVALIDATION_CHANNEL)
+
+        # When
+        await cached_company_repository.add_tag(
+            "L1캐시회사",
+            [
+                CompanyTagEntity(
+                    names=(CompanyTagNameEntity(language_code="ko", name="L1태그"),)
+                )
+            ],
+        )
+
+        # Then
+        assert len(local_cache) == 0
+        message = None
+        for _ in range(10):
+            message = await pubsub.get_message(timeout=0.1)
+            if message is not None:
+                break
+        assert set(json.loads(message["data"])) >= {
+            "repository:company:name:L1캐시회사",
+            "repository:company:name:L1 Cache Company",
+        }
+        await pubsub.aclose()
+
+    # 캐시 미스 요청 합치기(single-flight) 테스트
+    async def test_concurrent_get_by_name_misses_run_one_query(
+        self, company_repository, company, sql_statements
+    ):
+        # Given
+        import asyncio
+
+        company_name = company.names[0].name
+        sql_statements.clear()
+
+        # When
+        results = await asyncio.gather(
+            *(company_repository.get_by_name(company_name) for _ in range(100))
+        )
+
+        # Then
+        assert all(result.names[0].name == company_name for result in results)
+        name_queries = [
+            statement
+            for statement in sql_statements
+            if "JOIN company_names" in statement
+        ]
+        assert len(name_queries) == 1
+
+    async def test_concurrent_get_by_tag_misses_run_one_query(
+        self, company_repository, companies_with_tags, company_tags, sql_statements
+    ):
+        # Given
+        import asyncio
+
+        tag_name = company_tags[0].names[0].name
+        sql_statements.clear()
+
+        # When
+        results = await asyncio.gather(
+            *(company_repository.get_by_tag(tag_name) for _ in range(100))
+        )
+
+        # Then
+        assert all(len(result.items) == 2 for result in results)
+        tag_queries = [
+            statement
+            for statement in sql_statements
+            if "JOIN company_tag " in statement
+        ]
+        assert len(tag_queries) == 1
+
+    async def test_get_by_name_waits_for_other_worker_holding_lock(
+        self,
+        async_session,
+        company_mapper,
+        company_tag_mapper,
+        redis_client,
+        settings,
+        company,
+        sql_statements,
+    ):
+        # Given
+        import asyncio
+
+        from app.domain.company_entity import CompanyEntity, CompanyNameEntity
+        from app.repositories.company_repository import CompanyRepository
+
+        company_repository = CompanyRepository(
+            db=async_session,
+            company_mapper=company_mapper,
+            company_tag_mapper=company_tag_mapper,
+            redis_client=redis_client,
+            settings=settings.model_copy(
+                update={"REPOSITORY_CACHE_LOCK_ENABLED": True}
+            ),
+        )
+        company_name = company.names[0].name
+        cache_key = f"repository:company:name:{company_name}"
+        entity = CompanyEntity(
+            names=(CompanyNameEntity(language_code="ko", name=company_name),),
+            id=str(company.id),
+        )
+
+        # 다른 워커가 락을 잡고 DB 조회 중인 상태
+        await redis_client.set(f"lock:{cache_key}", "other-worker", px=3000)
+        sql_statements.clear()
+
+        # When
+        task = asyncio.create_task(company_repository.get_by_name(company_name))
+        await asyncio.sleep(0.1)
+        await redis_client.set(cache_key, company_mapper.entity_to_json(entity))
+        result = await task
+
+        # Then
+        assert result.names[0].name == company_name
+        assert sql_statements == []
+
+    async def test_get_by_name_releases_lock_after_load(
+        self,
+        async_session,
+        company_mapper,
+        company_tag_mapper,
+        redis_client,
+        settings,
+        company,
+    ):
+        # Given
+        from app.repositories.company_repository import CompanyRepository
+
+        company_repository = CompanyRepository(
+            db=async_session,
+            company_mapper=company_mapper,
+            company_tag_mapper=company_tag_mapper,
+            redis_client=redis_client,
+            settings=settings.model_copy(
+                update={"REPOSITORY_CACHE_LOCK_ENABLED": True}
+            ),
+        )
+        company_name = company.names[0].name
+
+        # When
+        result = await company_repository.get_by_name(company_name)
+
+        # Then
+        assert result is not None
+        assert await redis_client.exists(f"repository:company:name:{company_name}")
+        assert not await redis_client.exists(
+            f"lock:repository:company:name:{company_name}"
+        )
+
+    async def test_get_by_tag_serves_stale_value_and_refreshes_in_background(
+        self,
+        async_session,
+        company_mapper,
+        company_tag_mapper,
+        redis_client,
+        settings,
+        companies_with_tags,
+        company_tags,
+    ):
+        # Given
+        from contextlib import asynccontextmanager
+
+        from app.cache.entry import unpack_cache_entry
+        from app.cache.refresher import CacheRefresher
+        from app.repositories.company_repository import CompanyRepository
+
+        @asynccontextmanager
+        async def _session_factory():
+            yield async_session
+
+        cache_refresher = CacheRefresher(
+            _session_factory, max_concurrency=1, max_pending=10
+        )
+        company_repository = CompanyRepository(
+            db=async_session,
+            company_mapper=company_mapper,
+            company_tag_mapper=company_tag_mapper,
+            redis_client=redis_client,
+            settings=settings.model_copy(update={"REPOSITORY_CACHE_TAG_SOFT_TTL": 60}),
+            cache_refresher=cache_refresher,
+        )
+        tag_name = company_tags[0].names[0].name
+        cache_key = f"repository:company:tag_pages:{tag_name}"
+        field = f"{settings.SEARCH_PAGE_SIZE}:"
+        # soft 만료된 빈 페이지 (1970-01-01 기준 soft 만료 시각)
+        await redis_client.hset(cache_key, field, "v2|json|1|[null,[]]")
+
+        # When
+        result = await company_repository.get_by_tag(tag_name)
+
+        # Then
+        assert result.items == ()
+        assert len(cache_refresher) == 1
+
+        await cache_refresher.join()
+        entry = unpack_cache_entry(await redis_client.hget(cache_key, field))
+        assert entry.soft_expires_at > 1
+        refreshed = await company_repository.get_by_tag(tag_name)
+        assert len(refreshed.items) == 2
+        assert len(cache_refresher) == 0
+
+    async def test_get_by_name_does_not_refresh_fresh_entry(
+        self,
+        async_session,
+        company_mapper,
+        company_tag_mapper,
+        redis_client,
+        settings,
+        company,
+    ):
+        # Given
+        from app.cache.refresher import CacheRefresher
+        from app.repositories.company_repository import CompanyRepository
+
+        cache_refresher = CacheRefresher(None, max_concurrency=1, max_pending=10)
+        company_repository = CompanyRepository(
+            db=async_session,
+            company_mapper=company_mapper,
+            company_tag_mapper=company_tag_mapper,
+            redis_client=redis_client,
+            settings=settings.model_copy(update={"REPOSITORY_CACHE_NAME_SOFT_TTL": 60}),
+            cache_refresher=cache_refresher,
+        )
+        company_name = company.names[0].name
+
+        # When
+        await company_repository.get_by_name(company_name)
+        result = await company_repository.get_by_name(company_name)
+
+        # Then
+        assert result is not None
+        assert len(cache_refresher) == 0
+        assert (
+            await redis_client.ttl(f"repository:company:name:{company_name}")
+            == settings.REPOSITORY_CACHE_TTL
+        )
+
+    @pytest.mark.parametrize("codec", ["json", "orjson", "msgpack"])
+    async def test_get_by_tag_with_cache_codec(
+        self,
+        async_session,
+        company_mapper,
+        company_tag_mapper,
+        redis_client,
+        settings,
+        companies_with_tags,
+        company_tags,
+        codec,
+    ):
+        # Given
+        from app.repositories.company_repository import CompanyRepository
+
+        company_repository = CompanyRepository(
+            db=async_session,
+            company_mapper=company_mapper,
+            company_tag_mapper=company_tag_mapper,
+            redis_client=redis_client,
+            settings=settings.model_copy(update={"REPOSITORY_CACHE_CODEC": codec}),
+        )
+        tag_name = company_tags[0].names[0].name
+
+        # When
+        loaded = await company_repository.get_by_tag(tag_name)
+        cached = await company_repository.get_by_tag(tag_name)
+
+        # Then
+        raw = await redis_client.hget(
+            f"repository:company:tag_pages:{tag_name}",
+            f"{settings.SEARCH_PAGE_SIZE}:",
+        )
+        assert raw.startswith(f"v2|{codec}|".encode())
+        assert cached == loaded
+        assert len(cached.items) == 2
+
+    async def test_get_by_name_skips_entry_with_unknown_codec(
+        self, company_repository, redis_client, company, sql_statements
+    ):
+        # Given
+        company_name = company.names[0].name
+        cache_key = f"repository:company:name:{company_name}"
+        await redis_client.set(cache_key, b"v2|future-codec||\x00\x01")
+        sql_statements.clear()
+
+        # When
+        result = await company_repository.get_by_name(company_name)
+
+        # Then
+        assert result is not None
+        assert result.names[0].name == company_name
+        assert len(sql_statements) > 0
+        assert (await redis_client.get(cache_key)).startswith(b"v2|json|")
+
+    # keyset 페이지네이션 테스트
+    async def test_get_by_partial_name_pages_with_cursor(
+        self, company_repository, companies
+    ):
+        # Given
+        partial_name = "회사"
+
+        # When
+        first = await company_repository.get_by_partial_name(partial_name, limit=1)
+        second = await company_repository.get_by_partial_name(
+            partial_name, limit=1, cursor=first.next_cursor
+        )
+
+        # Then
+        assert [company.names[0].name for company in first.items] == ["회사1"]
+        assert [company.names[0].name for company in second.items] == ["회사2"]
+        assert first.next_cursor is not None
+        assert second.next_cursor is None
+
+    async def test_get_by_tag_pages_with_cursor(
+        self, company_repository, companies_with_tags, company_tags, redis_client
+    ):
+        # Given
+        tag_name = company_tags[0].names[0].name
+
+        # When
+        first = await company_repository.get_by_tag(tag_name, limit=1)
+        second = await company_repository.get_by_tag(
+            tag_name, limit=1, cursor=first.next_cursor
+        )
+
+        # Then
+        assert len(first.items) == len(second.items) == 1
+        assert first.items != second.items
+        assert {first.items[0].names[0].name, second.items[0].names[0].name} == {
+            companies_with_tags[0].names[0].name,
+            companies_with_tags[1].names[0].name,
+        }
+        assert second.next_cursor is None
+        # 페이지별로 같은 hash 의 다른 field 에 캐시
+        assert await redis_client.hkeys(f"repository:company:tag_pages:{tag_name}") == [
+            b"1:",
+            f"1:{first.next_cursor}".encode(),
+        ]
+
+    async def test_get_by_tag_limit_is_bounded_by_max_page_size(
+        self,
+        async_session,
+        company_mapper,
+        company_tag_mapper,
+        redis_client,
+        settings,
+        companies_with_tags,
+        company_tags,
+    ):
+        # Given
+        from app.repositories.company_repository import CompanyRepository
+
+        company_repository = CompanyRepository(
+            db=async_session,
+            company_mapper=company_mapper,
+            company_tag_mapper=company_tag_mapper,
+            redis_client=redis_client,
+            settings=settings.model_copy(update={"SEARCH_MAX_PAGE_SIZE": 1}),
+        )
+
+        # When
+        result = await company_repository.get_by_tag(
+            company_tags[0].names[0].name, limit=100
+        )
+
+        # Then
+        assert len(result.items) == 1
+        assert result.next_cursor is not None
+
+    @pytest.mark.parametrize("cursor", ["not-a-cursor", "WyJhYmMiXQ"])
+    async def test_get_by_tag_with_invalid_cursor(
+        self, company_repository, companies_with_tags, company_tags, cursor
+    ):
+        # Given
+        from app.core.pagination import InvalidCursorError
+
+        # When / Then
+        with pytest.raises(InvalidCursorError):
+            await company_repository.get_by_tag(
+                company_tags[0].names[0].name, cursor=cursor
+            )
+
+    # 부분 검색 정렬 (정확 일치 > 앞부분 일치 > trigram 유사도)
+    async def test_get_by_partial_name_ranks_exact_then_prefix_then_similarity(
+        self, company_repository, async_session
+    ):
+        # Given
+        from app.db.models.company_model import Company, CompanyName
+
+        for name in ["주식회사 원티드랩", "원티드랩스코리아", "원티드랩", "원티드"]:
+            company = Company()
+            company.names.append(CompanyName(name=name, language_code="ko"))
+            async_session.add(company)
+        await async_session.flush()
+
+        # When
+        result = await company_repository.get_by_partial_name("원티드")
+
+        # Then
+        assert [company.names[0].name for company in result.items] == [
+            "원티드",
+            "원티드랩",
+            "원티드랩스코리아",
+            "주식회사 원티드랩",
+        ]
+
+    async def test_get_by_partial_name_ranked_pages_keep_order(
+        self, company_repository, async_session
+    ):
+        # Given
+        from app.db.models.company_model import Company, CompanyName
+
+        for name in ["주식회사 원티드랩", "원티드랩스코리아", "원티드랩", "원티드"]:
+            company = Company()
+            company.names.append(CompanyName(name=name, language_code="ko"))
+            async_session.add(company)
+        await async_session.flush()
+        everything = await company_repository.get_by_partial_name("원티드")
+
+        # When
+        names, cursor = [], None
+        while True:
+            page = await company_repository.get_by_partial_name(
+                "원티드", limit=1, cursor=cursor
+            )
+            names += [company.names[0].name for company in page.items]
+            if (cursor := page.next_cursor) is None:
+                break
+
+        # Then
+        assert names == [company.names[0].name for company in everything.items]
+
+    async def test_get_by_partial_name_returns_company_once_for_multiple_languages(
+        self, company_repository, async_session
+    ):
+        # Given
+        from app.db.models.company_model import Company, CompanyName
+
+        company = Company()
+        company.names.append(CompanyName(name="원티드랩", language_code="ko"))
+        company.names.append(CompanyName(name="원티드랩 Japan", language_code="jp"))
+        async_session.add(company)
+        await async_session.flush()
+
+        # When
+        result = await company_repository.get_by_partial_name("원티드")
+
+        # Then
+        assert len(result.items) == 1
+
+    async def test_get_by_partial_name_scoped_to_language(
+        self, company_repository, async_session
+    ):
+        # Given
+        from app.db.models.company_model import Company, CompanyName
+
+        company = Company()
+        company.names.append(CompanyName(name="원티드랩", language_code="ko"))
+        company.names.append(CompanyName(name="Wantedlab", language_code="en"))
+        async_session.add(company)
+        await async_session.flush()
+
+        # When
+        ko = await company_repository.get_by_partial_name("wanted", language_code="ko")
+        en = await company_repository.get_by_partial_name("wanted", language_code="en")
+
+        # Then
+        assert ko.items == ()
+        assert len(en.items) == 1
+
+    @pytest.mark.parametrize("partial_name", ["%", "_", "회_"])
+    async def test_get_by_partial_name_escapes_like_wildcards(
+        self, company_repository, companies, partial_name
+    ):
+        # Given
+
+        # When
+        result = await company_repository.get_by_partial_name(partial_name)
+
+        # Then
+        assert result.items == ()
+
+    # 정규화 키 검색 (초성, 가나/전각 접기)
+    async def test_save_fills_search_key(self, company_repository, async_session):
+        # Given
+        from sqlalchemy import select
+
+        from app.db.models.company_model import CompanyName
+        from app.domain.company_entity import CompanyEntity, CompanyNameEntity
+        from app.search.normalize import build_search_key
+
+        company = CompanyEntity(
+            names=(CompanyNameEntity(language_code="ko", name="원티드랩"),)
+        )
+
+        # When
+        await company_repository.save(company)
+        await async_session.flush()
+
+        # Then
+        search_key = await async_session.scalar(
+            select(CompanyName.search_key).where(CompanyName.name == "원티드랩")
+        )
+        assert search_key == build_search_key("원티드랩")
+
+    @pytest.mark.parametrize(
+        ("partial_name", "expected"),
+        [
+            ("ㅇㅌㄷ", "원티드랩"),
+            ("ｳｫﾝﾃｯﾄﾞ", "ウォンテッド"),
+            ("うぉんてっど", "ウォンテッド"),
+            ("ＷＡＮＴＥＤ", "Wantedlab"),
+        ],
+    )
+    async def test_get_by_partial_name_normalized_mode(
+        self, company_repository, async_session, partial_name, expected
+    ):
+        # Given
+        from app.core.constants import SearchMode
+        from app.db.models.company_model import Company, CompanyName
+
+        for language_code, name in [
+            ("ko", "원티드랩"),
+            ("jp", "ウォンテッド"),
+            ("en", "Wantedlab"),
+        ]:
+            company = Company()
+            company.names.append(CompanyName(name=name, language_code=language_code))
+            async_session.add(company)
+        await async_session.flush()
+
+        # When
+        result = await company_repository.get_by_partial_name(
+            partial_name, mode=SearchMode.NORMALIZED
+        )
+        raw = await company_repository.get_by_partial_name(partial_name)
+
+        # Then
+        assert [company.names[0].name for company in result.items] == [expected]
+        assert raw.items == ()
+
+    async def test_get_by_partial_name_normalized_mode_ranks_choseong_prefix(
+        self, company_repository, async_session
+    ):
+        # Given
+        from app.core.constants import SearchMode
+        from app.db.models.company_model import Company, CompanyName
+
+        for name in ["주식회사 원티드", "원티드랩", "원티드"]:
+            company = Company()
+            company.names.append(CompanyName(name=name, language_code="ko"))
+            async_session.add(company)
+        await async_session.flush()
+
+        # When
+        result = await company_repository.get_by_partial_name(
+            "ㅇㅌㄷ", mode=SearchMode.NORMALIZED
+        )
+
+        # Then
+        assert [company.names[0].name for company in result.items] == [
+            "원티드",
+            "원티드랩",
+            "주식회사 원티드",
+        ]
+
+    # 다중 태그 검색 (all / any)
+    @pytest.mark.parametrize(("mode", "expected"), [("all", [0]), ("any", [0, 1, 2])])
+    async def test_get_by_tags(
+        self, company_repository, companies_with_two_tags, company_tags, mode, expected
+    ):
+        # Given
+        from app.core.constants import TagMatchMode
+
+        tags = [company_tags[0].names[0].name, company_tags[1].names[0].name]
+
+        # When
+        result = await company_repository.get_by_tags(tags, mode=TagMatchMode(mode))
+
+        # Then
+        assert sorted(company.names[0].name for company in result.items) == sorted(
+            companies_with_two_tags[i].names[0].name for i in expected
+        )
+
+    async def test_get_by_tags_uses_canonical_cache_key(
+        self, company_repository, companies_with_two_tags, company_tags, sql_statements
+    ):
+        # Given
+        from app.core.constants import TagMatchMode
+
+        tag1, tag2 = company_tags[0].names[0].name, company_tags[1].names[0].name
+        await company_repository.get_by_tags([tag1, tag2], mode=TagMatchMode.ALL)
+        sql_statements.clear()
+
+        # When
+        result = await company_repository.get_by_tags(
+            [tag2, tag1, tag2], mode=TagMatchMode.ALL
+        )
+
+        # Then
+        assert len(result.items) == 1
+        assert sql_statements == []
+
+    async def test_add_tag_invalidates_tag_combination_cache(
+        self, company_repository, companies_with_two_tags, company_tags, redis_client
+    ):
+        # Given
+        from app.cache.keys import company_tags_cache_key
+        from app.core.constants import TagMatchMode
+        from app.domain.company_entity import CompanyTagEntity, CompanyTagNameEntity
+
+        tags = [company_tags[0].names[0].name, company_tags[1].names[0].name]
+        await company_repository.get_by_tags(tags, mode=TagMatchMode.ALL)
+        cache_key = company_tags_cache_key(tags, TagMatchMode.ALL)
+        assert await redis_client.exists(cache_key)
+
+        # When
+        await company_repository.add_tag(
+            companies_with_two_tags[1].names[0].name,
+            [
+                CompanyTagEntity(
+                    id=company_tags[1].id,
+                    names=(
+                        CompanyTagNameEntity(
+                            language_code="ko", name=company_tags[1].names[0].name
+                        ),
+                    ),
+                )
+            ],
+        )
+        result = await company_repository.get_by_tags(tags, mode=TagMatchMode.ALL)
+
+        # Then
+        assert len(result.items) == 2
+
+    # 태그 비트맵 인덱스
+    @pytest.mark.parametrize(("mode", "expected"), [("all", [0]), ("any", [0, 1, 2])])
+    async def test_get_by_tags_from_tag_index_without_sql(
+        self,
+        indexed_company_repository,
+        tag_index,
+        companies_with_two_tags,
+        company_tags,
+        sql_statements,
+        mode,
+        expected,
+    ):
+        # Given
+        from app.core.constants import TagMatchMode
+
+        await tag_index.refresh()
+        sql_statements.clear()
+        tags = [company_tags[0].names[0].name, company_tags[1].names[0].name]
+
+        # When
+        result = await indexed_company_repository.get_by_tags(
+            tags, mode=TagMatchMode(mode)
+        )
+
+        # Then
+        assert sorted(company.names[0].name for company in result.items) == sorted(
+            companies_with_two_tags[i].names[0].name for i in expected
+        )
+        assert sql_statements == []
+
+    async def test_get_by_tag_from_tag_index_pages_like_database(
+        self,
+        company_repository,
+        indexed_company_repository,
+        tag_index,
+        companies_with_tags,
+        company_tags,
+    ):
+        # Given
+        await tag_index.refresh()
+        tag = company_tags[0].names[0].name
+
+        # When
+        first = await indexed_company_repository.get_by_tag(tag, limit=1)
+        second = await indexed_company_repository.get_by_tag(
+            tag, limit=1, cursor=first.next_cursor
+        )
+
+        # Then
+        expected = await company_repository.get_by_tag(tag, limit=1)
+        assert first == expected
+        assert second.next_cursor is None
+        assert {first.items[0], second.items[0]} == {
+            (await company_repository.get_by_tag(tag)).items[i] for i in range(2)
+        }
+
+    # 입력 중인 검색어를 캐시된 짧은 검색어 후보로 계산
+    @pytest.mark.parametrize(
+        ("mode", "queries"),
+        [
+            ("name", ["원", "원티", "원티드", "원티드랩"]),
+            ("normalized", ["ㅇ", "ㅇㅌ", "ㅇㅌㄷ", "ㅇㅌㄷㄹ"]),
+        ],
+    )
+    async def test_get_by_partial_name_refines_cached_shorter_query(
+        self,
+        company_repository,
+        async_session,
+        redis_client,
+        company_mapper,
+        company_tag_mapper,
+        settings,
+        sql_statements,
+        mode,
+        queries,
+    ):
+        # Given
+        from app.core.constants import SearchMode
+        from app.db.models.company_model import Company, CompanyName
+        from app.repositories.company_repository import CompanyRepository
+
+        for name in [
+            "주식회사 원티드랩",
+            "원티드랩스코리아",
+            "원티드랩",
+            "원티드",
+            "원",
+        ]:
+            company = Company()
+            company.names.append(CompanyName(name=name, language_code="ko"))
+            company.names.append(CompanyName(name=f"{name} en", language_code="en"))
+            async_session.add(company)
+        await async_session.flush()
+        sql_repository = CompanyRepository(
+            db=async_session,
+            company_mapper=company_mapper,
+            company_tag_mapper=company_tag_mapper,
+            redis_client=redis_client,
+            settings=settings.model_copy(
+                update={
+                    "REPOSITORY_CACHE_PARTIAL_REFINE_MAX_SIZE": 0,
+                    "REPOSITORY_CACHE_PARTIAL_TTL": 1,
+                }
+            ),
+        )
+        await company_repository.get_by_partial_name(queries[0], mode=SearchMode(mode))
+        sql_statements.clear()
+
+        # When - 한 페이지에 모두 들어가는 결과는 DB 를 조회하지 않음
+        results = [
+            await company_repository.get_by_partial_name(
+                query, limit=10, mode=SearchMode(mode)
+            )
+            for query in queries[1:]
+        ]
+
+        # Then
+        assert sql_statements == []
+        assert company_repository._refine_stats.hits == len(queries) - 1
+        await redis_client.flushall()
+        for query, result in zip(queries[1:], results):
+            expected = await sql_repository.get_by_partial_name(
+                query, limit=10, mode=SearchMode(mode)
+            )
+            # 회사 내 이름 순서는 정해져 있지 않으므로 집합으로 비교
+            assert [set(company.names) for company in result.items] == [
+                set(company.names) for company in expected.items
+            ]
+            assert result.next_cursor == expected.next_cursor
+
+    async def test_get_by_partial_name_refined_first_page_continues_with_sql(
+        self,
+        company_repository,
+        async_session,
+        redis_client,
+        company_mapper,
+        company_tag_mapper,
+        settings,
+        monkeypatch,
+    ):
+        # Given
+        from app.db.models.company_model import Company, CompanyName
+        from app.repositories.company_repository import CompanyRepository
+        from app.search import refine
+        from app.search.trigram import similarity
+
+        for name in [
+            "원티드랩",
+            "원티드",
+            "주식회사 원티드",
+            "원티드랩스코리아",
+            "원티",
+        ]:
+            company = Company()
+            company.names.append(CompanyName(name=name, language_code="ko"))
+            async_session.add(company)
+        await async_session.flush()
+        sql_repository = CompanyRepository(
+            db=async_session,
+            company_mapper=company_mapper,
+            company_tag_mapper=company_tag_mapper,
+            redis_client=redis_client,
+            settings=settings.model_copy(
+                update={"REPOSITORY_CACHE_PARTIAL_REFINE_MAX_SIZE": 0}
+            ),
+        )
+        # 메모리 유사도가 DB(pg_trgm)와 조금 다른 경우
+        monkeypatch.setattr(
+            refine, "similarity", lambda left, right: similarity(left, right) + 0.01
+        )
+        await company_repository.get_by_partial_name("원")
+
+        async def _all_pages(repository):
+            names, cursors, cursor = [], [], None
+            while True:
+                page = await repository.get_by_partial_name(
+                    "원티드", limit=2, cursor=cursor
+                )
+                names += [company.names[0].name for company in page.items]
+                if page.next_cursor is None:
+                    return names, cursors
+                cursor = page.next_cursor
+                cursors.append(cursor)
+
+        # When - 첫 페이지는 후보로 범위를 좁히고, 다음 페이지는 DB 커서로 이어서 조회
+        names, cursors = await _all_pages(company_repository)
+
+        # Then
+        assert company_repository._refine_stats.hits == 1
+        await redis_client.flushall()
+        expected_names, expected_cursors = await _all_pages(sql_repository)
+        assert names == expected_names
+        assert len(set(names)) == 4
+        assert cursors == expected_cursors
+
+    async def test_get_by_partial_name_falls_back_to_sql_above_refine_threshold(
+        self,
+        async_session,
+        redis_client,
+        company_mapper,
+        company_tag_mapper,
+        settings,
+        companies,
+        sql_statements,
+    ):
+        # Given
+        from app.repositories.company_repository import CompanyRepository
+
+        company_repository = CompanyRepository(
+            db=async_session,
+            company_mapper=company_mapper,
+            company_tag_mapper=company_tag_mapper,
+            redis_client=redis_client,
+            settings=settings.model_copy(
+                update={"REPOSITORY_CACHE_PARTIAL_REFINE_MAX_SIZE": 1}
+            ),
+        )
+        await company_repository.get_by_partial_name("회")
+        sql_statements.clear()
+
+        # When
+        result = await company_repository.get_by_partial_name("회사")
+
+        # Then
+        assert [company.names[0].name for company in result.items] == [
+            "회사1",
+            "회사2",
+        ]
+        assert sql_statements != []
+        assert company_repository._refine_stats.hits == 0
+        assert company_repository._refine_stats.misses == 2
+
+    # 오타 허용(fuzzy) 검색
+    async def test_get_by_partial_name_fuzzy_finds_misspelled_name(
+        self, company_repository, async_session
+    ):
+        # Given
+        from app.db.models.company_model import Company, CompanyName
+
+        for name in ["원티드랩", "링크드코리아"]:
+            company = Company()
+            company.names.append(CompanyName(name=name, language_code="ko"))
+            async_session.add(company)
+        await async_session.flush()
+
+        # When
+        exact = await company_repository.get_by_partial_name("원티드렙")
+        fuzzy = await company_repository.get_by_partial_name("원티드렙", fuzzy=True)
+
+        # Then
+        assert exact.items == ()
+        assert [company.names[0].name for company in fuzzy.items] == ["원티드랩"]
+
+    async def test_get_by_partial_name_fuzzy_ranks_substring_matches_first(
+        self, company_repository, async_session
+    ):
+        # Given
+        from app.db.models.company_model import Company, CompanyName
+
+        for name in ["Wantd Co", "Wantedlab", "Wanted"]:
+            company = Company()
+            company.names.append(CompanyName(name=name, language_code="en"))
+            async_session.add(company)
+        await async_session.flush()
+
+        # When
+        result = await company_repository.get_by_partial_name("Wanted", fuzzy=True)
+
+        # Then
+        assert [company.names[0].name for company in result.items] == [
+            "Wanted",
+            "Wantedlab",
+            "Wantd Co",
+        ]
+
+    async def test_get_by_partial_name_fuzzy_caps_candidates(
+        self,
+        async_session,
+        redis_client,
+        company_mapper,
+        company_tag_mapper,
+        settings,
+    ):
+        # Given
+        from app.db.models.company_model import Company, CompanyName
+        from app.repositories.company_repository import CompanyRepository
+
+        company_repository = CompanyRepository(
+            db=async_session,
+            company_mapper=company_mapper,
+            company_tag_mapper=company_tag_mapper,
+            redis_client=redis_client,
+            settings=settings.model_copy(update={"SEARCH_FUZZY_MAX_CANDIDATES": 1}),
+        )
+        for name in ["Wantd", "Wanteb"]:
+            company = Company()
+            company.names.append(CompanyName(name=name, language_code="en"))
+            async_session.add(company)
+        await async_session.flush()
+
+        # When
+        result = await company_repository.get_by_partial_name("Wanted", fuzzy=True)
+
+        # Then
+        assert [company.names[0].name for company in result.items] == ["Wanteb"]
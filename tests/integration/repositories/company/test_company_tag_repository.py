@@ -420,3 +420,120 @@ class TestCompanyTagRepository:
         assert result is not None
         assert len(result.names) == 1  # 변화 없음
         assert result.names[0].language_code == "ko"
+
+    async def test_get_or_create_all_creates_and_extends_tags(
+        self, company_tag_repository, company_tags
+    ):
+        # Given
+        from app.dto.company_dto import CompanyTagDto, CompanyTagNameDto
+
+        tags = [
+            CompanyTagDto(
+                names=(
+                    CompanyTagNameDto(language_code="ko", name="태그1"),
+                    CompanyTagNameDto(language_code="en", name="tag_1"),
+                )
+            ),
+            CompanyTagDto(
+                names=(
+                    CompanyTagNameDto(language_code="ko", name="새태그"),
+                    CompanyTagNameDto(language_code="en", name="new tag"),
+                )
+            ),
+            CompanyTagDto(names=(CompanyTagNameDto(language_code="ko", name="태그2"),)),
+        ]
+
+        # When
+        result = await company_tag_repository.get_or_create_all(tags)
+
+        # Then
+        assert [tag.id for tag in result] == [
+            company_tags[0].id,
+            result[1].id,
+            company_tags[1].id,
+        ]
+        assert result[1].id not in {tag.id for tag in company_tags}
+        assert {(name.language_code, name.name) for name in result[0].names} == {
+            ("ko", "태그1"),
+            ("en", "tag_1"),
+        }
+        assert {(name.language_code, name.name) for name in result[1].names} == {
+            ("ko", "새태그"),
+            ("en", "new tag"),
+        }
+        assert all(name.id is not None for tag in result for name in tag.names)
+
+        saved = await company_tag_repository.get_by_names(
+            [CompanyTagNameDto(language_code="en", name="tag_1")]
+        )
+        assert saved.id == company_tags[0].id
+        # 세션에 로드되어 있던 태그도 추가된 태그명이 반영됨
+        assert len(saved.names) == 2
+
+    async def test_get_or_create_all_reuses_tag_created_in_same_batch(
+        self, company_tag_repository
+    ):
+        # Given
+        from app.dto.company_dto import CompanyTagDto, CompanyTagNameDto
+
+        tags = [
+            CompanyTagDto(names=(CompanyTagNameDto(language_code="ko", name="중복"),)),
+            CompanyTagDto(
+                names=(
+                    CompanyTagNameDto(language_code="ko", name="중복"),
+                    CompanyTagNameDto(language_code="en", name="duplicate"),
+                )
+            ),
+        ]
+
+        # When
+        result = await company_tag_repository.get_or_create_all(tags)
+
+        # Then
+        assert result[0].id == result[1].id
+        assert {(name.language_code, name.name) for name in result[1].names} == {
+            ("ko", "중복"),
+            ("en", "duplicate"),
+        }
+
+    async def test_get_or_create_all_uses_constant_number_of_queries(
+        self, company_tag_repository, async_session, sql_statements
+    ):
+        # Given
+        from app.db.models.company_model import CompanyTag, CompanyTagName
+        from app.dto.company_dto import CompanyTagDto, CompanyTagNameDto
+
+        for i in range(10):
+            tag = CompanyTag()
+            tag.names.append(CompanyTagName(name=f"기존태그{i}", language_code="ko"))
+            async_session.add(tag)
+        await async_session.flush()
+
+        # 기존 태그 10개(영어 이름 추가) + 새 태그 10개
+        tags = [
+            CompanyTagDto(
+                names=(
+                    CompanyTagNameDto(language_code="ko", name=f"기존태그{i}"),
+                    CompanyTagNameDto(language_code="en", name=f"existing tag {i}"),
+                )
+            )
+            for i in range(10)
+        ] + [
+            CompanyTagDto(
+                names=(
+                    CompanyTagNameDto(language_code="ko", name=f"새태그{i}"),
+                    CompanyTagNameDto(language_code="en", name=f"new tag {i}"),
+                )
+            )
+            for i in range(10)
+        ]
+        sql_statements.clear()
+
+        # When
+        result = await company_tag_repository.get_or_create_all(tags)
+
+        # Then
+        assert len(result) == 20
+        assert all(len(tag.names) == 2 for tag in result)
+        # 기존 태그 조회 1번 + 태그 INSERT 1번 + 태그명 INSERT 1번
+        assert len(sql_statements) == 3
@@ -0,0 +1,84 @@
+import asyncio
+
+
+async def _wait_until(predicate, timeout=1.0):
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while not predicate():
+        if loop.time() > deadline:
+            raise AssertionError("condition not met in time")
+        await asyncio.sleep(0.01)
+
+
+class TestAutocomplete:
+    async def test_load_prefix_index_from_company_names(self, async_session):
+        # Given
+        from app.db.models import Company, CompanyName
+        from app.search.autocomplete import load_prefix_index
+
+        company = Company()
+        company.names.append(CompanyName(language_code="ko", name="자동완성회사"))
+        company.names.append(CompanyName(language_code="en", name="Autocomplete Co"))
+        async_session.add(company)
+        await async_session.flush()
+
+        # When
+        index = await load_prefix_index(async_session)
+
+        # Then
+        assert index.search("자동", "ko", limit=10) == ["자동완성회사"]
+        assert index.search("auto", "en", limit=10) == ["Autocomplete Co"]
+        assert index.search("auto", "ko", limit=10) == ["자동완성회사"]
+
+    async def test_added_company_is_delivered_to_other_workers(self, redis_client):
+        # Given
+        from app.search.autocomplete import AutocompleteIndex, AutocompleteSubscriber
+        from app.search.prefix_index import PrefixIndex
+
+        async def _load():
+            return PrefixIndex()
+
+        this_worker = AutocompleteIndex(redis_client, PrefixIndex(), load=_load)
+        other_worker = AutocompleteIndex(redis_client, PrefixIndex(), load=_load)
+        subscriber = AutocompleteSubscriber(redis_client, other_worker)
+        await subscriber.start()
+
+        # When
+        await this_worker.add_company("1", [("ko", "새회사"), ("en", "New Co")])
+
+        # Then
+        try:
+            assert this_worker.search("새", "ko", limit=10) == ["새회사"]
+            await _wait_until(lambda: len(other_worker) == 2)
+            assert other_worker.search("new", "ko", limit=10) == ["새회사"]
+        finally:
+            await subscriber.stop()
+
+    async def test_reload_rebuilds_other_workers(self, redis_client):
+        # Given
+        from app.search.autocomplete import AutocompleteIndex, AutocompleteSubscriber
+        from app.search.prefix_index import PrefixIndex
+
+        async def _load():
+            return PrefixIndex.build([("1", "ko", "다시만든회사")])
+
+        this_worker = AutocompleteIndex(redis_client, PrefixIndex(), load=_load)
+        other_worker = AutocompleteIndex(redis_client, PrefixIndex(), load=_load)
+        own_subscriber = AutocompleteSubscriber(redis_client, this_worker)
+        subscriber = AutocompleteSubscriber(redis_client, other_worker)
+        await own_subscriber.start()
+        await subscriber.start()
+
+        # When
+        await this_worker.reload()
+
+        # Then
+        try:
+            assert this_worker.search("다시", "ko", limit=10) == ["다시만든회사"]
+            await _wait_until(lambda: len(other_worker) == 1)
+            assert other_worker.search("다시", "ko", limit=10) == ["다시만든회사"]
+            # 보낸 워커는 자신의 메시지로 다시 만들지 않음
+            assert own_subscriber._reload_task is None
+        finally:
+            await own_subscriber.stop()
+            await subscriber.stop()
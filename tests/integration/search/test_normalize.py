@@ -0,0 +1,35 @@
+class TestNormalize:
+    def test_normalize_search_text_folds_width_case_and_kana(self):
+        # Given
+        from app.search.normalize import normalize_search_text
+
+        # When / Then
+        assert normalize_search_text("Ｗａｎｔｅｄ LAB") == "wanted lab"
+        assert normalize_search_text("ｳｫﾝﾃｯﾄﾞ") == normalize_search_text("うぉんてっど")
+        assert normalize_search_text("ウォンテッド") == "うぉんてっど"
+
+    def test_hangul_choseong(self):
+        # Given
+        from app.search.normalize import hangul_choseong
+
+        # When / Then
+        assert hangul_choseong("원티드랩") == "ㅇㅌㄷㄹ"
+        assert hangul_choseong("주식회사 원티드 Lab") == "ㅈㅅㅎㅅ ㅇㅌㄷ Lab"
+
+    def test_build_search_key_contains_normalized_name_and_choseong(self):
+        # Given
+        from app.search.normalize import (
+            SEARCH_KEY_SEPARATOR,
+            build_search_key,
+            normalize_search_text,
+        )
+
+        # When
+        search_key = build_search_key("원티드랩")
+
+        # Then
+        assert search_key.split(SEARCH_KEY_SEPARATOR) == [
+            "원티드랩",
+            normalize_search_text("ㅇㅌㄷㄹ"),
+        ]
+        assert build_search_key("Wantedlab") == "wantedlab"
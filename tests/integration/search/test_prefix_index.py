@@ -0,0 +1,127 @@
+class TestPrefixIndex:
+    def _build(self):
+        from app.search.prefix_index import PrefixIndex
+
+        return PrefixIndex.build(
+            [
+                ("1", "ko", "원티드랩"),
+                ("1", "en", "Wantedlab"),
+                ("2", "ko", "원티드"),
+                ("3", "ko", "원티드랩스코리아"),
+                ("4", "en", "Wanted Korea"),
+                ("5", "ko", "링크드코리아"),
+            ]
+        )
+
+    def test_exact_and_shorter_matches_first(self):
+        # Given
+        index = self._build()
+
+        # When
+        result = index.search("원티드", "ko", limit=10)
+
+        # Then
+        assert result == ["원티드", "원티드랩", "원티드랩스코리아"]
+
+    def test_limit(self):
+        # Given
+        index = self._build()
+
+        # When
+        result = index.search("원티드", "ko", limit=2)
+
+        # Then
+        assert result == ["원티드", "원티드랩"]
+
+    def test_matches_other_languages_and_returns_wanted_language_name(self):
+        # Given
+        index = self._build()
+
+        # When
+        result = index.search("WANTED", "ko", limit=10)
+
+        # Then - 언어별 이름이 없으면 첫 번째 이름으로 노출, 같은 회사는 한 번만
+        assert result == ["원티드랩", "Wanted Korea"]
+
+    def test_same_company_is_returned_once(self):
+        # Given
+        from app.search.prefix_index import PrefixIndex
+
+        index = PrefixIndex.build([("1", "ko", "랩"), ("1", "en", "랩 en")])
+
+        # When
+        result = index.search("랩", "en", limit=10)
+
+        # Then
+        assert result == ["랩 en"]
+
+    def test_no_match_or_blank_query(self):
+        # Given
+        index = self._build()
+
+        # When / Then
+        assert index.search("없는회사", "ko", limit=10) == []
+        assert index.search("  ", "ko", limit=10) == []
+
+    def test_add_updates_index_incrementally(self):
+        # Given
+        index = self._build()
+
+        # When
+        index.add("6", [("ko", "원티드2"), ("en", "Wanted Two")])
+        index.add("6", [("ko", "원티드2")])
+
+        # Then
+        assert index.search("원티드", "ko", limit=3) == [
+            "원티드",
+            "원티드2",
+            "원티드랩",
+        ]
+        assert index.search("wanted t", "en", limit=10) == ["Wanted Two"]
+        assert len(index) == 8
+
+    def test_matches_full_ranking(self):
+        # Given - 길이 버킷별로 멈추는 검색이 전체 후보를 정렬한 결과와 같아야 함
+        import random
+
+        from app.search.prefix_index import PrefixIndex, normalize_prefix
+
+        rng = random.Random(0)
+        rows = [
+            (
+                str(company_id),
+                language_code,
+                "".join(rng.choice("abAB") for _ in range(rng.randint(1, 6))),
+            )
+            for company_id in range(300)
+            for language_code in rng.sample(["ko", "en", "ja"], rng.randint(1, 3))
+        ]
+        index = PrefixIndex.build(rows)
+
+        def _expected(prefix, language_code, limit):
+            key = normalize_prefix(prefix)
+            ranked = sorted(
+                (
+                    len(normalize_prefix(name)),
+                    row_language != language_code,
+                    normalize_prefix(name),
+                    company_id,
+                )
+                for company_id, row_language, name in rows
+                if normalize_prefix(name).startswith(key)
+            )
+            result = []
+            for *_, company_id in ranked:
+                if company_id not in result:
+                    result.append(company_id)
+            return [
+                index._display_name(company_id, language_code)
+                for company_id in result[:limit]
+            ]
+
+        # When / Then
+        for prefix in ["a", "B", "ab", "bba", "aaaa"]:
+            for language_code in ["ko", "en"]:
+                assert index.search(prefix, language_code, limit=7) == _expected(
+                    prefix, language_code, 7
+                )
@@ -0,0 +1,45 @@
+class TestRefineCandidates:
+    def test_filters_and_ranks_like_partial_name_search(self):
+        # Given
+        from app.core.constants import SearchMode
+        from app.search.refine import refine_candidates
+
+        candidates = [
+            ["a", [[1, "주식회사 원티드랩", None]], [["ko", "주식회사 원티드랩"]]],
+            ["b", [[2, "원티드랩", None]], [["ko", "원티드랩"]]],
+            ["c", [[3, "원티드", None]], [["ko", "원티드"]]],
+            ["d", [[4, "원티", None], [5, "원티드랩스", None]], [["ko", "원티"]]],
+        ]
+
+        # When
+        result = refine_candidates(candidates, "원티드랩", SearchMode.NAME)
+
+        # Then
+        assert [candidate[0] for _, candidate in result] == ["b", "d", "a"]
+        assert result[0][0][:1] == [0]
+        assert result[1][1][1] == [[5, "원티드랩스", None]]
+
+    def test_normalized_mode_matches_search_key(self):
+        # Given
+        from app.core.constants import SearchMode
+        from app.search.normalize import build_search_key
+        from app.search.refine import refine_candidates
+
+        candidates = [
+            [
+                company_id,
+                [[name_id, name, build_search_key(name)]],
+                [["ko", name]],
+            ]
+            for company_id, name_id, name in [
+                ("a", 1, "원티드랩"),
+                ("b", 2, "원티드"),
+                ("c", 3, "우리"),
+            ]
+        ]
+
+        # When
+        result = refine_candidates(candidates, "ㅇㅌㄷ", SearchMode.NORMALIZED)
+
+        # Then
+        assert [candidate[0] for _, candidate in result] == ["b", "a"]
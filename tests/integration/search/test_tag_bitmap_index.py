@@ -0,0 +1,214 @@
+class TestBitmap:
+    def test_add_discard_and_iterate_across_containers(self):
+        # Given
+        from app.search.tag_bitmap_index import Bitmap
+
+        bitmap = Bitmap([70000, 3, 1])
+
+        # When
+        bitmap.add(2)
+        bitmap.add(3)
+        bitmap.discard(70000)
+        bitmap.discard(99)
+
+        # Then
+        assert list(bitmap) == [1, 2, 3]
+        assert len(bitmap) == 3
+        assert 2 in bitmap
+        assert 70000 not in bitmap
+
+    def test_iter_from_seeks_within_and_across_containers(self):
+        # Given
+        from app.search.tag_bitmap_index import Bitmap
+
+        bitmap = Bitmap([1, 5, 9, 65536, 65540, 131072])
+
+        # When / Then
+        assert list(bitmap.iter_from(5)) == [5, 9, 65536, 65540, 131072]
+        assert list(bitmap.iter_from(10)) == [65536, 65540, 131072]
+        assert list(bitmap.iter_from(65537)) == [65540, 131072]
+        assert list(bitmap.iter_from(131073)) == []
+
+    def test_intersection_and_union(self):
+        # Given
+        from app.search.tag_bitmap_index import Bitmap
+
+        left = Bitmap([1, 5, 9, 65536, 65540])
+        right = Bitmap([5, 9, 10, 65540, 131072])
+
+        # When
+        intersection = Bitmap.intersection([left, right])
+        union = Bitmap.union([left, right])
+
+        # Then
+        assert list(intersection) == [5, 9, 65540]
+        assert list(union) == [1, 5, 9, 10, 65536, 65540, 131072]
+
+    def test_intersection_of_disjoint_containers_is_empty(self):
+        # Given
+        from app.search.tag_bitmap_index import Bitmap
+
+        # When
+        result = Bitmap.intersection([Bitmap([1]), Bitmap([65537]), Bitmap([1, 2])])
+
+        # Then
+        assert not result
+        assert list(result) == []
+
+
+class TestTagBitmapIndex:
+    def _build(self):
+        from app.search.tag_bitmap_index import TagBitmapIndex
+
+        return TagBitmapIndex.build(
+            [
+                ("a", "ko", "회사A"),
+                ("a", "en", "Company A"),
+                ("b", "ko", "회사B"),
+                ("c", "ko", "회사C"),
+            ],
+            [
+                ("a", "ko", "태그1"),
+                ("a", "en", "tag_1"),
+                ("a", "ko", "태그2"),
+                ("b", "ko", "태그1"),
+                ("c", "ko", "태그2"),
+                ("unknown", "ko", "태그1"),
+            ],
+        )
+
+    def test_search_any_and_all(self):
+        # Given
+        from app.core.constants import TagMatchMode
+
+        index = self._build()
+
+        # When
+        any_result = index.search(["태그1", "태그2"], TagMatchMode.ANY, limit=10)
+        all_result = index.search(["태그1", "태그2"], TagMatchMode.ALL, limit=10)
+
+        # Then
+        assert [company_id for company_id, _ in any_result] == ["a", "b", "c"]
+        assert all_result == [("a", (("ko", "회사A"), ("en", "Company A")))]
+
+    def test_search_matches_tag_name_in_any_language(self):
+        # Given
+        from app.core.constants import TagMatchMode
+
+        index = self._build()
+
+        # When
+        result = index.search(["tag_1"], TagMatchMode.ANY, limit=10)
+
+        # Then
+        assert [company_id for company_id, _ in result] == ["a"]
+
+    def test_search_pages_by_company_id(self):
+        # Given
+        from app.core.constants import TagMatchMode
+
+        index = self._build()
+
+        # When
+        result = index.search(["태그1", "태그2"], TagMatchMode.ANY, limit=1, after="a")
+
+        # Then
+        assert [company_id for company_id, _ in result] == ["b"]
+
+    def test_search_pages_match_full_scan(self):
+        # Given
+        import random
+
+        from app.core.constants import TagMatchMode
+        from app.search.tag_bitmap_index import TagBitmapIndex
+
+        rng = random.Random(0)
+        tags = ["태그1", "태그2", "태그3"]
+        company_tags = {
+            f"{rng.getrandbits(32):08x}": {tag for tag in tags if rng.random() < 0.4}
+            for _ in range(300)
+        }
+        # build 순서와 관계없이 회사 ID 순으로 조회되어야 함
+        ids = list(company_tags)
+        rng.shuffle(ids)
+        index = TagBitmapIndex.build(
+            [(company_id, "ko", company_id) for company_id in ids],
+            [
+                (company_id, "ko", tag)
+                for company_id in ids
+                for tag in company_tags[company_id]
+            ],
+        )
+        # build 이후 추가된 회사 (정렬되지 않은 꼬리)
+        for _ in range(20):
+            company_id = f"{rng.getrandbits(32):08x}"
+            company_tags[company_id] = {tag for tag in tags if rng.random() < 0.4}
+            index.update_company(
+                company_id,
+                [("ko", company_id)],
+                [("ko", tag) for tag in company_tags[company_id]],
+            )
+
+        for mode, query in [
+            (TagMatchMode.ANY, ["태그1"]),
+            (TagMatchMode.ANY, ["태그1", "태그3"]),
+            (TagMatchMode.ALL, ["태그1", "태그2"]),
+            (TagMatchMode.ALL, ["태그1", "없는태그"]),
+        ]:
+            expected = sorted(
+                company_id
+                for company_id, matched in company_tags.items()
+                if (
+                    matched >= set(query)
+                    if mode == TagMatchMode.ALL
+                    else matched & set(query)
+                )
+            )
+
+            # When
+            pages, after = [], None
+            while True:
+                page = index.search(query, mode, limit=7, after=after)
+                pages.extend(company_id for company_id, _ in page)
+                if len(page) < 7:
+                    break
+                after = page[-1][0]
+
+            # Then
+            assert pages == expected
+
+    def test_update_company_replaces_tags(self):
+        # Given
+        from app.core.constants import TagMatchMode
+
+        index = self._build()
+
+        # When
+        index.update_company("b", [("ko", "회사B")], [("ko", "태그2")])
+        index.update_company("d", [("ko", "회사D")], [("ko", "태그3")])
+
+        # Then
+        assert index.search(["태그1"], TagMatchMode.ANY, limit=10) == [
+            ("a", (("ko", "회사A"), ("en", "Company A")))
+        ]
+        assert [
+            company_id
+            for company_id, _ in index.search(["태그2"], TagMatchMode.ANY, limit=10)
+        ] == ["a", "b", "c"]
+        assert index.search(["태그3"], TagMatchMode.ANY, limit=10) == [
+            ("d", (("ko", "회사D"),))
+        ]
+        assert len(index) == 4
+
+    def test_memory_usage(self):
+        # Given
+        index = self._build()
+
+        # When
+        usage = index.memory_usage()
+
+        # Then
+        assert usage["companies"] == 3
+        assert usage["tags"] == 3
+        assert usage["bitmap_bytes"] > 0
+        assert usage["table_bytes"] > 0
@@ -0,0 +1,85 @@
+import asyncio
+
+
+async def _wait_until(predicate, timeout=1.0):
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while not predicate():
+        if loop.time() > deadline:
+            raise AssertionError("condition not met in time")
+        await asyncio.sleep(0.01)
+
+
+class TestTagIndex:
+    async def test_load_tag_bitmap_index_from_company_tags(self, async_session):
+        # Given
+        from app.core.constants import TagMatchMode
+        from app.db.models import Company, CompanyName, CompanyTag, CompanyTagName
+        from app.search.tag_index import load_tag_bitmap_index
+
+        tag = CompanyTag()
+        tag.names.append(CompanyTagName(language_code="ko", name="인덱스태그"))
+        tag.names.append(CompanyTagName(language_code="en", name="index tag"))
+        company = Company()
+        company.names.append(CompanyName(language_code="ko", name="인덱스회사"))
+        company.tags.append(tag)
+        async_session.add(company)
+        await async_session.flush()
+
+        # When
+        index = await load_tag_bitmap_index(async_session)
+
+        # Then
+        assert index.search(["index tag"], TagMatchMode.ANY, limit=10) == [
+            (str(company.id), (("ko", "인덱스회사"),))
+        ]
+
+    async def test_updated_company_is_delivered_to_other_workers(self, redis_client):
+        # Given
+        from app.core.constants import TagMatchMode
+        from app.search.tag_bitmap_index import TagBitmapIndex
+        from app.search.tag_index import TagIndex, TagIndexSubscriber
+
+        async def _load():
+            return TagBitmapIndex()
+
+        this_worker = TagIndex(redis_client, TagBitmapIndex(), load=_load)
+        other_worker = TagIndex(redis_client, TagBitmapIndex(), load=_load)
+        subscriber = TagIndexSubscriber(redis_client, other_worker)
+        await subscriber.start()
+
+        # When
+        await this_worker.update_company("1", [("ko", "새회사")], [("ko", "새태그")])
+
+        # Then
+        try:
+            assert len(this_worker) == 1
+            await _wait_until(lambda: len(other_worker) == 1)
+            assert other_worker.search(["새태그"], TagMatchMode.ANY, 10, None) == [
+                ("1", (("ko", "새회사"),))
+            ]
+        finally:
+            await subscriber.stop()
+
+    async def test_reload_rebuilds_other_workers(self, redis_client):
+        # Given
+        from app.search.tag_bitmap_index import TagBitmapIndex
+        from app.search.tag_index import TagIndex, TagIndexSubscriber
+
+        async def _load():
+            return TagBitmapIndex.build([("1", "ko", "회사")], [("1", "ko", "태그")])
+
+        this_worker = TagIndex(redis_client, TagBitmapIndex(), load=_load)
+        other_worker = TagIndex(redis_client, TagBitmapIndex(), load=_load)
+        subscriber = TagIndexSubscriber(redis_client, other_worker)
+        await subscriber.start()
+
+        # When
+        await this_worker.reload()
+
+        # Then
+        try:
+            assert len(this_worker) == 1
+            await _wait_until(lambda: len(other_worker) == 1)
+        finally:
+            await subscriber.stop()
@@ -0,0 +1,45 @@
+class TestTrigram:
+    def test_trigrams_are_padded_per_word(self):
+        # Given
+        from app.search.trigram import trigrams
+
+        # When
+        result = trigrams("Two words")
+
+        # Then
+        assert result == {
+            "  t",
+            " tw",
+            "two",
+            "wo ",
+            "  w",
+            " wo",
+            "wor",
+            "ord",
+            "rds",
+            "ds ",
+        }
+
+    def test_similarity_matches_pg_trgm(self):
+        # Given
+        from app.search.trigram import similarity
+
+        # When / Then
+        # postgres: SELECT similarity('word', 'two words') -> 0.363636
+        assert round(similarity("word", "two words"), 6) == 0.363636
+        assert similarity("Wanted", "wanted") == 1.0
+        assert similarity("원티드", "링크드") == 0.0
+        assert similarity("", "원티드") == 0.0
+        assert similarity(None, "원티드") is None
+
+    def test_word_similarity_matches_pg_trgm(self):
+        # Given
+        from app.search.trigram import word_similarity
+
+        # When / Then
+        # postgres: SELECT word_similarity('word', 'two words') -> 0.8
+        assert word_similarity("word", "two words") == 0.8
+        assert round(word_similarity("wantd", "Wantedlab Korea"), 6) == 0.666667
+        assert word_similarity("원티드랩", "주식회사 원티드랩") == 1.0
+        assert word_similarity("", "원티드") == 0.0
+        assert word_similarity("원티드", None) is None
@@ -105,3 +105,68 @@ def company_dtos():
         ),
         CompanyDto(names=(CompanyNameDto(language_code="en", name="Test Company 3"),)),
     ]
+
+
+@pytest.fixture()
+def company_service_with_index(
+    async_session,
+    mock_company_repository,
+    mock_company_tag_repository,
+    company_mapper,
+    company_tag_mapper,
+):
+    from unittest.mock import MagicMock
+
+    from app.search.autocomplete import AutocompleteIndex
+    from app.services.company_service import CompanyService
+
+    autocomplete_index = MagicMock(spec=AutocompleteIndex)
+    company_service = CompanyService(
+        db=async_session,
+        company_repo=mock_company_repository,
+        company_tag_repo=mock_company_tag_repository,
+        company_mapper=company_mapper,
+        company_tag_mapper=company_tag_mapper,
+        autocomplete_index=autocomplete_index,
+    )
+    return company_service, autocomplete_index
+
+
+@pytest.fixture()
+def company_service_with_tag_index(
+    async_session,
+    mock_company_repository,
+    mock_company_tag_repository,
+    company_mapper,
+    company_tag_mapper,
+):
+    from unittest.mock import MagicMock
+
+    from app.search.tag_index import TagIndex
+    from app.services.company_service import CompanyService
+
+    tag_index = MagicMock(spec=TagIndex)
+    company_service = CompanyService(
+        db=async_session,
+        company_repo=mock_company_repository,
+        company_tag_repo=mock_company_tag_repository,
+        company_mapper=company_mapper,
+        company_tag_mapper=company_tag_mapper,
+        tag_index=tag_index,
+    )
+    return company_service, tag_index
+
+
+@pytest.fixture()
+async def file_session_factory(tmp_path):
+    # 여러 커넥션이 동시에 쓰는 코드용, 테스트 트랜잭션과 분리된 파일 sqlite
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+    from app.db import models  # noqa: F401
+    from app.db.base import Base
+
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'import.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield async_sessionmaker(bind=engine, expire_on_commit=False)
+    await engine.dispose()
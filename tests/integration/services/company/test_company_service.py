@@ -1,3 +1,6 @@
+import pytest
+
+
 class TestCompanyService:
     async def test_get_by_name_not_found(
         self, company_service, mock_company_repository
@@ -61,119 +64,191 @@ class TestCompanyService:
         self, company_service, mock_company_repository
     ):
         # Given
-        mock_company_repository.get_by_partial_name.return_value = []
+        from app.dto.company_dto import CompanyPageDto
+
+        mock_company_repository.get_by_partial_name.return_value = CompanyPageDto(
+            items=()
+        )
 
         # When
         result = await company_service.get_by_partial_name("없는회사", "ko")
 
         # Then
-        assert result == []
+        assert result.items == ()
         mock_company_repository.get_by_partial_name.assert_called_once_with(
-            partial_name="없는회사"
+            partial_name="없는회사",
+            limit=None,
+            cursor=None,
+            language_code=None,
+            mode="name",
+            fuzzy=False,
         )
 
     async def test_get_by_partial_name_found_with_matching_language(
         self, company_service, mock_company_repository, company_dtos
     ):
         # Given
-        mock_company_repository.get_by_partial_name.return_value = company_dtos
+        from app.dto.company_dto import CompanyPageDto
+
+        mock_company_repository.get_by_partial_name.return_value = CompanyPageDto(
+            items=tuple(company_dtos)
+        )
 
         # When
         result = await company_service.get_by_partial_name("테스트", "ko")
 
         # Then
-        assert len(result) == 3
-        assert result[0].company_name == "테스트회사1"
-        assert result[1].company_name == "테스트회사2"
+        assert len(result.items) == 3
+        assert result.items[0].company_name == "테스트회사1"
+        assert result.items[1].company_name == "테스트회사2"
         assert (
-            result[2].company_name == "Test Company 3"
+            result.items[2].company_name == "Test Company 3"
         )  # ko가 없어서 첫 번째 언어 (en)
         mock_company_repository.get_by_partial_name.assert_called_once_with(
-            partial_name="테스트"
+            partial_name="테스트",
+            limit=None,
+            cursor=None,
+            language_code=None,
+            mode="name",
+            fuzzy=False,
         )
 
     async def test_get_by_partial_name_found_with_fallback_language(
         self, company_service, mock_company_repository, company_dtos
     ):
         # Given
-        mock_company_repository.get_by_partial_name.return_value = company_dtos
+        from app.dto.company_dto import CompanyPageDto
+
+        mock_company_repository.get_by_partial_name.return_value = CompanyPageDto(
+            items=tuple(company_dtos)
+        )
 
         # When
         result = await company_service.get_by_partial_name("테스트", "fr")
 
         # Then
-        assert len(result) == 3
-        assert result[0].company_name == "테스트회사1"  # 첫 번째 언어 (ko)
-        assert result[1].company_name == "테스트회사2"  # 첫 번째 언어 (ko)
-        assert result[2].company_name == "Test Company 3"  # 첫 번째 언어 (en)
+        assert len(result.items) == 3
+        assert result.items[0].company_name == "테스트회사1"  # 첫 번째 언어 (ko)
+        assert result.items[1].company_name == "테스트회사2"  # 첫 번째 언어 (ko)
+        assert result.items[2].company_name == "Test Company 3"  # 첫 번째 언어 (en)
         mock_company_repository.get_by_partial_name.assert_called_once_with(
-            partial_name="테스트"
+            partial_name="테스트",
+            limit=None,
+            cursor=None,
+            language_code=None,
+            mode="name",
+            fuzzy=False,
+        )
+
+    async def test_get_by_partial_name_language_only(
+        self, company_service, mock_company_repository
+    ):
+        # Given
+        from app.dto.company_dto import CompanyPageDto
+
+        mock_company_repository.get_by_partial_name.return_value = CompanyPageDto(
+            items=()
+        )
+
+        # When
+        await company_service.get_by_partial_name("테스트", "ko", language_only=True)
+
+        # Then
+        mock_company_repository.get_by_partial_name.assert_called_once_with(
+            partial_name="테스트",
+            limit=None,
+            cursor=None,
+            language_code="ko",
+            mode="name",
+            fuzzy=False,
         )
 
     async def test_get_by_tag_empty_result(
         self, company_service, mock_company_repository
     ):
         # Given
-        mock_company_repository.get_by_tag.return_value = []
+        from app.dto.company_dto import CompanyPageDto
+
+        mock_company_repository.get_by_tag.return_value = CompanyPageDto(items=())
 
         # When
         result = await company_service.get_by_tag("없는태그", "ko")
 
         # Then
-        assert result == []
-        mock_company_repository.get_by_tag.assert_called_once_with(tag="없는태그")
+        assert result.items == ()
+        mock_company_repository.get_by_tag.assert_called_once_with(
+            tag="없는태그", limit=None, cursor=None
+        )
 
     async def test_get_by_tag_found_with_matching_language(
         self, company_service, mock_company_repository, company_dtos
     ):
         # Given
-        mock_company_repository.get_by_tag.return_value = company_dtos
+        from app.dto.company_dto import CompanyPageDto
+
+        mock_company_repository.get_by_tag.return_value = CompanyPageDto(
+            items=tuple(company_dtos)
+        )
 
         # When
         result = await company_service.get_by_tag("태그1", "ko")
 
         # Then
-        assert len(result) == 3
-        assert result[0].company_name == "테스트회사1"
-        assert result[1].company_name == "테스트회사2"
+        assert len(result.items) == 3
+        assert result.items[0].company_name == "테스트회사1"
+        assert result.items[1].company_name == "테스트회사2"
         assert (
-            result[2].company_name == "Test Company 3"
+            result.items[2].company_name == "Test Company 3"
         )  # ko가 없어서 첫 번째 언어 (en)
-        mock_company_repository.get_by_tag.assert_called_once_with(tag="태그1")
+        mock_company_repository.get_by_tag.assert_called_once_with(
+            tag="태그1", limit=None, cursor=None
+        )
 
     async def test_get_by_tag_found_with_japanese_tag_korean_response(
         self, company_service, mock_company_repository, company_dtos
     ):
         # Given
-        mock_company_repository.get_by_tag.return_value = company_dtos
+        from app.dto.company_dto import CompanyPageDto
+
+        mock_company_repository.get_by_tag.return_value = CompanyPageDto(
+            items=tuple(company_dtos)
+        )
 
         # When
         result = await company_service.get_by_tag("タグ1", "ko")
 
         # Then
-        assert len(result) == 3
-        assert result[0].company_name == "테스트회사1"
-        assert result[1].company_name == "테스트회사2"
+        assert len(result.items) == 3
+        assert result.items[0].company_name == "테스트회사1"
+        assert result.items[1].company_name == "테스트회사2"
         assert (
-            result[2].company_name == "Test Company 3"
+            result.items[2].company_name == "Test Company 3"
         )  # ko가 없어서 첫 번째 언어 (en)
-        mock_company_repository.get_by_tag.assert_called_once_with(tag="タグ1")
+        mock_company_repository.get_by_tag.assert_called_once_with(
+            tag="タグ1", limit=None, cursor=None
+        )
 
     async def test_get_by_tag_found_with_fallback_language(
         self, company_service, mock_company_repository, company_dtos
     ):
         # Given
-        mock_company_repository.get_by_tag.return_value = company_dtos
+        from app.dto.company_dto import CompanyPageDto
+
+        mock_company_repository.get_by_tag.return_value = CompanyPageDto(
+            items=tuple(company_dtos)
+        )
 
         # When
         result = await company_service.get_by_tag("tag1", "zh")
 
         # Then
-        assert len(result) == 3
-        assert result[0].company_name == "테스트회사1"  # 첫 번째 언어 (ko)
-        assert result[1].company_name == "테스트회사2"  # 첫 번째 언어 (ko)
-        assert result[2].company_name == "Test Company 3"  # 첫 번째 언어 (en)
-        mock_company_repository.get_by_tag.assert_called_once_with(tag="tag1")
+        assert len(result.items) == 3
+        assert result.items[0].company_name == "테스트회사1"  # 첫 번째 언어 (ko)
+        assert result.items[1].company_name == "테스트회사2"  # 첫 번째 언어 (ko)
+        assert result.items[2].company_name == "Test Company 3"  # 첫 번째 언어 (en)
+        mock_company_repository.get_by_tag.assert_called_once_with(
+            tag="tag1", limit=None, cursor=None
+        )
 
     async def test_get_by_name_with_invalid_company_names_returns_none(
         self, company_service, mock_company_repository
@@ -195,51 +270,56 @@ class TestCompanyService:
         self, company_service, mock_company_repository, company_dtos
     ):
         # Given
-        from app.dto.company_dto import CompanyDto, CompanyNameDto
+        from app.dto.company_dto import CompanyDto, CompanyNameDto, CompanyPageDto
 
         valid_company = CompanyDto(
             names=(CompanyNameDto(language_code="ko", name="테스트회사1"),)
         )
         invalid_company = CompanyDto(names=())
 
-        mock_company_repository.get_by_partial_name.return_value = [
-            valid_company,
-            invalid_company,
-        ]
+        mock_company_repository.get_by_partial_name.return_value = CompanyPageDto(
+            items=(valid_company, invalid_company)
+        )
 
         # When
         result = await company_service.get_by_partial_name("테스트", "ko")
 
         # Then
-        assert len(result) == 1
-        assert result[0].company_name == "테스트회사1"
+        assert len(result.items) == 1
+        assert result.items[0].company_name == "테스트회사1"
         mock_company_repository.get_by_partial_name.assert_called_once_with(
-            partial_name="테스트"
+            partial_name="테스트",
+            limit=None,
+            cursor=None,
+            language_code=None,
+            mode="name",
+            fuzzy=False,
         )
 
     async def test_get_by_tag_with_invalid_company_names_skips_invalid(
         self, company_service, mock_company_repository, company_dtos
     ):
         # Given
-        from app.dto.company_dto import CompanyDto
+        from app.dto.company_dto import CompanyDto, CompanyPageDto
 
         valid_company = company_dtos[0]
         invalid_company = CompanyDto(names=())
 
-        mock_company_repository.get_by_tag.return_value = [
-            valid_company,
-            invalid_company,
-        ]
+        mock_company_repository.get_by_tag.return_value = CompanyPageDto(
+            items=(valid_company, invalid_company)
+        )
 
         # When
         result = await company_service.get_by_tag("태그1", "ko")
 
         # Then
-        assert len(result) == 1
-        assert result[0].company_name == "테스트회사1"
-        mock_company_repository.get_by_tag.assert_called_once_with(tag="태그1")
+        assert len(result.items) == 1
+        assert result.items[0].company_name == "테스트회사1"
+        mock_company_repository.get_by_tag.assert_called_once_with(
+            tag="태그1", limit=None, cursor=None
+        )
 
-    async def test_create_with_existing_tag_adds_missing_language_codes(
+    async def test_create_resolves_tags_in_bulk(
         self, company_service, mock_company_repository, mock_company_tag_repository
     ):
         # Given
@@ -251,35 +331,34 @@ class TestCompanyService:
             CompanyTagNameDto,
         )
 
-        # 기존 태그 (ko만 있음)
-        existing_tag = CompanyTagEntity(
-            id=1, names=(CompanyTagNameEntity(language_code="ko", name="개발"),)
-        )
-
-        # 업데이트된 태그 (ko, en, ja 모두 있음)
-        updated_tag = CompanyTagEntity(
-            id=1,
-            names=(
-                CompanyTagNameEntity(language_code="ko", name="개발"),
-                CompanyTagNameEntity(language_code="en", name="development"),
-                CompanyTagNameEntity(language_code="ja", name="開発"),
+        tag_dtos = (
+            CompanyTagDto(
+                names=(
+                    CompanyTagNameDto(language_code="ko", name="개발"),
+                    CompanyTagNameDto(language_code="en", name="development"),
+                )
+            ),
+            CompanyTagDto(
+                names=(CompanyTagNameDto(language_code="ko", name="새태그"),)
             ),
         )
-
-        mock_company_tag_repository.get_by_names.return_value = existing_tag
-        mock_company_tag_repository.add_missing_names.return_value = updated_tag
+        resolved_tags = [
+            CompanyTagEntity(
+                id=1,
+                names=(
+                    CompanyTagNameEntity(language_code="ko", name="개발"),
+                    CompanyTagNameEntity(language_code="en", name="development"),
+                ),
+            ),
+            CompanyTagEntity(
+                id=2, names=(CompanyTagNameEntity(language_code="ko", name="새태그"),)
+            ),
+        ]
+        mock_company_tag_repository.get_or_create_all.return_value = resolved_tags
 
         company_dto = CompanyDto(
             names=(CompanyNameDto(language_code="ko", name="테스트회사"),),
-            tags=(
-                CompanyTagDto(
-                    names=(
-                        CompanyTagNameDto(language_code="ko", name="개발"),
-                        CompanyTagNameDto(language_code="en", name="development"),
-                        CompanyTagNameDto(language_code="ja", name="開発"),
-                    )
-                ),
-            ),
+            tags=tag_dtos,
         )
 
         # When
@@ -287,22 +366,16 @@ class TestCompanyService:
 
         # Then
         assert result is not None
-        mock_company_tag_repository.get_by_names.assert_called_once()
-        mock_company_tag_repository.add_missing_names.assert_called_once()
-
-        # add_missing_names 호출 인자 확인
-        call_args = mock_company_tag_repository.add_missing_names.call_args
-        assert call_args.kwargs["tag"] == existing_tag
-        expected_names = [
-            CompanyTagNameDto(language_code="ko", name="개발"),
-            CompanyTagNameDto(language_code="en", name="development"),
-            CompanyTagNameDto(language_code="ja", name="開発"),
-        ]
-        assert call_args.kwargs["names"] == expected_names
+        mock_company_tag_repository.get_or_create_all.assert_called_once_with(
+            tags=list(tag_dtos)
+        )
+        mock_company_tag_repository.get_by_names.assert_not_called()
+        mock_company_tag_repository.add_missing_names.assert_not_called()
 
-        mock_company_repository.save.assert_called_once()
+        saved_company = mock_company_repository.save.call_args.kwargs["company"]
+        assert list(saved_company.tags) == resolved_tags
 
-    async def test_add_tags_with_existing_tag_adds_missing_language_codes(
+    async def test_add_tags_resolves_tags_in_bulk(
         self, company_service, mock_company_repository, mock_company_tag_repository
     ):
         # Given
@@ -314,44 +387,25 @@ class TestCompanyService:
         )
         from app.dto.company_dto import CompanyTagDto, CompanyTagNameDto
 
-        # 기존 태그 (ko, en만 있음)
-        existing_tag = CompanyTagEntity(
-            id=1,
-            names=(
-                CompanyTagNameEntity(language_code="ko", name="스타트업"),
-                CompanyTagNameEntity(language_code="en", name="startup"),
-            ),
-        )
-
-        # 업데이트된 태그 (ko, en, fr, de 모두 있음)
-        updated_tag = CompanyTagEntity(
+        resolved_tag = CompanyTagEntity(
             id=1,
             names=(
                 CompanyTagNameEntity(language_code="ko", name="스타트업"),
                 CompanyTagNameEntity(language_code="en", name="startup"),
-                CompanyTagNameEntity(language_code="fr", name="startup"),
-                CompanyTagNameEntity(language_code="de", name="startup"),
             ),
         )
-
-        # 업데이트된 회사 엔티티
-        updated_company = CompanyEntity(
+        mock_company_tag_repository.get_or_create_all.return_value = [resolved_tag]
+        mock_company_repository.add_tag.return_value = CompanyEntity(
             id="test-id",
             names=(CompanyNameEntity(language_code="ko", name="테스트회사"),),
-            tags=(updated_tag,),
+            tags=(resolved_tag,),
         )
 
-        mock_company_tag_repository.get_by_names.return_value = existing_tag
-        mock_company_tag_repository.add_missing_names.return_value = updated_tag
-        mock_company_repository.add_tag.return_value = updated_company
-
         tags = [
             CompanyTagDto(
                 names=(
                     CompanyTagNameDto(language_code="ko", name="스타트업"),
                     CompanyTagNameDto(language_code="en", name="startup"),
-                    CompanyTagNameDto(language_code="fr", name="startup"),
-                    CompanyTagNameDto(language_code="de", name="startup"),
                 )
             )
         ]
@@ -361,54 +415,95 @@ class TestCompanyService:
 
         # Then
         assert result is not None
-        mock_company_tag_repository.get_by_names.assert_called_once()
-        mock_company_tag_repository.add_missing_names.assert_called_once()
-
-        # add_missing_names 호출 인자 확인
-        call_args = mock_company_tag_repository.add_missing_names.call_args
-        assert call_args.kwargs["tag"] == existing_tag
-        expected_names = [
-            CompanyTagNameDto(language_code="ko", name="스타트업"),
-            CompanyTagNameDto(language_code="en", name="startup"),
-            CompanyTagNameDto(language_code="fr", name="startup"),
-            CompanyTagNameDto(language_code="de", name="startup"),
-        ]
-        assert call_args.kwargs["names"] == expected_names
-
+        mock_company_tag_repository.get_or_create_all.assert_called_once_with(tags=tags)
         mock_company_repository.add_tag.assert_called_once_with(
-            name="테스트회사", tags=[updated_tag]
+            name="테스트회사", tags=[resolved_tag]
         )
 
-    async def test_create_with_new_tag_does_not_call_add_missing_names(
-        self, company_service, mock_company_repository, mock_company_tag_repository
+    async def test_create_adds_names_to_autocomplete_index(
+        self, company_service_with_index, mock_company_repository
     ):
         # Given
-        from app.dto.company_dto import (
-            CompanyDto,
-            CompanyNameDto,
-            CompanyTagDto,
-            CompanyTagNameDto,
+        from app.domain.company_entity import CompanyEntity, CompanyNameEntity
+        from app.dto.company_dto import CompanyDto, CompanyNameDto
+
+        company_service, autocomplete_index = company_service_with_index
+        mock_company_repository.save.return_value = CompanyEntity(
+            id="company-id",
+            names=(
+                CompanyNameEntity(language_code="ko", name="새회사"),
+                CompanyNameEntity(language_code="en", name="New Co"),
+            ),
+        )
+        company_dto = CompanyDto(
+            names=(
+                CompanyNameDto(language_code="ko", name="새회사"),
+                CompanyNameDto(language_code="en", name="New Co"),
+            )
         )
 
-        mock_company_tag_repository.get_by_names.return_value = None
+        # When
+        await company_service.create(company_dto, "ko")
 
-        company_dto = CompanyDto(
-            names=(CompanyNameDto(language_code="ko", name="테스트회사"),),
-            tags=(
-                CompanyTagDto(
-                    names=(
-                        CompanyTagNameDto(language_code="ko", name="새태그"),
-                        CompanyTagNameDto(language_code="en", name="new tag"),
-                    )
-                ),
-            ),
+        # Then
+        autocomplete_index.add_company.assert_awaited_once_with(
+            "company-id", [("ko", "새회사"), ("en", "New Co")]
+        )
+
+    async def test_tag_changes_update_tag_index_after_commit(
+        self, company_service_with_tag_index, mock_company_repository, company_entity
+    ):
+        # Given
+        from dataclasses import replace
+
+        company_service, tag_index = company_service_with_tag_index
+        mock_company_repository.add_tag.return_value = company_entity
+        mock_company_repository.remove_tag.return_value = replace(
+            company_entity, tags=company_entity.tags[:1]
         )
 
         # When
-        result = await company_service.create(company_dto, "ko")
+        await company_service.add_tags("테스트회사", [], "ko")
+        await company_service.remove_tag("테스트회사", "태그2", "ko")
+
+        # Then (회사의 전체 태그 상태를 반영)
+        names = [("ko", "테스트회사"), ("en", "Test Company"), ("jp", "テスト会社")]
+        tag1 = [("ko", "태그1"), ("en", "tag1"), ("jp", "タグ1")]
+        tag2 = [("ko", "태그2"), ("en", "tag2")]
+        assert tag_index.update_company.await_args_list[0].args == (
+            "test-id",
+            names,
+            tag1 + tag2,
+        )
+        assert tag_index.update_company.await_args_list[1].args == (
+            "test-id",
+            names,
+            tag1,
+        )
+
+    async def test_failed_tag_change_does_not_update_tag_index(
+        self, company_service_with_tag_index, mock_company_repository
+    ):
+        # Given
+        company_service, tag_index = company_service_with_tag_index
+        mock_company_repository.remove_tag.side_effect = RuntimeError("db error")
+
+        # When / Then
+        with pytest.raises(RuntimeError):
+            await company_service.remove_tag("테스트회사", "태그1", "ko")
+        tag_index.update_company.assert_not_called()
+
+    async def test_autocomplete_uses_index(self, company_service_with_index):
+        # Given
+        company_service, autocomplete_index = company_service_with_index
+        autocomplete_index.search.return_value = ["원티드랩", "원티드랩스"]
+
+        # When
+        result = await company_service.autocomplete("원티", "ko", limit=2)
 
         # Then
-        assert result is not None
-        mock_company_tag_repository.get_by_names.assert_called_once()
-        mock_company_tag_repository.add_missing_names.assert_not_called()
-        mock_company_repository.save.assert_called_once()
+        assert [company.company_name for company in result] == [
+            "원티드랩",
+            "원티드랩스",
+        ]
+        autocomplete_index.search.assert_called_once_with("원티", "ko", 2)
@@ -0,0 +1,150 @@
+import asyncio
+import gzip
+
+import pytest
+from sqlalchemy import func, select
+
+CSV_TEXT = "company_ko,company_en,company_ja,tag_ko,tag_en,tag_ja\n" + "".join(
+    f"회사{i},Company {i},,태그{i % 3},tag{i % 3},\n" for i in range(20)
+)
+BOUNDARY = b"----boundary1234"
+
+
+def _multipart_body(content: bytes) -> bytes:
+    return (
+        b"preamble\r\n"
+        + b"--" + BOUNDARY + b"\r\n"
+        + b'Content-Disposition: form-data; name="note"\r\n\r\n'
+        + b"--not a boundary\r\n"
+        + b"--" + BOUNDARY + b"\r\n"
+        + b'Content-Disposition: form-data; name="file"; filename="companies.csv"\r\n'
+        + b"Content-Type: text/csv\r\n\r\n"
+        + content
+        + b"\r\n--" + BOUNDARY + b"--\r\n"
+    )  # fmt: skip
+
+
+async def _split(data: bytes, size: int):
+    # 네트워크에서 작은 청크로 나뉘어 도착하는 본문
+    for start in range(0, len(data), size):
+        yield data[start : start + size]
+
+
+def _multipart_chunks(body: bytes):
+    from app.services.csv_upload import multipart_file_chunks
+
+    return multipart_file_chunks(_split(body, 11), BOUNDARY)
+
+
+async def _collect(chunks) -> bytes:
+    return b"".join([chunk async for chunk in chunks])
+
+
+class TestCsvUpload:
+    @pytest.mark.parametrize("size", [1, 7, 4096])
+    async def test_multipart_file_chunks_yields_file_part(self, size):
+        # Given
+        from app.services.csv_upload import multipart_file_chunks
+
+        body = _multipart_body(CSV_TEXT.encode())
+
+        # When
+        content = await _collect(multipart_file_chunks(_split(body, size), BOUNDARY))
+
+        # Then
+        assert content == CSV_TEXT.encode()
+
+    async def test_multipart_without_file_part(self):
+        # Given
+        from app.services.csv_upload import CsvUploadError, multipart_file_chunks
+
+        body = (
+            b"--" + BOUNDARY + b"\r\n"
+            + b'Content-Disposition: form-data; name="note"\r\n\r\nhello'
+            + b"\r\n--" + BOUNDARY + b"--\r\n"
+        )  # fmt: skip
+
+        # When / Then
+        with pytest.raises(CsvUploadError):
+            await _collect(multipart_file_chunks(_split(body, 5), BOUNDARY))
+
+    def test_multipart_boundary(self):
+        # Given
+        from app.services.csv_upload import multipart_boundary
+
+        # When / Then
+        assert multipart_boundary('multipart/form-data; boundary="ab c"') == b"ab c"
+        assert multipart_boundary("text/csv") is None
+
+    @pytest.mark.parametrize("compress", [False, True])
+    async def test_maybe_gunzip_chunks(self, compress):
+        # Given
+        from app.services.csv_upload import maybe_gunzip_chunks
+
+        data = CSV_TEXT.encode()
+        if compress:
+            data = gzip.compress(data[:100]) + gzip.compress(data[100:])
+
+        # When
+        content = await _collect(maybe_gunzip_chunks(_split(data, 3)))
+
+        # Then
+        assert content == CSV_TEXT.encode()
+
+    async def test_gunzip_chunks_bounds_output_size(self):
+        # Given
+        from app.services.csv_upload import gunzip_chunks
+
+        data = gzip.compress(b"a" * 1_000_000)
+
+        # When
+        sizes = [len(chunk) async for chunk in gunzip_chunks(_split(data, 1024), 4096)]
+
+        # Then
+        assert sum(sizes) == 1_000_000
+        assert max(sizes) <= 4096
+
+    async def test_import_from_upload_stream(self, file_session_factory):
+        # Given
+        from app.db.models import Company, CompanyTag
+        from app.services.csv_upload import open_upload_stream
+        from app.services.data_importer import DataImporterService
+
+        body = _multipart_body(gzip.compress(CSV_TEXT.encode()))
+        csv_file = open_upload_stream(
+            _multipart_chunks(body), asyncio.get_running_loop()
+        )
+
+        # When
+        result = await DataImporterService(
+            file_session_factory, parallelism=2
+        ).import_csv(csv_file, chunk_size=3)
+        csv_file.close()
+
+        # Then
+        assert result == (20, 3)
+        async with file_session_factory() as session:
+            assert await session.scalar(select(func.count()).select_from(Company)) == 20
+            assert (
+                await session.scalar(select(func.count()).select_from(CompanyTag)) == 3
+            )
+
+    async def test_upload_stream_read_times_out(self):
+        # Given
+        from app.services.csv_upload import CsvUploadError, open_upload_stream
+
+        async def _stalled():
+            # 헤더 일부만 보내고 더 이상 본문이 오지 않는 연결
+            yield b"company_ko,"
+            await asyncio.Event().wait()
+
+        csv_file = open_upload_stream(
+            _stalled(), asyncio.get_running_loop(), timeout=0.05
+        )
+
+        # When / Then
+        try:
+            with pytest.raises(CsvUploadError):
+                await asyncio.wait_for(asyncio.to_thread(csv_file.read), timeout=1)
+        finally:
+            await asyncio.to_thread(csv_file.close)
@@ -0,0 +1,115 @@
+import gzip
+import json
+
+
+async def _collect(chunks):
+    return b"".join([chunk async for chunk in chunks])
+
+
+class TestDataExporterService:
+    async def test_export_companies_with_names_and_tags(
+        self, async_session, session_factory
+    ):
+        # Given
+        from app.db.models import Company, CompanyName, CompanyTag, CompanyTagName
+        from app.services.data_exporter import DataExporterService
+
+        tag = CompanyTag()
+        tag.names.append(CompanyTagName(language_code="ko", name="내보내기태그"))
+        tag.names.append(CompanyTagName(language_code="en", name="export tag"))
+        tagged = Company()
+        tagged.names.append(CompanyName(language_code="ko", name="내보내기회사"))
+        tagged.names.append(CompanyName(language_code="en", name="Export Co"))
+        tagged.tags.append(tag)
+        untagged = Company()
+        untagged.names.append(CompanyName(language_code="en", name="No Tag Co"))
+        async_session.add_all([tagged, untagged])
+        await async_session.flush()
+
+        # When
+        rows = [
+            row async for row in DataExporterService(session_factory).export_companies()
+        ]
+
+        # Then
+        assert sorted(rows, key=lambda row: row["id"]) == sorted(
+            [
+                {
+                    "id": str(tagged.id),
+                    "company_name": {"ko": "내보내기회사", "en": "Export Co"},
+                    "tags": [{"tag_name": {"ko": "내보내기태그", "en": "export tag"}}],
+                },
+                {
+                    "id": str(untagged.id),
+                    "company_name": {"en": "No Tag Co"},
+                    "tags": [],
+                },
+            ],
+            key=lambda row: row["id"],
+        )
+
+    async def test_export_projects_language(self, async_session, session_factory):
+        # Given
+        from app.db.models import Company, CompanyName, CompanyTag, CompanyTagName
+        from app.services.data_exporter import DataExporterService
+
+        ko_tag = CompanyTag()
+        ko_tag.names.append(CompanyTagName(language_code="ko", name="한국어태그"))
+        ko_tag.names.append(CompanyTagName(language_code="en", name="korean tag"))
+        en_tag = CompanyTag()
+        en_tag.names.append(CompanyTagName(language_code="en", name="english only"))
+        company = Company()
+        company.names.append(CompanyName(language_code="ko", name="언어회사"))
+        company.names.append(CompanyName(language_code="en", name="Language Co"))
+        company.tags.extend([ko_tag, en_tag])
+        # 한국어 회사명이 없는 회사는 내보내지 않음
+        en_only = Company()
+        en_only.names.append(CompanyName(language_code="en", name="English Only Co"))
+        en_only.tags.append(ko_tag)
+        async_session.add_all([company, en_only])
+        await async_session.flush()
+
+        # When
+        rows = [
+            row
+            async for row in DataExporterService(session_factory).export_companies(
+                language_code="ko"
+            )
+        ]
+
+        # Then
+        assert rows == [
+            {
+                "id": str(company.id),
+                "company_name": {"ko": "언어회사"},
+                "tags": [{"tag_name": {"ko": "한국어태그"}}],
+            }
+        ]
+
+    async def test_export_ndjson_is_flushed_in_chunks(
+        self, async_session, session_factory, monkeypatch
+    ):
+        # Given
+        from app.db.models import Company, CompanyName
+        from app.services import data_exporter
+        from app.services.data_exporter import DataExporterService, gzip_chunks
+
+        for i in range(5):
+            company = Company()
+            company.names.append(CompanyName(language_code="ko", name=f"청크회사{i}"))
+            async_session.add(company)
+        await async_session.flush()
+        monkeypatch.setattr(data_exporter, "EXPORT_CHUNK_SIZE", 1)
+        exporter = DataExporterService(session_factory)
+
+        # When
+        chunks = [chunk async for chunk in exporter.export_ndjson()]
+        compressed = await _collect(gzip_chunks(exporter.export_ndjson()))
+
+        # Then
+        assert len(chunks) == 5
+        assert gzip.decompress(compressed) == b"".join(chunks)
+        assert sorted(
+            json.loads(line)["company_name"]["ko"]
+            for line in b"".join(chunks).splitlines()
+        ) == [f"청크회사{i}" for i in range(5)]
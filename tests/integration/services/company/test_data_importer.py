@@ -0,0 +1,107 @@
+import asyncio
+import threading
+
+import pytest
+from sqlalchemy import func, select
+
+CSV_HEADER = "company_ko,company_en,company_ja,tag_ko,tag_en,tag_ja\n"
+
+
+def _write_csv(path, lines):
+    path.write_text(CSV_HEADER + "".join(f"{line}\n" for line in lines))
+    return path
+
+
+async def _count(session_factory, table):
+    async with session_factory() as session:
+        return await session.scalar(select(func.count()).select_from(table))
+
+
+class TestDataImporterService:
+    async def test_parallel_writers_share_tags(self, file_session_factory, tmp_path):
+        # Given
+        from app.db.models import CompanyName, CompanyTag, CompanyTagName, company_tag
+        from app.services.data_importer import DataImporterService
+
+        csv_path = _write_csv(
+            tmp_path / "companies.csv",
+            [
+                f"회사{i},Company {i},,태그{i % 5}|태그{(i + 1) % 5},tag{i % 5}|tag{(i + 1) % 5},"
+                for i in range(30)
+            ],
+        )
+        importer = DataImporterService(
+            file_session_factory, parallelism=3, queue_size=1
+        )
+
+        # When
+        result = await asyncio.wait_for(importer.import_csv(csv_path, chunk_size=2), 10)
+
+        # Then
+        assert result == (30, 5)
+        assert await _count(file_session_factory, CompanyName) == 60
+        assert await _count(file_session_factory, CompanyTag) == 5
+        assert await _count(file_session_factory, CompanyTagName) == 10
+        assert await _count(file_session_factory, company_tag) == 60
+
+    async def test_rows_are_parsed_off_the_event_loop(
+        self, file_session_factory, tmp_path, monkeypatch
+    ):
+        # Given
+        from app.services import data_importer
+
+        threads = []
+        prepare_chunk = data_importer.prepare_chunk
+
+        def _prepare_chunk(raw_rows):
+            threads.append(threading.current_thread())
+            return prepare_chunk(raw_rows)
+
+        monkeypatch.setattr(data_importer, "prepare_chunk", _prepare_chunk)
+        csv_path = _write_csv(
+            tmp_path / "companies.csv", [f"회사{i},,,,," for i in range(10)]
+        )
+
+        # When
+        await data_importer.DataImporterService(
+            file_session_factory, parallelism=2
+        ).import_csv(csv_path, chunk_size=3)
+
+        # Then
+        assert len(threads) == 4
+        assert threading.main_thread() not in threads
+
+    async def test_failed_chunk_stops_other_writers(
+        self, file_session_factory, tmp_path
+    ):
+        # Given
+        from app.services.data_importer import (
+            DataImporterService,
+            DataInitializationError,
+        )
+
+        csv_path = _write_csv(
+            tmp_path / "companies.csv",
+            [f"회사{i},,,,," for i in range(20)] + ["회사0,,,,,"],
+        )
+        importer = DataImporterService(file_session_factory, parallelism=3)
+
+        # When / Then
+        with pytest.raises(DataInitializationError, match="19~21번째 줄"):
+            await asyncio.wait_for(importer.import_csv(csv_path, chunk_size=3), 10)
+
+    async def test_missing_column_is_reported_with_line(
+        self, file_session_factory, tmp_path
+    ):
+        # Given
+        from app.services.data_importer import (
+            DataImporterService,
+            DataInitializationError,
+        )
+
+        csv_path = tmp_path / "companies.csv"
+        csv_path.write_text("company_ko,company_en\n원티드랩,Wantedlab\n")
+
+        # When / Then
+        with pytest.raises(DataInitializationError, match="1번째 줄"):
+            await DataImporterService(file_session_factory).import_csv(csv_path)
@@ -0,0 +1,118 @@
+import pytest
+from sqlalchemy import event, select
+
+CSV_HEADER = "company_ko,company_en,company_ja,tag_ko,tag_en,tag_ja\n"
+
+
+def _write_csv(path, lines):
+    path.write_text(CSV_HEADER + "".join(f"{line}\n" for line in lines))
+    return path
+
+
+async def _load_companies(async_session):
+    # {회사명 집합: 태그명 집합들}
+    from sqlalchemy.orm import selectinload
+
+    from app.db.models import Company, CompanyTag
+
+    result = await async_session.execute(
+        select(Company).options(
+            selectinload(Company.names),
+            selectinload(Company.tags).selectinload(CompanyTag.names),
+        )
+    )
+    return {
+        frozenset((name.language_code, name.name) for name in company.names): {
+            frozenset((name.language_code, name.name) for name in tag.names)
+            for tag in company.tags
+        }
+        for company in result.scalars().all()
+    }
+
+
+class TestDataInitializerService:
+    @pytest.mark.parametrize("bulk", [False, True])
+    async def test_initialize_data_from_csv(self, async_session, tmp_path, bulk):
+        # Given
+        from app.services.data_initializer import DataInitializerService
+
+        csv_path = _write_csv(
+            tmp_path / "companies.csv",
+            [
+                "원티드랩,Wantedlab,,태그_1|태그_2,tag_1|tag_2,タグ_1|タグ_2",
+                ",,,태그_1,tag_1,タグ_1",
+                "링크드코리아,,リンクドコリア,태그_2,tag_2,タグ_2",
+                " 스피링크 ,,,,,",
+                "테크랩,Tech Lab,,태그_3|,tag_3|tag_4,",
+            ],
+        )
+
+        # When
+        result = await DataInitializerService(async_session).initialize_data_from_csv(
+            csv_path, bulk=bulk, chunk_size=2
+        )
+
+        # Then
+        assert result["companies_count"] == 4
+        assert result["tags_count"] == 4
+        tag_1 = frozenset({("ko", "태그_1"), ("en", "tag_1"), ("jp", "タグ_1")})
+        tag_2 = frozenset({("ko", "태그_2"), ("en", "tag_2"), ("jp", "タグ_2")})
+        assert await _load_companies(async_session) == {
+            frozenset({("ko", "원티드랩"), ("en", "Wantedlab")}): {tag_1, tag_2},
+            frozenset({("ko", "링크드코리아"), ("jp", "リンクドコリア")}): {tag_2},
+            frozenset({("ko", "스피링크")}): set(),
+            frozenset({("ko", "테크랩"), ("en", "Tech Lab")}): {
+                frozenset({("ko", "태그_3"), ("en", "tag_3")}),
+                frozenset({("en", "tag_4")}),
+            },
+        }
+
+    async def test_bulk_import_uses_multi_row_inserts_per_chunk(
+        self, async_session, _test_engine, tmp_path
+    ):
+        # Given
+        from app.services.data_initializer import DataInitializerService
+
+        csv_path = _write_csv(
+            tmp_path / "companies.csv",
+            [f"회사{i},Company {i},,태그{i},tag{i}," for i in range(6)],
+        )
+        statements = []
+
+        def _record(conn, cursor, statement, parameters, context, executemany):
+            if statement.startswith("INSERT"):
+                statements.append(statement)
+
+        event.listen(_test_engine.sync_engine, "before_cursor_execute", _record)
+
+        # When
+        try:
+            result = await DataInitializerService(
+                async_session
+            ).initialize_data_from_csv(csv_path, bulk=True, chunk_size=3)
+        finally:
+            event.remove(_test_engine.sync_engine, "before_cursor_execute", _record)
+
+        # Then
+        assert result["companies_count"] == 6
+        assert result["tags_count"] == 6
+        # 청크마다 태그 ID 발급 1번 + 테이블 4개에 각 1번
+        assert len(statements) == 2 * 5
+
+    async def test_bulk_import_reports_failed_chunk(self, async_session, tmp_path):
+        # Given
+        from app.services.data_initializer import (
+            DataInitializationError,
+            DataInitializerService,
+        )
+
+        csv_path = _write_csv(
+            tmp_path / "companies.csv",
+            ["회사1,,,,,", "회사2,,,,,", "회사3,,,,,", "회사3,,,,,"],
+        )
+
+        # When / Then
+        with pytest.raises(DataInitializationError, match="3~4번째 줄"):
+            await DataInitializerService(async_session).initialize_data_from_csv(
+                csv_path, bulk=True, chunk_size=2
+            )
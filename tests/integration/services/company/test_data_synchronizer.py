@@ -0,0 +1,168 @@
+import pytest
+from sqlalchemy import event, select
+
+CSV_HEADER = "company_ko,company_en,company_ja,tag_ko,tag_en,tag_ja\n"
+
+
+def _write_csv(path, lines):
+    path.write_text(CSV_HEADER + "".join(f"{line}\n" for line in lines))
+    return path
+
+
+async def _load_companies(async_session):
+    # {회사명 집합: 태그명 집합들}
+    from sqlalchemy.orm import selectinload
+
+    from app.db.models import Company, CompanyTag
+
+    async_session.expire_all()
+    result = await async_session.execute(
+        select(Company).options(
+            selectinload(Company.names),
+            selectinload(Company.tags).selectinload(CompanyTag.names),
+        )
+    )
+    return {
+        frozenset((name.language_code, name.name) for name in company.names): {
+            frozenset((name.language_code, name.name) for name in tag.names)
+            for tag in company.tags
+        }
+        for company in result.scalars().all()
+    }
+
+
+INITIAL_ROWS = [
+    "원티드랩,Wantedlab,,태그_1|태그_2,tag_1|tag_2,",
+    "링크드코리아,,,태그_2,tag_2,",
+    "스피링크,,,,,",
+]
+
+
+class TestDataSynchronizerService:
+    async def test_sync_applies_only_changes(self, async_session, tmp_path):
+        # Given
+        from app.services.data_initializer import DataInitializerService
+
+        initializer = DataInitializerService(async_session)
+        await initializer.initialize_data_from_csv(
+            _write_csv(tmp_path / "initial.csv", INITIAL_ROWS), bulk=True
+        )
+        csv_path = _write_csv(
+            tmp_path / "nightly.csv",
+            [
+                # 태그_2 연결 해제, 영문명 변경
+                "원티드랩,Wanted Lab,,태그_1,tag_1,",
+                # 변경 없음
+                "링크드코리아,,,태그_2,tag_2,",
+                # 태그 연결 추가
+                "스피링크,,,태그_3,tag_3,",
+                # 새 회사
+                "테크랩,Tech Lab,,태그_1,tag_1,",
+            ],
+        )
+
+        # When
+        result = await initializer.initialize_data_from_csv(
+            csv_path, sync=True, chunk_size=2
+        )
+
+        # Then
+        assert result["inserted"] == 1
+        assert result["updated"] == 2
+        assert result["unchanged"] == 1
+        assert result["linked"] == 2
+        assert result["unlinked"] == 1
+        assert result["changed"] is True
+        tag_1 = frozenset({("ko", "태그_1"), ("en", "tag_1")})
+        tag_2 = frozenset({("ko", "태그_2"), ("en", "tag_2")})
+        tag_3 = frozenset({("ko", "태그_3"), ("en", "tag_3")})
+        assert await _load_companies(async_session) == {
+            frozenset({("ko", "원티드랩"), ("en", "Wanted Lab")}): {tag_1},
+            frozenset({("ko", "링크드코리아")}): {tag_2},
+            frozenset({("ko", "스피링크")}): {tag_3},
+            frozenset({("ko", "테크랩"), ("en", "Tech Lab")}): {tag_1},
+        }
+
+    async def test_sync_is_idempotent(self, async_session, _test_engine, tmp_path):
+        # Given
+        from app.services.data_initializer import DataInitializerService
+
+        csv_path = _write_csv(tmp_path / "companies.csv", INITIAL_ROWS)
+        initializer = DataInitializerService(async_session)
+        await initializer.initialize_data_from_csv(csv_path, sync=True)
+        statements = []
+
+        def _record(conn, cursor, statement, parameters, context, executemany):
+            if statement.startswith(("INSERT", "UPDATE", "DELETE")):
+                statements.append(statement)
+
+        event.listen(_test_engine.sync_engine, "before_cursor_execute", _record)
+
+        # When
+        try:
+            result = await initializer.initialize_data_from_csv(csv_path, sync=True)
+        finally:
+            event.remove(_test_engine.sync_engine, "before_cursor_execute", _record)
+
+        # Then
+        assert result["inserted"] == result["updated"] == 0
+        assert result["unchanged"] == 3
+        assert result["changed"] is False
+        assert statements == []
+
+    async def test_sync_invalidates_only_changed_entities(
+        self, async_session, tmp_path, mock_company_repository
+    ):
+        # Given
+        from app.mappers.company_tag_mapper import CompanyTagMapper
+        from app.repositories.company_tag_repository import CompanyTagRepository
+        from app.services.data_synchronizer import DataSynchronizerService
+
+        synchronizer = DataSynchronizerService(
+            async_session,
+            CompanyTagRepository(
+                db=async_session, company_tag_mapper=CompanyTagMapper()
+            ),
+            company_repo=mock_company_repository,
+        )
+        await synchronizer.sync_csv(_write_csv(tmp_path / "initial.csv", INITIAL_ROWS))
+        mock_company_repository.invalidate.reset_mock()
+        csv_path = _write_csv(
+            tmp_path / "nightly.csv",
+            [
+                "원티드랩,Wantedlab,,태그_1,tag_1,",
+                "링크드코리아,,,태그_2,tag_2,",
+                "스피링크,,,,,",
+            ],
+        )
+
+        # When
+        await synchronizer.sync_csv(csv_path)
+
+        # Then
+        mock_company_repository.invalidate.assert_awaited_once()
+        kwargs = mock_company_repository.invalidate.await_args.kwargs
+        assert set(kwargs["company_names"]) == {"원티드랩", "Wantedlab"}
+        assert set(kwargs["tag_names"]) == {"태그_2", "tag_2"}
+
+    async def test_sync_rejects_names_of_different_companies(
+        self, async_session, tmp_path
+    ):
+        # Given
+        from app.services.data_initializer import (
+            DataInitializationError,
+            DataInitializerService,
+        )
+
+        initializer = DataInitializerService(async_session)
+        await initializer.initialize_data_from_csv(
+            _write_csv(tmp_path / "initial.csv", INITIAL_ROWS), sync=True
+        )
+        csv_path = _write_csv(
+            tmp_path / "nightly.csv", ["스피링크,Wantedlab,,,,", "링크드코리아,,,,,"]
+        )
+
+        # When / Then
+        with pytest.raises(DataInitializationError, match="1~2번째 줄") as exc_info:
+            await initializer.initialize_data_from_csv(csv_path, sync=True)
+        assert "1번째 줄의 회사명" in str(exc_info.value)
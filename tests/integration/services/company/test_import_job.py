@@ -0,0 +1,224 @@
+import asyncio
+import time
+
+import pytest
+
+
+@pytest.fixture()
+def job_manager(redis_client):
+    from app.services.import_job import ImportJobManager
+
+    return ImportJobManager(redis_client, heartbeat_interval=0.01)
+
+
+class TestImportJobManager:
+    async def test_job_reports_progress_and_result(self, job_manager):
+        # Given
+        async def _run(on_progress):
+            on_progress(3)
+            on_progress(2)
+            return {"companies_count": 5}
+
+        # When
+        job_id = await job_manager.start(_run, total_rows=5)
+        await job_manager.join()
+
+        # Then
+        job = await job_manager.get(job_id)
+        assert job["status"] == "succeeded"
+        assert job["rows_processed"] == 5
+        assert job["total_rows"] == 5
+        assert job["eta_seconds"] is None
+        assert job["result"] == {"companies_count": 5}
+
+    async def test_running_job_reports_eta(self, job_manager):
+        # Given
+        started = asyncio.Event()
+        release = asyncio.Event()
+
+        async def _run(on_progress):
+            on_progress(10)
+            started.set()
+            await release.wait()
+            return {}
+
+        job_id = await job_manager.start(_run, total_rows=40)
+        await started.wait()
+        await asyncio.sleep(0.05)  # heartbeat 로 진행 상황 저장
+
+        # When
+        job = await job_manager.get(job_id)
+
+        # Then
+        assert job["status"] == "running"
+        assert job["rows_processed"] == 10
+        assert job["rows_per_second"] > 0
+        assert job["eta_seconds"] > 0
+        release.set()
+        await job_manager.join()
+
+    async def test_only_one_job_runs_across_workers(self, job_manager, redis_client):
+        # Given
+        from app.services.import_job import ImportJobConflictError, ImportJobManager
+
+        release = asyncio.Event()
+
+        async def _run(on_progress):
+            await release.wait()
+            return {}
+
+        other_worker = ImportJobManager(redis_client)
+        await job_manager.start(_run)
+
+        # When / Then
+        with pytest.raises(ImportJobConflictError):
+            await other_worker.start(_run)
+        release.set()
+        await job_manager.join()
+        # 작업이 끝나면 락이 해제됨
+        await other_worker.start(_run)
+        await other_worker.join()
+
+    async def test_cancel_from_other_worker(self, job_manager, redis_client):
+        # Given
+        from app.services.import_job import IMPORT_LOCK_KEY, ImportJobManager
+
+        started = asyncio.Event()
+
+        async def _run(on_progress):
+            started.set()
+            await asyncio.Event().wait()
+
+        job_id = await job_manager.start(_run)
+        await started.wait()
+
+        task = job_manager._tasks[job_id]
+
+        # When
+        assert await ImportJobManager(redis_client).cancel(job_id)
+        await asyncio.wait_for(job_manager.join(), timeout=1)
+
+        # Then
+        job = await job_manager.get(job_id)
+        assert job["status"] == "cancelled"
+        assert job["cancel_requested"]
+        # 종료 시 취소를 기다리는 쪽에서도 취소로 보임
+        assert task.cancelled()
+        assert await redis_client.exists(IMPORT_LOCK_KEY) == 0
+
+    async def test_cancelled_waiter_cancels_job(self, job_manager, redis_client):
+        # Given
+        from app.services.import_job import IMPORT_LOCK_KEY
+
+        started = asyncio.Event()
+
+        async def _run(on_progress):
+            started.set()
+            await asyncio.Event().wait()
+
+        job_id = await job_manager.start(_run)
+        await started.wait()
+        waiter = asyncio.create_task(job_manager.wait(job_id, cancel_on_exit=True))
+        await asyncio.sleep(0)
+
+        # When (업로드 요청의 연결이 끊긴 경우)
+        waiter.cancel()
+        await asyncio.wait_for(job_manager.join(), timeout=1)
+
+        # Then
+        assert waiter.cancelled()
+        job = await job_manager.get(job_id)
+        assert job["status"] == "cancelled"
+        assert await redis_client.exists(IMPORT_LOCK_KEY) == 0
+
+    async def test_job_stops_when_lock_is_taken_by_other_owner(
+        self, job_manager, redis_client
+    ):
+        # Given
+        from app.services.import_job import IMPORT_LOCK_KEY, LOCK_LOST_ERROR
+
+        started = asyncio.Event()
+
+        async def _run(on_progress):
+            started.set()
+            await asyncio.Event().wait()
+
+        job_id = await job_manager.start(_run)
+        await started.wait()
+
+        # When (락이 만료되어 다른 워커의 작업이 락을 잡은 경우)
+        await redis_client.set(IMPORT_LOCK_KEY, "other-job")
+        await asyncio.wait_for(job_manager.join(), timeout=1)
+
+        # Then
+        job = await job_manager.get(job_id)
+        assert job["status"] == "failed"
+        assert job["error"] == LOCK_LOST_ERROR
+        assert await redis_client.get(IMPORT_LOCK_KEY) == b"other-job"
+
+    async def test_job_without_lock_is_reported_failed(self, redis_client):
+        # Given
+        from app.services.import_job import (
+            LOCK_LOST_ERROR,
+            ImportJobManager,
+            import_job_key,
+        )
+
+        # 실행하던 워커가 종료되어 상태는 running 이지만 락은 만료된 작업
+        now = time.time()
+        await redis_client.hset(
+            import_job_key("dead-job"),
+            mapping={
+                "id": "dead-job",
+                "status": "running",
+                "rows_processed": 10,
+                "started_at": now,
+                "updated_at": now,
+            },
+        )
+        job_manager = ImportJobManager(redis_client)
+
+        # When
+        job = await job_manager.get("dead-job")
+
+        # Then
+        assert job["status"] == "failed"
+        assert job["error"] == LOCK_LOST_ERROR
+        assert not await job_manager.cancel("dead-job")
+
+    async def test_failed_job_records_error(self, job_manager):
+        # Given
+        from app.services.data_initializer import DataInitializationError
+
+        async def _run(on_progress):
+            raise DataInitializationError("CSV 파일 3번째 줄 처리 중 오류 발생")
+
+        # When
+        job_id = await job_manager.start(_run)
+        await job_manager.join()
+
+        # Then
+        job = await job_manager.get(job_id)
+        assert job["status"] == "failed"
+        assert job["error"] == "CSV 파일 3번째 줄 처리 중 오류 발생"
+        assert not await job_manager.cancel(job_id)
+
+    async def test_start_releases_lock_when_job_state_cannot_be_saved(
+        self, job_manager, redis_client, monkeypatch
+    ):
+        # Given
+        from app.services.import_job import IMPORT_LOCK_KEY
+
+        async def _run(on_progress):
+            return {}
+
+        async def _hset(*args, **kwargs):
+            raise ConnectionError("redis unavailable")
+
+        monkeypatch.setattr(redis_client, "hset", _hset)
+
+        # When / Then
+        with pytest.raises(ConnectionError):
+            await job_manager.start(_run)
+        assert await redis_client.exists(IMPORT_LOCK_KEY) == 0
+        assert len(job_manager) == 0